@@ -3,4 +3,23 @@ Module to provide for command line access but does not perform
 any actions if imported into another Python module.
 """
 
-from pymarkdown.main import PyMarkdownLint  # noqa F401
+from typing import Any
+
+from pymarkdown.general.parser_logging_stripper import StrippedLoggingFinder
+
+if StrippedLoggingFinder.is_requested():
+    StrippedLoggingFinder.install()
+
+
+def __getattr__(attribute_name: str) -> Any:
+    """
+    Import the PyMarkdownLint class only when it is first used, so that modules
+    like the lint client can be imported without loading the entire linter.
+    """
+    if attribute_name == "PyMarkdownLint":
+        from pymarkdown.main import (  # pylint: disable=import-outside-toplevel
+            PyMarkdownLint,
+        )
+
+        return PyMarkdownLint
+    raise AttributeError(f"module {__name__!r} has no attribute {attribute_name!r}")
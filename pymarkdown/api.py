@@ -4,16 +4,31 @@ Create a new instance of the `PyMarkdownApi` class.
 """
 
 import argparse
+import io
 import os
-import tempfile
-from dataclasses import dataclass
-from typing import Any, List, Optional
+import threading
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Iterator, List, Optional, Set, Tuple, cast
 
 from application_file_scanner import ApplicationFileScanner
+from application_properties import ApplicationProperties
 
 from pymarkdown.application_logging import ApplicationLogging
+from pymarkdown.extensions.pragma_token import PragmaToken
+from pymarkdown.file_scan_helper import FileScanHelper
+from pymarkdown.general.bad_tokenization_error import BadTokenizationError
+from pymarkdown.general.incremental_tokenizer import (
+    IncrementalEdit,
+    IncrementalTokenization,
+    IncrementalTokenizer,
+)
 from pymarkdown.general.main_presentation import MainPresentation
+from pymarkdown.general.parser_helper import ParserHelper
+from pymarkdown.general.token_stream_cache import TokenStreamCache
 from pymarkdown.main import PyMarkdownLint
+from pymarkdown.parallel_scan_helper import RecordingPresentation
+from pymarkdown.plugin_manager.bad_plugin_error import BadPluginError
+from pymarkdown.plugin_manager.bad_plugin_fix_error import BadPluginFixError
 from pymarkdown.plugin_manager.plugin_scan_failure import PluginScanFailure
 
 # pylint: disable=too-many-lines
@@ -53,6 +68,7 @@ class PyMarkdownApi:  # docvet: ignore[missing-examples]
         self.__set_properties: List[str] = []
         self.__disable_json5_configuration = False
         self.__enable_continue_on_error = False
+        self.__parallelism = 1
 
     # pylint: disable=too-many-arguments
     def scan_path(
@@ -130,6 +146,8 @@ class PyMarkdownApi:  # docvet: ignore[missing-examples]
         self.__verify_string_argument_not_empty("path_to_scan", path_to_scan)
 
         scan_arguments = self.__build_common_arguments("scan")
+        if self.__parallelism > 1:
+            scan_arguments.extend(("--jobs", str(self.__parallelism)))
         self.__add_common_scan_arguments(
             scan_arguments,
             path_to_scan,
@@ -138,7 +156,172 @@ class PyMarkdownApi:  # docvet: ignore[missing-examples]
             exclude_patterns=exclude_patterns,
             respect_gitignore=respect_gitignore,
         )
+        return self.__scan_with_arguments(scan_arguments)
 
+    # pylint: enable=too-many-arguments
+
+    # pylint: disable=too-many-arguments
+    def scan_path_iter(
+        self,
+        path_to_scan: str,
+        recurse_if_directory: bool = False,
+        alternate_extensions: Optional[str] = None,
+        exclude_patterns: Optional[List[str]] = None,
+        respect_gitignore: bool = False,
+    ) -> Iterator["PyMarkdownScanPathResult"]:
+        """
+        *Scan a provided path for eligible Markdown files, providing the rule violations and pragma errors for each file as it is scanned.*
+
+        This method finds the same files as the `scan_path` method, using the same arguments, but instead of returning
+        the results for all of those files at once, it yields the results for each file as soon as that file has been
+        scanned.  As only the results for one file are kept at a time, the memory used does not grow with the number of
+        files or the number of results.  Each file is scanned using a scanner created by the
+        [`create_scanner`][pymarkdown.api.PyMarkdownApi.create_scanner] method, so the configuration and the rule
+        plugins are only loaded once.
+
+        Args:
+            path_to_scan: The path to scan. Can be a file, a directory, or a glob pattern.
+                If a relative path is provided, it is resolved against the current working directory.
+            recurse_if_directory: If `path_to_scan` is a directory, setting this to `True`
+                includes all subdirectories in the scan.
+            alternate_extensions: An optional comma-separated list of file extensions to scan.
+                If not `None` and not an empty string, this list **replaces** the default `.md` extension entirely.
+                Defaults to `.md` if `None` or an empty string is passed.
+            exclude_patterns: If provided, glob patterns to exclude files or directories.
+                Patterns are resolved relative to the **current working directory**, not the `path_to_scan` parameter.
+            respect_gitignore: If `True`, respect any `.gitignore` files found when scanning
+                according to standard Git rules.
+
+        Yields:
+            A [PyMarkdownScanPathResult][pymarkdown.api.PyMarkdownScanPathResult] object for each eligible file, in the
+                same order that the `list_path` method lists those files.
+
+        Raises:
+            PyMarkdownApiArgumentException: If `path_to_scan` is empty or if `alternate_extensions`
+                does not contain a valid list of file extensions.
+            PyMarkdownApiNoFilesFoundException: If no eligible files were found.
+            PyMarkdownApiException: Raised for unexpected internal errors, such as invalid configuration files, plugin loading failures, or unhandled I/O errors.
+                **Note on `enable_continue_on_error`**: If this option is enabled, certain **System Errors** are not raised as exceptions. Instead, they are collected in the `critical_errors` list of the result for the file that they occurred in.
+
+        Examples:
+            ##### Processing Results as Each File is Scanned.
+
+            This example writes out the failures for each file as soon as that file is scanned.
+
+            ```python
+            from pymarkdown.api import PyMarkdownApi, PyMarkdownApiException
+
+            try:
+                for file_result in PyMarkdownApi().scan_path_iter("docs", recurse_if_directory=True):
+                    for next_failure in file_result.scan_failures:
+                        print(f"{next_failure.scan_file}:{next_failure.line_number}: {next_failure.rule_id}")
+            except PyMarkdownApiException as e:
+                print(f"Scan failed: {e}")
+            ```
+        """
+        list_result = self.list_path(
+            path_to_scan,
+            recurse_if_directory,
+            alternate_extensions,
+            exclude_patterns=exclude_patterns,
+            respect_gitignore=respect_gitignore,
+        )
+        scanner = self.create_scanner()
+        for next_file in list_result.matching_files:
+            yield scanner.scan_file(next_file)
+
+    # pylint: enable=too-many-arguments
+
+    # pylint: disable=too-many-arguments
+    def scan_and_render_path(
+        self,
+        path_to_scan: str,
+        html_directory: str,
+        recurse_if_directory: bool = False,
+        alternate_extensions: Optional[str] = None,
+        exclude_patterns: Optional[List[str]] = None,
+        respect_gitignore: bool = False,
+    ) -> "PyMarkdownScanPathResult":
+        """
+        *Scan a provided path for eligible Markdown files, checking them for rule violations and rendering each of them into HTML.*
+
+        This is the API interface equivalent for the [`pymarkdown scan --html-directory`](../user-guide.md#-html-directory) command line action.
+
+        Each eligible file is parsed once, with the same tokens used both to check for rule violations and
+        to produce the HTML for that file.  The HTML is written to a file with the same relative path within
+        `html_directory`, but with a `.html` extension.  Those relative paths are taken from the deepest
+        directory containing all the eligible files.  If the contents of a file and any configuration affecting
+        its HTML have not changed since it was last rendered into `html_directory`, it is not rendered again.
+
+        If [`set_parallelism`][pymarkdown.api.PyMarkdownApi.set_parallelism] was used to request more than
+        one process, each file is both scanned and rendered by the worker processes.
+
+        Args:
+            path_to_scan: The path to scan. Can be a file, a directory, or a glob pattern.
+                If a relative path is provided, it is resolved against the current working directory.
+            html_directory: The directory to write the HTML files into.  It is created if it does not exist.
+            recurse_if_directory: If `path_to_scan` is a directory, setting this to `True`
+                includes all subdirectories in the scan.
+            alternate_extensions: An optional comma-separated list of file extensions to scan.
+                If not `None` and not an empty string, this list **replaces** the default `.md` extension entirely.
+            exclude_patterns: If provided, glob patterns to exclude files or directories.
+            respect_gitignore: If `True`, respect any `.gitignore` files found when scanning
+                according to standard Git rules.
+
+        Returns:
+            A [PyMarkdownScanPathResult][pymarkdown.api.PyMarkdownScanPathResult] object with the same
+            contents as the result returned by [`scan_path`][pymarkdown.api.PyMarkdownApi.scan_path].
+
+        Raises:
+            PyMarkdownApiArgumentException: If `path_to_scan` or `html_directory` is empty, or if `alternate_extensions`
+                does not contain a valid list of file extensions.
+            PyMarkdownApiNoFilesFoundException: If no eligible files were found.
+            PyMarkdownApiException: Raised for unexpected internal errors, such as invalid configuration files,
+                plugin loading failures, or being unable to write an HTML file.
+
+        Examples:
+            This example checks all the Markdown files in the `docs` directory and renders them into
+            the `site` directory, using four processes.
+
+            ```python
+            from pymarkdown.api import PyMarkdownApi, PyMarkdownApiException
+
+            try:
+                scan_result = (
+                    PyMarkdownApi()
+                        .set_parallelism(4)
+                        .scan_and_render_path("docs", "site", recurse_if_directory=True)
+                )
+            except PyMarkdownApiException as e:
+                print(f"Scan failed: {e}")
+                return
+
+            if scan_result.scan_failures:
+                print(f"Found {len(scan_result.scan_failures)} issues.")
+            ```
+        """
+        self.__verify_string_argument_not_empty("path_to_scan", path_to_scan)
+        self.__verify_string_argument_not_empty("html_directory", html_directory)
+
+        scan_arguments = self.__build_common_arguments("scan")
+        if self.__parallelism > 1:
+            scan_arguments.extend(("--jobs", str(self.__parallelism)))
+        scan_arguments.extend(("--html-directory", html_directory))
+        self.__add_common_scan_arguments(
+            scan_arguments,
+            path_to_scan,
+            recurse_if_directory,
+            alternate_extensions,
+            exclude_patterns=exclude_patterns,
+            respect_gitignore=respect_gitignore,
+        )
+        return self.__scan_with_arguments(scan_arguments)
+
+    # pylint: enable=too-many-arguments
+
+    def __scan_with_arguments(
+        self, scan_arguments: List[str]
+    ) -> "PyMarkdownScanPathResult":
         this_presentation = PyMarkdownApi.ApiPresentation()
         scanner_instance = PyMarkdownLint(
             presentation=this_presentation,
@@ -159,8 +342,6 @@ class PyMarkdownApi:  # docvet: ignore[missing-examples]
                 ) from this_exception
         return self.__handle_scan_results(return_code, this_presentation)
 
-    # pylint: enable=too-many-arguments
-
     def scan_string(
         self,
         string_to_scan: str,
@@ -238,6 +419,66 @@ class PyMarkdownApi:  # docvet: ignore[missing-examples]
             )
         return self.__handle_scan_results(return_code, this_presentation)
 
+    def create_scanner(self) -> "PyMarkdownScanner":
+        """
+        *Create a reusable scanner that scans Markdown using the current configuration.*
+
+        The `scan_path` and `scan_string` methods load the configuration and the rule plugins
+        each time they are called.  This method loads them once, returning a
+        [PyMarkdownScanner][pymarkdown.api.PyMarkdownScanner] object that can be used to scan
+        any number of strings or files with that configuration.  Any changes made to the
+        configuration of this object after the scanner is created do not affect that scanner.
+
+        The scanner's methods can be called from multiple threads at the same time, such as
+        from the workers of a `ThreadPoolExecutor`.  Each thread that scans is given its own
+        instances of the rule plugins, which it reuses for each of its scans.
+
+        Returns:
+            A [PyMarkdownScanner][pymarkdown.api.PyMarkdownScanner] object that scans using the current configuration.
+
+        Raises:
+            PyMarkdownApiException: Raised for errors loading the configuration, such as invalid configuration files
+                or plugin loading failures.
+
+        Examples:
+            This example creates a single scanner and uses it to scan a number of Markdown strings
+            from a pool of threads.
+
+            ```python
+            from concurrent.futures import ThreadPoolExecutor
+            from pymarkdown.api import PyMarkdownApi
+
+            scanner = PyMarkdownApi().disable_rule_by_identifier("md013").create_scanner()
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                scan_results = list(executor.map(scanner.scan_string, pages_to_validate))
+
+            for page_result in scan_results:
+                print(f"Found {len(page_result.scan_failures)} issues.")
+            ```
+        """
+        scan_arguments = self.__build_common_arguments("scan-stdin")
+
+        this_presentation = PyMarkdownApi.ApiPresentation()
+        scanner_instance = PyMarkdownLint(
+            presentation=this_presentation,
+            show_stack_trace=self.__enable_stack_trace,
+            inherit_logging=self.__inherit_logging,
+        )
+        try:
+            parsed_arguments, properties = scanner_instance.initialize_for_scanning(
+                scan_arguments
+            )
+        except SystemExit as this_exception:
+            raise PyMarkdownApiException(
+                this_presentation.pse[-1].strip("\n")
+            ) from this_exception
+        return PyMarkdownScanner(
+            parsed_arguments,
+            properties,
+            self.__enable_stack_trace,
+            self.__enable_continue_on_error,
+        )
+
     # pylint: disable=too-many-arguments
     def fix_path(
         self,
@@ -348,11 +589,10 @@ class PyMarkdownApi:  # docvet: ignore[missing-examples]
         """
         *Scan a provided Markdown string and apply any eligible automatic fixes.*
 
-        This is the API interface equivalent of:
-
-        - writing the provided `string_to_scan` contents to a temporary file
-        - applying a the `pymarkdown fix ` command line to the temporary file
-        - reading the fixed contents of the temporary file into the `fixed_file` attribute of the [PyMarkdownFixStringResult][pymarkdown.api.PyMarkdownFixStringResult] object
+        This is the API interface equivalent of applying the `pymarkdown fix` command line to a file containing the
+        provided `string_to_scan` contents, and placing the fixed contents of that file into the `fixed_file` attribute
+        of the [PyMarkdownFixStringResult][pymarkdown.api.PyMarkdownFixStringResult] object.  No file is written to, as
+        the contents are fixed in memory.
 
         This method is the alternative to `fix_path` for cases where the Markdown content is available as a string rather than a file on disk. It allows for programmatic fixing of generated or dynamically created Markdown content.
 
@@ -400,40 +640,11 @@ class PyMarkdownApi:  # docvet: ignore[missing-examples]
         """
         self.__verify_string_argument_not_empty("string_to_scan", string_to_scan)
 
-        temp_file = None
-        try:
-            with tempfile.NamedTemporaryFile(
-                "wt", suffix=".md", encoding="utf-8", delete=False
-            ) as temp_file:
-                temp_file.write(string_to_scan)
-
-            scan_arguments = self.__build_common_arguments("fix")
-            scan_arguments.append(temp_file.name)
-
-            this_presentation = PyMarkdownApi.ApiPresentation()
-            scanner_instance = PyMarkdownLint(
-                presentation=this_presentation,
-                show_stack_trace=self.__enable_stack_trace,
-                inherit_logging=self.__inherit_logging,
-            )
-            return_code = 0
-            try:
-                scanner_instance.main(scan_arguments)
-            except SystemExit as this_exception:
-                # https://github.com/python/typeshed/issues/8513#issue-1333671093
-                return_code = (
-                    int(this_exception.code)
-                    if isinstance(this_exception.code, int)
-                    else 99
-                )
-            fix_result = self.__handle_fix_results(return_code, this_presentation)
-            with open(temp_file.name, "rt", encoding="utf-8") as fixed_file:
-                return PyMarkdownFixStringResult(
-                    bool(fix_result.files_fixed), fixed_file.read()
-                )
-        finally:
-            if temp_file and os.path.isfile(temp_file.name):  # pragma: no cover
-                os.remove(temp_file.name)
+        # The line endings are translated in the same way that they are translated
+        # when a file is read, as for the `scan_string` method.
+        return self.create_scanner().fix_string(
+            io.StringIO(string_to_scan, newline=None).read()
+        )
 
     # pylint: disable=too-many-arguments
     def list_path(
@@ -1279,6 +1490,47 @@ class PyMarkdownApi:  # docvet: ignore[missing-examples]
         self.__enable_continue_on_error = True
         return self
 
+    def set_parallelism(self, number_of_processes: int) -> "PyMarkdownApi":
+        """
+        *Sets the number of processes to use when scanning multiple files.*
+
+        This is the API interface equivalent for the [`--jobs`](../user-guide.md#-jobs-or-j) command line argument.
+
+        When more than one process is requested, the files found by the `scan_path` method are
+        shared between a pool of worker processes.  The results are collected in the same order
+        that they would be reported by a single process, so the returned results do not change.
+
+        Args:
+            number_of_processes: The number of processes to use.  A value of `1` scans
+                each file in the current process.
+
+        Returns:
+            Returns `self` to allow for method chaining.
+
+        Raises:
+            PyMarkdownApiArgumentException: If `number_of_processes` is less than 1.
+
+        Examples:
+            This example uses four processes to scan all the Markdown files in the `docs` directory.
+
+            ```python
+            from pymarkdown.api import PyMarkdownApi
+
+            scan_result = (
+                PyMarkdownApi()
+                    .set_parallelism(4)
+                    .scan_path("docs", recurse_if_directory=True)
+            )
+            ```
+        """
+        if number_of_processes < 1:
+            raise PyMarkdownApiArgumentException(
+                "number_of_processes",
+                "Parameter named 'number_of_processes' must be an integer greater than or equal to 1.",
+            )
+        self.__parallelism = number_of_processes
+        return self
+
     def __handle_scan_results(
         self, return_code: int, this_presentation: "PyMarkdownApi.ApiPresentation"
     ) -> "PyMarkdownScanPathResult":
@@ -1480,6 +1732,482 @@ class PyMarkdownApi:  # docvet: ignore[missing-examples]
 # pylint: enable=too-many-instance-attributes,too-many-public-methods
 
 
+class PyMarkdownScanner:  # docvet: ignore[missing-examples]
+    """
+    Class to provide for a reusable scanner, created by the
+    [`create_scanner`][pymarkdown.api.PyMarkdownApi.create_scanner] method, that scans
+    Markdown using a configuration that is only loaded once.
+
+    The methods of this class can be called from multiple threads at the same time.  As
+    the rule plugins keep state for the file that they are scanning, each thread is given
+    its own tokenizer and rule plugin instances the first time that it scans, and reuses
+    them for each of its following scans.
+
+    The tokens for the most recently scanned contents are cached and shared between
+    those threads, so that fixing a string or file that was just scanned, or scanning
+    the same contents again, does not tokenize those contents again.
+
+    For editor integrations, the `scan_edit` method scans an edit to a string that was
+    already scanned, only tokenizing the blocks around the edit again, and only scanning
+    with the rules whose results can be changed by those blocks.
+    """
+
+    __scan_id_for_strings = "in-memory"
+
+    def __init__(
+        self,
+        scan_arguments: argparse.Namespace,
+        properties: ApplicationProperties,
+        show_stack_trace: bool,
+        continue_on_error: bool,
+    ) -> None:
+        """
+        Initialize a new instance of the PyMarkdownScanner class.
+        """
+        self.__scan_arguments = scan_arguments
+        self.__properties = properties
+        self.__show_stack_trace = show_stack_trace
+        self.__continue_on_error = continue_on_error
+        self.__thread_state = threading.local()
+        self.__token_cache = TokenStreamCache()
+
+        # Creating the scan helper for the current thread verifies any configuration
+        # that is only used while scanning, such as the per-file ignores.
+        _ = self.__get_scan_helper()
+
+    def scan_string(self, string_to_scan: str) -> "PyMarkdownScanPathResult":
+        """
+        *Scan a provided Markdown string for rule violations and pragma errors.*
+
+        This method returns the same results as the
+        [`scan_string`][pymarkdown.api.PyMarkdownApi.scan_string] method of the
+        `PyMarkdownApi` class, using the scanner's configuration.
+
+        Args:
+            string_to_scan: The Markdown string to scan.
+
+        Returns:
+            A [PyMarkdownScanPathResult][pymarkdown.api.PyMarkdownScanPathResult] object if the scan completes without raising an exception.
+
+        Raises:
+            PyMarkdownApiArgumentException: If `string_to_scan` is empty.
+            PyMarkdownApiException: Raised for errors while scanning, unless `enable_continue_on_error` was enabled
+                when the scanner was created, in which case those errors are collected in the `critical_errors` list
+                of the returned object.
+        """
+        PyMarkdownScanner.__verify_string_argument_not_empty(
+            "string_to_scan", string_to_scan
+        )
+        return self.__scan(
+            PyMarkdownScanner.__scan_id_for_strings,
+            lambda scan_helper: scan_helper.scan_single_string(
+                string_to_scan, PyMarkdownScanner.__scan_id_for_strings
+            ),
+        )
+
+    def scan_file(self, file_to_scan: str) -> "PyMarkdownScanPathResult":
+        """
+        *Scan a single Markdown file for rule violations and pragma errors.*
+
+        Unlike the [`scan_path`][pymarkdown.api.PyMarkdownApi.scan_path] method of the
+        `PyMarkdownApi` class, the provided path must be the path of a single file, and is
+        scanned regardless of its extension.  As with that method, any rule failures are
+        reported using the absolute path of the file.
+
+        Args:
+            file_to_scan: The path of the file to scan.
+
+        Returns:
+            A [PyMarkdownScanPathResult][pymarkdown.api.PyMarkdownScanPathResult] object if the scan completes without raising an exception.
+
+        Raises:
+            PyMarkdownApiArgumentException: If `file_to_scan` is empty.
+            PyMarkdownApiNoFilesFoundException: If `file_to_scan` is not the path of an existing file.
+            PyMarkdownApiException: Raised for errors while scanning, unless `enable_continue_on_error` was enabled
+                when the scanner was created, in which case those errors are collected in the `critical_errors` list
+                of the returned object.
+        """
+        PyMarkdownScanner.__verify_string_argument_not_empty(
+            "file_to_scan", file_to_scan
+        )
+        if not os.path.isfile(file_to_scan):
+            raise PyMarkdownApiNoFilesFoundException("No matching files found.")
+        file_to_scan = os.path.abspath(file_to_scan)
+        return self.__scan(
+            file_to_scan,
+            lambda scan_helper: scan_helper.scan_single_file(
+                file_to_scan,
+                scan_helper.check_file_name_against_per_file_disabled_identifiers(
+                    file_to_scan
+                ),
+            ),
+        )
+
+    def fix_string(self, string_to_fix: str) -> "PyMarkdownFixStringResult":
+        """
+        *Scan a provided Markdown string and apply any eligible automatic fixes.*
+
+        This method returns the same results as the
+        [`fix_string`][pymarkdown.api.PyMarkdownApi.fix_string] method of the
+        `PyMarkdownApi` class, using the scanner's configuration.  The string is
+        fixed in memory, without writing to any files.
+
+        Args:
+            string_to_fix: The Markdown string to scan and fix.
+
+        Returns:
+            A [PyMarkdownFixStringResult][pymarkdown.api.PyMarkdownFixStringResult] object if the fix completes without raising an exception.
+
+        Raises:
+            PyMarkdownApiArgumentException: If `string_to_fix` is empty.
+            PyMarkdownApiException: Raised for errors while fixing, unless `enable_continue_on_error` was enabled
+                when the scanner was created, in which case the string is returned without any fixes applied.
+        """
+        PyMarkdownScanner.__verify_string_argument_not_empty(
+            "string_to_fix", string_to_fix
+        )
+        fix_results: List[Tuple[bool, str]] = []
+        self.__scan(
+            PyMarkdownScanner.__scan_id_for_strings,
+            lambda scan_helper: fix_results.append(
+                scan_helper.fix_single_string(
+                    string_to_fix, PyMarkdownScanner.__scan_id_for_strings
+                )
+            ),
+        )
+        if not fix_results:
+            return PyMarkdownFixStringResult(False, string_to_fix)
+        return PyMarkdownFixStringResult(*fix_results[0])
+
+    def scan_string_for_edits(self, string_to_scan: str) -> "PyMarkdownEditScanResult":
+        """
+        *Scan a provided Markdown string, keeping what is needed to scan any edits to it.*
+
+        This method returns the same rule failures and pragma errors as the
+        [`scan_string`][pymarkdown.api.PyMarkdownScanner.scan_string] method.  The returned
+        object can then be passed to the [`scan_edit`][pymarkdown.api.PyMarkdownScanner.scan_edit]
+        method to scan the string after it is edited.
+
+        Args:
+            string_to_scan: The Markdown string to scan.
+
+        Returns:
+            A [PyMarkdownEditScanResult][pymarkdown.api.PyMarkdownEditScanResult] object if the scan completes without raising an exception.
+
+        Raises:
+            PyMarkdownApiArgumentException: If `string_to_scan` is empty.
+            PyMarkdownApiException: Raised for errors while scanning, unless `enable_continue_on_error` was enabled
+                when the scanner was created, in which case those errors are collected in the `critical_errors` list
+                of the returned object.
+        """
+        PyMarkdownScanner.__verify_string_argument_not_empty(
+            "string_to_scan", string_to_scan
+        )
+        return self.__scan_tokenization(
+            string_to_scan,
+            lambda incremental_tokenizer: incremental_tokenizer.tokenize(
+                string_to_scan
+            ),
+            None,
+        )
+
+    def scan_edit(
+        self, previous_result: "PyMarkdownEditScanResult", edit: IncrementalEdit
+    ) -> "PyMarkdownEditScanResult":
+        """
+        *Scan a Markdown string after applying an edit to a version of it that was already scanned.*
+
+        This method is meant for editor integrations that scan a document each time that it
+        is changed.  Instead of tokenizing the entire document again, only the top-level
+        blocks around the edit are tokenized again.  Only the rules whose results can be
+        changed by those blocks, including any rule that examines each line, are scanned
+        with again.  The rule failures for every other rule are kept from the previous
+        result, with their line numbers adjusted for any lines added or removed by the edit.
+        If the edit adds or removes any pragmas, or if the previous result contains any
+        critical errors, every rule is scanned with again.
+
+        The returned rule failures and pragma errors are the same as those returned by the
+        [`scan_string`][pymarkdown.api.PyMarkdownScanner.scan_string] method for the edited string.
+
+        Args:
+            previous_result: The result of scanning the string before the edit, as returned by the
+                [`scan_string_for_edits`][pymarkdown.api.PyMarkdownScanner.scan_string_for_edits]
+                method or by an earlier call to this method.
+            edit: The edit to apply, replacing a range of lines in the string with new lines.
+
+        Returns:
+            A [PyMarkdownEditScanResult][pymarkdown.api.PyMarkdownEditScanResult] object for the edited string if the scan completes without raising an exception.
+
+        Raises:
+            PyMarkdownApiArgumentException: If the lines replaced by `edit` are not within the string.
+            PyMarkdownApiException: Raised for errors while scanning, unless `enable_continue_on_error` was enabled
+                when the scanner was created, in which case those errors are collected in the `critical_errors` list
+                of the returned object.
+
+        Examples:
+            This example scans a string, and then scans it again after its third line is
+            replaced with two new lines.
+
+            ```python
+            from pymarkdown.api import PyMarkdownApi
+            from pymarkdown.general.incremental_tokenizer import IncrementalEdit
+
+            scanner = PyMarkdownApi().create_scanner()
+            scan_result = scanner.scan_string_for_edits("# Heading\n\nSome text.\n")
+            scan_result = scanner.scan_edit(
+                scan_result, IncrementalEdit(3, 3, ["Some new", "text."])
+            )
+            print(f"Found {len(scan_result.scan_failures)} issues.")
+            ```
+        """
+        try:
+            edited_lines = edit.apply_to_lines(
+                previous_result.source_text.split(ParserHelper.newline_character)
+            )
+        except ValueError as this_exception:
+            raise PyMarkdownApiArgumentException("edit", str(this_exception)) from (
+                this_exception
+            )
+        edited_string = ParserHelper.newline_character.join(edited_lines)
+        previous_tokenization = previous_result.tokenization
+        return self.__scan_tokenization(
+            edited_string,
+            lambda incremental_tokenizer: (
+                incremental_tokenizer.tokenize(edited_string)
+                if previous_tokenization is None
+                else incremental_tokenizer.apply_edit(previous_tokenization, edit)
+            ),
+            previous_result,
+        )
+
+    def __scan_tokenization(
+        self,
+        string_to_scan: str,
+        tokenize_function: Callable[[IncrementalTokenizer], IncrementalTokenization],
+        previous_result: Optional["PyMarkdownEditScanResult"],
+    ) -> "PyMarkdownEditScanResult":
+        tokenizations: List[IncrementalTokenization] = []
+        rule_ids_to_scan: List[Optional[Set[str]]] = []
+        enabled_rule_ids: Set[str] = set()
+
+        def __scan_function(scan_helper: FileScanHelper) -> None:
+            enabled_rule_ids.update(scan_helper.enabled_rule_ids)
+            tokenizations.append(
+                tokenize_function(scan_helper.create_incremental_tokenizer())
+            )
+            rule_ids_to_scan.append(
+                PyMarkdownScanner.__find_rule_ids_to_scan(
+                    scan_helper, previous_result, tokenizations[0]
+                )
+            )
+            scan_helper.scan_single_tokenization(
+                tokenizations[0],
+                PyMarkdownScanner.__scan_id_for_strings,
+                rule_ids_to_scan[0],
+            )
+
+        scan_result = self.__scan(
+            PyMarkdownScanner.__scan_id_for_strings, __scan_function
+        )
+        scan_failures = scan_result.scan_failures
+        scanned_rule_ids = enabled_rule_ids
+        if previous_result and rule_ids_to_scan and rule_ids_to_scan[0] is not None:
+            scanned_rule_ids = rule_ids_to_scan[0]
+            scan_failures = PyMarkdownScanner.__merge_previous_scan_failures(
+                scan_failures, previous_result, tokenizations[0], scanned_rule_ids
+            )
+        return PyMarkdownEditScanResult(
+            scan_failures,
+            scan_result.pragma_errors,
+            scan_result.critical_errors,
+            string_to_scan,
+            tokenizations[0] if tokenizations else None,
+            sorted(scanned_rule_ids),
+        )
+
+    @staticmethod
+    def __find_rule_ids_to_scan(
+        scan_helper: FileScanHelper,
+        previous_result: Optional["PyMarkdownEditScanResult"],
+        tokenization: IncrementalTokenization,
+    ) -> Optional[Set[str]]:
+        """
+        Find the identifiers of the rules that need to scan the edited string, or
+        None if every rule does.
+        """
+        if (
+            previous_result is None
+            or previous_result.critical_errors
+            or previous_result.tokenization is None
+            or tokenization.was_fully_parsed
+        ):
+            return None
+        first_line_number = tokenization.first_parsed_line_number
+        previous_last_line_number = (
+            tokenization.last_parsed_line_number - tokenization.line_number_delta
+        )
+        if PyMarkdownScanner.__has_pragma_within(
+            previous_result.tokenization, first_line_number, previous_last_line_number
+        ) or PyMarkdownScanner.__has_pragma_within(
+            tokenization, first_line_number, tokenization.last_parsed_line_number
+        ):
+            return None
+
+        # Any rule that reported a failure within the lines that were tokenized
+        # again is scanned again, as that failure may no longer apply.
+        rule_ids_to_scan = scan_helper.find_rule_ids_affected_by_token_names(
+            tokenization.parsed_token_names
+        )
+        rule_ids_to_scan.update(
+            next_failure.rule_id.lower()
+            for next_failure in previous_result.scan_failures
+            if first_line_number
+            <= next_failure.line_number
+            <= previous_last_line_number
+        )
+        return rule_ids_to_scan
+
+    @staticmethod
+    def __has_pragma_within(
+        tokenization: IncrementalTokenization,
+        first_line_number: int,
+        last_line_number: int,
+    ) -> bool:
+        last_token = tokenization.tokens[-1] if tokenization.tokens else None
+        return bool(
+            last_token
+            and last_token.is_pragma
+            and any(
+                first_line_number <= abs(next_line_number) <= last_line_number
+                for next_line_number in cast(PragmaToken, last_token).pragma_lines
+            )
+        )
+
+    @staticmethod
+    def __merge_previous_scan_failures(
+        scan_failures: List["PyMarkdownScanFailure"],
+        previous_result: "PyMarkdownEditScanResult",
+        tokenization: IncrementalTokenization,
+        scanned_rule_ids: Set[str],
+    ) -> List["PyMarkdownScanFailure"]:
+        previous_last_line_number = (
+            tokenization.last_parsed_line_number - tokenization.line_number_delta
+        )
+        kept_failures = [
+            (
+                replace(
+                    next_failure,
+                    line_number=next_failure.line_number
+                    + tokenization.line_number_delta,
+                )
+                if next_failure.line_number > previous_last_line_number
+                else next_failure
+            )
+            for next_failure in previous_result.scan_failures
+            if next_failure.rule_id.lower() not in scanned_rule_ids
+        ]
+        return sorted(
+            scan_failures + kept_failures,
+            key=lambda next_failure: (
+                next_failure.line_number,
+                next_failure.column_number,
+                next_failure.rule_id,
+            ),
+        )
+
+    def __get_scan_helper(self) -> Tuple[FileScanHelper, RecordingPresentation]:
+        scan_helper_and_presentation: Optional[
+            Tuple[FileScanHelper, RecordingPresentation]
+        ] = getattr(self.__thread_state, "scan_helper_and_presentation", None)
+        if scan_helper_and_presentation is None:
+            try:
+                scan_helper_and_presentation = (
+                    FileScanHelper.create_recording_scan_helper(
+                        self.__scan_arguments,
+                        self.__properties,
+                        self.__show_stack_trace,
+                    )
+                )
+            except ValueError as this_exception:
+                raise PyMarkdownApiException(
+                    f"Configuration Error: {this_exception}"
+                ) from this_exception
+            scan_helper_and_presentation[0].set_token_cache(self.__token_cache)
+            self.__thread_state.scan_helper_and_presentation = (
+                scan_helper_and_presentation
+            )
+        return scan_helper_and_presentation
+
+    # pylint: disable=broad-exception-caught
+    def __scan(
+        self, scan_id: str, scan_function: Callable[[FileScanHelper], None]
+    ) -> "PyMarkdownScanPathResult":
+        scan_helper, recording_presentation = self.__get_scan_helper()
+        recording_presentation.recorded_events = []
+        critical_errors: List[str] = []
+        try:
+            scan_function(scan_helper)
+        except Exception as this_exception:
+            # The rule plugins may be left part way through a file, so this thread
+            # is given new instances for its next scan.
+            self.__thread_state.scan_helper_and_presentation = None
+            critical_errors.append(
+                self.__format_scan_error(
+                    scan_id, this_exception, recording_presentation
+                )
+            )
+
+        this_presentation = PyMarkdownApi.ApiPresentation()
+        for next_event in recording_presentation.recorded_events:
+            if isinstance(next_event, PluginScanFailure):
+                this_presentation.print_scan_failure(next_event)
+            else:
+                this_presentation.print_pragma_failure(*next_event)
+        return PyMarkdownScanPathResult(
+            this_presentation.scan_failures,
+            this_presentation.pragma_errors,
+            critical_errors,
+        )
+
+    # pylint: enable=broad-exception-caught
+
+    def __format_scan_error(
+        self,
+        scan_id: str,
+        this_exception: Exception,
+        presentation: MainPresentation,
+    ) -> str:
+        allow_shortcut = self.__continue_on_error and isinstance(
+            this_exception, (BadPluginError, BadPluginFixError, BadTokenizationError)
+        )
+        if not (
+            allow_shortcut
+            or isinstance(this_exception, (BadPluginError, BadPluginFixError))
+        ):
+            raise PyMarkdownApiException(
+                f"Unexpected Error({type(this_exception).__name__}): {this_exception}"
+            ) from this_exception
+        formatted_error = presentation.format_scan_error(
+            scan_id,
+            this_exception,
+            self.__show_stack_trace and not allow_shortcut,
+            allow_shortcut,
+        )
+        assert formatted_error is not None, "Scan errors are always formatted."
+        if not allow_shortcut:
+            raise PyMarkdownApiException(formatted_error) from this_exception
+        return formatted_error
+
+    @staticmethod
+    def __verify_string_argument_not_empty(
+        argument_name: str, string_to_validate: str
+    ) -> None:
+        if not string_to_validate.strip():
+            raise PyMarkdownApiArgumentException(
+                argument_name, f"Parameter named '{argument_name}' cannot be empty."
+            )
+
+
 @dataclass(frozen=True)
 class PyMarkdownScanFailure:  # docvet: ignore[missing-examples]
     """
@@ -1709,6 +2437,44 @@ class PyMarkdownScanPathResult:  # docvet: ignore[missing-examples]
     """
 
 
+@dataclass(frozen=True)
+class PyMarkdownEditScanResult(  # docvet: ignore[missing-examples]
+    PyMarkdownScanPathResult
+):
+    """
+    This dataclass encapsulates the results from either the
+    [`scan_string_for_edits`][pymarkdown.api.PyMarkdownScanner.scan_string_for_edits]
+    or [`scan_edit`][pymarkdown.api.PyMarkdownScanner.scan_edit] methods.
+
+    Along with the results of the scan, it keeps the string that was scanned and its tokens,
+    so that an edit to that string can be scanned by passing this object to the
+    [`scan_edit`][pymarkdown.api.PyMarkdownScanner.scan_edit] method.
+
+    Attributes:
+        scan_failures (List[PyMarkdownScanFailure]): List of rule failures found during the scan.
+        pragma_errors (List[PyMarkdownPragmaError]): List of pragma errors detected during the scan.
+        critical_errors (List[str]): List of critical errors encountered during the scan.
+        source_text (str): The Markdown string that was scanned.
+        tokenization (Optional[IncrementalTokenization]): The tokens for the string, if it was tokenized.
+        scanned_rule_ids (List[str]): The identifiers of the rules that scanned the string.
+    """
+
+    source_text: str
+    """
+    The Markdown string that was scanned.
+    """
+    tokenization: Optional[IncrementalTokenization]
+    """
+    The tokens for the string, or None if it could not be tokenized.  This is only meant to be used
+    by the [`scan_edit`][pymarkdown.api.PyMarkdownScanner.scan_edit] method.
+    """
+    scanned_rule_ids: List[str]
+    """
+    The identifiers of the rules that scanned the string.  The rule failures for any other enabled
+    rules were kept from the previous result.
+    """
+
+
 @dataclass(frozen=True)
 class PyMarkdownFixResult:  # docvet: ignore[missing-examples]
     """
@@ -1783,7 +2549,7 @@ class PyMarkdownFixStringResult:  # docvet: ignore[missing-examples]
     Class to encapsulate the results for the [`fix_string`][pymarkdown.api.PyMarkdownApi.fix_string] method.
 
     This is the API interface encapsulation for the result of executing the `pymarkdown fix` command
-    against a temporarily file that contains a string that was passed to the `fix_string` method.
+    against the contents of a string that was passed to the `fix_string` method.
 
     This result contains information about fixes applied to the input string, interpreted as a Markdown document.
 
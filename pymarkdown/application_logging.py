@@ -5,7 +5,7 @@ Module to provide for a simplified way to setup logging.
 import argparse
 import logging
 import sys
-from typing import List, Optional, Tuple
+from typing import List, Optional, TextIO, Tuple
 
 from application_properties import ApplicationProperties
 
@@ -50,6 +50,18 @@ class ApplicationLogging:
         self.__default_log_level = default_log_level
         self.__properties = application_properties
         self.__new_handler: Optional[logging.FileHandler] = None
+        self.__log_to_standard_error = False
+
+    def log_to_standard_error(self) -> None:
+        """
+        Write any logging that is not written to a file to standard error instead of
+        standard output, for when standard output is used for something else.
+        """
+        self.__log_to_standard_error = True
+
+    @property
+    def __log_stream(self) -> TextIO:
+        return sys.stderr if self.__log_to_standard_error else sys.stdout
 
     def pre_initialize_with_args(self, args: argparse.Namespace) -> None:
         """
@@ -74,7 +86,7 @@ class ApplicationLogging:
                 "Application logging set to '%s'.",
                 logging.getLevelName(base_logger.level),
             )
-        logging.basicConfig(stream=sys.stdout, level=new_level)
+        logging.basicConfig(stream=self.__log_stream, level=new_level)
 
     def __calculate_effective_levels(
         self, args: argparse.Namespace
@@ -113,7 +125,7 @@ class ApplicationLogging:
                 temp_log_level = (
                     logging.DEBUG if self.__show_stack_trace else logging.CRITICAL
                 )
-                logging.basicConfig(stream=sys.stdout, level=temp_log_level)
+                logging.basicConfig(stream=self.__log_stream, level=temp_log_level)
 
             log_level_to_enact = ApplicationLogging.__available_log_maps[
                 effective_log_level
@@ -133,6 +145,7 @@ class ApplicationLogging:
         Terminate the logging for the application.
         """
         if self.__new_handler:
+            logging.getLogger().removeHandler(self.__new_handler)
             self.__new_handler.close()
             self.__new_handler = None
 
@@ -0,0 +1,183 @@
+"""
+Module to provide for the corpora of Markdown documents measured by the bench command.
+"""
+
+import json
+import os
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Tuple
+
+
+@dataclass(frozen=True)
+class BenchmarkCorpus:
+    """
+    Class to provide for a named corpus of Markdown documents to measure.
+    """
+
+    corpus_name: str
+    documents: List[str]
+    required_extensions: List[str]
+
+    @property
+    def line_count(self) -> int:
+        """
+        Number of lines in all of the documents in the corpus.
+        """
+        return sum(next_document.count("\n") for next_document in self.documents)
+
+
+class BenchmarkCorpora:
+    """
+    Class to provide for the corpora of Markdown documents measured by the bench
+    command.
+
+    Except for the CommonMark examples, which are taken from the specification tests
+    and checked in as a resource, each corpus is generated with a fixed pattern, so
+    that the same scale always produces the same documents.  The scale multiplies the
+    size of the generated documents, or the number of copies of the examples.
+    """
+
+    __commonmark_examples_file_name = "benchmark_commonmark_examples.json"
+    __lines_per_scale = 250
+
+    @staticmethod
+    def corpus_names() -> List[str]:
+        """
+        Names of the available corpora, in the order that they are measured.
+        """
+        return list(BenchmarkCorpora.__corpus_creators())
+
+    @staticmethod
+    def create_corpus(corpus_name: str, scale: int) -> BenchmarkCorpus:
+        """
+        Create the named corpus at the specified scale.
+        """
+        corpus_creator, required_extensions = BenchmarkCorpora.__corpus_creators()[
+            corpus_name
+        ]
+        return BenchmarkCorpus(corpus_name, corpus_creator(scale), required_extensions)
+
+    @staticmethod
+    def __corpus_creators() -> Dict[str, Tuple[Callable[[int], List[str]], List[str]]]:
+        return {
+            "deep-lists": (BenchmarkCorpora.__create_deep_lists, []),
+            "long-block-quotes": (BenchmarkCorpora.__create_long_block_quotes, []),
+            "huge-tables": (BenchmarkCorpora.__create_huge_tables, ["markdown-tables"]),
+            "link-references": (BenchmarkCorpora.__create_link_references, []),
+            "emphasis": (BenchmarkCorpora.__create_emphasis, []),
+            "commonmark-examples": (
+                BenchmarkCorpora.__create_commonmark_examples,
+                [],
+            ),
+        }
+
+    @staticmethod
+    def __join_lines(document_lines: List[str], line_count: int) -> List[str]:
+        return ["\n".join(document_lines[:line_count]) + "\n"]
+
+    @staticmethod
+    def __create_deep_lists(scale: int) -> List[str]:
+        line_count = scale * BenchmarkCorpora.__lines_per_scale
+        document_lines: List[str] = []
+        item_index = 0
+        while len(document_lines) < line_count:
+            depth = item_index % 8
+            indent = "  " * depth
+            document_lines.append(f"{indent}- item {item_index} with *some* text")
+            if item_index % 4 == 3:
+                document_lines.append(f"{indent}  continued with `code` and text")
+            if item_index % 16 == 15:
+                document_lines.append("")
+            item_index += 1
+        return BenchmarkCorpora.__join_lines(document_lines, line_count)
+
+    @staticmethod
+    def __create_long_block_quotes(scale: int) -> List[str]:
+        line_count = scale * BenchmarkCorpora.__lines_per_scale
+        quote_pattern = [
+            "> A line of quoted text with *emphasis*.",
+            "> Another line of the same paragraph.",
+            ">",
+            "> - A list item within the quote",
+            ">   continued on the next line.",
+            ">",
+            "> > A nested quote with `code`.",
+            "> > More of the nested quote.",
+            ">",
+        ]
+        document_lines: List[str] = []
+        while len(document_lines) < line_count:
+            document_lines.extend(quote_pattern)
+        return BenchmarkCorpora.__join_lines(document_lines, line_count)
+
+    @staticmethod
+    def __create_huge_tables(scale: int) -> List[str]:
+        line_count = scale * BenchmarkCorpora.__lines_per_scale
+        document_lines: List[str] = []
+        row_index = 0
+        while len(document_lines) < line_count:
+            if row_index % 200 == 0:
+                if document_lines:
+                    document_lines.append("")
+                document_lines.extend(
+                    [
+                        "| Name | Code | Emphasis | Link | Number |",
+                        "| :--- | :---: | --- | --- | ---: |",
+                    ]
+                )
+            document_lines.append(
+                f"| row {row_index} | `value_{row_index}` | *some* **text** "
+                + f"| [link](/url/{row_index}) | {row_index} |"
+            )
+            row_index += 1
+        return BenchmarkCorpora.__join_lines(document_lines, line_count)
+
+    @staticmethod
+    def __create_link_references(scale: int) -> List[str]:
+        line_count = scale * BenchmarkCorpora.__lines_per_scale
+        definition_count = line_count // 4
+        document_lines: List[str] = []
+        reference_index = 0
+        while len(document_lines) < line_count - definition_count - 1:
+            next_index = reference_index % definition_count
+            document_lines.append(
+                f"See [the reference][ref-{next_index}], [ref-{next_index}], "
+                + f"and [an inline link](/inline/{reference_index} 'title')."
+            )
+            if reference_index % 5 == 4:
+                document_lines.append("")
+            reference_index += 1
+        document_lines.append("")
+        document_lines.extend(
+            f'[ref-{definition_index}]: /url/{definition_index} "Title {definition_index}"'
+            for definition_index in range(definition_count)
+        )
+        return BenchmarkCorpora.__join_lines(document_lines, line_count)
+
+    @staticmethod
+    def __create_emphasis(scale: int) -> List[str]:
+        line_count = scale * BenchmarkCorpora.__lines_per_scale
+        emphasis_pattern = [
+            "Some *emphasis*, **strong**, and ***both*** in one line.",
+            "Underscores _work_ __too__, but not in_the_middle_of_words.",
+            "Nested *emphasis with **strong** inside* and **strong *with* emphasis**.",
+            "Unbalanced *delimiters **are* left** as *text and `code*` spans.",
+            "Runs of ****many**** delimiters and * spaced * ones are tricky.",
+            "",
+        ]
+        document_lines: List[str] = []
+        while len(document_lines) < line_count:
+            document_lines.extend(emphasis_pattern)
+        return BenchmarkCorpora.__join_lines(document_lines, line_count)
+
+    @staticmethod
+    def __create_commonmark_examples(scale: int) -> List[str]:
+        corpus_path = os.path.join(
+            os.path.dirname(os.path.realpath(__file__)),
+            "..",
+            "resources",
+            BenchmarkCorpora.__commonmark_examples_file_name,
+        )
+        with open(corpus_path, "rt", encoding="utf-8") as corpus_file:
+            examples: List[str] = json.load(corpus_file)
+        return examples * scale
@@ -0,0 +1,421 @@
+"""
+Module to provide for the bench command, measuring how long it takes to scan and
+fix the benchmark corpora.
+"""
+
+import argparse
+import json
+import logging
+import platform
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from application_properties import ApplicationProperties
+from columnar import columnar
+
+from pymarkdown.benchmark.benchmark_corpus import BenchmarkCorpora, BenchmarkCorpus
+from pymarkdown.file_scan_helper import FileScanHelper
+from pymarkdown.general.bad_tokenization_error import BadTokenizationError
+from pymarkdown.general.main_presentation import MainPresentation
+from pymarkdown.general.parser_helper import ParserHelper
+from pymarkdown.general.phase_timer import PhaseTimer
+from pymarkdown.plugin_manager.bad_plugin_error import BadPluginError
+from pymarkdown.return_code_helper import ApplicationResult
+from pymarkdown.version import __version__
+
+LOGGER = logging.getLogger(__name__)
+
+BenchmarkResults = Dict[str, Any]
+
+
+class BenchmarkHelper:
+    """
+    Class to provide for the bench command, measuring how long it takes to scan and
+    fix the benchmark corpora.
+
+    Each corpus is scanned, and then fixed, the requested number of times, keeping
+    the fastest of those times along with the time taken by each phase during that
+    run.  The results can be written to a JSON file, and can be compared against the
+    results from an earlier run, reporting any corpus that has become slower by more
+    than the threshold as a regression.
+    """
+
+    results_format_version = 1
+    scan_operation = "scan"
+    fix_operation = "fix"
+    __bench_subcommand = "bench"
+
+    def __init__(
+        self,
+        properties: ApplicationProperties,
+        presentation: MainPresentation,
+        show_stack_trace: bool,
+    ) -> None:
+        """
+        Initialize a new instance of the BenchmarkHelper class.
+        """
+        self.__properties = properties
+        self.__presentation = presentation
+        self.__show_stack_trace = show_stack_trace
+
+    @staticmethod
+    def argparse_subparser_name() -> str:
+        """
+        Name of the subparser for the bench command.
+        """
+        return BenchmarkHelper.__bench_subcommand
+
+    @staticmethod
+    def add_argparse_subparser(subparsers: argparse._SubParsersAction) -> None:  # type: ignore
+        """
+        Add the subparser for the bench command.
+        """
+        new_sub_parser = subparsers.add_parser(
+            BenchmarkHelper.__bench_subcommand,
+            help="measure how fast the benchmark corpora are scanned and fixed",
+        )
+        new_sub_parser.add_argument(
+            "--corpus",
+            dest="bench_corpora",
+            action="append",
+            choices=BenchmarkCorpora.corpus_names(),
+            help="corpus to measure, measuring every corpus if not specified",
+        )
+        new_sub_parser.add_argument(
+            "--scale",
+            dest="bench_scale",
+            action="store",
+            default=1,
+            type=BenchmarkHelper.__validate_positive_integer,
+            help="multiplier for the size of each corpus",
+        )
+        new_sub_parser.add_argument(
+            "--repeat",
+            dest="bench_repeat",
+            action="store",
+            default=3,
+            type=BenchmarkHelper.__validate_positive_integer,
+            help="number of times to measure each corpus, keeping the fastest time",
+        )
+        new_sub_parser.add_argument(
+            "--skip-fix",
+            dest="bench_skip_fix",
+            action="store_true",
+            default=False,
+            help="only measure scanning each corpus, not fixing it",
+        )
+        new_sub_parser.add_argument(
+            "--output-file",
+            dest="bench_output_file",
+            action="store",
+            default=None,
+            help="path of the JSON file to write the results to",
+        )
+        new_sub_parser.add_argument(
+            "--compare",
+            dest="bench_compare_file",
+            action="store",
+            default=None,
+            help="path of a JSON results file to compare the results against",
+        )
+        new_sub_parser.add_argument(
+            "--threshold",
+            dest="bench_threshold",
+            action="store",
+            default=10.0,
+            type=BenchmarkHelper.__validate_positive_number,
+            help="percentage slower than the compared results that is reported as a regression",
+        )
+
+    @staticmethod
+    def __validate_positive_integer(argument: str) -> int:
+        try:
+            argument_value = int(argument)
+        except ValueError:
+            argument_value = 0
+        if argument_value < 1:
+            raise argparse.ArgumentTypeError(
+                f"Value '{argument}' is not a positive integer."
+            )
+        return argument_value
+
+    @staticmethod
+    def __validate_positive_number(argument: str) -> float:
+        try:
+            argument_value = float(argument)
+        except ValueError:
+            argument_value = 0.0
+        if not argument_value > 0.0:
+            raise argparse.ArgumentTypeError(
+                f"Value '{argument}' is not a positive number."
+            )
+        return argument_value
+
+    def handle_argparse_subparser(self, args: argparse.Namespace) -> ApplicationResult:
+        """
+        Handle the bench command.
+        """
+        baseline_results: Optional[BenchmarkResults] = None
+        if args.bench_compare_file:
+            baseline_results = self.__load_baseline_results(args.bench_compare_file)
+            if baseline_results is None:
+                return ApplicationResult.SYSTEM_ERROR
+
+        corpus_names = args.bench_corpora or BenchmarkCorpora.corpus_names()
+        benchmark_results: BenchmarkResults = {
+            "version": BenchmarkHelper.results_format_version,
+            "pymarkdown_version": __version__,
+            "python_version": platform.python_version(),
+            "scale": args.bench_scale,
+            "repeat": args.bench_repeat,
+            "corpora": {
+                next_corpus_name: self.__measure_corpus(
+                    args,
+                    BenchmarkCorpora.create_corpus(next_corpus_name, args.bench_scale),
+                )
+                for next_corpus_name in corpus_names
+            },
+        }
+
+        if args.bench_output_file:
+            with open(
+                args.bench_output_file, "wt", encoding="utf-8", newline="\n"
+            ) as output_file:
+                json.dump(benchmark_results, output_file, indent=2)
+                output_file.write(ParserHelper.newline_character)
+
+        self.__print_results(benchmark_results, baseline_results)
+        if baseline_results is not None and self.__report_regressions(
+            benchmark_results, baseline_results, args.bench_threshold
+        ):
+            return ApplicationResult.SCAN_TRIGGERED_AT_LEAST_ONCE
+        return ApplicationResult.SUCCESS
+
+    def __load_baseline_results(self, baseline_file: str) -> Optional[BenchmarkResults]:
+        try:
+            with open(baseline_file, "rt", encoding="utf-8") as input_file:
+                baseline_results = json.load(input_file)
+        except (OSError, ValueError) as this_exception:
+            self.__presentation.print_system_error(
+                f"Unable to load the benchmark results to compare against from '{baseline_file}': {this_exception}"
+            )
+            return None
+        if (
+            not isinstance(baseline_results, dict)
+            or baseline_results.get("version") != BenchmarkHelper.results_format_version
+            or not isinstance(baseline_results.get("corpora"), dict)
+        ):
+            self.__presentation.print_system_error(
+                f"File '{baseline_file}' does not contain benchmark results that can be compared against."
+            )
+            return None
+        return baseline_results
+
+    def __measure_corpus(
+        self, args: argparse.Namespace, benchmark_corpus: BenchmarkCorpus
+    ) -> Dict[str, Any]:
+        LOGGER.info("Measuring corpus '%s'.", benchmark_corpus.corpus_name)
+
+        corpus_args = argparse.Namespace(**vars(args))
+        corpus_args.enable_extensions = ",".join(
+            ([args.enable_extensions] if args.enable_extensions else [])
+            + benchmark_corpus.required_extensions
+        )
+        scan_helper, _ = FileScanHelper.create_recording_scan_helper(
+            corpus_args, self.__properties, self.__show_stack_trace
+        )
+        phase_timer = PhaseTimer()
+        scan_helper.set_phase_timer(phase_timer)
+
+        corpus_results: Dict[str, Any] = {
+            "documents": len(benchmark_corpus.documents),
+            "lines": benchmark_corpus.line_count,
+            "bytes": sum(
+                len(next_document.encode("utf-8"))
+                for next_document in benchmark_corpus.documents
+            ),
+            BenchmarkHelper.scan_operation: BenchmarkHelper.__measure_operation(
+                args.bench_repeat,
+                benchmark_corpus,
+                phase_timer,
+                scan_helper.scan_single_string,
+            ),
+        }
+        if not args.bench_skip_fix:
+            corpus_results[BenchmarkHelper.fix_operation] = (
+                BenchmarkHelper.__measure_operation(
+                    args.bench_repeat,
+                    benchmark_corpus,
+                    phase_timer,
+                    scan_helper.fix_single_string,
+                )
+            )
+        return corpus_results
+
+    @staticmethod
+    def __measure_operation(
+        repeat_count: int,
+        benchmark_corpus: BenchmarkCorpus,
+        phase_timer: PhaseTimer,
+        operation_function: Callable[[str, str], Any],
+    ) -> Dict[str, Any]:
+        return min(
+            (
+                BenchmarkHelper.__measure_operation_once(
+                    benchmark_corpus, phase_timer, operation_function
+                )
+                for _ in range(repeat_count)
+            ),
+            key=lambda operation_results: float(operation_results["seconds"]),
+        )
+
+    @staticmethod
+    def __measure_operation_once(
+        benchmark_corpus: BenchmarkCorpus,
+        phase_timer: PhaseTimer,
+        operation_function: Callable[[str, str], Any],
+    ) -> Dict[str, Any]:
+        phase_timer.reset()
+        error_count = 0
+        start_time = time.perf_counter()
+        for document_index, next_document in enumerate(benchmark_corpus.documents):
+            try:
+                operation_function(
+                    next_document,
+                    f"{benchmark_corpus.corpus_name}-{document_index}",
+                )
+            except (BadPluginError, BadTokenizationError) as this_exception:
+                LOGGER.warning(
+                    "Document %d of corpus '%s' reported an error: %s",
+                    document_index,
+                    benchmark_corpus.corpus_name,
+                    this_exception,
+                )
+                error_count += 1
+        return {
+            "seconds": time.perf_counter() - start_time,
+            "errors": error_count,
+            "phases": phase_timer.elapsed_times,
+        }
+
+    def __print_results(
+        self,
+        benchmark_results: BenchmarkResults,
+        baseline_results: Optional[BenchmarkResults],
+    ) -> None:
+        headers = ["corpus", "operation", "phase", "seconds"]
+        if baseline_results is not None:
+            headers.extend(["baseline", "change"])
+        show_rows: List[List[str]] = []
+        for corpus_name, corpus_results in benchmark_results["corpora"].items():
+            for operation_name in (
+                BenchmarkHelper.scan_operation,
+                BenchmarkHelper.fix_operation,
+            ):
+                if operation_name in corpus_results:
+                    BenchmarkHelper.__add_rows_for_operation(
+                        show_rows,
+                        corpus_name,
+                        operation_name,
+                        corpus_results[operation_name],
+                        baseline_results,
+                    )
+
+        table = columnar(show_rows, headers, no_borders=True)
+        split_rows = table.split(ParserHelper.newline_character)
+        new_rows = [next_row.rstrip() for next_row in split_rows]
+        self.__presentation.print_system_output(
+            ParserHelper.newline_character.join(new_rows)
+        )
+
+    @staticmethod
+    def __add_rows_for_operation(
+        show_rows: List[List[str]],
+        corpus_name: str,
+        operation_name: str,
+        operation_results: Dict[str, Any],
+        baseline_results: Optional[BenchmarkResults],
+    ) -> None:
+        baseline_operation = BenchmarkHelper.__find_baseline_operation(
+            baseline_results, corpus_name, operation_name
+        )
+        phase_times = {"total": operation_results["seconds"]}
+        phase_times.update(operation_results["phases"])
+        for phase_name, phase_time in phase_times.items():
+            display_row = [
+                corpus_name,
+                operation_name,
+                phase_name,
+                f"{phase_time:.3f}",
+            ]
+            if baseline_results is not None:
+                display_row.extend(
+                    BenchmarkHelper.__compare_phase_time(
+                        baseline_operation, phase_name, phase_time
+                    )
+                )
+            show_rows.append(display_row)
+
+    @staticmethod
+    def __find_baseline_operation(
+        baseline_results: Optional[BenchmarkResults],
+        corpus_name: str,
+        operation_name: str,
+    ) -> Optional[Dict[str, Any]]:
+        if baseline_results is None:
+            return None
+        baseline_corpus = baseline_results["corpora"].get(corpus_name)
+        if not isinstance(baseline_corpus, dict):
+            return None
+        baseline_operation = baseline_corpus.get(operation_name)
+        return baseline_operation if isinstance(baseline_operation, dict) else None
+
+    @staticmethod
+    def __compare_phase_time(
+        baseline_operation: Optional[Dict[str, Any]],
+        phase_name: str,
+        phase_time: float,
+    ) -> List[str]:
+        baseline_time: Optional[float] = None
+        if baseline_operation is not None:
+            baseline_time = (
+                baseline_operation.get("seconds")
+                if phase_name == "total"
+                else baseline_operation.get("phases", {}).get(phase_name)
+            )
+        if not baseline_time:
+            return ["", ""]
+        return [
+            f"{baseline_time:.3f}",
+            f"{(phase_time - baseline_time) * 100.0 / baseline_time:+.1f}%",
+        ]
+
+    def __report_regressions(
+        self,
+        benchmark_results: BenchmarkResults,
+        baseline_results: BenchmarkResults,
+        threshold_percentage: float,
+    ) -> bool:
+        found_regression = False
+        for corpus_name, corpus_results in benchmark_results["corpora"].items():
+            for operation_name in (
+                BenchmarkHelper.scan_operation,
+                BenchmarkHelper.fix_operation,
+            ):
+                baseline_operation = BenchmarkHelper.__find_baseline_operation(
+                    baseline_results, corpus_name, operation_name
+                )
+                if operation_name not in corpus_results or not baseline_operation:
+                    continue
+                current_time = corpus_results[operation_name]["seconds"]
+                baseline_time = baseline_operation.get("seconds")
+                if baseline_time and current_time > baseline_time * (
+                    1.0 + threshold_percentage / 100.0
+                ):
+                    self.__presentation.print_system_error(
+                        f"Regression: {operation_name} of corpus '{corpus_name}' took {current_time:.3f} seconds, "
+                        + f"{(current_time - baseline_time) * 100.0 / baseline_time:.1f}% slower than "
+                        + f"the {baseline_time:.3f} seconds it was compared against."
+                    )
+                    found_regression = True
+        return found_regression
@@ -915,9 +915,9 @@ class BlockQuoteCountHelper:
             adjust_current_block_quote,
             last_bq_index,
         )
-        POGGER.debug(f">>>>>stack_increase_needed:{stack_increase_needed}")
-        POGGER.debug(f">>>>>stack_decrease_needed:{stack_decrease_needed}")
-        POGGER.debug(f">>>>>adjust_current_block_quote:{adjust_current_block_quote}")
+        POGGER.debug(">>>>>stack_increase_needed:$", stack_increase_needed)
+        POGGER.debug(">>>>>stack_decrease_needed:$", stack_decrease_needed)
+        POGGER.debug(">>>>>adjust_current_block_quote:$", adjust_current_block_quote)
         POGGER.debug(
             ">>block_quote_data.current_count>>$",
             block_quote_data.current_count,
@@ -930,10 +930,10 @@ class BlockQuoteCountHelper:
             and adjust_current_block_quote
         )
         if force_list_continuation:
-            POGGER.debug(f">>>>>last_bq_index:{last_bq_index}")
-            POGGER.debug(f">>>>>parser_state.token_stack:{parser_state.token_stack}")
+            POGGER.debug(">>>>>last_bq_index:$", last_bq_index)
+            POGGER.debug(">>>>>parser_state.token_stack:$", parser_state.token_stack)
             POGGER.debug(
-                f">>>>>len(parser_state.token_stack):{len(parser_state.token_stack)}"
+                ">>>>>len(parser_state.token_stack):$", len(parser_state.token_stack)
             )
             force_list_continuation = (
                 last_bq_index + 1 < len(parser_state.token_stack)
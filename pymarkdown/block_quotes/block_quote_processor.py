@@ -819,7 +819,7 @@ class BlockQuoteProcessor:
                         avoid_block_starts,
                     )
                 except ValueError as this_exception:
-                    POGGER.debug(f"escaped special handling due to: {this_exception}")
+                    POGGER.debug("escaped special handling due to: $", this_exception)
 
         return BlockQuoteProcessor.__handlers(
             process_fenced_block,
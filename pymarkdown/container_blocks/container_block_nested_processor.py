@@ -333,7 +333,7 @@ class ContainerBlockNestedProcessor:
         POGGER.debug("__calculate_nested_removed_text")
         POGGER.debug(
             "__cnrt->token_doc($)",
-            ParserHelper.make_value_visible(parser_state.token_document),
+            parser_state.token_document,
         )
         if previous_document_length != len(parser_state.token_document):
             POGGER.debug(
@@ -592,7 +592,9 @@ class ContainerBlockNestedProcessor:
             ListStartMarkdownToken,
             parser_state.nested_list_start.matching_markdown_token,
         )
-        list_start_token_index = parser_state.token_document.index(mmt_list)
+        list_start_token_index = parser_state.find_matching_markdown_token_index(
+            parser_state.nested_list_start
+        )
         POGGER.debug(
             "list_start_token_index>>$<<",
             list_start_token_index,
@@ -4,7 +4,6 @@ Module to provide processing for the container blocks.
 
 from __future__ import annotations
 
-import copy
 import logging
 from typing import TYPE_CHECKING, List, Optional, Tuple, cast
 
@@ -25,7 +24,7 @@ from pymarkdown.general.requeue_line_info import RequeueLineInfo
 from pymarkdown.general.tab_helper import TabHelper
 from pymarkdown.tokens.block_quote_markdown_token import BlockQuoteMarkdownToken
 from pymarkdown.tokens.list_start_markdown_token import ListStartMarkdownToken
-from pymarkdown.tokens.markdown_token import EndMarkdownToken, MarkdownToken
+from pymarkdown.tokens.markdown_token import MarkdownToken
 
 if TYPE_CHECKING:  # pragma: no cover
     from pymarkdown.container_blocks.parse_block_pass_properties import (
@@ -251,16 +250,7 @@ class ContainerBlockProcessor:
                 position_marker.index_indent,
             )
 
-        parser_state.mark_start_information(position_marker)
-
-        parser_state.copy_of_token_stack = []
-        parser_state.copy_of_token_stack.extend(parser_state.token_stack)
-
-        parser_state.block_copy = [
-            copy.deepcopy(i.matching_markdown_token)
-            for i in parser_state.token_stack
-            if not i.is_document
-        ]
+        parser_state.mark_start_of_line(position_marker)
 
         return position_marker
 
@@ -322,20 +312,25 @@ class ContainerBlockProcessor:
     def __look_back_in_document_for_block_quote(
         parser_state: ParserState, token_index: int
     ) -> Optional[BlockQuoteMarkdownToken]:
-        # Option? Look back on stack instead?
-        other_block_quote_token, other_token_index = None, token_index
-        while other_token_index >= 0:
-            if parser_state.token_document[other_token_index].is_block_quote_start:
-                block_quote_token = cast(
-                    BlockQuoteMarkdownToken,
-                    parser_state.token_document[other_token_index],
+        # As a block quote that has not ended is still on the stack, the last block
+        # quote in the document that has not ended is found on the stack, instead of
+        # looking back through the document.
+        other_block_quote_token: Optional[BlockQuoteMarkdownToken] = None
+        other_token_index = -1
+        for stack_token in parser_state.token_stack:
+            if not stack_token.is_block_quote:
+                continue
+            try:
+                block_quote_index = parser_state.find_matching_markdown_token_index(
+                    stack_token
+                )
+            except ValueError:
+                continue
+            if other_token_index < block_quote_index <= token_index:
+                other_block_quote_token = cast(
+                    BlockQuoteMarkdownToken, stack_token.matching_markdown_token
                 )
-                if not ContainerBlockProcessor.__does_block_quote_token_have_end(
-                    parser_state, block_quote_token
-                ):
-                    other_block_quote_token = block_quote_token
-                    break
-            other_token_index -= 1
+                other_token_index = block_quote_index
         POGGER.debug_with_visible_whitespace(
             "PLFCB>>other_block_quote_token>>$",
             other_block_quote_token,
@@ -401,25 +396,16 @@ class ContainerBlockProcessor:
         ), "If we are processing a block quote, need a token."
         POGGER.debug(
             "PLFCB>>found_block_quote_token>>:$:",
-            ParserHelper.make_value_visible(found_block_quote_token),
+            found_block_quote_token,
         )
-        found_token_index = parser_state.token_document.index(found_block_quote_token)
-        POGGER.debug("PLFCB>>found_token_index>>:$:", found_token_index)
-        found_token_index += 1
-        while found_token_index < len(parser_state.token_document):
-            if parser_state.token_document[found_token_index].is_end_token:
-                end_token = cast(
-                    EndMarkdownToken, parser_state.token_document[found_token_index]
-                )
-                if end_token.start_markdown_token == found_block_quote_token:
-                    break
-            found_token_index += 1
-        POGGER.debug(
-            "PLFCB>>found_token_index>>:$:max:$",
-            found_token_index,
-            len(parser_state.token_document),
+
+        # The end token for a block quote is added to the document when its stack
+        # token is removed from the stack, so there is no need to search the rest
+        # of the document for that end token.
+        return not any(
+            stack_token.matching_markdown_token is found_block_quote_token
+            for stack_token in parser_state.token_stack
         )
-        return found_token_index < len(parser_state.token_document)
 
     @staticmethod
     def __calculate_adjusted_whitespace_kludge(
@@ -444,10 +430,7 @@ class ContainerBlockProcessor:
         ):
             found_block_quote_token = None
         if found_block_quote_token:
-            POGGER.debug(
-                "PLFCB>>found_block_quote_token>>:$:",
-                ParserHelper.make_value_visible(found_block_quote_token),
-            )
+            POGGER.debug("PLFCB>>found_block_quote_token>>:$:", found_block_quote_token)
             leading_spaces = found_block_quote_token.calculate_next_bleading_space_part(
                 increment_index=False, delta=-1, allow_overflow=True
             )
@@ -496,10 +479,7 @@ class ContainerBlockProcessor:
             parser_state.token_document[token_index],
         )
 
-        POGGER.debug(
-            "CAW>>found_block_quote_token>>:$:",
-            ParserHelper.make_value_visible(found_block_quote_token),
-        )
+        POGGER.debug("CAW>>found_block_quote_token>>:$:", found_block_quote_token)
         if found_block_quote_token:
             POGGER.debug(
                 "PLFCB>>leading_text_index>>$",
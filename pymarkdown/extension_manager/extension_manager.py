@@ -3,6 +3,8 @@ Module to provide classes to deal with extensions.
 """
 
 import argparse
+import hashlib
+import json
 import logging
 import re
 from typing import Dict, List, Optional, Set, Tuple
@@ -65,6 +67,7 @@ class ExtensionManager:
         self.__is_strike_through_enabled: bool = False
         self.__is_extended_autolinks_enabled: bool = False
         self.__is_tables_enabled: bool = False
+        self.__configuration_fingerprint = ""
 
     def initialize(
         self,
@@ -162,6 +165,28 @@ class ExtensionManager:
         self.__is_tables_enabled = (
             MarkdownTablesExtension().get_identifier() in self.__enabled_extensions
         )
+        self.__configuration_fingerprint = self.__calculate_configuration_fingerprint()
+
+    def __calculate_configuration_fingerprint(self) -> str:
+        extension_properties: Dict[str, str] = {}
+        if self.__properties is not None:
+            extension_properties = {
+                property_name: repr(
+                    self.__properties.get_property(property_name, object)
+                )
+                for property_name in self.__properties.property_names_under(
+                    ExtensionManager.__extensions_prefix
+                )
+            }
+        return hashlib.sha256(
+            json.dumps(
+                {
+                    "enabled_extensions": self.__enabled_extensions,
+                    "extension_properties": extension_properties,
+                },
+                sort_keys=True,
+            ).encode("utf-8")
+        ).hexdigest()
 
     def get_extension_instance(self, extension_id: str) -> ParserExtension:
         """
@@ -169,6 +194,14 @@ class ExtensionManager:
         """
         return self.__extension_objects[extension_id]
 
+    @property
+    def configuration_fingerprint(self) -> str:
+        """
+        Fingerprint of the enabled extensions and their configuration, which
+        changes if any configuration that affects tokenizing changes.
+        """
+        return self.__configuration_fingerprint
+
     @property
     def is_front_matter_enabled(self) -> bool:
         """
@@ -5,6 +5,8 @@ Module to provide for a leaf element that can be added to markdown parsing strea
 import logging
 from typing import Dict, List, Optional, Tuple, cast
 
+from typing_extensions import override
+
 from pymarkdown.general.parser_helper import ParserHelper
 from pymarkdown.general.parser_logger import ParserLogger
 from pymarkdown.general.position_marker import PositionMarker
@@ -26,6 +28,13 @@ class FrontMatterMarkdownToken(LeafMarkdownToken):
     Class to provide for an encapsulation of the front matter data.
     """
 
+    __slots__ = (
+        "__collected_lines",
+        "__end_boundary_line",
+        "__matter_map",
+        "__start_boundary_line",
+    )
+
     # pylint: disable=too-many-arguments
     def __init__(
         self,
@@ -50,7 +59,6 @@ class FrontMatterMarkdownToken(LeafMarkdownToken):
             position_marker=position_marker,
             is_extension=True,
         )
-        self.__compose_extra_data_field()
 
     # pylint: enable=too-many-arguments
     # pylint: disable=protected-access
@@ -91,19 +99,18 @@ class FrontMatterMarkdownToken(LeafMarkdownToken):
         """
         return self.__matter_map
 
-    def __compose_extra_data_field(self) -> None:
+    @override
+    def _compose_extra_data_field(self) -> str:
         """
         Compose the object's self.extra_data field from the local object's variables.
         """
-        self._set_extra_data(
-            MarkdownToken.extra_data_separator.join(
-                [
-                    self.__start_boundary_line,
-                    self.__end_boundary_line,
-                    str(self.__collected_lines),
-                    str(self.__matter_map),
-                ]
-            )
+        return MarkdownToken.extra_data_separator.join(
+            [
+                self.__start_boundary_line,
+                self.__end_boundary_line,
+                str(self.__collected_lines),
+                str(self.__matter_map),
+            ]
         )
 
     @classmethod
@@ -166,15 +173,12 @@ class FrontMatterMarkdownToken(LeafMarkdownToken):
 
     @staticmethod
     def __handle_front_matter_token(
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str:
+    ) -> None:
         """
         Handle the front matter token.  Note that it does not contribute anything
         at all to the HTML output.
         """
         _ = (next_token, transform_state, output_parts)
-
-        return output_html
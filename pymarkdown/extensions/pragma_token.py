@@ -6,7 +6,7 @@ import logging
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Set, Tuple
 
-from typing_extensions import Protocol
+from typing_extensions import Protocol, override
 
 from pymarkdown.container_blocks.parse_block_pass_properties import (
     ParseBlockPassProperties,
@@ -496,6 +496,8 @@ class PragmaToken(MarkdownToken):
     Token that contains the pragmas for the document.
     """
 
+    __slots__ = ("__pragma_lines",)
+
     pragma_prefix = "<!--"
     pragma_alternate_prefix = "<!---"
     pragma_title = "pyml "
@@ -515,9 +517,9 @@ class PragmaToken(MarkdownToken):
             is_extension=True,
             extra_data="",
         )
-        self.__compose_extra_data_field()
 
-    def __compose_extra_data_field(self) -> None:
+    @override
+    def _compose_extra_data_field(self) -> str:
         """
         Compose the object's self.extra_data field from the local object's variables.
         """
@@ -525,7 +527,7 @@ class PragmaToken(MarkdownToken):
             f";{next_line_number}:{self.__pragma_lines[next_line_number]}"
             for next_line_number in self.__pragma_lines
         )
-        self._set_extra_data(serialized_pragmas[1:])
+        return serialized_pragmas[1:]
 
     @staticmethod
     def get_markdown_token_type() -> str:
@@ -548,7 +550,6 @@ class PragmaToken(MarkdownToken):
         old_pragma = self.__pragma_lines[initial_line_number]
         del self.__pragma_lines[initial_line_number]
         self.__pragma_lines[new_line_number] = old_pragma
-        self.__compose_extra_data_field()
 
     def register_for_markdown_transform(
         self,
@@ -578,11 +579,8 @@ class PragmaToken(MarkdownToken):
 
     @staticmethod
     def __handle_pragma_token(
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str:
+    ) -> None:
         _ = (transform_state, next_token, output_parts)
-
-        return output_html
@@ -61,6 +61,8 @@ class TaskListToken(InlineMarkdownToken):
     Token that contains the pragmas for the document.
     """
 
+    __slots__ = ("__checked_character",)
+
     def __init__(
         self,
         checked_character: str,
@@ -140,11 +142,10 @@ class TaskListToken(InlineMarkdownToken):
 
     @staticmethod
     def __handle_task_list_token(
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str:
+    ) -> None:
         _ = (transform_state, next_token)
 
         task_list_token = cast(TaskListToken, next_token)
@@ -155,16 +156,3 @@ class TaskListToken(InlineMarkdownToken):
         attributes_map["type"] = "checkbox"
 
         output_parts.append(HtmlOpenTagItem("input", attributes_map))
-
-        return TaskListToken.__handle_task_list_token_old(output_html, task_list_token)
-
-    @staticmethod
-    def __handle_task_list_token_old(
-        output_html: str, task_list_token: "TaskListToken"
-    ) -> str:
-        if task_list_token.checked_character == " ":
-            xx = '<input type="checkbox">'
-        else:
-            xx = '<input checked="" type="checkbox">'
-
-        return output_html + xx
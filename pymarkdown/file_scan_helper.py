@@ -4,26 +4,54 @@ for the application.
 """
 
 import argparse
+import contextlib
 import copy
+import io
 import logging
 import os
 import shutil
 import sys
 import tempfile
-from typing import Callable, Dict, List, Optional, Set, Tuple, Union, cast
+from typing import (
+    Callable,
+    ContextManager,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
 from application_file_scanner import ApplicationFileScanner
 from application_properties import ApplicationProperties
 from py_walk import get_parser_from_list
 from py_walk.models import Parser
 
+from pymarkdown.extension_manager.extension_manager import ExtensionManager
 from pymarkdown.extensions.pragma_token import PragmaToken
 from pymarkdown.general.bad_tokenization_error import BadTokenizationError
+from pymarkdown.general.incremental_tokenizer import (
+    IncrementalTokenization,
+    IncrementalTokenizer,
+)
 from pymarkdown.general.main_presentation import MainPresentation
 from pymarkdown.general.parser_helper import ParserHelper
 from pymarkdown.general.parser_logger import ParserLogger
-from pymarkdown.general.source_providers import FileSourceProvider
+from pymarkdown.general.phase_timer import PhaseTimer
+from pymarkdown.general.source_providers import (
+    InMemorySourceProvider,
+    ResettableSourceProvider,
+)
+from pymarkdown.general.token_stream_cache import TokenStreamCache
 from pymarkdown.general.tokenized_markdown import TokenizedMarkdown
+from pymarkdown.html_render_helper import HtmlRenderHelper
+from pymarkdown.parallel_scan_helper import (
+    ParallelScanHelper,
+    RecordingPresentation,
+    WorkerScanResult,
+)
 from pymarkdown.plugin_manager.bad_plugin_error import BadPluginError
 from pymarkdown.plugin_manager.bad_plugin_fix_error import BadPluginFixError
 from pymarkdown.plugin_manager.fix_line_record import FixLineRecord
@@ -31,8 +59,14 @@ from pymarkdown.plugin_manager.fix_token_record import FixTokenRecord
 from pymarkdown.plugin_manager.found_plugin import FoundPlugin
 from pymarkdown.plugin_manager.plugin_manager import PluginManager
 from pymarkdown.plugin_manager.plugin_scan_context import PluginScanContext
+from pymarkdown.plugin_manager.plugin_scan_failure import (
+    PluginScanFailure,
+    RecordedScanEvent,
+)
 from pymarkdown.plugin_manager.replace_tokens_record import ReplaceTokensRecord
 from pymarkdown.return_code_helper import ApplicationResult, ReturnCodeHelper
+from pymarkdown.scan_result_cache import ScanResultCache
+from pymarkdown.structured_output_presentation import StructuredOutputPresentation
 from pymarkdown.tokens.markdown_token import MarkdownToken
 from pymarkdown.transform_markdown.transform_to_markdown import TransformToMarkdown
 
@@ -52,6 +86,10 @@ class FileScanHelper:
     __stdin_scan_subcommand = "scan-stdin"
     __normal_fix_subcommand = "fix"
 
+    __worker_scan_helper: Optional["FileScanHelper"] = None
+    __worker_presentation: Optional[RecordingPresentation] = None
+    __worker_phase_timer: Optional[PhaseTimer] = None
+
     # pylint: disable=too-many-arguments
     def __init__(
         self,
@@ -73,9 +111,41 @@ class FileScanHelper:
         self.__continue_on_error = False
         self.__properties = properties
         self.__per_file_ignores_list: List[Tuple[Parser, Set[str]]] = []
+        self.__phase_timer: Optional[PhaseTimer] = None
+        self.__html_renderer: Optional[HtmlRenderHelper] = None
+        self.__token_cache: Optional[TokenStreamCache] = None
 
     # pylint: enable=too-many-arguments
 
+    def set_phase_timer(self, phase_timer: Optional[PhaseTimer]) -> None:
+        """
+        Set the timer used to measure the time taken by each phase of scanning and
+        fixing, including the phases of tokenizing, or None to stop measuring.
+        """
+        self.__phase_timer = phase_timer
+        self.__tokenizer.set_phase_timer(phase_timer)
+
+    def set_html_renderer(self, html_renderer: Optional[HtmlRenderHelper]) -> None:
+        """
+        Set the helper used to render the tokens for any scanned file into HTML, or
+        None to stop rendering.
+        """
+        self.__html_renderer = html_renderer
+
+    def set_token_cache(self, token_cache: Optional[TokenStreamCache]) -> None:
+        """
+        Set the cache used to reuse the tokens for any contents that were already
+        tokenized, or None to tokenize the contents every time.
+        """
+        self.__token_cache = token_cache
+
+    def __measure_phase(self, phase_name: str) -> ContextManager[None]:
+        return (
+            self.__phase_timer.measure(phase_name)
+            if self.__phase_timer
+            else contextlib.nullcontext()
+        )
+
     def process_files_to_scan(
         self,
         args: argparse.Namespace,
@@ -102,34 +172,267 @@ class FileScanHelper:
             self.__process_per_file_ignores()
 
             POGGER.debug("Scanning from: $", files_to_scan)
+            if not in_fix_mode:
+                return (
+                    False,
+                    self.__scan_files(args, files_to_scan),
+                    False,
+                )
+
+            # Each pass over a file being fixed tokenizes its contents, which are
+            # often the same as the contents tokenized by the previous pass.
+            if self.__token_cache is None:
+                self.__token_cache = TokenStreamCache()
             is_first_file = True
             for next_file in files_to_scan:
                 per_file_disabled_identifiers = (
-                    self.__check_file_name_against_per_file_disabled_identifiers(
+                    self.check_file_name_against_per_file_disabled_identifiers(
                         next_file
                     )
                 )
-                if in_fix_mode:
-                    did_succeed, did_fix_any_file, did_attempt_at_least_one_fix = (
-                        self.__fix_specific_file(
-                            is_first_file,
-                            next_file,
-                            args,
-                            per_file_disabled_identifiers,
-                            did_fix_any_file,
-                        )
-                    )
-                    if did_attempt_at_least_one_fix:
-                        return False, False, True
-                else:
-                    did_succeed = self.__scan_specific_file(
-                        next_file, next_file, per_file_disabled_identifiers
+                did_succeed, did_fix_any_file, did_attempt_at_least_one_fix = (
+                    self.__fix_specific_file(
+                        is_first_file,
+                        next_file,
+                        args,
+                        per_file_disabled_identifiers,
+                        did_fix_any_file,
                     )
+                )
+                if did_attempt_at_least_one_fix:
+                    return False, False, True
                 is_first_file = False
                 if not did_succeed:
                     did_fail_any_file = True
         return did_fix_any_file, did_fail_any_file, False
 
+    def __scan_files(self, args: argparse.Namespace, files_to_scan: List[str]) -> bool:
+        scan_cache = ScanResultCache.create_if_enabled(
+            args, self.__properties, self.__plugins
+        )
+        self.__html_renderer = HtmlRenderHelper.create_if_enabled(
+            args, self.__properties, files_to_scan
+        )
+        try:
+            if args.scan_jobs > 1 and len(files_to_scan) > 1:
+                return self.__scan_files_in_parallel(args, files_to_scan, scan_cache)
+
+            did_fail_any_file = False
+            for next_file in files_to_scan:
+                per_file_disabled_identifiers = (
+                    self.check_file_name_against_per_file_disabled_identifiers(
+                        next_file
+                    )
+                )
+                file_key = (
+                    scan_cache.calculate_file_key(
+                        next_file, per_file_disabled_identifiers
+                    )
+                    if scan_cache
+                    else None
+                )
+                render_key = self.__calculate_render_key(next_file)
+                cached_events = (
+                    scan_cache.load(file_key) if scan_cache and file_key else None
+                )
+                if cached_events is not None:
+                    self.__replay_cached_events(cached_events)
+                    if render_key is not None:
+                        self.__render_specific_file(next_file, render_key)
+                    continue
+                if self.__scan_specific_file_and_cache(
+                    next_file,
+                    per_file_disabled_identifiers,
+                    scan_cache,
+                    file_key,
+                    render_key is not None,
+                ):
+                    self.__record_rendered_file(next_file, render_key)
+                else:
+                    did_fail_any_file = True
+            return did_fail_any_file
+        finally:
+            if scan_cache:
+                scan_cache.close()
+            if self.__html_renderer:
+                self.__html_renderer.close()
+                self.__html_renderer = None
+
+    def __calculate_render_key(self, next_file: str) -> Optional[str]:
+        """
+        Calculate the key used to render the file into HTML, returning None if
+        the file does not need to be rendered.
+        """
+        if not self.__html_renderer:
+            return None
+        render_key = self.__html_renderer.calculate_render_key(next_file) or ""
+        return (
+            None
+            if self.__html_renderer.is_rendered(next_file, render_key)
+            else render_key
+        )
+
+    def __record_rendered_file(self, next_file: str, render_key: Optional[str]) -> None:
+        if self.__html_renderer and render_key is not None:
+            self.__html_renderer.record_rendered(next_file, render_key)
+
+    def __render_specific_file(self, next_file: str, render_key: str) -> None:
+        """
+        Render a file whose scan results were cached, tokenizing it only to
+        produce its HTML.
+        """
+        assert self.__html_renderer is not None
+        with ResettableSourceProvider.from_file(next_file) as source_provider:
+            actual_tokens = self.__tokenizer.transform_from_provider(
+                source_provider, do_add_end_of_stream_token=True
+            )
+        self.__render_tokens(next_file, actual_tokens)
+        self.__record_rendered_file(next_file, render_key)
+
+    def __render_tokens(
+        self, next_file_name: str, actual_tokens: List[MarkdownToken]
+    ) -> None:
+        assert self.__html_renderer is not None
+        POGGER.info("Rendering file '$' into HTML.", next_file_name)
+        with self.__measure_phase(PhaseTimer.render_html_phase):
+            self.__html_renderer.render_tokens(next_file_name, actual_tokens)
+
+    # pylint: disable=too-many-arguments
+    def __scan_specific_file_and_cache(
+        self,
+        next_file: str,
+        per_file_disabled_identifiers: Set[str],
+        scan_cache: Optional[ScanResultCache],
+        file_key: Optional[str],
+        render_html: bool,
+    ) -> bool:
+        if not (scan_cache and file_key):
+            return self.__scan_specific_file(
+                next_file, next_file, per_file_disabled_identifiers, render_html
+            )
+
+        self.__plugins.start_recording_events()
+        try:
+            did_succeed = self.__scan_specific_file(
+                next_file, next_file, per_file_disabled_identifiers, render_html
+            )
+        finally:
+            recorded_events = self.__plugins.stop_recording_events()
+        if did_succeed:
+            scan_cache.store(file_key, recorded_events)
+        return did_succeed
+
+    # pylint: enable=too-many-arguments
+
+    def __replay_recorded_events(
+        self, recorded_events: List[RecordedScanEvent]
+    ) -> None:
+        for next_event in recorded_events:
+            if isinstance(next_event, PluginScanFailure):
+                self.__plugins.log_filtered_scan_failure(next_event)
+            else:
+                self.__plugins.log_pragma_failure(*next_event)
+
+    def __replay_cached_events(self, cached_events: List[RecordedScanEvent]) -> None:
+
+        # Files whose results are loaded from the cache are not scanned, so they
+        # are measured as a phase of their own to show that in any profile report.
+        with self.__measure_phase(PhaseTimer.scan_cache_replay_phase):
+            self.__replay_recorded_events(cached_events)
+
+    # pylint: disable=too-many-locals
+    def __scan_files_in_parallel(
+        self,
+        args: argparse.Namespace,
+        files_to_scan: List[str],
+        scan_cache: Optional[ScanResultCache],
+    ) -> bool:
+        files_with_identifiers: List[Tuple[str, Set[str], bool]] = []
+        file_keys: List[Optional[str]] = []
+        render_keys: List[Optional[str]] = []
+        cached_events: List[Optional[List[RecordedScanEvent]]] = []
+        for next_file in files_to_scan:
+            per_file_disabled_identifiers = (
+                self.check_file_name_against_per_file_disabled_identifiers(next_file)
+            )
+            render_key = self.__calculate_render_key(next_file)
+            render_keys.append(render_key)
+            files_with_identifiers.append(
+                (next_file, per_file_disabled_identifiers, render_key is not None)
+            )
+            file_key = (
+                scan_cache.calculate_file_key(next_file, per_file_disabled_identifiers)
+                if scan_cache
+                else None
+            )
+            file_keys.append(file_key)
+            cached_events.append(
+                scan_cache.load(file_key) if scan_cache and file_key else None
+            )
+        parallel_helper = ParallelScanHelper(
+            args.scan_jobs,
+            FileScanHelper.initialize_scan_worker,
+            (
+                args,
+                self.__properties,
+                self.__show_stack_trace,
+                self.__html_renderer,
+                self.__phase_timer is not None,
+            ),
+            FileScanHelper.scan_file_in_worker,
+        )
+
+        did_fail_any_file = False
+        with contextlib.closing(
+            parallel_helper.scan_files(
+                [
+                    next_file_with_identifiers
+                    for next_file_with_identifiers, next_cached_events in zip(
+                        files_with_identifiers, cached_events
+                    )
+                    if next_cached_events is None
+                ]
+            )
+        ) as scan_results:
+            for (
+                (next_file, per_file_disabled_identifiers, render_html),
+                file_key,
+                render_key,
+                recorded_events,
+            ) in zip(files_with_identifiers, file_keys, render_keys, cached_events):
+                if recorded_events is None:
+                    scan_result = next(scan_results)
+                    if scan_result is None:
+                        POGGER.info(
+                            "Worker was unable to scan file '$', rescanning.",
+                            next_file,
+                        )
+                        if self.__scan_specific_file_and_cache(
+                            next_file,
+                            per_file_disabled_identifiers,
+                            scan_cache,
+                            file_key,
+                            render_html,
+                        ):
+                            self.__record_rendered_file(next_file, render_key)
+                        else:
+                            did_fail_any_file = True
+                        continue
+                    recorded_events, phase_measurements = scan_result
+                    if self.__phase_timer and phase_measurements:
+                        self.__phase_timer.add_measurements(*phase_measurements)
+                    if scan_cache and file_key:
+                        scan_cache.store(file_key, recorded_events)
+                    self.__record_rendered_file(next_file, render_key)
+                    self.__replay_recorded_events(recorded_events)
+                    continue
+                if render_key is not None:
+                    self.__render_specific_file(next_file, render_key)
+                self.__replay_cached_events(recorded_events)
+        return did_fail_any_file
+
+    # pylint: enable=too-many-locals
+
     # pylint: disable=too-many-arguments
     def __fix_specific_file(
         self,
@@ -161,9 +464,13 @@ class FileScanHelper:
 
     # pylint: enable=too-many-arguments
 
-    def __check_file_name_against_per_file_disabled_identifiers(
+    def check_file_name_against_per_file_disabled_identifiers(
         self, next_file_name: str
     ) -> Set[str]:
+        """
+        Determine the identifiers of the rules that are disabled for the specified
+        file by the `plugins.per-file-ignores` configuration.
+        """
 
         modified_next_file_name = os.path.abspath(next_file_name)
         modified_next_file_name = (
@@ -180,54 +487,280 @@ class FileScanHelper:
     def __scan_from_stdin(
         self, args: argparse.Namespace, string_to_scan: Optional[str]
     ) -> None:
-        temporary_file = None
-        scan_exception = None
         scan_id = "stdin" if string_to_scan is None else "in-memory"
         try:
             if args.x_test_stdin_fault:
                 raise IOError("made up")
+            source_text = string_to_scan or sys.stdin.read()
+        except IOError as this_exception:
+            try:
+                raise IOError(
+                    f"Contents of {scan_id} were not read ({this_exception})."
+                ) from this_exception
+            except IOError as wrapped_exception:
+                self.__handle_scan_error(scan_id, wrapped_exception)
+            return
+
+        # The contents are scanned from memory, translating any line endings in
+        # the same way that they are translated when a file is read.  As nothing
+        # was read from a file, the contents are scanned without any possible
+        # per-file disabled identifiers.
+        self.__scan_specific_file(
+            scan_id,
+            scan_id,
+            None,
+            source_text=io.StringIO(source_text, newline=None).read(),
+        )
 
-            with tempfile.NamedTemporaryFile(
-                "wt", delete=False, encoding="utf-8"
-            ) as outfile:
-                temporary_file = outfile.name
+    # pylint: disable=protected-access
+    @staticmethod
+    def initialize_scan_worker(
+        args: argparse.Namespace,
+        properties: ApplicationProperties,
+        show_stack_trace: bool,
+        html_renderer: Optional[HtmlRenderHelper] = None,
+        measure_phases: bool = False,
+    ) -> None:
+        """
+        Initialize a worker process with its own tokenizer and plugin manager,
+        recording any results instead of outputting them.  If a render helper is
+        provided, the worker renders the HTML for any file that it is asked to.  If
+        requested, the worker also measures the time taken by each phase of each
+        scan, handing those measurements back with the results.
+        """
+        (
+            FileScanHelper.__worker_scan_helper,
+            FileScanHelper.__worker_presentation,
+        ) = FileScanHelper.create_recording_scan_helper(
+            args, properties, show_stack_trace
+        )
+        FileScanHelper.__worker_scan_helper.set_html_renderer(html_renderer)
+        FileScanHelper.__worker_phase_timer = PhaseTimer() if measure_phases else None
+        FileScanHelper.__worker_scan_helper.set_phase_timer(
+            FileScanHelper.__worker_phase_timer
+        )
+        FileScanHelper.__worker_scan_helper.__plugins.set_phase_timer(
+            FileScanHelper.__worker_phase_timer
+        )
 
-                if string_to_scan:
-                    outfile.write(string_to_scan)
-                else:
-                    for line in sys.stdin:
-                        outfile.write(line)
+    # pylint: enable=protected-access
 
-            # As the temporary file is being used to capture the standard-in, the file needs to be
-            # scanned without any possible per-file disabled identifiers.
-            self.__scan_specific_file(temporary_file, scan_id, None)
+    # pylint: disable=protected-access
+    @staticmethod
+    def create_recording_scan_helper(
+        args: argparse.Namespace,
+        properties: ApplicationProperties,
+        show_stack_trace: bool,
+    ) -> Tuple["FileScanHelper", RecordingPresentation]:
+        """
+        Create a scan helper with its own tokenizer and plugin manager, recording any
+        results with the returned presentation instead of outputting them.  As the
+        rule plugins keep state for the file that they are scanning, the scan helper
+        must only be used by one thread at a time.
+        """
+        presentation = RecordingPresentation()
 
-        except IOError as this_exception:
-            scan_exception = this_exception
-        finally:
-            if temporary_file and os.path.exists(temporary_file):
-                os.remove(temporary_file)
+        plugin_dir = os.path.join(
+            os.path.dirname(os.path.realpath(__file__)), "plugins"
+        )
+        plugins = PluginManager(presentation)
+        plugins.initialize(
+            plugin_dir,
+            args.add_plugin,
+            args.enable_rules,
+            args.disable_rules,
+            properties,
+            show_stack_trace,
+            args.x_fix_debug,
+        )
+        plugins.apply_configuration(properties)
+
+        extensions = ExtensionManager(presentation)
+        extensions.initialize(properties)
+        extensions.apply_configuration(args.enable_extensions)
+
+        tokenizer = TokenizedMarkdown()
+        tokenizer.apply_configuration(properties, extensions)
+
+        scan_helper = FileScanHelper(
+            tokenizer,
+            plugins,
+            presentation,
+            show_stack_trace,
+            FileScanHelper.__handle_worker_error,
+            properties,
+        )
+        scan_helper.__process_per_file_ignores()
+        return scan_helper, presentation
 
-        if scan_exception:
-            try:
-                raise IOError(
-                    f"Temporary file to capture {scan_id} was not written ({scan_exception})."
-                ) from scan_exception
-            except IOError as this_exception:
-                self.__handle_scan_error(scan_id, this_exception)
+    # pylint: enable=protected-access
+
+    @staticmethod
+    def __handle_worker_error(
+        formatted_error: str,
+        thrown_error: Optional[Exception],
+        exit_on_error: bool = True,
+        print_prefix: str = "\n\n",
+    ) -> None:
+        _ = (thrown_error, exit_on_error, print_prefix)
+        raise AssertionError(
+            f"Errors are reported by the owner of the scan helper: {formatted_error}"
+        )
+
+    # pylint: disable=broad-exception-caught
+    @staticmethod
+    def scan_file_in_worker(
+        file_to_scan: Tuple[str, Set[str], bool],
+    ) -> Optional[WorkerScanResult]:
+        """
+        Scan a single file within a worker process, rendering it into HTML if
+        requested, and returning the recorded events along with any phase
+        measurements, or None if the file could not be scanned cleanly.
+        """
+        assert (
+            FileScanHelper.__worker_scan_helper is not None
+            and FileScanHelper.__worker_presentation is not None
+        ), "Worker must be initialized before scanning."
+
+        next_file, per_file_disabled_identifiers, render_html = file_to_scan
+        presentation = FileScanHelper.__worker_presentation
+        presentation.recorded_events = []
+        phase_timer = FileScanHelper.__worker_phase_timer
+        if phase_timer:
+            phase_timer.reset()
+        try:
+            FileScanHelper.__worker_scan_helper.scan_single_file(
+                next_file, per_file_disabled_identifiers, render_html
+            )
+        except Exception:
+            return None
+        return presentation.recorded_events, (
+            (phase_timer.elapsed_times, phase_timer.call_counts)
+            if phase_timer
+            else None
+        )
+
+    # pylint: enable=broad-exception-caught
+
+    def scan_single_file(
+        self,
+        next_file: str,
+        per_file_disabled_identifiers: Optional[Set[str]],
+        render_html: bool = False,
+    ) -> None:
+        """
+        Scan a single file, allowing any exceptions to be handled by the caller.  If
+        requested, the tokens for the file are also rendered into HTML using the
+        helper provided to `set_html_renderer`.
+        """
+        source_text = self.__read_file_for_token_cache(next_file)
+        with (
+            ResettableSourceProvider.from_file(next_file)
+            if source_text is None
+            else InMemorySourceProvider(source_text)
+        ) as source_provider:
+            self.__scan_file(
+                source_provider,
+                next_file,
+                per_file_disabled_identifiers,
+                render_html,
+                source_text,
+            )
+
+    def __read_file_for_token_cache(self, next_file: str) -> Optional[str]:
+
+        # The contents of the file are only needed to look up its tokens in the
+        # cache, and files large enough to be streamed are not kept in memory.
+        if (
+            self.__token_cache is None
+            or os.path.getsize(next_file)
+            >= ResettableSourceProvider.streaming_threshold_in_bytes
+        ):
+            return None
+        with open(next_file, encoding="utf-8") as file_to_parse:
+            return file_to_parse.read()
+
+    def scan_single_string(self, string_to_scan: str, scan_id: str) -> None:
+        """
+        Scan a single string, reported using the scan identifier in place of a file
+        name, allowing any exceptions to be handled by the caller.
+        """
+        with InMemorySourceProvider(string_to_scan) as source_provider:
+            self.__scan_file(source_provider, scan_id, None, source_text=string_to_scan)
+
+    def create_incremental_tokenizer(self) -> IncrementalTokenizer:
+        """
+        Create an incremental tokenizer that uses the same tokenizer as this helper.
+        """
+        return IncrementalTokenizer(self.__tokenizer)
+
+    @property
+    def enabled_rule_ids(self) -> Set[str]:
+        """
+        Get the identifiers of the rules that are enabled.
+        """
+        return {next_plugin.plugin_id for next_plugin in self.__plugins.enabled_plugins}
+
+    def find_rule_ids_affected_by_token_names(self, token_names: Set[str]) -> Set[str]:
+        """
+        Find the identifiers of the enabled rules whose results may change when
+        tokens with any of the specified names are added to or removed from a
+        document.
+        """
+        return {
+            next_plugin.plugin_id
+            for next_plugin in self.__plugins.find_plugins_affected_by_token_names(
+                token_names
+            )
+        }
+
+    def scan_single_tokenization(
+        self,
+        tokenization: IncrementalTokenization,
+        scan_id: str,
+        rule_ids_to_scan: Optional[Set[str]],
+    ) -> None:
+        """
+        Scan a document that was already tokenized, reported using the scan
+        identifier in place of a file name, allowing any exceptions to be handled by
+        the caller.  If specified, only the rules with the specified identifiers
+        are scanned with.
+        """
+        per_file_disabled_identifiers = (
+            None
+            if rule_ids_to_scan is None
+            else self.enabled_rule_ids - rule_ids_to_scan
+        )
+        with InMemorySourceProvider(tokenization.source_text) as source_provider:
+            self.__scan_file(
+                source_provider,
+                scan_id,
+                per_file_disabled_identifiers,
+                actual_tokens=tokenization.tokens,
+            )
 
     def __scan_specific_file(
         self,
         next_file: str,
         next_file_name: str,
         per_file_disabled_identifiers: Optional[Set[str]],
+        render_html: bool = False,
+        source_text: Optional[str] = None,
     ) -> bool:
 
         try:
-            source_provider = FileSourceProvider(next_file)
-            self.__scan_file(
-                source_provider, next_file_name, per_file_disabled_identifiers
-            )
+            with (
+                ResettableSourceProvider.from_file(next_file)
+                if source_text is None
+                else InMemorySourceProvider(source_text)
+            ) as source_provider:
+                self.__scan_file(
+                    source_provider,
+                    next_file_name,
+                    per_file_disabled_identifiers,
+                    render_html,
+                    source_text,
+                )
             return True
         except BadPluginError as this_exception:
             self.__handle_scan_error(next_file, this_exception, allow_shortcut=True)
@@ -237,14 +770,21 @@ class FileScanHelper:
             self.__handle_scan_error(next_file, this_exception, allow_shortcut=True)
         return False
 
+    # pylint: disable=too-many-arguments
     def __scan_file(
         self,
-        source_provider: FileSourceProvider,
+        source_provider: ResettableSourceProvider,
         next_file_name: str,
         per_file_disabled_identifiers: Optional[Set[str]],
+        render_html: bool = False,
+        source_text: Optional[str] = None,
+        actual_tokens: Optional[List[MarkdownToken]] = None,
     ) -> None:  # sourcery skip: extract-method
         """
-        Scan a given file and call the plugin manager for any significant events.
+        Scan a given file and call the plugin manager for any significant events,
+        rendering the same tokens into HTML if requested.  If the text provided by
+        the source provider is also supplied, its tokens may come from the cache.
+        If the tokens are supplied, they are used instead of tokenizing the file.
         """
 
         POGGER.info("Scanning file '$'.", next_file_name)
@@ -254,9 +794,14 @@ class FileScanHelper:
             POGGER.info("Starting file '$'.", next_file_name)
 
             POGGER.info("Scanning file '$' token-by-token.", next_file_name)
-            actual_tokens = self.__tokenizer.transform_from_provider(
-                source_provider, do_add_end_of_stream_token=True
-            )
+            if actual_tokens is None:
+                actual_tokens = (
+                    self.__tokenizer.transform_from_provider(
+                        source_provider, do_add_end_of_stream_token=True
+                    )
+                    if source_text is None
+                    else self.__tokenize_contents(source_text)
+                )
             context = self.__plugins.starting_new_file(
                 next_file_name, actual_tokens, per_file_disabled_identifiers
             )
@@ -269,6 +814,8 @@ class FileScanHelper:
                 actual_tokens,
                 per_file_disabled_identifiers,
             )
+            if render_html:
+                self.__render_tokens(next_file_name, actual_tokens)
 
             context.report_on_triggered_rules()
             POGGER.info("Ending file '$'.", next_file_name)
@@ -278,11 +825,26 @@ class FileScanHelper:
             POGGER.info("Ending file '$' with exception.", next_file_name)
             raise
 
+    # pylint: enable=too-many-arguments
+
+    def __tokenize_contents(self, file_contents: str) -> List[MarkdownToken]:
+        if self.__token_cache is None:
+            return self.__tokenizer.transform_from_provider(
+                InMemorySourceProvider(file_contents), do_add_end_of_stream_token=True
+            )
+        return self.__token_cache.get_tokens(
+            file_contents,
+            self.__tokenizer.configuration_fingerprint,
+            lambda: self.__tokenizer.transform_from_provider(
+                InMemorySourceProvider(file_contents), do_add_end_of_stream_token=True
+            ),
+        )
+
     # pylint: disable=too-many-arguments
     def __process_file_scan(
         self,
         context: PluginScanContext,
-        source_provider: FileSourceProvider,
+        source_provider: ResettableSourceProvider,
         next_file_name: str,
         actual_tokens: List[MarkdownToken],
         per_file_disabled_identifiers: Optional[Set[str]],
@@ -294,18 +856,20 @@ class FileScanHelper:
             actual_tokens = actual_tokens[:-1]
 
         POGGER.info("Scanning file '$' tokens.", next_file_name)
-        for next_token in actual_tokens:
-            POGGER.info("Processing token: $", next_token)
-            self.__plugins.next_token(
-                context, next_token, per_file_disabled_identifiers
-            )
+        with self.__measure_phase(PhaseTimer.plugin_tokens_phase):
+            for next_token in actual_tokens:
+                POGGER.info("Processing token: $", next_token)
+                self.__plugins.next_token(
+                    context, next_token, per_file_disabled_identifiers
+                )
 
         POGGER.info("Completed scanning tokens in file '$'.", next_file_name)
 
         POGGER.info("Scanning file '$' line-by-line.", next_file_name)
-        self.__process_lines_in_file(
-            source_provider, context, next_file_name, per_file_disabled_identifiers
-        )
+        with self.__measure_phase(PhaseTimer.plugin_lines_phase):
+            self.__process_lines_in_file(
+                source_provider, context, next_file_name, per_file_disabled_identifiers
+            )
 
     # pylint: enable=too-many-arguments
 
@@ -381,14 +945,16 @@ class FileScanHelper:
             ReturnCodeHelper.exit_application(ApplicationResult.SYSTEM_ERROR)
 
     def __process_file_fix_rescan(
-        self, fix_debug: bool, fix_nolog_rescan: bool, next_file_two: str
+        self,
+        fix_debug: bool,
+        fix_nolog_rescan: bool,
+        next_file_name: str,
+        file_contents: str,
     ) -> List[MarkdownToken]:
         _ = fix_debug
         # if fix_debug:
-        #     print(f"scan: {next_file_two}")
-        POGGER.info("Rescanning file '$' before line-by-line fixes.", next_file_two)
-        source_provider = FileSourceProvider(next_file_two)
-
+        #     print(f"scan: {next_file_name}")
+        POGGER.info("Rescanning file '$' before line-by-line fixes.", next_file_name)
         if fix_nolog_rescan:
             saved_log_level = logging.WARNING
             if POGGER.is_enabled_for(logging.DEBUG):
@@ -402,9 +968,7 @@ class FileScanHelper:
             )
 
         try:
-            actual_tokens = self.__tokenizer.transform_from_provider(
-                source_provider, do_add_end_of_stream_token=True
-            )
+            actual_tokens = self.__tokenize_contents(file_contents)
         finally:
             if fix_nolog_rescan:
                 saved_log_level_name = logging.getLevelName(saved_log_level)
@@ -418,7 +982,7 @@ class FileScanHelper:
     # pylint: disable=too-many-arguments, too-many-locals
     def __process_file_fix_pass(
         self,
-        next_file: str,
+        file_contents: str,
         next_file_name: str,
         fix_debug: bool,
         fix_file_debug: bool,
@@ -426,22 +990,23 @@ class FileScanHelper:
         fix_list: List[str],
         collect_list: List[str],
         per_file_disabled_identifiers: Optional[Set[str]],
-    ) -> Tuple[bool, Set[str], Set[str]]:
-        # Scan the provided file for any token fixes.
-        (
-            next_file_two,
-            actual_tokens,
-            did_any_tokens_get_fixed,
-            collected_token_triggers,
-        ) = self.__process_file_fix_tokens(
-            next_file,
-            next_file_name,
-            fix_debug,
-            fix_file_debug,
-            fix_list,
-            collect_list,
-            per_file_disabled_identifiers,
-        )
+    ) -> Tuple[bool, str, Set[str], Set[str]]:
+        # Scan the provided contents for any token fixes.
+        with self.__measure_phase(PhaseTimer.fix_tokens_phase):
+            (
+                token_fixed_contents,
+                actual_tokens,
+                did_any_tokens_get_fixed,
+                collected_token_triggers,
+            ) = self.__process_file_fix_tokens(
+                file_contents,
+                next_file_name,
+                fix_debug,
+                fix_file_debug,
+                fix_list,
+                collect_list,
+                per_file_disabled_identifiers,
+            )
 
         # If tokens are returned, then no changes were made due to tokens and the
         # tokenized list can be reused without any worry of changes.
@@ -454,44 +1019,40 @@ class FileScanHelper:
             )
         else:
             actual_tokens = self.__process_file_fix_rescan(
-                fix_debug, fix_nolog_rescan, next_file_two
+                fix_debug, fix_nolog_rescan, next_file_name, token_fixed_contents
             )
 
-        # As the lines are processed, a new temporary line file is written to. If either
-        # tokens were fixed or lines were fixed, the file contents of the file
-        # temporary_line_file_name will contain the updated document.
-        (
-            this_file_fix_line_records,
-            temporary_line_file_name,
-            collected_line_triggers,
-        ) = self.__process_file_fix_lines(
-            next_file_two,
-            next_file_name,
-            actual_tokens,
-            fix_debug,
-            fix_file_debug,
-            fix_list,
-            collect_list,
-            per_file_disabled_identifiers,
-        )
+        # As the lines are processed, they are written to an in-memory buffer. If either
+        # tokens were fixed or lines were fixed, the contents of that buffer are the
+        # updated document.
+        with self.__measure_phase(PhaseTimer.fix_lines_phase):
+            (
+                this_file_fix_line_records,
+                line_fixed_contents,
+                collected_line_triggers,
+            ) = self.__process_file_fix_lines(
+                token_fixed_contents,
+                next_file_name,
+                actual_tokens,
+                fix_debug,
+                fix_file_debug,
+                fix_list,
+                collect_list,
+                per_file_disabled_identifiers,
+            )
 
-        # If anything was fixed, copy the temporary file on top of the original file
-        # that was scanned.
+        # If anything was fixed, the line buffer is the new contents for the next pass.
         did_any_lines_get_fixed = bool(this_file_fix_line_records)
         did_anything_get_fixed = did_any_lines_get_fixed or did_any_tokens_get_fixed
         if did_anything_get_fixed:
-            if fix_debug and fix_file_debug:
-                print(f"Copy {temporary_line_file_name} to {next_file}")
-            shutil.copyfile(temporary_line_file_name, next_file)
-        if fix_debug and fix_file_debug:
-            print(f"Remove:{temporary_line_file_name}")
-        os.remove(temporary_line_file_name)
-        if next_file_two != next_file:
-            if fix_debug and fix_file_debug:
-                print(f"Remove:{next_file_two}")
-            os.remove(next_file_two)
+            file_contents = line_fixed_contents
 
-        return did_anything_get_fixed, collected_token_triggers, collected_line_triggers
+        return (
+            did_anything_get_fixed,
+            file_contents,
+            collected_token_triggers,
+            collected_line_triggers,
+        )
 
     # pylint: enable=too-many-arguments, too-many-locals
 
@@ -501,13 +1062,13 @@ class FileScanHelper:
         plugins_by_fix_level: Dict[int, List[str]],
         minimum_fix_level: int,
         fixes_by_id: Dict[str, FoundPlugin],
-        next_file: str,
+        file_contents: str,
         next_file_name: str,
         fix_debug: bool,
         fix_file_debug: bool,
         fix_nolog_rescan: bool,
         per_file_disabled_identifiers: Optional[Set[str]],
-    ) -> Tuple[bool, bool, int]:
+    ) -> Tuple[bool, bool, int, str]:
         keep_processing = False
         collect_list: List[str] = []
         fix_list = []
@@ -520,10 +1081,11 @@ class FileScanHelper:
 
         (
             did_anything_get_fixed_this_time,
+            file_contents,
             collected_token_triggers,
             collected_line_triggers,
         ) = self.__process_file_fix_pass(
-            next_file,
+            file_contents,
             next_file_name,
             fix_debug,
             fix_file_debug,
@@ -551,11 +1113,16 @@ class FileScanHelper:
             keep_processing = True
             minimum_fix_level = new_minimum_fix_level
 
-        return keep_processing, did_anything_get_fixed_this_time, minimum_fix_level
+        return (
+            keep_processing,
+            did_anything_get_fixed_this_time,
+            minimum_fix_level,
+            file_contents,
+        )
 
     # pylint: enable=too-many-arguments, too-many-locals
 
-    # pylint: disable=too-many-arguments, too-many-locals
+    # pylint: disable=too-many-arguments
     def __process_file_fix(
         self,
         next_file: str,
@@ -565,6 +1132,47 @@ class FileScanHelper:
         fix_nolog_rescan: bool,
         per_file_disabled_identifiers: Optional[Set[str]],
     ) -> Tuple[bool, bool]:
+        with open(next_file, "rt", encoding="utf-8") as source_file:
+            original_contents = source_file.read()
+        did_anything_get_fixed, file_contents, did_attempt_at_least_one_fix = (
+            self.__process_contents_fix(
+                original_contents,
+                next_file_name,
+                fix_debug,
+                fix_file_debug,
+                fix_nolog_rescan,
+                per_file_disabled_identifiers,
+            )
+        )
+        if did_anything_get_fixed:
+            if fix_debug and fix_file_debug:
+                print(f"Write: {next_file}")
+            FileScanHelper.__write_file_atomically(next_file, file_contents)
+        return did_anything_get_fixed, did_attempt_at_least_one_fix
+
+    # pylint: enable=too-many-arguments
+
+    def fix_single_string(self, string_to_fix: str, fix_id: str) -> Tuple[bool, str]:
+        """
+        Fix a single string, reported using the fix identifier in place of a file
+        name, returning whether it was changed and its fixed contents.  Any
+        exceptions are left to be handled by the caller.
+        """
+        did_anything_get_fixed, fixed_contents, _ = self.__process_contents_fix(
+            string_to_fix, fix_id, False, False, False, None
+        )
+        return did_anything_get_fixed, fixed_contents
+
+    # pylint: disable=too-many-arguments, too-many-locals
+    def __process_contents_fix(
+        self,
+        original_contents: str,
+        next_file_name: str,
+        fix_debug: bool,
+        fix_file_debug: bool,
+        fix_nolog_rescan: bool,
+        per_file_disabled_identifiers: Optional[Set[str]],
+    ) -> Tuple[bool, str, bool]:
         enabled_plugins_with_fixes = filter(
             lambda x: x.plugin_supports_fix, self.__plugins.enabled_plugins
         )
@@ -594,16 +1202,18 @@ class FileScanHelper:
         keep_processing = did_attempt_at_least_one_fix
         minimum_fix_level = min(plugins_by_fix_level.keys()) if keep_processing else -1
 
+        file_contents = original_contents
         while keep_processing:
             (
                 keep_processing,
                 did_anything_get_fixed_this_time,
                 minimum_fix_level,
+                file_contents,
             ) = self.__process_file_fix_next_level(
                 plugins_by_fix_level,
                 minimum_fix_level,
                 fixes_by_id,
-                next_file,
+                file_contents,
                 next_file_name,
                 fix_debug,
                 fix_file_debug,
@@ -614,14 +1224,42 @@ class FileScanHelper:
                 did_anything_get_fixed or did_anything_get_fixed_this_time
             )
 
-        return did_anything_get_fixed, did_attempt_at_least_one_fix
+        did_anything_get_fixed = (
+            did_anything_get_fixed and file_contents != original_contents
+        )
+        return did_anything_get_fixed, file_contents, did_attempt_at_least_one_fix
 
     # pylint: enable=too-many-arguments, too-many-locals
 
+    @staticmethod
+    def __write_file_atomically(next_file: str, file_contents: str) -> None:
+        """
+        Write the new contents to a temporary file in the same directory as the
+        file, then replace the file with it, so that the file is never left
+        partially written.
+        """
+        temporary_file_name = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                "wt",
+                dir=os.path.dirname(os.path.abspath(next_file)),
+                suffix=".tmp",
+                delete=False,
+                encoding="utf-8",
+            ) as temporary_file:
+                temporary_file_name = temporary_file.name
+                temporary_file.write(file_contents)
+            shutil.copymode(next_file, temporary_file_name)
+            os.replace(temporary_file_name, next_file)
+            temporary_file_name = None
+        finally:
+            if temporary_file_name and os.path.exists(temporary_file_name):
+                os.remove(temporary_file_name)
+
     # pylint: disable=too-many-arguments, too-many-locals
     def __process_file_fix_lines(
         self,
-        next_file: str,
+        file_contents: str,
         next_file_name: str,
         actual_tokens: List[MarkdownToken],
         fix_debug: bool,
@@ -630,10 +1268,8 @@ class FileScanHelper:
         collect_list: List[str],
         per_file_disabled_identifiers: Optional[Set[str]],
     ) -> Tuple[List[FixLineRecord], str, Set[str]]:
-        source_provider = FileSourceProvider(next_file)
-        with tempfile.NamedTemporaryFile() as temp_output:
-            temporary_file_name = temp_output.name
-        with open(temporary_file_name, "wt", encoding="utf-8") as source_file:
+        source_provider = InMemorySourceProvider(file_contents)
+        with io.StringIO() as source_file:
             POGGER.info("Scanning before line-by-line fixes.")
             fix_context = self.__plugins.starting_new_file(
                 next_file_name,
@@ -679,11 +1315,14 @@ class FileScanHelper:
             if this_file_fix_line_records and fix_debug:
                 for next_record in fix_context.fix_line_records:
                     print(next_record)
+            fixed_contents = source_file.getvalue()
 
-        self.__print_file_in_debug_mode(fix_debug, fix_file_debug, temporary_file_name)
+        self.__print_contents_in_debug_mode(
+            fix_debug, fix_file_debug, next_file_name, fixed_contents
+        )
         return (
             this_file_fix_line_records,
-            temporary_file_name,
+            fixed_contents,
             report_context.get_triggered_rules(),
         )
 
@@ -692,7 +1331,7 @@ class FileScanHelper:
     # pylint: disable=too-many-arguments, too-many-locals
     def __process_file_fix_tokens(
         self,
-        next_file: str,
+        file_contents: str,
         next_file_name: str,
         fix_debug: bool,
         fix_file_debug: bool,
@@ -700,13 +1339,12 @@ class FileScanHelper:
         collect_list: List[str],
         per_file_disabled_identifiers: Optional[Set[str]],
     ) -> Tuple[str, List[MarkdownToken], bool, Set[str]]:
-        self.__print_file_in_debug_mode(fix_debug, fix_file_debug, next_file)
+        self.__print_contents_in_debug_mode(
+            fix_debug, fix_file_debug, next_file_name, file_contents
+        )
 
         POGGER.info("Scanning file to fix '$' token-by-token.", next_file_name)
-        source_provider = FileSourceProvider(next_file)
-        actual_tokens = self.__tokenizer.transform_from_provider(
-            source_provider, do_add_end_of_stream_token=True
-        )
+        actual_tokens = self.__tokenize_contents(file_contents)
 
         fix_token_map: Dict[MarkdownToken, List[FixTokenRecord]] = {}
         replace_tokens_list: List[ReplaceTokensRecord] = []
@@ -745,12 +1383,12 @@ class FileScanHelper:
         did_any_tokens_get_fixed = False
         if fix_context.get_fix_token_map() or fix_context.get_replace_tokens_list():
             (
-                next_file,
+                file_contents,
                 actual_tokens,
                 did_any_tokens_get_fixed,
             ) = self.__process_file_fix_tokens_apply_fixes(
                 fix_context,
-                next_file,
+                next_file_name,
                 actual_tokens,
                 fix_token_map,
                 fix_debug,
@@ -758,7 +1396,7 @@ class FileScanHelper:
                 replace_tokens_list,
             )
         return (
-            next_file,
+            file_contents,
             actual_tokens,
             did_any_tokens_get_fixed,
             report_context.get_triggered_rules(),
@@ -903,7 +1541,7 @@ class FileScanHelper:
     def __process_file_fix_tokens_apply_fixes(
         self,
         context: PluginScanContext,
-        next_file: str,
+        next_file_name: str,
         actual_tokens: List[MarkdownToken],
         fix_token_map: Dict[MarkdownToken, List[FixTokenRecord]],
         fix_debug: bool,
@@ -920,15 +1558,12 @@ class FileScanHelper:
 
         if fix_debug:
             print(f"MARKDOWN:{ParserHelper.make_value_visible(markdown_from_tokens)}")
-        with tempfile.NamedTemporaryFile() as temp_output:
-            temporary_file_name = temp_output.name
-        with open(temporary_file_name, "wt", encoding="utf-8") as source_file:
-            source_file.write(markdown_from_tokens)
-            next_file = temporary_file_name
-            actual_tokens.clear()
+        actual_tokens.clear()
 
-        self.__print_file_in_debug_mode(fix_debug, fix_file_debug, temporary_file_name)
-        return next_file, actual_tokens, did_any_tokens_get_fixed
+        self.__print_contents_in_debug_mode(
+            fix_debug, fix_file_debug, next_file_name, markdown_from_tokens
+        )
+        return markdown_from_tokens, actual_tokens, did_any_tokens_get_fixed
 
     # pylint: enable=too-many-arguments
 
@@ -976,19 +1611,18 @@ class FileScanHelper:
 
     # pylint: enable=too-many-arguments
 
-    def __print_file_in_debug_mode(
-        self, fix_debug: bool, fix_file_debug: bool, next_file: str
+    @staticmethod
+    def __print_contents_in_debug_mode(
+        fix_debug: bool, fix_file_debug: bool, next_file_name: str, file_contents: str
     ) -> None:
         if fix_debug and fix_file_debug:
-            with open(next_file, "rt", encoding="utf-8") as source_file:
-                file_contents = source_file.read()
-                print(
-                    "\n--"
-                    + next_file
-                    + "--\n"
-                    + file_contents.replace("\n", "\\n")
-                    + "\n--"
-                )
+            print(
+                "\n--"
+                + next_file_name
+                + "--\n"
+                + file_contents.replace("\n", "\\n")
+                + "\n--"
+            )
 
     def __apply_token_fix(
         self,
@@ -1053,7 +1687,7 @@ class FileScanHelper:
     # pylint: disable=too-many-arguments
     def __process_lines_in_file(
         self,
-        source_provider: FileSourceProvider,
+        source_provider: ResettableSourceProvider,
         context: PluginScanContext,
         next_file_name: str,
         per_file_disabled_identifiers: Optional[Set[str]],
@@ -1088,6 +1722,16 @@ class FileScanHelper:
         """
         return FileScanHelper.__stdin_scan_subcommand == args.primary_subparser  # type: ignore
 
+    @staticmethod
+    def is_scan_specified(args: argparse.Namespace) -> bool:
+        """
+        Specifies whether scanning, either from paths or from stdin, was specified.
+        """
+        return args.primary_subparser in (
+            FileScanHelper.__normal_scan_subcommand,
+            FileScanHelper.__stdin_scan_subcommand,
+        )
+
     @staticmethod
     def add_argparse_subparser(subparsers: argparse._SubParsersAction, is_fix_mode: bool) -> None:  # type: ignore
         """
@@ -1109,10 +1753,47 @@ class FileScanHelper:
         )
 
         if not is_fix_mode:
-            subparsers.add_parser(
+            new_sub_parser.add_argument(
+                "-j",
+                "--jobs",
+                dest="scan_jobs",
+                action="store",
+                default=1,
+                type=FileScanHelper.__validate_jobs_argument,
+                help="number of processes to use when scanning multiple files",
+            )
+            new_sub_parser.add_argument(
+                "--cache-directory",
+                dest="scan_cache_directory",
+                action="store",
+                default=None,
+                help="directory used to cache the scan results for unchanged files",
+            )
+            new_sub_parser.add_argument(
+                "--html-directory",
+                dest="scan_html_directory",
+                action="store",
+                default=None,
+                help="directory to render the HTML for each scanned file into",
+            )
+            StructuredOutputPresentation.add_command_line_arguments(new_sub_parser)
+            stdin_sub_parser = subparsers.add_parser(
                 FileScanHelper.__stdin_scan_subcommand,
                 help="scan the standard input as a Markdown file",
             )
+            StructuredOutputPresentation.add_command_line_arguments(stdin_sub_parser)
+
+    @staticmethod
+    def __validate_jobs_argument(argument: str) -> int:
+        try:
+            number_of_jobs = int(argument)
+        except ValueError:
+            number_of_jobs = 0
+        if number_of_jobs < 1:
+            raise argparse.ArgumentTypeError(
+                f"Value '{argument}' is not a positive integer."
+            )
+        return number_of_jobs
 
     def __validate_entry(
         self, next_entry: str, full_property_name: str, per_file_ignores_prefix: str
@@ -0,0 +1,480 @@
+"""
+Module to provide for an incremental tokenization of a markdown-encoded string,
+re-parsing only the parts of the document affected by an edit.
+"""
+
+import copy
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple, cast
+
+from pymarkdown.extensions.pragma_token import PragmaToken
+from pymarkdown.general.bad_tokenization_error import BadTokenizationError
+from pymarkdown.general.parser_helper import ParserHelper
+from pymarkdown.general.parser_logger import ParserLogger
+from pymarkdown.general.source_providers import InMemorySourceProvider
+from pymarkdown.general.tokenized_markdown import TokenizedMarkdown
+from pymarkdown.tokens.end_of_stream_token import EndOfStreamToken
+from pymarkdown.tokens.markdown_token import EndMarkdownToken, MarkdownToken
+
+POGGER = ParserLogger(logging.getLogger(__name__))
+
+
+@dataclass(frozen=True)
+class IncrementalEdit:
+    """
+    Class to describe an edit to a document, replacing the lines from the first
+    line number to the last line number, inclusive, with the replacement lines.
+    To insert lines without replacing any, use a last line number that is one
+    less than the first line number.
+    """
+
+    first_line_number: int
+    last_line_number: int
+    replacement_lines: List[str]
+
+    def apply_to_lines(self, source_lines: List[str]) -> List[str]:
+        """
+        Apply the edit to the lines of a document, returning the edited lines.  A
+        ValueError is raised if the edit is not within the document.
+        """
+        line_count = len(source_lines)
+        if not 1 <= self.first_line_number <= line_count + 1:
+            raise ValueError(
+                f"First line number {self.first_line_number} must be between 1 and {line_count + 1}."
+            )
+        if not self.first_line_number - 1 <= self.last_line_number <= line_count:
+            raise ValueError(
+                f"Last line number {self.last_line_number} must be between {self.first_line_number - 1} and {line_count}."
+            )
+        return (
+            source_lines[: self.first_line_number - 1]
+            + self.replacement_lines
+            + source_lines[self.last_line_number :]
+        )
+
+
+@dataclass(frozen=True)
+class IncrementalTokenization:
+    """
+    Class to provide for the tokenization of a document, along with the range of
+    lines that were parsed to produce it.  For a full parse, that range covers the
+    entire document.
+    """
+
+    source_lines: List[str]
+    tokens: List[MarkdownToken]
+    first_parsed_line_number: int
+    last_parsed_line_number: int
+    line_number_delta: int
+    parsed_token_names: Set[str]
+    was_fully_parsed: bool
+
+    @property
+    def source_text(self) -> str:
+        """
+        The text of the document that was tokenized.
+        """
+        return ParserHelper.newline_character.join(self.source_lines)
+
+
+class IncrementalTokenizer:
+    """
+    Class to provide for an incremental tokenization of a markdown-encoded string.
+
+    An edit is applied by looking for the top-level blocks around the edited lines,
+    re-parsing only the lines from the start of the block before the edit to the
+    start of the first block after the edit that was not affected by it.  A block
+    can only be used as a boundary if it starts at the beginning of a line after a
+    blank line, with no container or leaf block left open.  The tokens for the
+    re-parsed lines are then spliced between the unchanged tokens from the previous
+    tokenization, with the line numbers of the tokens after the edit adjusted.
+
+    Because link reference definitions affect links anywhere in the document, any
+    edit to a document containing them is handled with a full parse.
+
+    The tokens before the re-parsed lines are shared with the previous tokenization,
+    as are the tokens after those lines if the edit does not change the number of
+    lines in the document.  Otherwise, the tokens after those lines are copied
+    before their line numbers are adjusted, leaving the previous tokenization
+    unchanged, unless the caller does not need to keep it.
+    """
+
+    def __init__(
+        self, tokenizer: TokenizedMarkdown, verify_with_full_parse: bool = False
+    ) -> None:
+        """
+        Initialize a new instance of the IncrementalTokenizer class.  If the verify
+        flag is set, every incremental parse is compared against a full parse of the
+        same document, raising a BadTokenizationError if they are not the same.
+        """
+        self.__tokenizer = tokenizer
+        self.__verify_with_full_parse = verify_with_full_parse
+
+    def tokenize(self, source_text: str) -> IncrementalTokenization:
+        """
+        Perform a full parse of the specified text.
+        """
+        return self.__tokenize_lines(
+            source_text.split(ParserHelper.newline_character), 0
+        )
+
+    def apply_edit(
+        self,
+        previous_tokenization: IncrementalTokenization,
+        edit: IncrementalEdit,
+        keep_previous_tokenization: bool = True,
+    ) -> IncrementalTokenization:
+        """
+        Apply an edit to a previously tokenized document, re-parsing as little of
+        the document as possible.  If the previous tokenization does not need to be
+        kept, the line numbers of its tokens may be adjusted in place instead of
+        adjusting copies of those tokens, and it must not be used again.
+        """
+        new_lines = edit.apply_to_lines(previous_tokenization.source_lines)
+        line_number_delta = len(edit.replacement_lines) - (
+            edit.last_line_number - edit.first_line_number + 1
+        )
+        if not new_lines or IncrementalTokenizer.__contains_link_reference_definition(
+            previous_tokenization.tokens
+        ):
+            POGGER.debug("Incremental parse not possible, falling back to full parse.")
+            return self.__tokenize_lines(new_lines or [""], line_number_delta)
+
+        new_tokenization = self.__tokenize_edited_region(
+            previous_tokenization,
+            edit,
+            new_lines,
+            line_number_delta,
+            keep_previous_tokenization,
+        )
+        if new_tokenization is None:
+            POGGER.debug("Incremental parse not possible, falling back to full parse.")
+            return self.__tokenize_lines(new_lines, line_number_delta)
+
+        if self.__verify_with_full_parse:
+            self.__verify_against_full_parse(new_tokenization)
+        return new_tokenization
+
+    def __tokenize_lines(
+        self, source_lines: List[str], line_number_delta: int
+    ) -> IncrementalTokenization:
+        tokens = self.__tokenizer.transform_from_provider(
+            InMemorySourceProvider(ParserHelper.newline_character.join(source_lines)),
+            do_add_end_of_stream_token=True,
+        )
+        return IncrementalTokenization(
+            source_lines,
+            tokens,
+            1,
+            len(source_lines),
+            line_number_delta,
+            {next_token.token_name for next_token in tokens},
+            True,
+        )
+
+    # pylint: disable=too-many-locals,too-many-arguments
+    def __tokenize_edited_region(
+        self,
+        previous_tokenization: IncrementalTokenization,
+        edit: IncrementalEdit,
+        new_lines: List[str],
+        line_number_delta: int,
+        keep_previous_tokenization: bool,
+    ) -> Optional[IncrementalTokenization]:
+        old_tokens, end_of_stream_token, old_pragma_lines = (
+            IncrementalTokenizer.__split_special_tokens(previous_tokenization.tokens)
+        )
+        if end_of_stream_token is None:
+            return None
+        region_starts = IncrementalTokenizer.__find_region_starts(
+            old_tokens, previous_tokenization.source_lines, old_pragma_lines
+        )
+
+        start_line_number, start_token_index = 1, 0
+        for next_line_number, next_token_index in region_starts:
+            if next_line_number >= edit.first_line_number:
+                break
+            start_line_number, start_token_index = next_line_number, next_token_index
+
+        region_result = self.__tokenize_until_top_level(
+            new_lines,
+            start_line_number,
+            [
+                next_start
+                for next_start in region_starts
+                if next_start[0] >= edit.last_line_number + 2
+            ],
+            line_number_delta,
+        )
+        if region_result is None:
+            return None
+        region_end, region_tokens, region_end_of_stream_token, region_pragma_lines = (
+            region_result
+        )
+
+        new_tokens = old_tokens[:start_token_index] + region_tokens
+        if region_end:
+            replaced_tokens = old_tokens[start_token_index : region_end[1]]
+            end_line_number = region_end[0] + line_number_delta
+            new_tokens.extend(
+                IncrementalTokenizer.__shift_tokens(
+                    old_tokens[region_end[1] :] + [end_of_stream_token],
+                    line_number_delta,
+                    keep_previous_tokenization,
+                )
+            )
+        else:
+            replaced_tokens = old_tokens[start_token_index:]
+            end_line_number = len(new_lines) + 1
+            assert region_end_of_stream_token is not None
+            new_tokens.append(region_end_of_stream_token)
+
+        if new_pragma_lines := IncrementalTokenizer.__merge_pragma_lines(
+            old_pragma_lines,
+            region_pragma_lines,
+            start_line_number,
+            region_end[0] if region_end else None,
+            line_number_delta,
+        ):
+            new_tokens.append(PragmaToken(new_pragma_lines))
+
+        POGGER.debug(
+            "Incremental parse of lines $ to $.", start_line_number, end_line_number - 1
+        )
+        return IncrementalTokenization(
+            new_lines,
+            new_tokens,
+            start_line_number,
+            end_line_number - 1,
+            line_number_delta,
+            {next_token.token_name for next_token in replaced_tokens + region_tokens},
+            False,
+        )
+
+    # pylint: enable=too-many-locals,too-many-arguments
+
+    @staticmethod
+    def __shift_tokens(
+        tokens: List[MarkdownToken],
+        line_number_delta: int,
+        keep_previous_tokenization: bool,
+    ) -> List[MarkdownToken]:
+        """
+        Shift the line numbers of the tokens by the delta.  To keep the previous
+        tokenization unchanged, only the tokens whose line numbers change are copied,
+        along with any end tokens for those copies, so that each end token refers
+        to the copy of its start token.
+        """
+        if not line_number_delta:
+            return tokens
+        if not keep_previous_tokenization:
+            for next_token in tokens:
+                next_token.shift_line_number(line_number_delta)
+            return tokens
+
+        copied_start_tokens: Dict[int, MarkdownToken] = {}
+        shifted_tokens: List[MarkdownToken] = []
+        for next_token in tokens:
+            copied_start_token = (
+                copied_start_tokens.get(id(next_token.start_markdown_token))
+                if isinstance(next_token, EndMarkdownToken)
+                else None
+            )
+            if next_token.line_number or copied_start_token:
+                copied_token = copy.copy(next_token)
+                copied_token.shift_line_number(line_number_delta)
+                if copied_start_token:
+                    cast(EndMarkdownToken, copied_token).set_start_markdown_token(
+                        copied_start_token
+                    )
+                elif copied_token.requires_end_token:
+                    copied_start_tokens[id(next_token)] = copied_token
+                next_token = copied_token
+            shifted_tokens.append(next_token)
+        return shifted_tokens
+
+    def __tokenize_until_top_level(
+        self,
+        new_lines: List[str],
+        start_line_number: int,
+        possible_ends: List[Tuple[int, int]],
+        line_number_delta: int,
+    ) -> Optional[
+        Tuple[
+            Optional[Tuple[int, int]],
+            List[MarkdownToken],
+            Optional[EndOfStreamToken],
+            Dict[int, str],
+        ]
+    ]:
+        """
+        Tokenize from the start line number until the first of the possible ends
+        that is still at the top level of the document after the edit, or until the
+        end of the document if there is no such end.
+        """
+        for next_end in possible_ends:
+            end_line_number = next_end[0] + line_number_delta
+            region_tokens, _, region_pragma_lines = self.__tokenize_region(
+                new_lines, start_line_number, end_line_number, False
+            )
+            if IncrementalTokenizer.__contains_link_reference_definition(region_tokens):
+                return None
+            next_region_starts = IncrementalTokenizer.__find_region_starts(
+                region_tokens, new_lines, region_pragma_lines
+            )
+            if next_region_starts and next_region_starts[-1][0] == end_line_number:
+                return (
+                    next_end,
+                    region_tokens[: next_region_starts[-1][1]],
+                    None,
+                    region_pragma_lines,
+                )
+            POGGER.debug(
+                "Region ending at line $ did not end at the top level, extending it.",
+                end_line_number,
+            )
+
+        region_tokens, region_end_of_stream_token, region_pragma_lines = (
+            self.__tokenize_region(
+                new_lines, start_line_number, len(new_lines) + 1, True
+            )
+        )
+        if IncrementalTokenizer.__contains_link_reference_definition(region_tokens):
+            return None
+        return None, region_tokens, region_end_of_stream_token, region_pragma_lines
+
+    def __tokenize_region(
+        self,
+        new_lines: List[str],
+        start_line_number: int,
+        end_line_number: int,
+        is_at_end_of_document: bool,
+    ) -> Tuple[List[MarkdownToken], Optional[EndOfStreamToken], Dict[int, str]]:
+        """
+        Tokenize the lines from the start line number up to the end line number.
+        Unless the region is at the end of the document, the line at the end line
+        number is included, so that any blocks before it are closed the same way
+        as they are for the full document.
+        """
+        region_lines = new_lines[
+            start_line_number
+            - 1 : end_line_number
+            - (1 if is_at_end_of_document else 0)
+        ]
+        region_tokens = self.__tokenizer.transform_from_provider(
+            InMemorySourceProvider(ParserHelper.newline_character.join(region_lines)),
+            do_add_end_of_stream_token=is_at_end_of_document,
+            starting_line_number=start_line_number,
+        )
+        return IncrementalTokenizer.__split_special_tokens(region_tokens)
+
+    @staticmethod
+    def __contains_link_reference_definition(tokens: List[MarkdownToken]) -> bool:
+        return any(next_token.is_link_reference_definition for next_token in tokens)
+
+    @staticmethod
+    def __split_special_tokens(
+        tokens: List[MarkdownToken],
+    ) -> Tuple[List[MarkdownToken], Optional[EndOfStreamToken], Dict[int, str]]:
+        pragma_lines: Dict[int, str] = {}
+        if tokens and tokens[-1].is_pragma:
+            pragma_lines = cast(PragmaToken, tokens[-1]).pragma_lines
+            tokens = tokens[:-1]
+        end_of_stream_token = None
+        if tokens and tokens[-1].is_end_of_stream:
+            end_of_stream_token = cast(EndOfStreamToken, tokens[-1])
+            tokens = tokens[:-1]
+        return tokens, end_of_stream_token, pragma_lines
+
+    @staticmethod
+    def __find_region_starts(
+        tokens: List[MarkdownToken],
+        source_lines: List[str],
+        pragma_lines: Dict[int, str],
+    ) -> List[Tuple[int, int]]:
+        """
+        Find each line, and the index of the token starting on that line, that a
+        region of the document can be re-parsed from.  Such a line must start a
+        block at the top level of the document, without any leading whitespace,
+        directly after a blank line that was also at the top level.
+        """
+        pragma_line_numbers = {
+            abs(next_line_number) for next_line_number in pragma_lines
+        }
+        region_starts: List[Tuple[int, int]] = []
+        block_depth = 0
+        last_blank_line_number = 0
+        for token_index, next_token in enumerate(tokens):
+            if next_token.is_blank_line:
+                last_blank_line_number = (
+                    next_token.line_number if not block_depth else 0
+                )
+                continue
+            if last_blank_line_number and not next_token.is_end_token:
+                start_line_number = last_blank_line_number + 1
+                while start_line_number in pragma_line_numbers:
+                    start_line_number += 1
+                if start_line_number <= len(source_lines) and source_lines[
+                    start_line_number - 1
+                ][:1] not in (
+                    "",
+                    ParserHelper.space_character,
+                    ParserHelper.tab_character,
+                ):
+                    region_starts.append((start_line_number, token_index))
+            last_blank_line_number = 0
+            if next_token.is_end_token:
+                block_depth -= 1
+            elif next_token.requires_end_token:
+                block_depth += 1
+        return region_starts
+
+    @staticmethod
+    def __merge_pragma_lines(
+        old_pragma_lines: Dict[int, str],
+        region_pragma_lines: Dict[int, str],
+        start_line_number: int,
+        end_line_number: Optional[int],
+        line_number_delta: int,
+    ) -> Dict[int, str]:
+        merged_pragma_lines = dict(region_pragma_lines)
+        for next_line_number, next_pragma in old_pragma_lines.items():
+            absolute_line_number = abs(next_line_number)
+            if absolute_line_number < start_line_number:
+                merged_pragma_lines[next_line_number] = next_pragma
+            elif end_line_number and absolute_line_number >= end_line_number:
+                merged_pragma_lines[
+                    next_line_number
+                    + (
+                        line_number_delta
+                        if next_line_number > 0
+                        else -line_number_delta
+                    )
+                ] = next_pragma
+        return {
+            next_line_number: merged_pragma_lines[next_line_number]
+            for next_line_number in sorted(merged_pragma_lines, key=abs)
+        }
+
+    def __verify_against_full_parse(
+        self, new_tokenization: IncrementalTokenization
+    ) -> None:
+        full_tokenization = self.__tokenize_lines(
+            new_tokenization.source_lines, new_tokenization.line_number_delta
+        )
+        incremental_tokens = [str(next_token) for next_token in new_tokenization.tokens]
+        full_tokens = [str(next_token) for next_token in full_tokenization.tokens]
+        if incremental_tokens != full_tokens:
+            token_index = 0
+            while (
+                token_index < min(len(incremental_tokens), len(full_tokens))
+                and incremental_tokens[token_index] == full_tokens[token_index]
+            ):
+                token_index += 1
+            raise BadTokenizationError(
+                "Incremental parse of lines "
+                + f"{new_tokenization.first_parsed_line_number} to "
+                + f"{new_tokenization.last_parsed_line_number} differs from a full "
+                + f"parse at token {token_index}."
+            )
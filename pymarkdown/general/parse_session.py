@@ -0,0 +1,100 @@
+"""
+Module to provide for the state of a single parse of a Markdown document.
+"""
+
+from contextvars import ContextVar, Token
+from types import TracebackType
+from typing import TYPE_CHECKING, Dict, List, Optional, Type
+
+from pymarkdown.container_blocks.parse_block_pass_properties import (
+    ParseBlockPassProperties,
+)
+from pymarkdown.general.source_providers import SourceProvider
+from pymarkdown.links.link_reference_titles import LinkReferenceTitles
+from pymarkdown.tokens.markdown_token import MarkdownToken
+from pymarkdown.tokens.stack_token import StackToken
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pymarkdown.inline.inline_handler_helper import InlineHandlers
+
+
+class ParseSession:
+    """
+    Class to provide for the state of a single parse of a Markdown document.
+
+    Each call to tokenize a document creates its own session, so that a single
+    tokenizer can be used to tokenize documents at the same time from different
+    threads.  As most of the parser is made up of static helper functions, the
+    session for the parse that is in progress is found with the `current` function
+    instead of being passed to each of those functions.
+    """
+
+    __current_session: ContextVar[Optional["ParseSession"]] = ContextVar(
+        "pymarkdown_parse_session", default=None
+    )
+
+    def __init__(
+        self,
+        source_provider: SourceProvider,
+        parse_properties: ParseBlockPassProperties,
+        inline_handlers: "InlineHandlers",
+    ) -> None:
+        """
+        Initialize a new instance of the ParseSession class.
+        """
+        self.__source_provider = source_provider
+        self.__parse_properties = parse_properties
+        self.__inline_handlers = inline_handlers
+        self.token_document: List[MarkdownToken] = []
+        self.token_stack: List[StackToken] = []
+        self.link_definitions: Dict[str, LinkReferenceTitles] = {}
+        self.__previous_session_token: Optional[Token[Optional[ParseSession]]] = None
+
+    def __enter__(self) -> "ParseSession":
+        assert (
+            self.__previous_session_token is None
+        ), "A parse session cannot be entered more than once."
+        self.__previous_session_token = ParseSession.__current_session.set(self)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        assert (
+            self.__previous_session_token is not None
+        ), "A parse session must be entered before it is exited."
+        ParseSession.__current_session.reset(self.__previous_session_token)
+        self.__previous_session_token = None
+
+    @staticmethod
+    def current() -> "ParseSession":
+        """
+        Get the session for the parse that is in progress.
+        """
+        current_session = ParseSession.__current_session.get()
+        assert current_session is not None, "A parse session must be in progress."
+        return current_session
+
+    @property
+    def source_provider(self) -> SourceProvider:
+        """
+        Source of the lines of the document being parsed.
+        """
+        return self.__source_provider
+
+    @property
+    def parse_properties(self) -> ParseBlockPassProperties:
+        """
+        Properties for the parse, including the pragma lines that were found.
+        """
+        return self.__parse_properties
+
+    @property
+    def inline_handlers(self) -> "InlineHandlers":
+        """
+        Handlers for the inline elements, as determined by the enabled extensions.
+        """
+        return self.__inline_handlers
@@ -28,7 +28,10 @@ class ParserLogger:
     functionality for logging parsing information.
 
     To keep things performant, the calls to the underlying logging libraries
-    are only done when needed.
+    are only done when needed.  Each `$` in the format is replaced with the
+    visible form of the matching argument only if the message is logged, so
+    the format must not be built with an f-string or by concatenating the
+    arguments, and the arguments must not be made visible before the call.
     """
 
     start_range_sequence = "\u8268"
@@ -92,11 +95,9 @@ class ParserLogger:
         Log information at a "DEBUG" level to the logger, but replace the
         automatic filtering of any string with make_value_visible to
         using make_whitespace_visible.
-
-        Note: This is seldom used, and does not have a reset check as
-        the reset will be hit by one of the other two functions long
-        before it gets here.
         """
+        if ParserLogger.__global_count != self.__local_count:
+            self.__reset_cache()
         if self.__is_debug_enabled:
             msg = self.__munge(True, log_format, cast(List[Any], args))
             self.__my_logger.debug(msg, stacklevel=2)
@@ -0,0 +1,213 @@
+"""
+Module to provide for loading the PyMarkdown modules with their parser logging
+calls removed.
+"""
+
+import ast
+import importlib.abc
+import importlib.machinery
+import importlib.util
+import marshal
+import os
+import struct
+import sys
+from types import CodeType, ModuleType
+from typing import List, Optional, Sequence, Union
+
+
+class ParserLoggingStripper(ast.NodeTransformer):
+    """
+    Class to provide for removing the parser logging calls from the syntax tree of
+    a module.
+
+    Each statement that only calls one of the logging functions of the module's
+    `POGGER` instance is removed.  As the arguments to those calls are never
+    evaluated, neither they nor the call itself cost anything.  If removing those
+    statements leaves a block empty, a `pass` statement is put in its place.
+    """
+
+    logger_name = "POGGER"
+    stripped_function_names = {"debug", "info", "debug_with_visible_whitespace"}
+
+    def __init__(self) -> None:
+        """
+        Initialize a new instance of the ParserLoggingStripper class.
+        """
+        self.removed_call_count = 0
+
+    @staticmethod
+    def strip_source(source_text: Union[str, bytes], file_name: str) -> ast.Module:
+        """
+        Parse the source for a module and remove its parser logging calls.
+        """
+        stripped_tree = ParserLoggingStripper().visit(
+            ast.parse(source_text, filename=file_name)
+        )
+        assert isinstance(stripped_tree, ast.Module)
+        return stripped_tree
+
+    def __is_parser_logging_call(self, statement: ast.stmt) -> bool:
+        return (
+            isinstance(statement, ast.Expr)
+            and isinstance(statement.value, ast.Call)
+            and isinstance(statement.value.func, ast.Attribute)
+            and isinstance(statement.value.func.value, ast.Name)
+            and statement.value.func.value.id == ParserLoggingStripper.logger_name
+            and statement.value.func.attr
+            in ParserLoggingStripper.stripped_function_names
+        )
+
+    def generic_visit(self, node: ast.AST) -> ast.AST:
+        """
+        Remove any parser logging calls from the statement lists of the node,
+        before visiting the statements that are left.  As statements can only be
+        contained within other statements, the expressions of the node are not
+        visited.
+        """
+        for field_name, field_value in ast.iter_fields(node):
+            if not isinstance(field_value, list) or not field_value:
+                continue
+            if isinstance(field_value[0], ast.stmt):
+                kept_statements: List[ast.stmt] = [
+                    next_statement
+                    for next_statement in field_value
+                    if not self.__is_parser_logging_call(next_statement)
+                ]
+                self.removed_call_count += len(field_value) - len(kept_statements)
+                if not kept_statements and field_name != "orelse":
+                    kept_statements.append(
+                        ast.copy_location(ast.Pass(), field_value[0])
+                    )
+                setattr(node, field_name, kept_statements)
+                field_value = kept_statements
+            for next_child in field_value:
+                if isinstance(
+                    next_child, (ast.stmt, ast.excepthandler, ast.match_case)
+                ):
+                    self.visit(next_child)
+        return node
+
+
+class StrippedLoggingLoader(importlib.machinery.SourceFileLoader):
+    """
+    Class to provide for loading a module with its parser logging calls removed.
+
+    The compiled module is cached next to the normal cached module, but with its
+    own optimization tag, so that the stripped and the normal forms of a module
+    never replace each other.
+    """
+
+    __cache_optimization_tag = "pymarkdownstripped1"
+    __header_format = "<4sIII"
+
+    def get_code(self, fullname: str) -> Optional[CodeType]:
+        """
+        Get the code object for the module, from the cache if it is current.
+        """
+        source_path = self.get_filename(fullname)
+        source_stats = self.path_stats(source_path)
+        expected_header = struct.pack(
+            StrippedLoggingLoader.__header_format,
+            importlib.util.MAGIC_NUMBER,
+            0,
+            int(source_stats["mtime"]) & 0xFFFFFFFF,
+            int(source_stats.get("size", 0)) & 0xFFFFFFFF,
+        )
+        cache_path = importlib.util.cache_from_source(
+            source_path, optimization=StrippedLoggingLoader.__cache_optimization_tag
+        )
+        try:
+            cached_data = self.get_data(cache_path)
+            if cached_data[: len(expected_header)] == expected_header:
+                # As with the normal cached modules, the cached code was written by
+                # this class, and is only used if it matches the current source.
+                cached_code = marshal.loads(  # nosec B302
+                    cached_data[len(expected_header) :]
+                )
+                if isinstance(cached_code, CodeType):
+                    return cached_code
+        except (OSError, EOFError, ValueError, TypeError):
+            pass
+
+        module_code: CodeType = compile(
+            ParserLoggingStripper.strip_source(self.get_data(source_path), source_path),
+            source_path,
+            "exec",
+            dont_inherit=True,
+        )
+        if not sys.dont_write_bytecode:
+            try:
+                self.set_data(cache_path, expected_header + marshal.dumps(module_code))
+            except OSError:
+                pass
+        return module_code
+
+
+class StrippedLoggingFinder(importlib.abc.MetaPathFinder):
+    """
+    Class to provide for finding the PyMarkdown modules, so that they are loaded
+    with their parser logging calls removed.
+
+    As the calls are removed when each module is first imported, the finder must
+    be installed before any of the parser's modules are imported.  The `pymarkdown`
+    package does this if the environment variable named by
+    `environment_variable_name` is set to a value other than `0`.
+    """
+
+    environment_variable_name = "PYMARKDOWN_STRIP_PARSER_LOGGING"
+    __package_prefix = "pymarkdown."
+
+    @staticmethod
+    def is_requested() -> bool:
+        """
+        Determine whether the environment requests that the parser logging calls
+        are removed.
+        """
+        return os.environ.get(
+            StrippedLoggingFinder.environment_variable_name, "0"
+        ) not in ("", "0")
+
+    @staticmethod
+    def is_installed() -> bool:
+        """
+        Determine whether the finder is installed.
+        """
+        return any(
+            isinstance(next_finder, StrippedLoggingFinder)
+            for next_finder in sys.meta_path
+        )
+
+    @staticmethod
+    def install() -> None:
+        """
+        Install the finder, if it is not already installed.
+        """
+        if not StrippedLoggingFinder.is_installed():
+            sys.meta_path.insert(0, StrippedLoggingFinder())
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Optional[Sequence[str]],
+        target: Optional[ModuleType] = None,
+    ) -> Optional[importlib.machinery.ModuleSpec]:
+        """
+        Find the specification for a PyMarkdown module, using a loader that removes
+        the parser logging calls.
+        """
+        _ = target
+        if not fullname.startswith(StrippedLoggingFinder.__package_prefix):
+            return None
+        found_spec = importlib.machinery.PathFinder.find_spec(fullname, path)
+        if (
+            found_spec is None
+            or not isinstance(found_spec.loader, importlib.machinery.SourceFileLoader)
+            or not found_spec.origin
+        ):
+            return found_spec
+        return importlib.util.spec_from_file_location(
+            fullname,
+            found_spec.origin,
+            loader=StrippedLoggingLoader(fullname, found_spec.origin),
+            submodule_search_locations=found_spec.submodule_search_locations,
+        )
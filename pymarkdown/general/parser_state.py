@@ -15,6 +15,7 @@ from pymarkdown.container_blocks.parse_block_pass_properties import (
 from pymarkdown.general.position_marker import PositionMarker
 from pymarkdown.general.requeue_line_info import RequeueLineInfo
 from pymarkdown.tokens.block_quote_markdown_token import BlockQuoteMarkdownToken
+from pymarkdown.tokens.container_markdown_token import ContainerMarkdownToken
 from pymarkdown.tokens.list_start_markdown_token import ListStartMarkdownToken
 from pymarkdown.tokens.markdown_token import MarkdownToken
 from pymarkdown.tokens.stack_token import (
@@ -100,12 +101,18 @@ class ParserState:
 
         self.__last_block_quote_stack_token: Optional[StackToken] = None
         self.__last_block_quote_markdown_token_index: Optional[int] = None
+        self.__last_block_quote_markdown_token: Optional[BlockQuoteMarkdownToken] = None
+        self.__last_block_quote_journal_position = 0
         self.__copy_of_last_block_quote_markdown_token: Optional[
             BlockQuoteMarkdownToken
         ] = None
         self.__x1_token: Optional[ListStartMarkdownToken] = None
+        self.__x1_journal_position = 0
         self.__copy_of_x1_token: Optional[ListStartMarkdownToken] = None
         self.__x1_token_index: Optional[int] = -1
+        self.__journaled_tokens: List[ContainerMarkdownToken] = []
+        self.__block_copy_positions: List[Tuple[Optional[MarkdownToken], int]] = []
+        self.__block_copy: Optional[List[Optional[MarkdownToken]]] = []
 
         self.__original_stack_depth: int = 0
         self.__original_document_depth: int = 0
@@ -113,7 +120,6 @@ class ParserState:
         self.__same_line_container_tokens: Optional[List[MarkdownToken]] = None
         self.nested_list_start: Optional[ListStackToken] = None
         self.copy_of_token_stack: List[StackToken] = []
-        self.block_copy: List[Optional[MarkdownToken]] = []
         self.parse_properties = parse_properties
 
     # pylint: enable=too-many-arguments
@@ -174,8 +180,35 @@ class ParserState:
         """
         Copy of the last block quote markdown token, before any changes.
         """
+        if (
+            self.__copy_of_last_block_quote_markdown_token is None
+            and self.__last_block_quote_markdown_token is not None
+        ):
+            self.__copy_of_last_block_quote_markdown_token = cast(
+                BlockQuoteMarkdownToken,
+                self.__last_block_quote_markdown_token.create_snapshot(
+                    self.__last_block_quote_journal_position
+                ),
+            )
         return self.__copy_of_last_block_quote_markdown_token
 
+    @property
+    def block_copy(self) -> List[Optional[MarkdownToken]]:
+        """
+        Copies of the markdown tokens for each of the stack tokens in the
+        copy_of_token_stack field, before any changes.
+        """
+        if self.__block_copy is None:
+            self.__block_copy = [
+                (
+                    next_token.create_snapshot(journal_position)
+                    if isinstance(next_token, ContainerMarkdownToken)
+                    else copy.copy(next_token)
+                )
+                for next_token, journal_position in self.__block_copy_positions
+            ]
+        return self.__block_copy
+
     @property
     def original_line_to_parse(self) -> Optional[str]:
         """
@@ -216,6 +249,11 @@ class ParserState:
         """
         TBD
         """
+        if self.__copy_of_x1_token is None and self.__x1_token is not None:
+            self.__copy_of_x1_token = cast(
+                ListStartMarkdownToken,
+                self.__x1_token.create_snapshot(self.__x1_journal_position),
+            )
         return self.__copy_of_x1_token
 
     @property
@@ -390,6 +428,48 @@ class ParserState:
             for next_item_on_stack in self.token_stack
         )
 
+    def mark_start_of_line(self, position_marker: PositionMarker) -> None:
+        """
+        Mark the start of processing a new line, including the state of each of
+        the tokens on the stack, in case that a requeue needs to occur.
+
+        Instead of copying each container token, a journal of the changes to
+        those tokens is kept from this point, and the copies are only created from
+        those journals if they are needed.
+        """
+        for next_token in self.__journaled_tokens:
+            next_token.stop_journal()
+        self.__journaled_tokens = []
+
+        self.mark_start_information(position_marker)
+
+        self.copy_of_token_stack = []
+        self.copy_of_token_stack.extend(self.token_stack)
+        self.__block_copy_positions = []
+        for next_stack_token in self.token_stack:
+            if next_stack_token.is_document:
+                continue
+            markdown_token = next_stack_token.matching_markdown_token
+            self.__block_copy_positions.append(
+                (
+                    markdown_token,
+                    (
+                        self.__start_journal_for_token(markdown_token)
+                        if markdown_token
+                        else 0
+                    ),
+                )
+            )
+        self.__block_copy = None
+
+    def __start_journal_for_token(self, markdown_token: MarkdownToken) -> int:
+        if not isinstance(markdown_token, ContainerMarkdownToken):
+            return 0
+        journal_position = markdown_token.start_journal()
+        if not journal_position:
+            self.__journaled_tokens.append(markdown_token)
+        return journal_position
+
     def mark_start_information(self, position_marker: PositionMarker) -> None:
         """
         Mark the start of processing this line of information.  A lot of
@@ -413,6 +493,7 @@ class ParserState:
             self.__last_block_quote_stack_token,
             self.__last_block_quote_markdown_token_index,
         ) = (None, None)
+        self.__last_block_quote_markdown_token = None
         self.__copy_of_last_block_quote_markdown_token = None
         if not self.token_stack[last_stack_index].is_document:
             self.__last_block_quote_stack_token = self.token_stack[last_stack_index]
@@ -422,19 +503,21 @@ class ParserState:
             ), "Always start with a container or leaf token, that has a matching markdown token."
             try:
                 self.__last_block_quote_markdown_token_index = (
-                    self.token_document.index(markdown_token)
+                    self.find_matching_markdown_token_index(
+                        self.token_stack[last_stack_index]
+                    )
                 )
-                self.__copy_of_last_block_quote_markdown_token = cast(
+                self.__last_block_quote_markdown_token = cast(
                     BlockQuoteMarkdownToken,
-                    copy.deepcopy(
-                        self.token_document[
-                            self.__last_block_quote_markdown_token_index
-                        ]
-                    ),
+                    self.token_document[self.__last_block_quote_markdown_token_index],
+                )
+                self.__last_block_quote_journal_position = (
+                    self.__start_journal_for_token(
+                        self.__last_block_quote_markdown_token
+                    )
                 )
             except ValueError:
                 self.__last_block_quote_markdown_token_index = -1
-                self.__copy_of_last_block_quote_markdown_token = None
         x1 = self.find_last_list_block_on_stack()
         self.__x1_token = None
         self.__copy_of_x1_token = None
@@ -445,8 +528,38 @@ class ParserState:
             assert isinstance(matching_token, ListStartMarkdownToken)
             self.__x1_token = matching_token
 
-            self.__copy_of_x1_token = copy.deepcopy(self.__x1_token)
-            self.__x1_token_index = self.token_document.index(self.__x1_token)
+            self.__x1_journal_position = self.__start_journal_for_token(self.__x1_token)
+            self.__x1_token_index = self.find_matching_markdown_token_index(
+                self.token_stack[x1]
+            )
+
+    def find_matching_markdown_token_index(self, stack_token: StackToken) -> int:
+        """
+        Find the index of the stack token's matching markdown token within the
+        document, raising a ValueError if that markdown token is not in the document.
+
+        As the document is only ever changed near its end, the index recorded with the
+        stack token is used if it is still correct, and the document is searched from
+        its end if it is not.
+        """
+        markdown_token = stack_token.matching_markdown_token
+        token_index = stack_token.matching_markdown_token_index
+        if (
+            token_index is not None
+            and token_index < len(self.token_document)
+            and self.token_document[token_index] is markdown_token
+        ):
+            return token_index
+
+        token_index = len(self.token_document) - 1
+        while (
+            token_index >= 0 and self.token_document[token_index] is not markdown_token
+        ):
+            token_index -= 1
+        if token_index < 0:
+            raise ValueError(f"Token {markdown_token} is not in the document.")
+        stack_token.record_matching_markdown_token_index(token_index)
+        return token_index
 
     def mark_for_leaf_processing(
         self, container_level_tokens: List[MarkdownToken]
@@ -0,0 +1,92 @@
+"""
+Module to provide for the measurement of the time taken by each phase of scanning
+and fixing a document.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+
+class PhaseTimer:
+    """
+    Class to provide for the measurement of the time taken by each phase of scanning
+    and fixing a document.
+
+    The time taken by each phase, and the number of times that it was measured, is
+    accumulated until the timer is reset.  As some
+    phases include other phases, such as the fix phases including the parsing of the
+    document being fixed, the time for each phase includes the time of any phases
+    within it.  A timer must only be used by one thread at a time.
+    """
+
+    block_pass_phase = "block-pass"
+    coalesce_phase = "coalesce"
+    inline_phase = "inline"
+    plugin_tokens_phase = "plugin-tokens"
+    plugin_lines_phase = "plugin-lines"
+    fix_tokens_phase = "fix-tokens"
+    fix_lines_phase = "fix-lines"
+    render_html_phase = "render-html"
+    scan_cache_replay_phase = "scan-cache-replay"
+
+    def __init__(self) -> None:
+        """
+        Initialize a new instance of the PhaseTimer class.
+        """
+        self.__elapsed_times: Dict[str, float] = {}
+        self.__call_counts: Dict[str, int] = {}
+
+    @contextmanager
+    def measure(self, phase_name: str) -> Iterator[None]:
+        """
+        Measure the time taken by the enclosed code, adding it to the time for the
+        specified phase.
+        """
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.__elapsed_times[phase_name] = (
+                self.__elapsed_times.get(phase_name, 0.0)
+                + time.perf_counter()
+                - start_time
+            )
+            self.__call_counts[phase_name] = self.__call_counts.get(phase_name, 0) + 1
+
+    @property
+    def elapsed_times(self) -> Dict[str, float]:
+        """
+        Time taken by each phase that was measured, in seconds.
+        """
+        return dict(self.__elapsed_times)
+
+    @property
+    def call_counts(self) -> Dict[str, int]:
+        """
+        Number of times that each phase was measured.
+        """
+        return dict(self.__call_counts)
+
+    def add_measurements(
+        self, elapsed_times: Dict[str, float], call_counts: Dict[str, int]
+    ) -> None:
+        """
+        Add the times and counts measured by another timer, such as a timer used by
+        a worker process, to the times and counts for this timer.
+        """
+        for phase_name, phase_time in elapsed_times.items():
+            self.__elapsed_times[phase_name] = (
+                self.__elapsed_times.get(phase_name, 0.0) + phase_time
+            )
+        for phase_name, call_count in call_counts.items():
+            self.__call_counts[phase_name] = (
+                self.__call_counts.get(phase_name, 0) + call_count
+            )
+
+    def reset(self) -> None:
+        """
+        Reset the time taken by each phase, and the number of times it was measured.
+        """
+        self.__elapsed_times = {}
+        self.__call_counts = {}
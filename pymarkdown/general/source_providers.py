@@ -2,8 +2,11 @@
 Module to provide a tokenization of a markdown-encoded string.
 """
 
+import codecs
+import os
 from abc import ABC, abstractmethod, abstractproperty
-from typing import List, Optional
+from types import TracebackType
+from typing import Optional, TextIO, Type
 
 from pymarkdown.general.parser_helper import ParserHelper
 
@@ -30,17 +33,83 @@ class SourceProvider(ABC):
         """
 
 
-class InMemorySourceProvider(SourceProvider):
+class ResettableSourceProvider(SourceProvider):
+    """
+    Class to provide for an abstract definition of a source provider that can be
+    read more than once.
+    """
+
+    streaming_threshold_in_bytes = 1024 * 1024
+    """Files at least this size are read using a StreamingFileSourceProvider.
+    """
+
+    # pylint: disable=deprecated-decorator
+    @abstractproperty
+    def did_final_line_end_with_newline(self) -> bool:
+        """
+        Indicate whether the final line of the input ended with a newline.
+        """
+
+    # pylint: enable=deprecated-decorator
+
+    @abstractmethod
+    def reset_to_start(self) -> None:
+        """
+        Reset the provider to the start of the stream.
+        """
+
+    def close(self) -> None:
+        """
+        Release any resources held by the provider.
+        """
+
+    def __enter__(self) -> "ResettableSourceProvider":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    @staticmethod
+    def from_file(file_to_open: str) -> "ResettableSourceProvider":
+        """
+        Create the source provider best suited to the size of the specified file.
+        """
+        if (
+            os.path.getsize(file_to_open)
+            >= ResettableSourceProvider.streaming_threshold_in_bytes
+        ):
+            return StreamingFileSourceProvider(file_to_open)
+        return FileSourceProvider(file_to_open)
+
+
+class InMemorySourceProvider(ResettableSourceProvider):
     """
     Class to provide for a source provider that is totally within memory.
+
+    Each line is found by searching forward from the end of the previous line,
+    so that the text is never copied and reading all of the lines takes time
+    proportional to the length of the text.
     """
 
     def __init__(self, source_text: str) -> None:
         """
         Initialize an instance of the InMemorySourceProvider class.
         """
-        self.__next_line_tuple: List[str] = source_text.split(
-            ParserHelper.newline_character, 1
+        self.__source_text = source_text
+        self.__next_line_index: Optional[int] = 0
+
+    @property
+    def did_final_line_end_with_newline(self) -> bool:
+        """
+        Indicate whether the final line of the text ended with a newline.
+        """
+        return not self.__source_text or self.__source_text.endswith(
+            ParserHelper.newline_character
         )
 
     @property
@@ -48,26 +117,30 @@ class InMemorySourceProvider(SourceProvider):
         """
         Whether the provider has reached the end of the input.
         """
-        return not self.__next_line_tuple
+        return self.__next_line_index is None
 
     def get_next_line(self) -> Optional[str]:
         """
         Get the next line from the source provider.
         """
-        token_to_use = None
-        if not self.is_at_end_of_file:
-            token_to_use = self.__next_line_tuple[0]
-            if len(self.__next_line_tuple) == 2:
-                self.__next_line_tuple = self.__next_line_tuple[1].split(
-                    ParserHelper.newline_character, 1
-                )
-            else:
-                assert self.__next_line_tuple
-                self.__next_line_tuple = []
-        return token_to_use
+        if self.__next_line_index is None:
+            return None
+        start_index = self.__next_line_index
+        end_index = self.__source_text.find(ParserHelper.newline_character, start_index)
+        if end_index == -1:
+            self.__next_line_index = None
+            return self.__source_text[start_index:]
+        self.__next_line_index = end_index + 1
+        return self.__source_text[start_index:end_index]
 
+    def reset_to_start(self) -> None:
+        """
+        Reset the provider to the start of the stream.
+        """
+        self.__next_line_index = 0
 
-class FileSourceProvider(SourceProvider):
+
+class FileSourceProvider(ResettableSourceProvider):
     """
     Class to provide for a source provider that is on media as a file.
     """
@@ -120,3 +193,86 @@ class FileSourceProvider(SourceProvider):
         Reset the provider to the start of the stream.
         """
         self.__read_index = 0
+
+
+class StreamingFileSourceProvider(ResettableSourceProvider):
+    """
+    Class to provide for a source provider that is on media as a file, reading
+    each line from the file only as it is requested.
+
+    To make sure that any encoding errors are raised when the provider is created,
+    as they are for the FileSourceProvider class, the file is decoded once in
+    blocks when the provider is created, without keeping any of the decoded text.
+    """
+
+    __block_size = 65536
+
+    def __init__(self, file_to_open: str) -> None:
+        """
+        Initialize an instance of the StreamingFileSourceProvider class.
+        """
+        self.__file_to_open = file_to_open
+        self.__open_file: Optional[TextIO] = None
+        self.__is_at_end_of_file = False
+
+        last_character = ParserHelper.newline_character
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        with open(file_to_open, "rb") as file_to_decode:
+            while next_block := file_to_decode.read(
+                StreamingFileSourceProvider.__block_size
+            ):
+                if decoded_block := decoder.decode(next_block):
+                    last_character = decoded_block[-1]
+        if decoded_block := decoder.decode(b"", final=True):
+            last_character = decoded_block[-1]
+        self.__did_final_line_end_with_newline = last_character in "\n\r"
+
+    @property
+    def did_final_line_end_with_newline(self) -> bool:
+        """
+        Indicate whether the final line of the file ended with a newline.
+        """
+        return self.__did_final_line_end_with_newline
+
+    @property
+    def is_at_end_of_file(self) -> bool:
+        """
+        Whether the provider has reached the end of the input.
+        """
+        return self.__is_at_end_of_file
+
+    def get_next_line(self) -> Optional[str]:
+        """
+        Get the next line from the source provider.
+        """
+        if self.__is_at_end_of_file:
+            return None
+        if self.__open_file is None:
+            self.__open_file = open(  # pylint: disable=consider-using-with
+                self.__file_to_open, encoding="utf-8"
+            )
+
+        next_line = self.__open_file.readline()
+        if next_line.endswith(ParserHelper.newline_character):
+            return next_line[:-1]
+
+        self.close()
+        self.__is_at_end_of_file = True
+        return next_line
+
+    def reset_to_start(self) -> None:
+        """
+        Reset the provider to the start of the stream.
+        """
+        if self.__open_file is not None:
+            self.__open_file.seek(0)
+        self.__is_at_end_of_file = False
+
+    def close(self) -> None:
+        """
+        Close the file if it is still open.  The file is closed automatically
+        once the last line has been read.
+        """
+        if self.__open_file is not None:
+            self.__open_file.close()
+            self.__open_file = None
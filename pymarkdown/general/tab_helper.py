@@ -6,11 +6,12 @@ import logging
 from typing import Optional, Tuple, cast
 
 from pymarkdown.general.parser_helper import ParserHelper
+from pymarkdown.general.parser_logger import ParserLogger
 from pymarkdown.general.parser_state import ParserState
 from pymarkdown.tokens.block_quote_markdown_token import BlockQuoteMarkdownToken
 from pymarkdown.tokens.list_start_markdown_token import ListStartMarkdownToken
 
-LOGGER = logging.getLogger(__name__)
+POGGER = ParserLogger(logging.getLogger(__name__))
 
 
 class TabHelper:
@@ -27,15 +28,9 @@ class TabHelper:
         and HTML blocks.
         """
 
-        LOGGER.debug(
-            "original_line>>:%s:<",
-            ParserHelper.make_whitespace_visible((original_line)),
-        )
-        LOGGER.debug("token_text>>:%s:<", ParserHelper.make_value_visible(token_text))
-        LOGGER.debug(
-            "extracted_whitespace>>:%s:<",
-            ParserHelper.make_value_visible(extracted_whitespace),
-        )
+        POGGER.debug_with_visible_whitespace("original_line>>:$:<", original_line)
+        POGGER.debug("token_text>>:$:<", token_text)
+        POGGER.debug("extracted_whitespace>>:$:<", extracted_whitespace)
         (
             tabified_token_text,
             _,
@@ -43,19 +38,13 @@ class TabHelper:
         ) = TabHelper.find_detabify_string(
             original_line, token_text, use_proper_traverse=True
         )
-        LOGGER.debug(
-            "tabified_token_text>>:%s:<",
-            ParserHelper.make_value_visible(tabified_token_text),
-        )
-        LOGGER.debug("tabified_token_text_index>>:%d:<", tabified_token_text_index)
+        POGGER.debug("tabified_token_text>>:$:<", tabified_token_text)
+        POGGER.debug("tabified_token_text_index>>:$:<", tabified_token_text_index)
         assert tabified_token_text_index != -1, "Detabified string must be found."
         assert tabified_token_text is not None, "Detabified string must be found."
 
         tabified_leading_spaces = original_line[:tabified_token_text_index]
-        LOGGER.debug(
-            "tabified_leading_spaces>>:%s:<",
-            ParserHelper.make_value_visible(tabified_leading_spaces),
-        )
+        POGGER.debug("tabified_leading_spaces>>:$:<", tabified_leading_spaces)
         tabified_suffix = extracted_whitespace
         tabified_prefix = None
 
@@ -70,19 +59,12 @@ class TabHelper:
             ) = TabHelper.match_tabbed_whitespace(
                 extracted_whitespace, tabified_leading_spaces
             )
-        LOGGER.debug(
-            "tabified_token_text>>:%s:<",
-            ParserHelper.make_value_visible(tabified_token_text),
-        )
-        LOGGER.debug(
-            "tabified_prefix>>:%s:<", ParserHelper.make_value_visible(tabified_prefix)
-        )
-        LOGGER.debug(
-            "tabified_suffix>>:%s:<", ParserHelper.make_value_visible(tabified_suffix)
-        )
-        LOGGER.debug("split_tab>>:%s:<", str(split_tab))
-        LOGGER.debug(
-            "split_tab_with_block_quote_suffix>>:%s:<",
+        POGGER.debug("tabified_token_text>>:$:<", tabified_token_text)
+        POGGER.debug("tabified_prefix>>:$:<", tabified_prefix)
+        POGGER.debug("tabified_suffix>>:$:<", tabified_suffix)
+        POGGER.debug("split_tab>>:$:<", str(split_tab))
+        POGGER.debug(
+            "split_tab_with_block_quote_suffix>>:$:<",
             str(split_tab_with_block_quote_suffix),
         )
         return (
@@ -113,22 +95,21 @@ class TabHelper:
             have_been_inside_loop = True
             corrected_suffix = corrected_extracted_whitespace[index_from_end:]
             corrected_prefix = corrected_extracted_whitespace[:index_from_end]
-            LOGGER.debug(
-                "index_from_end=:%s: of :%s:",
+            POGGER.debug(
+                "index_from_end=:$: of :$:",
                 index_from_end,
                 len(corrected_extracted_whitespace),
             )
-            LOGGER.debug("corrected_suffix=:%s:", corrected_suffix)
-            LOGGER.debug(
-                "corrected_prefix=:%s:",
-                ParserHelper.make_whitespace_visible(corrected_prefix),
+            POGGER.debug("corrected_suffix=:$:", corrected_suffix)
+            POGGER.debug_with_visible_whitespace(
+                "corrected_prefix=:$:", corrected_prefix
             )
             detabified_prefix = TabHelper.detabify_string(corrected_prefix)
-            LOGGER.debug("detabified_prefix=:%s:", detabified_prefix)
+            POGGER.debug("detabified_prefix=:$:", detabified_prefix)
             detabified_suffix = TabHelper.detabify_string(
                 corrected_suffix, additional_start_delta=len(detabified_prefix)
             )
-            LOGGER.debug("detabified_suffix=:%s:", detabified_suffix)
+            POGGER.debug("detabified_suffix=:$:", detabified_suffix)
             if len(detabified_suffix) < len(extracted_whitespace):
                 index_from_end -= 1
         assert index_from_end >= 0, "Index must be within the string."
@@ -137,20 +118,12 @@ class TabHelper:
             corrected_prefix = corrected_extracted_whitespace
             corrected_suffix = ""
 
-        LOGGER.debug(
-            "corrected_prefix=:%s:", ParserHelper.make_value_visible(corrected_prefix)
-        )
-        LOGGER.debug(
-            "corrected_suffix=:%s:", ParserHelper.make_value_visible(corrected_suffix)
-        )
+        POGGER.debug("corrected_prefix=:$:", corrected_prefix)
+        POGGER.debug("corrected_suffix=:$:", corrected_suffix)
         split_tab = detabified_suffix != extracted_whitespace
-        LOGGER.debug(
-            "detabified_prefix=:%s:", ParserHelper.make_value_visible(detabified_prefix)
-        )
-        LOGGER.debug(
-            "detabified_suffix=:%s:", ParserHelper.make_value_visible(detabified_suffix)
-        )
-        LOGGER.debug("split_tab=:%s:", str(split_tab))
+        POGGER.debug("detabified_prefix=:$:", detabified_prefix)
+        POGGER.debug("detabified_suffix=:$:", detabified_suffix)
+        POGGER.debug("split_tab=:$:", str(split_tab))
         split_tab_with_block_quote_suffix = False
         if split_tab:
             split_tab_with_block_quote_suffix = detabified_prefix.endswith(">")
@@ -358,13 +331,8 @@ class TabHelper:
         of a tab character.
         """
 
-        LOGGER.debug(
-            "original_line>:%s:<", ParserHelper.make_value_visible(original_line)
-        )
-        LOGGER.debug(
-            "reconstructed_line>:%s:<",
-            ParserHelper.make_value_visible(reconstructed_line),
-        )
+        POGGER.debug("original_line>:$:<", original_line)
+        POGGER.debug("reconstructed_line>:$:<", reconstructed_line)
         (
             adj_original,
             adj_original_index,
@@ -372,9 +340,9 @@ class TabHelper:
         ) = TabHelper.find_detabify_string(
             original_line, reconstructed_line, use_proper_traverse=use_proper_traverse
         )
-        LOGGER.debug(">>adj_original>:%s:<", adj_original)
-        LOGGER.debug(">>adj_original_index>:%d:<", adj_original_index)
-        LOGGER.debug(">>adj_traverse_original_index>:%d:<", adj_traverse_original_index)
+        POGGER.debug(">>adj_original>:$:<", adj_original)
+        POGGER.debug(">>adj_original_index>:$:<", adj_original_index)
+        POGGER.debug(">>adj_traverse_original_index>:$:<", adj_traverse_original_index)
 
         # This is a weird case.
         if adj_original is None and was_indented and original_line[0] == "\t":
@@ -390,7 +358,7 @@ class TabHelper:
             )
             was_indented = False
         split_tab = adj_original is None
-        LOGGER.debug("split_tab>:%s:<", str(split_tab))
+        POGGER.debug("split_tab>:$:<", str(split_tab))
         if split_tab:
             (
                 adj_original,
@@ -409,12 +377,11 @@ class TabHelper:
         return_index = (
             adj_traverse_original_index if use_proper_traverse else adj_original_index
         )
-        LOGGER.debug(
-            "adj_original=:%s:",
-            ParserHelper.make_whitespace_visible(adj_original.replace("\t", "\\t")),
+        POGGER.debug_with_visible_whitespace(
+            "adj_original=:$:", adj_original.replace("\t", "\\t")
         )
-        LOGGER.debug(">>return_index>:%d:<", return_index)
-        LOGGER.debug(">>split_tab>:%s:<", str(split_tab))
+        POGGER.debug(">>return_index>:$:<", return_index)
+        POGGER.debug(">>split_tab>:$:<", str(split_tab))
         return (
             adj_original,
             return_index,
@@ -434,21 +401,15 @@ class TabHelper:
         """
         Find a tabified string within a split.
         """
-        LOGGER.debug(
-            ">>reconstructed_line>:%s:<",
-            ParserHelper.make_whitespace_visible(
-                reconstructed_line.replace("\t", "\\t")
-            ),
+        POGGER.debug_with_visible_whitespace(
+            ">>reconstructed_line>:$:<", reconstructed_line.replace("\t", "\\t")
         )
         # Need to split this tab between two areas.
         if not reconstruct_prefix:
             reconstruct_prefix = " "
         reconstructed_line = f"{reconstruct_prefix}{reconstructed_line}"
-        LOGGER.debug(
-            ">>reconstructed_line>:%s:<",
-            ParserHelper.make_whitespace_visible(
-                reconstructed_line.replace("\t", "\\t")
-            ),
+        POGGER.debug_with_visible_whitespace(
+            ">>reconstructed_line>:$:<", reconstructed_line.replace("\t", "\\t")
         )
         (
             adj_original,
@@ -459,12 +420,12 @@ class TabHelper:
             reconstructed_line,
             use_proper_traverse=use_proper_traverse,
         )
-        LOGGER.debug(">>adj_original>:%s:<", adj_original)
-        LOGGER.debug(">>adj_original_index>:%d:<", adj_original_index)
-        LOGGER.debug(">>adj_traverse_original_index>:%d:<", adj_traverse_original_index)
+        POGGER.debug(">>adj_original>:$:<", adj_original)
+        POGGER.debug(">>adj_original_index>:$:<", adj_original_index)
+        POGGER.debug(">>adj_traverse_original_index>:$:<", adj_traverse_original_index)
         if abc:
             adj_original_index += 1
-            LOGGER.debug(">>adj_original_index>:%d:<", adj_original_index)
+            POGGER.debug(">>adj_original_index>:$:<", adj_original_index)
         return adj_original, adj_original_index, adj_traverse_original_index
 
     @staticmethod
@@ -508,13 +469,13 @@ class TabHelper:
         #     block_quote_token,
         # )
 
-        LOGGER.debug(
-            "__adjust_block_quote_indent_for_tab_block_quote>>block_token>>%s",
+        POGGER.debug(
+            "__adjust_block_quote_indent_for_tab_block_quote>>block_token>>$",
             str(block_quote_token),
         )
         block_quote_token.add_bleading_spaces(last_block_quote_leading_space)
-        LOGGER.debug(
-            "__adjust_block_quote_indent_for_tab_block_quote>>block_token>>%s",
+        POGGER.debug(
+            "__adjust_block_quote_indent_for_tab_block_quote>>block_token>>$",
             str(block_quote_token),
         )
         # POGGER.debug(
@@ -561,25 +522,16 @@ class TabHelper:
             ListStartMarkdownToken,
             parser_state.token_stack[stack_token_index].matching_markdown_token,
         )
-        LOGGER.debug(
-            "list_start_token=:%s:",
-            ParserHelper.make_value_visible(list_start_token),
-        )
+        POGGER.debug("list_start_token=:$:", list_start_token)
         list_leading_spaces = list_start_token.leading_spaces
         assert list_leading_spaces is not None, "Leading spaces must be defined by now."
-        LOGGER.debug(
-            "list_leading_spaces=:%s:",
-            ParserHelper.make_value_visible(list_leading_spaces),
-        )
+        POGGER.debug("list_leading_spaces=:$:", list_leading_spaces)
         list_leading_spaces_index = list_leading_spaces.rfind("\n")
         last_list_leading_space = list_leading_spaces[list_leading_spaces_index + 1 :]
-        LOGGER.debug(
-            "last_list_leading_space=:%s:",
-            ParserHelper.make_value_visible(last_list_leading_space),
-        )
+        POGGER.debug("last_list_leading_space=:$:", last_list_leading_space)
         tab_index = extracted_whitespace.find("\t")
-        LOGGER.debug("extracted_whitespace=:%s:", extracted_whitespace)
-        LOGGER.debug("tab_index=:%d:", tab_index)
+        POGGER.debug("extracted_whitespace=:$:", extracted_whitespace)
+        POGGER.debug("tab_index=:$:", tab_index)
 
         if (
             tab_index == -1
@@ -604,23 +556,14 @@ class TabHelper:
                 alternate_list_leading_space,
                 extracted_whitespace,
             )
-        LOGGER.debug("last_list_leading_space=:%s:", last_list_leading_space)
-        LOGGER.debug("extracted_whitespace=:%s:", extracted_whitespace)
+        POGGER.debug("last_list_leading_space=:$:", last_list_leading_space)
+        POGGER.debug("extracted_whitespace=:$:", extracted_whitespace)
 
-        LOGGER.debug(
-            "list_start_token=:%s:",
-            ParserHelper.make_value_visible(list_start_token),
-        )
+        POGGER.debug("list_start_token=:$:", list_start_token)
         list_start_token.remove_last_leading_space()
-        LOGGER.debug(
-            "list_start_token=:%s:",
-            ParserHelper.make_value_visible(list_start_token),
-        )
+        POGGER.debug("list_start_token=:$:", list_start_token)
         list_start_token.add_leading_spaces(last_list_leading_space)
-        LOGGER.debug(
-            "list_start_token=:%s:",
-            ParserHelper.make_value_visible(list_start_token),
-        )
+        POGGER.debug("list_start_token=:$:", list_start_token)
         return extracted_whitespace
 
     # pylint: enable=too-many-arguments
@@ -658,14 +601,8 @@ class TabHelper:
         """
         Adjust the last block quote for a tab.
         """
-        LOGGER.debug(
-            "extracted_whitespace=:%s:",
-            ParserHelper.make_value_visible(extracted_whitespace),
-        )
-        LOGGER.debug(
-            "parser_state=:%s:",
-            ParserHelper.make_value_visible(parser_state.token_stack),
-        )
+        POGGER.debug("extracted_whitespace=:$:", extracted_whitespace)
+        POGGER.debug("parser_state=:$:", parser_state.token_stack)
         stack_token_index = len(parser_state.token_stack) - 1
         while (
             stack_token_index > 0
@@ -675,12 +612,7 @@ class TabHelper:
             stack_token_index -= 1
         assert stack_token_index != 0, "Must not have gone back to the root index."
 
-        LOGGER.debug(
-            "parser_state=:%s:",
-            ParserHelper.make_value_visible(
-                parser_state.token_stack[stack_token_index]
-            ),
-        )
+        POGGER.debug("parser_state=:$:", parser_state.token_stack[stack_token_index])
         if parser_state.token_stack[stack_token_index].is_block_quote:
             TabHelper.__adjust_block_quote_indent_for_tab_block_quote(
                 parser_state, stack_token_index
@@ -0,0 +1,108 @@
+"""
+Module to provide for a cache of the tokens produced by tokenizing a document,
+keyed by the contents of that document.
+"""
+
+import hashlib
+import logging
+import pickle  # nosec B403
+import threading
+from collections import OrderedDict
+from typing import Callable, List, Tuple, cast
+
+from pymarkdown.general.parser_logger import ParserLogger
+from pymarkdown.tokens.markdown_token import MarkdownToken
+
+POGGER = ParserLogger(logging.getLogger(__name__))
+
+
+class TokenStreamCache:
+    """
+    Class to provide for a cache of the tokens produced by tokenizing a document,
+    keyed by a hash of the document's contents and a fingerprint of the
+    configuration that affects how it is tokenized.
+
+    When fixing a document, the same contents are often tokenized more than once,
+    such as when a pass over the document does not change it.  As the fixes are
+    applied by changing the tokens, each entry is kept in its pickled form, and a
+    new copy of the tokens is returned for each request.  That way, any changes made
+    to the returned tokens do not affect the cache.  Only the most recently used
+    entries are kept, and the cache can be used from multiple threads at the same
+    time.
+    """
+
+    default_maximum_entries = 32
+    """Default number of entries to keep before the least recently used is removed.
+    """
+
+    def __init__(self, maximum_entries: int = default_maximum_entries) -> None:
+        """
+        Initialize a new instance of the TokenStreamCache class.
+        """
+        if maximum_entries < 1:
+            raise ValueError("Maximum number of entries must be at least 1.")
+        self.__maximum_entries = maximum_entries
+        self.__cached_tokens: "OrderedDict[Tuple[str, str], bytes]" = OrderedDict()
+        self.__cache_lock = threading.Lock()
+        self.__hit_count = 0
+        self.__miss_count = 0
+
+    @property
+    def hit_count(self) -> int:
+        """
+        Number of requests that were satisfied from the cache.
+        """
+        return self.__hit_count
+
+    @property
+    def miss_count(self) -> int:
+        """
+        Number of requests that required the document to be tokenized.
+        """
+        return self.__miss_count
+
+    def clear(self) -> None:
+        """
+        Remove every entry from the cache.
+        """
+        with self.__cache_lock:
+            self.__cached_tokens.clear()
+
+    def get_tokens(
+        self,
+        source_text: str,
+        configuration_fingerprint: str,
+        tokenize_function: Callable[[], List[MarkdownToken]],
+    ) -> List[MarkdownToken]:
+        """
+        Get the tokens for the specified text, calling the tokenize function to
+        produce them if they are not already cached.  The returned tokens are not
+        shared with the cache, or with any other caller, and may be changed.
+        """
+        cache_key = (
+            configuration_fingerprint,
+            hashlib.sha256(source_text.encode("utf-8")).hexdigest(),
+        )
+        with self.__cache_lock:
+            pickled_tokens = self.__cached_tokens.get(cache_key)
+            if pickled_tokens is not None:
+                self.__cached_tokens.move_to_end(cache_key)
+                self.__hit_count += 1
+            else:
+                self.__miss_count += 1
+
+        if pickled_tokens is not None:
+            POGGER.info("Token stream cache hit for contents '$'.", cache_key[1])
+            # The pickled tokens were produced by this class and are never read from
+            # or written to anywhere outside of this process.
+            return cast(List[MarkdownToken], pickle.loads(pickled_tokens))  # nosec B301
+
+        POGGER.info("Token stream cache miss for contents '$'.", cache_key[1])
+        actual_tokens = tokenize_function()
+        pickled_tokens = pickle.dumps(actual_tokens, protocol=pickle.HIGHEST_PROTOCOL)
+        with self.__cache_lock:
+            self.__cached_tokens[cache_key] = pickled_tokens
+            self.__cached_tokens.move_to_end(cache_key)
+            while len(self.__cached_tokens) > self.__maximum_entries:
+                self.__cached_tokens.popitem(last=False)
+        return actual_tokens
@@ -2,9 +2,10 @@
 Module to provide a tokenization of a markdown-encoded string.
 """
 
+import contextlib
 import logging
 import os
-from typing import List, Optional, Tuple, cast
+from typing import ContextManager, List, Optional, Tuple, cast
 
 from application_properties import ApplicationProperties
 
@@ -20,9 +21,11 @@ from pymarkdown.extensions.front_matter_extension import FrontMatterExtension
 from pymarkdown.extensions.pragma_token import PragmaToken
 from pymarkdown.general.bad_tokenization_error import BadTokenizationError
 from pymarkdown.general.constants import Constants
+from pymarkdown.general.parse_session import ParseSession
 from pymarkdown.general.parser_helper import ParserHelper
 from pymarkdown.general.parser_logger import ParserLogger
 from pymarkdown.general.parser_state import ParserState
+from pymarkdown.general.phase_timer import PhaseTimer
 from pymarkdown.general.position_marker import PositionMarker
 from pymarkdown.general.requeue_line_info import RequeueLineInfo
 from pymarkdown.general.source_providers import InMemorySourceProvider, SourceProvider
@@ -30,13 +33,13 @@ from pymarkdown.html.html_helper import HtmlHelper
 from pymarkdown.inline.inline_character_reference_helper import (
     InlineCharacterReferenceHelper,
 )
+from pymarkdown.inline.inline_handler_helper import InlineHandlers
 from pymarkdown.inline.inline_processor import InlineProcessor
 from pymarkdown.leaf_blocks.leaf_block_helper import LeafBlockHelper
 from pymarkdown.leaf_blocks.leaf_block_processor_paragraph import (
     LeafBlockProcessorParagraph,
 )
 from pymarkdown.leaf_blocks.table_block_processor import TableBlockHelper
-from pymarkdown.links.link_parse_helper import LinkParseHelper
 from pymarkdown.links.link_reference_definition_helper import (
     LinkReferenceDefinitionHelper,
 )
@@ -67,11 +70,9 @@ class TokenizedMarkdown:
         Initializes a new instance of the TokenizedMarkdown class.
         """
 
-        self.__tokenized_document: List[MarkdownToken] = []
-        self.__token_stack: List[StackToken] = []
-        self.__parse_properties: Optional[ParseBlockPassProperties] = None
-        self.__source_provider: Optional[SourceProvider] = None
         self.__extension_manager: Optional[ExtensionManager] = None
+        self.__inline_handlers: Optional[InlineHandlers] = None
+        self.__phase_timer: Optional[PhaseTimer] = None
 
         if not resource_path:
             resource_path = os.path.join(os.path.split(__file__)[0], "..", "resources")
@@ -88,18 +89,52 @@ class TokenizedMarkdown:
         """
         _ = application_properties
         self.__extension_manager = extension_manager
-        self.__parse_properties = ParseBlockPassProperties(extension_manager)
+        self.__inline_handlers = InlineProcessor.create_inline_handlers(
+            extension_manager
+        )
+
+    @property
+    def configuration_fingerprint(self) -> str:
+        """
+        Fingerprint of any configuration that affects how documents are tokenized.
+        """
+        assert (
+            self.__extension_manager is not None
+        ), "Configuration must be applied before it can be fingerprinted."
+        return self.__extension_manager.configuration_fingerprint
+
+    def set_phase_timer(self, phase_timer: Optional[PhaseTimer]) -> None:
+        """
+        Set the timer used to measure the time taken by each phase of tokenizing,
+        or None to stop measuring.
+        """
+        self.__phase_timer = phase_timer
+
+    def __measure_phase(self, phase_name: str) -> ContextManager[None]:
+        return (
+            self.__phase_timer.measure(phase_name)
+            if self.__phase_timer
+            else contextlib.nullcontext()
+        )
+
+    @property
+    def __session(self) -> ParseSession:
+        return ParseSession.current()
 
     def transform_from_provider(
         self,
         source_provider: Optional[SourceProvider],
         do_add_end_of_stream_token: bool = False,
+        starting_line_number: int = 1,
     ) -> List[MarkdownToken]:
         """
         Transform the data from the source provider into a Markdown token stream.
+        If the source provider only provides part of a document, the starting
+        line number is the line number of the first line that it provides.
         """
-        self.__source_provider = source_provider
-        return self.__transform(do_add_end_of_stream_token)
+        return self.__transform(
+            source_provider, do_add_end_of_stream_token, starting_line_number
+        )
 
     def transform(
         self,
@@ -115,42 +150,57 @@ class TokenizedMarkdown:
 
         logging.getLogger().setLevel(logging.DEBUG if show_debug else logging.WARNING)
         ParserLogger.sync_on_next_call()
-        self.__source_provider = InMemorySourceProvider(your_text_string)
-        return self.__transform(do_add_end_of_stream_token)
+        return self.__transform(
+            InMemorySourceProvider(your_text_string), do_add_end_of_stream_token, 1
+        )
 
-    def __transform(self, do_add_end_of_stream_token: bool) -> List[MarkdownToken]:
+    def __transform(
+        self,
+        source_provider: Optional[SourceProvider],
+        do_add_end_of_stream_token: bool,
+        starting_line_number: int,
+    ) -> List[MarkdownToken]:
         """
         Transform a markdown-encoded string into an array of tokens.
+
+        All of the state for the parse is kept in a new parse session, allowing
+        this function to be called from different threads at the same time.
         """
         try:
-            self.__tokenized_document = []
-            self.__token_stack = []
-
             assert (
                 self.__extension_manager is not None
+                and self.__inline_handlers is not None
             ), "Extension manager must be initialized by this point."
-            InlineProcessor.initialize(self.__extension_manager)
-            LinkParseHelper.initialize()
-
-            POGGER.debug("\n\n>>>>>>>parse_blocks_pass>>>>>>")
-            first_pass_results = self.__parse_blocks_pass(do_add_end_of_stream_token)
+            assert (
+                source_provider is not None
+            ), "Source provider must be defined by this point."
+            with ParseSession(
+                source_provider,
+                ParseBlockPassProperties(self.__extension_manager),
+                self.__inline_handlers,
+            ) as parse_session:
+                POGGER.debug("\n\n>>>>>>>parse_blocks_pass>>>>>>")
+                with self.__measure_phase(PhaseTimer.block_pass_phase):
+                    first_pass_results = self.__parse_blocks_pass(
+                        do_add_end_of_stream_token, starting_line_number
+                    )
 
-            POGGER.debug("\n\n>>>>>>>coalesce_text_blocks>>>>>>")
-            coalesced_results = CoalesceProcessor.coalesce_text_blocks(
-                first_pass_results
-            )
+                POGGER.debug("\n\n>>>>>>>coalesce_text_blocks>>>>>>")
+                with self.__measure_phase(PhaseTimer.coalesce_phase):
+                    coalesced_results = CoalesceProcessor.coalesce_text_blocks(
+                        first_pass_results
+                    )
 
-            POGGER.debug("\n\n>>>>>>>parse_inline>>>>>>")
-            assert (
-                self.__parse_properties is not None
-            ), "Parse properties must be defined by this point."
-            final_pass_results = InlineProcessor.parse_inline(
-                coalesced_results, self.__parse_properties
-            )
+                POGGER.debug("\n\n>>>>>>>parse_inline>>>>>>")
+                with self.__measure_phase(PhaseTimer.inline_phase):
+                    final_pass_results = InlineProcessor.parse_inline(
+                        coalesced_results, parse_session.parse_properties
+                    )
 
-            final_coalesced_results = CoalesceProcessor.coalesce_text_blocks(
-                final_pass_results, only_change_text_blocks=True
-            )
+                with self.__measure_phase(PhaseTimer.coalesce_phase):
+                    final_coalesced_results = CoalesceProcessor.coalesce_text_blocks(
+                        final_pass_results, only_change_text_blocks=True
+                    )
             POGGER.debug("\n\n>>>>>>>final_pass_results>>>>>>")
             return final_coalesced_results
         except Exception as this_exception:
@@ -159,27 +209,21 @@ class TokenizedMarkdown:
             ) from this_exception
 
     def __parse_blocks_pass(
-        self, do_add_end_of_stream_token: bool
+        self, do_add_end_of_stream_token: bool, starting_line_number: int
     ) -> List[MarkdownToken]:
         """
         The first pass at the tokens is to deal with blocks.
         """
 
-        assert (
-            self.__parse_properties is not None
-        ), "Parse properties must be defined by this point."
-        assert (
-            self.__source_provider is not None
-        ), "Source provider must be defined by this point."
-        self.__token_stack = [DocumentStackToken()]
-        self.__tokenized_document = []
-        self.__parse_properties.pragma_lines = {}
+        self.__session.token_stack = [DocumentStackToken()]
+        self.__session.token_document = []
+        self.__session.parse_properties.pragma_lines = {}
 
         POGGER.debug("---")
         try:
             first_line_in_document, line_number = (
-                self.__source_provider.get_next_line(),
-                1,
+                self.__session.source_provider.get_next_line(),
+                starting_line_number,
             )
             POGGER.debug("---$---", first_line_in_document)
             (
@@ -221,13 +265,13 @@ class TokenizedMarkdown:
             raise BadTokenizationError(error_message) from this_exception
 
         if do_add_end_of_stream_token:
-            self.__tokenized_document.append(EndOfStreamToken(line_number))
+            self.__session.token_document.append(EndOfStreamToken(line_number))
 
-        if self.__parse_properties.pragma_lines:
-            self.__tokenized_document.append(
-                PragmaToken(self.__parse_properties.pragma_lines)
+        if self.__session.parse_properties.pragma_lines:
+            self.__session.token_document.append(
+                PragmaToken(self.__session.parse_properties.pragma_lines)
             )
-        return self.__tokenized_document
+        return self.__session.token_document
 
     # pylint: disable=too-many-arguments
     def __parse_blocks_pass_next_line(
@@ -241,20 +285,17 @@ class TokenizedMarkdown:
         ignore_table_start: bool,
     ) -> Tuple[bool, bool, bool, bool, bool, List[str], int, Optional[str]]:
         POGGER.debug("next-line>>$", next_line_in_document)
-        POGGER.debug("stack>>$", self.__token_stack)
-        POGGER.debug("current_block>>$", self.__token_stack[-1])
+        POGGER.debug("stack>>$", self.__session.token_stack)
+        POGGER.debug("current_block>>$", self.__session.token_stack[-1])
         POGGER.debug("line_number>>$", line_number)
         POGGER.debug("---")
 
-        assert (
-            self.__parse_properties is not None
-        ), "Parse properties must be defined by this point."
         parser_state = ParserState(
-            self.__token_stack,
-            self.__tokenized_document,
+            self.__session.token_stack,
+            self.__session.token_document,
             TokenizedMarkdown.__close_open_blocks,
             self.__handle_blank_line,
-            self.__parse_properties,
+            self.__session.parse_properties,
         )
         keep_on_going = True
         if did_start_close:
@@ -318,24 +359,26 @@ class TokenizedMarkdown:
     ) -> Tuple[bool, bool, List[MarkdownToken], int, bool, Optional[RequeueLineInfo]]:
         POGGER.debug("\n\ncleanup")
 
-        was_link_definition_started_before_close = self.__token_stack[
+        was_link_definition_started_before_close = self.__session.token_stack[
             -1
         ].was_link_definition_started
-        was_table_started_before_close = self.__token_stack[-1].was_table_block_started
+        was_table_started_before_close = self.__session.token_stack[
+            -1
+        ].was_table_block_started
 
         (
             tokens_from_line,
             requeue_line_info,
         ) = TokenizedMarkdown.__close_open_blocks(
             parser_state,
-            self.__tokenized_document,
+            self.__session.token_document,
             include_block_quotes=True,
             include_lists=True,
             caller_can_handle_requeue=True,
             was_forced=True,
         )
-        if not self.__tokenized_document:
-            self.__tokenized_document.extend(tokens_from_line)
+        if not self.__session.token_document:
+            self.__session.token_document.extend(tokens_from_line)
 
         keep_on_going = bool(requeue_line_info and requeue_line_info.lines_to_requeue)
         did_start_close = not keep_on_going
@@ -371,7 +414,7 @@ class TokenizedMarkdown:
         ignore_link_definition_start: bool,
         ignore_table_start: bool,
     ) -> Tuple[Optional[List[MarkdownToken]], Optional[RequeueLineInfo]]:
-        POGGER.debug(">>>>$", self.__tokenized_document)
+        POGGER.debug(">>>>$", self.__session.token_document)
 
         if not next_line_in_document or not next_line_in_document.strip(
             Constants.ascii_whitespace
@@ -388,9 +431,6 @@ class TokenizedMarkdown:
             )
         else:
             POGGER.debug("\n\nnormal lines")
-            assert (
-                self.__parse_properties is not None
-            ), "Parse properties must be defined by this point."
             (
                 tokens_from_line,
                 _,
@@ -403,11 +443,11 @@ class TokenizedMarkdown:
                 position_marker,
                 ignore_link_definition_start,
                 ignore_table_start,
-                self.__parse_properties,
+                self.__session.parse_properties,
                 0,
             )
 
-        POGGER.debug("<<<<$", self.__tokenized_document)
+        POGGER.debug("<<<<$", self.__session.token_document)
 
         return tokens_from_line, requeue_line_info
 
@@ -429,13 +469,13 @@ class TokenizedMarkdown:
 
         POGGER.debug(
             "---\nbefore>>$",
-            self.__tokenized_document,
+            self.__session.token_document,
         )
         POGGER.debug("before>>$", tokens_from_line)
-        self.__tokenized_document.extend(tokens_from_line)
+        self.__session.token_document.extend(tokens_from_line)
         POGGER.debug(
             "after>>$",
-            self.__tokenized_document,
+            self.__session.token_document,
         )
         if requeue:
             POGGER.debug("requeue>>$", requeue)
@@ -469,16 +509,15 @@ class TokenizedMarkdown:
             number_of_lines_to_requeue = len(requeue_line_info.lines_to_requeue)
             POGGER.debug("\n\n---lines_to_requeue>>$", number_of_lines_to_requeue)
             assert len(requeue_line_info.lines_to_requeue) > 0
-            assert self.__parse_properties is not None
 
             requeue.insert(0, requeue_line_info.lines_to_requeue[0])
             del requeue_line_info.lines_to_requeue[0]
             c = number_of_lines_to_requeue - 1
             while c > 0:
                 line_number -= 1
-                while line_number in self.__parse_properties.pragma_lines:
-                    x = self.__parse_properties.pragma_lines[line_number]
-                    del self.__parse_properties.pragma_lines[line_number]
+                while line_number in self.__session.parse_properties.pragma_lines:
+                    x = self.__session.parse_properties.pragma_lines[line_number]
+                    del self.__session.parse_properties.pragma_lines[line_number]
                     requeue.insert(0, x)
                     line_number -= 1
                 x = requeue_line_info.lines_to_requeue[0]
@@ -514,10 +553,7 @@ class TokenizedMarkdown:
         elif did_started_close:
             did_start_close = True
         else:
-            assert (
-                self.__source_provider is not None
-            ), "Source provider must be defined by this point."
-            next_line_in_document = self.__source_provider.get_next_line()
+            next_line_in_document = self.__session.source_provider.get_next_line()
             if next_line_in_document is None:
                 did_start_close = True
 
@@ -1214,17 +1250,14 @@ class TokenizedMarkdown:
         line_number: int,
         requeue: List[str],
     ) -> Tuple[Optional[str], int, List[str]]:
-        assert self.__source_provider, "Source provider must be defined by this point."
-        assert (
-            self.__parse_properties
-        ), "Parse properties must be defined by this point."
         POGGER.debug(
             "is_front_matter_enabled>>$",
-            self.__parse_properties.is_front_matter_enabled,
+            self.__session.parse_properties.is_front_matter_enabled,
         )
         if (
             first_line_in_document is not None
-            and self.__parse_properties.is_front_matter_enabled
+            and line_number == 1
+            and self.__session.parse_properties.is_front_matter_enabled
         ):
             assert (
                 self.__extension_manager is not None
@@ -1241,7 +1274,7 @@ class TokenizedMarkdown:
                 first_line_in_document,
                 line_number,
                 requeue,
-                self.__source_provider,
-                self.__tokenized_document,
+                self.__session.source_provider,
+                self.__session.token_document,
             )
         return first_line_in_document, line_number, requeue
@@ -0,0 +1,272 @@
+"""
+Module to provide for the rendering of scanned Markdown files into HTML files.
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from application_properties import ApplicationProperties
+
+from pymarkdown.general.parser_logger import ParserLogger
+from pymarkdown.scan_result_cache import ScanResultCache
+from pymarkdown.tokens.markdown_token import MarkdownToken
+from pymarkdown.transform_gfm.transform_to_gfm import TransformToGfm
+from pymarkdown.version import __version__
+
+POGGER = ParserLogger(logging.getLogger(__name__))
+
+
+@dataclass
+class HtmlRenderStatistics:
+    """
+    Class to keep track of how many files were rendered into HTML.
+    """
+
+    rendered: int = 0
+    unchanged: int = 0
+
+
+class HtmlRenderHelper:
+    """
+    Class to provide for the rendering of scanned Markdown files into HTML files.
+
+    Each Markdown file is rendered into a file with the same relative path within
+    the output directory, with its extension replaced with `.html`.  Those relative
+    paths are taken from the deepest directory that contains all the files being
+    scanned.
+
+    A manifest within the output directory records a key for each rendered file,
+    calculated from a hash of the source file's contents and a fingerprint of any
+    configuration that affects the HTML, namely the version of PyMarkdown and the
+    enabled extensions and their configuration.  If the key for a source file
+    matches its entry in the manifest and the HTML file still exists, that file
+    does not need to be rendered again.
+    """
+
+    __directory_property_name = "render.html_directory"
+    __manifest_file_name = ".pymarkdown-render.json"
+    __html_extension = ".html"
+
+    def __init__(
+        self, output_directory: str, base_directory: str, configuration_fingerprint: str
+    ) -> None:
+        """
+        Initialize a new instance of the HtmlRenderHelper class.
+        """
+        self.__output_directory = os.path.abspath(output_directory)
+        self.__base_directory = base_directory
+        self.__configuration_fingerprint = configuration_fingerprint
+        self.__statistics = HtmlRenderStatistics()
+        self.__transformer: Optional[TransformToGfm] = None
+        os.makedirs(self.__output_directory, exist_ok=True)
+        self.__manifest = self.__load_manifest()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Get the state to pickle when handing the helper to a worker process,
+        leaving the transformer to be created again by that worker.
+        """
+        helper_state = dict(self.__dict__)
+        helper_state["_HtmlRenderHelper__transformer"] = None
+        return helper_state
+
+    @property
+    def statistics(self) -> HtmlRenderStatistics:
+        """
+        Statistics on how many files were rendered.
+        """
+        return self.__statistics
+
+    @property
+    def output_directory(self) -> str:
+        """
+        Directory that the HTML files are written into.
+        """
+        return self.__output_directory
+
+    @staticmethod
+    def create_if_enabled(
+        args: argparse.Namespace,
+        properties: ApplicationProperties,
+        files_to_scan: List[str],
+    ) -> Optional["HtmlRenderHelper"]:
+        """
+        Create a new render helper if an HTML directory was specified on the command
+        line or in the configuration.
+        """
+        output_directory = args.scan_html_directory or properties.get_string_property(
+            HtmlRenderHelper.__directory_property_name
+        )
+        if not output_directory or not files_to_scan:
+            return None
+
+        base_directory = os.path.commonpath(
+            [os.path.dirname(os.path.abspath(next_file)) for next_file in files_to_scan]
+        )
+        fingerprint_source = {
+            "version": __version__,
+            "enable_extensions": args.enable_extensions,
+            "extension_properties": ScanResultCache.collect_properties_under(
+                properties, "extensions"
+            ),
+        }
+        fingerprint = hashlib.sha256(
+            json.dumps(fingerprint_source, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+        POGGER.info(
+            "Rendering HTML from '$' into directory '$'.",
+            base_directory,
+            output_directory,
+        )
+        return HtmlRenderHelper(output_directory, base_directory, fingerprint)
+
+    def __load_manifest(self) -> Dict[str, str]:
+        manifest_path = os.path.join(
+            self.__output_directory, HtmlRenderHelper.__manifest_file_name
+        )
+        try:
+            with open(manifest_path, "rt", encoding="utf-8") as manifest_file:
+                loaded_manifest = json.load(manifest_file)
+        except (OSError, ValueError) as this_exception:
+            if os.path.exists(manifest_path):
+                POGGER.info(
+                    "Unable to load render manifest '$': $",
+                    manifest_path,
+                    this_exception,
+                )
+            return {}
+        if not isinstance(loaded_manifest, dict):
+            return {}
+        return {
+            str(output_name): str(render_key)
+            for output_name, render_key in loaded_manifest.items()
+        }
+
+    def __get_output_name(self, file_name: str) -> str:
+        relative_path = os.path.relpath(
+            os.path.abspath(file_name), self.__base_directory
+        )
+        return (
+            os.path.splitext(relative_path)[0] + HtmlRenderHelper.__html_extension
+        ).replace(os.sep, "/")
+
+    def get_output_path(self, file_name: str) -> str:
+        """
+        Get the path of the HTML file that the specified file is rendered into.
+        """
+        return os.path.join(
+            self.__output_directory, *self.__get_output_name(file_name).split("/")
+        )
+
+    def calculate_render_key(self, file_name: str) -> Optional[str]:
+        """
+        Calculate the key for rendering the specified file, returning None if the
+        file cannot be read.
+        """
+        file_hash = hashlib.sha256(self.__configuration_fingerprint.encode("utf-8"))
+        try:
+            with open(file_name, "rb") as file_to_hash:
+                for next_block in iter(lambda: file_to_hash.read(65536), b""):
+                    file_hash.update(next_block)
+        except OSError as this_exception:
+            POGGER.info(
+                "Unable to read file '$' to render it: $", file_name, this_exception
+            )
+            return None
+        return file_hash.hexdigest()
+
+    def is_rendered(self, file_name: str, render_key: Optional[str]) -> bool:
+        """
+        Determine whether the HTML for the specified file is already up to date.
+        """
+        is_up_to_date = bool(
+            render_key
+            and self.__manifest.get(self.__get_output_name(file_name)) == render_key
+            and os.path.exists(self.get_output_path(file_name))
+        )
+        if is_up_to_date:
+            self.__statistics.unchanged += 1
+        return is_up_to_date
+
+    def render_tokens(self, file_name: str, actual_tokens: List[MarkdownToken]) -> None:
+        """
+        Render the tokens for the specified file into its HTML file, replacing
+        that file only once the HTML has been completely written.
+        """
+        if not self.__transformer:
+            self.__transformer = TransformToGfm()
+        output_path = self.get_output_path(file_name)
+        output_directory = os.path.dirname(output_path)
+        os.makedirs(output_directory, exist_ok=True)
+
+        temporary_path = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                "wt",
+                dir=output_directory,
+                suffix=".tmp",
+                delete=False,
+                encoding="utf-8",
+                newline="",
+            ) as output_file:
+                temporary_path = output_file.name
+                self.__transformer.transform_to_stream(actual_tokens, output_file)
+                output_file.write("\n")
+            os.replace(temporary_path, output_path)
+            temporary_path = None
+        except OSError as this_exception:
+            raise OSError(
+                f"Unable to write HTML file '{output_path}': {this_exception}"
+            ) from this_exception
+        finally:
+            if temporary_path and os.path.exists(temporary_path):
+                os.remove(temporary_path)
+        POGGER.info("Rendered file '$' into '$'.", file_name, output_path)
+
+    def record_rendered(self, file_name: str, render_key: Optional[str]) -> None:
+        """
+        Record that the specified file was rendered, so that it is not rendered
+        again until it or the configuration changes.
+        """
+        self.__statistics.rendered += 1
+        if render_key:
+            self.__manifest[self.__get_output_name(file_name)] = render_key
+
+    def close(self) -> None:
+        """
+        Write the manifest for the rendered files, and log the statistics for
+        the rendering.
+        """
+        manifest_path = os.path.join(
+            self.__output_directory, HtmlRenderHelper.__manifest_file_name
+        )
+        temporary_path = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                "wt",
+                dir=self.__output_directory,
+                suffix=".tmp",
+                delete=False,
+                encoding="utf-8",
+            ) as manifest_file:
+                temporary_path = manifest_file.name
+                json.dump(self.__manifest, manifest_file, indent=2, sort_keys=True)
+            os.replace(temporary_path, manifest_path)
+            temporary_path = None
+        except OSError as this_exception:
+            POGGER.info("Unable to store render manifest: $", this_exception)
+        finally:
+            if temporary_path and os.path.exists(temporary_path):
+                os.remove(temporary_path)
+
+        POGGER.info(
+            "Render HTML: $ files rendered, $ files unchanged.",
+            self.__statistics.rendered,
+            self.__statistics.unchanged,
+        )
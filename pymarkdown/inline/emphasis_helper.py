@@ -7,6 +7,7 @@ from typing import List, Optional, Tuple, cast
 
 from pymarkdown.extension_manager.extension_manager import ExtensionManager
 from pymarkdown.general.constants import Constants
+from pymarkdown.general.parse_session import ParseSession
 from pymarkdown.general.parser_helper import ParserHelper
 from pymarkdown.general.parser_logger import ParserLogger
 from pymarkdown.tokens.emphasis_markdown_token import EmphasisMarkdownToken
@@ -23,26 +24,27 @@ class EmphasisHelper:
 
     __simple_emphasis = "*"
     __complex_emphasis = "_"
-    __inline_emphasis = ""
     __strikethrough_emphasis = "~"
 
     @staticmethod
-    def initialize(extension_manager: ExtensionManager) -> None:
+    def calculate_inline_emphasis(extension_manager: ExtensionManager) -> str:
         """
-        Initialize this subsystem.
+        Calculate the string with all inline emphasis characters, based on the
+        enabled extensions.
         """
-        EmphasisHelper.__inline_emphasis = (
+        inline_emphasis = (
             f"{EmphasisHelper.__simple_emphasis}{EmphasisHelper.__complex_emphasis}"
         )
         if extension_manager.is_strike_through_enabled:
-            EmphasisHelper.__inline_emphasis += EmphasisHelper.__strikethrough_emphasis
+            inline_emphasis += EmphasisHelper.__strikethrough_emphasis
+        return inline_emphasis
 
     @staticmethod
     def get_inline_emphasis() -> str:
         """
         Get the current string with all inline emphasis characters.
         """
-        return EmphasisHelper.__inline_emphasis
+        return ParseSession.current().inline_handlers.inline_emphasis
 
     @staticmethod
     def __create_delimiter_stack(
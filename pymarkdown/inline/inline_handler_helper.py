@@ -14,6 +14,7 @@ from pymarkdown.extension_manager.extension_manager import ExtensionManager
 from pymarkdown.extensions.extended_autolinks import MarkdownExtendedAutolinksExtension
 from pymarkdown.extensions.task_list_items import TaskListToken
 from pymarkdown.general.constants import Constants
+from pymarkdown.general.parse_session import ParseSession
 from pymarkdown.general.parser_helper import ParserHelper
 from pymarkdown.general.parser_logger import ParserLogger
 from pymarkdown.inline.emphasis_helper import EmphasisHelper
@@ -56,92 +57,143 @@ class InlineHandlerProtocol(Protocol):
 # pylint: enable=too-few-public-methods
 
 
-class InlineHandlerHelper:
+class InlineHandlers:
     """
-    Class to orchestrate the handling of the different inline elements.
+    Class to provide for the handlers for the characters that may start an inline
+    element, as determined by the extensions that are enabled.
+
+    Once all of the handlers are registered, they are not changed, allowing them
+    to be shared by any parses that are in progress at the same time.
     """
 
-    valid_inline_text_block_sequence_starts = ""
-    __valid_inline_simple_text_block_sequence_starts = ""
+    def __init__(self, inline_emphasis: str) -> None:
+        """
+        Initialize a new instance of the InlineHandlers class.
+        """
+        self.__inline_emphasis = inline_emphasis
+        self.__character_handlers: Dict[str, InlineHandlerProtocol] = {}
+        self.__sequence_starts = ParserHelper.newline_character
+        self.__simple_sequence_starts = ParserHelper.newline_character
 
-    __inline_character_handlers: Dict[str, InlineHandlerProtocol] = {}
-    __inline_simple_character_handlers: Dict[str, InlineHandlerProtocol] = {}
+    @property
+    def inline_emphasis(self) -> str:
+        """
+        String with all of the characters that may start inline emphasis.
+        """
+        return self.__inline_emphasis
 
-    __inline_processing_needed = ""
+    @property
+    def sequence_starts(self) -> str:
+        """
+        String with all of the characters that may start an inline element.
+        """
+        return self.__sequence_starts
 
-    @staticmethod
-    def initialize(extension_manager: ExtensionManager) -> None:
+    @property
+    def simple_sequence_starts(self) -> str:
         """
-        Initialize the inline processor subsystem.
+        String with all of the characters that start a simple replacement.
         """
-        EmphasisHelper.initialize(extension_manager)
-        InlineHandlerHelper.__inline_processing_needed = (
-            f"{LinkParseHelper.link_label_start}{LinkParseHelper.link_label_end}"
-        )
-        InlineHandlerHelper.__inline_processing_needed += (
-            EmphasisHelper.get_inline_emphasis()
-        )
+        return self.__simple_sequence_starts
+
+    def get_handler(self, inline_character: str) -> Optional[InlineHandlerProtocol]:
+        """
+        Get the handler for the specified character, if one is registered.
+        """
+        return self.__character_handlers.get(inline_character)
+
+    def register_handler(
+        self,
+        inline_character: str,
+        start_token_handler: InlineHandlerProtocol,
+        is_simple_handler: bool = False,
+    ) -> None:
+        """
+        Register the handlers necessary to deal with token's start and end.
+        """
+        self.__character_handlers[inline_character] = start_token_handler
+        self.__sequence_starts += inline_character
+        if is_simple_handler:
+            self.__simple_sequence_starts += inline_character
+
+
+class InlineHandlerHelper:
+    """
+    Class to orchestrate the handling of the different inline elements.
+    """
 
-        InlineHandlerHelper.__inline_character_handlers = {}
-        InlineHandlerHelper.__inline_simple_character_handlers = {}
-        InlineHandlerHelper.valid_inline_text_block_sequence_starts = (
-            ParserHelper.newline_character
+    @staticmethod
+    def create_inline_handlers(extension_manager: ExtensionManager) -> InlineHandlers:
+        """
+        Create the handlers for the inline elements, based on the enabled extensions.
+        """
+        inline_handlers = InlineHandlers(
+            EmphasisHelper.calculate_inline_emphasis(extension_manager)
         )
-        InlineHandlerHelper.__valid_inline_simple_text_block_sequence_starts = (
-            ParserHelper.newline_character
+        inline_processing_needed = (
+            f"{LinkParseHelper.link_label_start}{LinkParseHelper.link_label_end}"
+            + inline_handlers.inline_emphasis
         )
 
-        InlineHandlerHelper.register_handlers(
+        inline_handlers.register_handler(
             InlineBacktickHelper.code_span_bounds,
             InlineBacktickHelper.handle_inline_backtick,
         )
-        InlineHandlerHelper.register_handlers(
+        inline_handlers.register_handler(
             InlineBackslashHelper.backslash_character,
             InlineBackslashHelper.handle_inline_backslash,
             is_simple_handler=True,
         )
-        InlineHandlerHelper.register_handlers(
+        inline_handlers.register_handler(
             InlineCharacterReferenceHelper.character_reference_start_character,
             InlineCharacterReferenceHelper.handle_character_reference,
             is_simple_handler=True,
         )
-        InlineHandlerHelper.register_handlers(
+        inline_handlers.register_handler(
             InlineAutoLinkHelper.angle_bracket_start,
             InlineAutoLinkHelper.handle_angle_brackets,
         )
-        for i in InlineHandlerHelper.__inline_processing_needed:
-            InlineHandlerHelper.register_handlers(
+        for i in inline_processing_needed:
+            inline_handlers.register_handler(
                 i, InlineHandlerHelper.__handle_inline_special_single_character
             )
-        InlineHandlerHelper.register_handlers(
+        inline_handlers.register_handler(
             LinkSearchHelper.image_start_sequence[0],
             InlineHandlerHelper.__handle_inline_image_link_start_character,
         )
         for i in ParserHelper.valid_characters_to_escape():
-            InlineHandlerHelper.register_handlers(
+            inline_handlers.register_handler(
                 i, InlineHandlerHelper.__handle_inline_control_character
             )
         if extension_manager.is_extended_autolinks_enabled:
-            InlineHandlerHelper.register_handlers(
+            inline_handlers.register_handler(
                 "h",
                 MarkdownExtendedAutolinksExtension.handle_http_autolink,
             )
-            InlineHandlerHelper.register_handlers(
+            inline_handlers.register_handler(
                 "w",
                 MarkdownExtendedAutolinksExtension.handle_www_autolink,
             )
-            InlineHandlerHelper.register_handlers(
+            inline_handlers.register_handler(
                 "@",
                 MarkdownExtendedAutolinksExtension.handle_email_autolink,
             )
-            InlineHandlerHelper.register_handlers(
+            inline_handlers.register_handler(
                 "x",
                 MarkdownExtendedAutolinksExtension.handle_email_autolink,
             )
-            InlineHandlerHelper.register_handlers(
+            inline_handlers.register_handler(
                 "m",
                 MarkdownExtendedAutolinksExtension.handle_email_autolink,
             )
+        return inline_handlers
+
+    @staticmethod
+    def get_valid_inline_text_block_sequence_starts() -> str:
+        """
+        Get the string with all of the characters that may start an inline element.
+        """
+        return ParseSession.current().inline_handlers.sequence_starts
 
     @staticmethod
     def __handle_inline_control_character(
@@ -170,34 +222,20 @@ class InlineHandlerHelper:
         """
         Check to see if a handler is registered.
         """
-        return inline_character in InlineHandlerHelper.__inline_character_handlers
+        return (
+            ParseSession.current().inline_handlers.get_handler(inline_character)
+            is not None
+        )
 
     @staticmethod
     def __get_handler(
         inline_character: str,
     ) -> InlineHandlerProtocol:
-        return InlineHandlerHelper.__inline_character_handlers[inline_character]
-
-    @staticmethod
-    def register_handlers(
-        inline_character: str,
-        start_token_handler: InlineHandlerProtocol,
-        is_simple_handler: bool = False,
-    ) -> None:
-        """
-        Register the handlers necessary to deal with token's start and end.
-        """
-        InlineHandlerHelper.__inline_character_handlers[inline_character] = (
-            start_token_handler
+        inline_handler = ParseSession.current().inline_handlers.get_handler(
+            inline_character
         )
-        InlineHandlerHelper.valid_inline_text_block_sequence_starts += inline_character
-        if is_simple_handler:
-            InlineHandlerHelper.__inline_simple_character_handlers[inline_character] = (
-                start_token_handler
-            )
-            InlineHandlerHelper.__valid_inline_simple_text_block_sequence_starts += (
-                inline_character
-            )
+        assert inline_handler is not None, "Handler must be registered."
+        return inline_handler
 
     @staticmethod
     def process_simple_inline_fn(
@@ -207,23 +245,17 @@ class InlineHandlerHelper:
         Handle a simple processing of inline text for simple replacements.
         """
 
+        inline_handlers = ParseSession.current().inline_handlers
         start_index, processed_parts = 0, []
         next_index = ParserHelper.index_any_of(
             source_text,
-            InlineHandlerHelper.__valid_inline_simple_text_block_sequence_starts,
+            inline_handlers.simple_sequence_starts,
             start_index,
         )
         while next_index != -1:
             processed_parts.append(source_text[start_index:next_index])
             inline_request = InlineRequest(source_text, next_index)
-            if (
-                source_text[next_index]
-                in InlineHandlerHelper.__inline_character_handlers
-            ):
-                proc_fn = InlineHandlerHelper.__inline_character_handlers[
-                    source_text[next_index]
-                ]
-                # assert proc_fn is not None
+            if proc_fn := inline_handlers.get_handler(source_text[next_index]):
                 inline_response = proc_fn(parser_properties, inline_request)
                 assert (
                     inline_response.new_string is not None
@@ -238,7 +270,7 @@ class InlineHandlerHelper:
                 start_index = next_index + 1
             next_index = ParserHelper.index_any_of(
                 source_text,
-                InlineHandlerHelper.__valid_inline_simple_text_block_sequence_starts,
+                inline_handlers.simple_sequence_starts,
                 start_index,
             )
 
@@ -11,7 +11,7 @@ from pymarkdown.container_blocks.parse_block_pass_properties import (
 from pymarkdown.extension_manager.extension_manager import ExtensionManager
 from pymarkdown.general.parser_helper import ParserHelper
 from pymarkdown.general.parser_logger import ParserLogger
-from pymarkdown.inline.inline_handler_helper import InlineHandlerHelper
+from pymarkdown.inline.inline_handler_helper import InlineHandlerHelper, InlineHandlers
 from pymarkdown.inline.inline_helper import InlineHelper
 from pymarkdown.inline.inline_text_block_helper import InlineTextBlockHelper
 from pymarkdown.plugins.utils.leading_space_index_tracker import (
@@ -34,11 +34,11 @@ class InlineProcessor:
     """
 
     @staticmethod
-    def initialize(extension_manager: ExtensionManager) -> None:
+    def create_inline_handlers(extension_manager: ExtensionManager) -> InlineHandlers:
         """
-        Initialize the inline processor subsystem.
+        Create the handlers for the inline elements, based on the enabled extensions.
         """
-        InlineHandlerHelper.initialize(extension_manager)
+        return InlineHandlerHelper.create_inline_handlers(extension_manager)
 
     @staticmethod
     def __parse_inline_tracker_start(
@@ -280,12 +280,9 @@ class InlineProcessor:
         )
         paragraph_token.add_whitespace(text_token.extracted_whitespace)
         POGGER.debug(">>after_add_ws>>$", coalesced_list[-1])
-        POGGER.debug(
-            ">>text_token>>$", ParserHelper.make_whitespace_visible(str(text_token))
-        )
-        POGGER.debug(
-            "text_token.token_text>:$:<",
-            ParserHelper.make_whitespace_visible(str(text_token.token_text)),
+        POGGER.debug_with_visible_whitespace(">>text_token>>$", str(text_token))
+        POGGER.debug_with_visible_whitespace(
+            "text_token.token_text>:$:<", str(text_token.token_text)
         )
         return InlineTextBlockHelper.process_inline_text_block(
             parse_properties,
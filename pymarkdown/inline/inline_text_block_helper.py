@@ -79,7 +79,7 @@ class InlineTextBlockHelper:
 
         next_index = ParserHelper.index_any_of(
             source_text,
-            InlineHandlerHelper.valid_inline_text_block_sequence_starts,
+            InlineHandlerHelper.get_valid_inline_text_block_sequence_starts(),
             start_index,
         )
         return next_index, pragma_line_numbers, source_text, split_para_space
@@ -1113,7 +1113,7 @@ class InlineTextBlockHelper:
         start_index = new_index
         next_index = ParserHelper.index_any_of(
             source_text,
-            InlineHandlerHelper.valid_inline_text_block_sequence_starts,
+            InlineHandlerHelper.get_valid_inline_text_block_sequence_starts(),
             start_index,
         )
         return (
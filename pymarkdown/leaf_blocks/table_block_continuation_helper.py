@@ -1,6 +1,5 @@
 """Module to help with the continuation or stopping of a table block."""
 
-import copy
 from typing import List, Optional, Tuple, cast
 
 from pymarkdown.container_blocks.container_grab_bag import POGGER
@@ -849,15 +848,18 @@ class TableBlockContinuationHelper:
                 markdown_token = parser_state.token_stack[lbqi].matching_markdown_token
                 assert markdown_token is not None
                 new_token.last_block_quote_markdown_token_index = (
-                    parser_state.token_document.index(markdown_token)
+                    parser_state.find_matching_markdown_token_index(
+                        parser_state.token_stack[lbqi]
+                    )
                 )
                 new_token.copy_of_last_block_quote_markdown_token = cast(
                     BlockQuoteMarkdownToken,
-                    copy.deepcopy(
+                    cast(
+                        BlockQuoteMarkdownToken,
                         parser_state.token_document[
                             new_token.last_block_quote_markdown_token_index
-                        ]
-                    ),
+                        ],
+                    ).create_snapshot(),
                 )
 
             new_token.copy_of_token_stack = parser_state.copy_of_token_stack
@@ -5,12 +5,13 @@ Module to provide for the ability to parse the text for a link.
 import logging
 import urllib
 import urllib.parse
-from typing import Dict, List, Optional, Tuple
+from typing import List, Optional, Tuple
 
 from pymarkdown.container_blocks.parse_block_pass_properties import (
     ParseBlockPassProperties,
 )
 from pymarkdown.general.constants import Constants
+from pymarkdown.general.parse_session import ParseSession
 from pymarkdown.general.parser_helper import ParserHelper
 from pymarkdown.general.parser_logger import ParserLogger
 from pymarkdown.inline.inline_backslash_helper import InlineBackslashHelper
@@ -27,8 +28,6 @@ class LinkParseHelper:
     Class to provide for the ability to parse the text for a link.
     """
 
-    __link_definitions: Dict[str, LinkReferenceTitles] = {}
-
     __link_safe_characters = "/#:?=()*!$'+,;@"
     __special_link_destination_characters = "%&"
 
@@ -61,29 +60,23 @@ class LinkParseHelper:
     __non_angle_link_unnest = ")"
     __non_angle_link_breaks = f"{Constants.ascii_control_characters}()\\"
 
-    @staticmethod
-    def initialize() -> None:
-        """
-        Initialize the inline subsystem.
-        """
-        LinkParseHelper.__link_definitions = {}
-
     @staticmethod
     def add_link_definition(link_name: str, link_value: LinkReferenceTitles) -> bool:
         """
         Add a link definition to the cache of links.
         """
+        link_definitions = ParseSession.current().link_definitions
         POGGER.debug(
             ">>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>$",
-            LinkParseHelper.__link_definitions,
+            link_definitions,
         )
         POGGER.debug(
             ">>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>$:$",
             link_name,
             link_value,
         )
-        if did_add_definition := link_name not in LinkParseHelper.__link_definitions:
-            LinkParseHelper.__link_definitions[link_name] = link_value
+        if did_add_definition := link_name not in link_definitions:
+            link_definitions[link_name] = link_value
             POGGER.debug(">>added def>>$-->$", link_name, link_value)
         return did_add_definition
 
@@ -123,14 +116,15 @@ class LinkParseHelper:
         link_label = LinkParseHelper.normalize_link_label(link_to_lookup)
         POGGER.debug("post>>$<<", link_label)
 
-        POGGER.debug("defs>>$<<", LinkParseHelper.__link_definitions)
-        if not link_label or link_label not in LinkParseHelper.__link_definitions:
+        link_definitions = ParseSession.current().link_definitions
+        POGGER.debug("defs>>$<<", link_definitions)
+        if not link_label or link_label not in link_definitions:
             update_index: int = -1
             inline_link: str = ""
             inline_title: str = ""
         else:
             POGGER.debug(link_type)
-            link_titles = LinkParseHelper.__link_definitions[link_label]
+            link_titles = link_definitions[link_label]
             assert (
                 link_titles.inline_link is not None
                 and link_titles.inline_title is not None
@@ -794,9 +788,7 @@ class LinkParseHelper:
         )
         if after_whitespace_index == len(line_to_parse) and not is_blank_line:
             return False, after_whitespace_index, None, None, None, None
-        POGGER.debug(
-            "Pre-LD>>$<<", ParserHelper.make_whitespace_visible(prefix_whitespace)
-        )
+        POGGER.debug_with_visible_whitespace("Pre-LD>>$<<", prefix_whitespace)
         POGGER.debug("LD>>$<<", line_to_parse[after_whitespace_index:])
         (
             inline_link,
@@ -530,17 +530,11 @@ class LinkReferenceDefinitionHelper:
                 parser_state.original_line_to_parse
             )
         while link_ref_stack_token.continuation_lines:
-            POGGER.debug(
-                "continuation_lines>>$<<",
-                ParserHelper.make_whitespace_visible(
-                    str(link_ref_stack_token.continuation_lines)
-                ),
+            POGGER.debug_with_visible_whitespace(
+                "continuation_lines>>$<<", str(link_ref_stack_token.continuation_lines)
             )
-            POGGER.debug(
-                "unmodified_lines>>$<<",
-                ParserHelper.make_whitespace_visible(
-                    str(link_ref_stack_token.unmodified_lines)
-                ),
+            POGGER.debug_with_visible_whitespace(
+                "unmodified_lines>>$<<", str(link_ref_stack_token.unmodified_lines)
             )
 
             assert link_ref_stack_token.unmodified_lines[-1] is not None
@@ -0,0 +1,189 @@
+"""
+Module to provide for a thin client that sends commands to a running PyMarkdown
+server, falling back to running them within the current process if no server
+is running.
+"""
+
+import json
+import os
+import socket
+import sys
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from pymarkdown.lint_server import LintServer
+
+
+@dataclass(frozen=True)
+class LintClientResult:
+    """
+    Class to provide for the results of running a command.
+    """
+
+    return_code: int
+    std_out: str
+    std_err: str
+    was_run_by_server: bool
+
+
+class LintClient:
+    """
+    Class to provide for a thin client that sends commands to a running PyMarkdown
+    server, falling back to running them within the current process if no server
+    is running.
+
+    Only a socket that is owned by the current user is connected to, so that a
+    server started by another user cannot be sent the commands.  Otherwise, the
+    commands are run within the current process.
+
+    Note that this module only imports the rest of PyMarkdown when a command is
+    run within the current process, so that the client starts quickly when a
+    server is running.
+    """
+
+    __stdin_scan_subcommand = "scan-stdin"
+
+    def __init__(
+        self, socket_path: Optional[str] = None, connect_timeout: float = 1.0
+    ) -> None:
+        """
+        Initialize a new instance of the LintClient class.
+        """
+        self.__socket_path = socket_path or LintServer.default_socket_path()
+        self.__connect_timeout = connect_timeout
+        self.__next_request_id = 1
+
+    def run(
+        self, arguments: List[str], standard_input: Optional[str] = None
+    ) -> LintClientResult:
+        """
+        Run the command with the specified arguments, using the server if one is
+        running, and within the current process if not.
+        """
+        return self.run_on_server(
+            arguments, standard_input
+        ) or LintClient.run_in_process(arguments, standard_input)
+
+    def run_on_server(
+        self, arguments: List[str], standard_input: Optional[str] = None
+    ) -> Optional[LintClientResult]:
+        """
+        Run the command with the specified arguments on the server, returning None
+        if the server could not be reached.
+        """
+        parameters: Dict[str, Any] = {"arguments": arguments, "cwd": os.getcwd()}
+        if standard_input is not None:
+            parameters["stdin"] = standard_input
+        response = self.__send_request("run", parameters)
+        if response is None or not isinstance(response.get("result"), dict):
+            return None
+        result = response["result"]
+        return LintClientResult(
+            result["return_code"], result["stdout"], result["stderr"], True
+        )
+
+    def is_server_running(self) -> bool:
+        """
+        Determine whether a server is listening on the socket, and that socket is
+        owned by the current user.
+        """
+        return LintServer.is_owned_by_current_user(
+            self.__socket_path
+        ) and LintServer.is_listening(self.__socket_path, self.__connect_timeout)
+
+    def shutdown_server(self) -> bool:
+        """
+        Ask the server to stop, returning whether the server was reached.
+        """
+        return self.__send_request("shutdown", {}) is not None
+
+    def __send_request(
+        self, method_name: str, parameters: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        if not hasattr(socket, "AF_UNIX") or not LintServer.is_owned_by_current_user(
+            self.__socket_path
+        ):
+            return None
+        request = {
+            "jsonrpc": "2.0",
+            "id": self.__next_request_id,
+            "method": method_name,
+            "params": parameters,
+        }
+        self.__next_request_id += 1
+        try:
+            with socket.socket(
+                socket.AF_UNIX, socket.SOCK_STREAM  # pylint: disable=no-member
+            ) as client_socket:
+                client_socket.settimeout(self.__connect_timeout)
+                client_socket.connect(self.__socket_path)
+                client_socket.settimeout(None)
+                with client_socket.makefile(
+                    "rw", encoding="utf-8", newline="\n"
+                ) as server_stream:
+                    server_stream.write(json.dumps(request) + "\n")
+                    server_stream.flush()
+                    response = json.loads(server_stream.readline())
+        except (OSError, ValueError):
+            return None
+        return response if isinstance(response, dict) else None
+
+    @staticmethod
+    def run_in_process(
+        arguments: List[str], standard_input: Optional[str] = None
+    ) -> LintClientResult:
+        """
+        Run the command with the specified arguments within the current process,
+        capturing its output.
+        """
+
+        # Imported here so that the client does not pay for importing the parser
+        # and the plugins when a server is running.
+        from pymarkdown.main import (  # pylint: disable=import-outside-toplevel
+            PyMarkdownLint,
+        )
+
+        return_code, std_out, std_err = PyMarkdownLint.run_with_captured_output(
+            arguments, standard_input
+        )
+        return LintClientResult(return_code, std_out, std_err, False)
+
+    @staticmethod
+    def main() -> None:
+        """
+        Main entry point for the client, passing the command line arguments on
+        to the server if one is running, and running PyMarkdown normally if not.
+        """
+        arguments = sys.argv[1:]
+        lint_client = LintClient()
+        if not lint_client.is_server_running():
+            # Imported here so that the client does not pay for importing the
+            # parser and the plugins when a server is running.
+            from pymarkdown.main import (  # pylint: disable=import-outside-toplevel
+                PyMarkdownLint,
+            )
+
+            PyMarkdownLint().main(arguments)
+            return
+
+        standard_input = (
+            sys.stdin.read()
+            if LintClient.__stdin_scan_subcommand in arguments
+            else None
+        )
+        result = lint_client.run(arguments, standard_input)
+        sys.stdout.write(result.std_out)
+        sys.stderr.write(result.std_err)
+        sys.exit(result.return_code)
+
+
+def main() -> None:
+    """
+    Main entry point.  Exposed in this manner so that the setup
+    entry_points configuration has something to execute.
+    """
+    LintClient.main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,347 @@
+"""
+Module to provide for a long-lived server that runs PyMarkdown commands for
+clients, keeping the parser and the plugins loaded between commands.
+"""
+
+import argparse
+import json
+import logging
+import os
+import socket
+import stat
+import sys
+import tempfile
+from typing import Any, Callable, Dict, List, Optional, TextIO, Tuple
+
+from pymarkdown.return_code_helper import ApplicationResult
+
+LOGGER = logging.getLogger(__name__)
+
+CommandRunner = Callable[[List[str], Optional[str]], Tuple[int, str, str]]
+SubcommandFinder = Callable[[List[str]], Optional[str]]
+
+
+class LintServer:
+    """
+    Class to provide for a long-lived server that runs PyMarkdown commands for
+    clients, keeping the parser and the plugins loaded between commands.
+
+    Requests and responses are JSON-RPC 2.0 messages, one per line, read from and
+    written to either standard input and output or the connections to a Unix
+    domain socket.  The `run` method runs a command, with the `arguments` that
+    would be passed on the command line, the `cwd` to run it in, and, optionally,
+    the `stdin` for the `scan-stdin` command.  Its result contains the
+    `return_code`, `stdout`, and `stderr` from running the command.  The
+    `shutdown` method stops the server.  A `run` request for the serve command
+    itself, as found by the subcommand finder, is rejected.
+
+    By default, the socket is created in the directory named by the
+    `XDG_RUNTIME_DIR` environment variable, or else in a directory for the current
+    user within the system's temporary directory, which is only accessible by that
+    user.  The socket itself is also only accessible by the current user, and the
+    client only connects to a socket that is owned by the current user.
+
+    The command runner keeps an initialized parser and set of plugins for each
+    configuration that is scanned with, so that a command that scans with the same
+    configuration as an earlier command only has to scan.  Commands are run one at
+    a time, in the order that they are received.
+
+    When serving over standard input and output, the application's logging is
+    written to standard error, so that it cannot be mistaken for a response.
+    """
+
+    socket_path_environment_variable = "PYMARKDOWN_SERVER_SOCKET"
+    __runtime_directory_environment_variable = "XDG_RUNTIME_DIR"
+    __socket_file_name = "pymarkdown.sock"
+    __serve_subcommand = "serve"
+    __parse_error = -32700
+    __invalid_request_error = -32600
+    __method_not_found_error = -32601
+    __invalid_params_error = -32602
+
+    def __init__(
+        self,
+        command_runner: CommandRunner,
+        subcommand_finder: Optional[SubcommandFinder] = None,
+    ) -> None:
+        """
+        Initialize a new instance of the LintServer class.  The command runner is
+        called with the arguments and the standard input for each command, and
+        returns the return code, standard output, and standard error.  If provided,
+        the subcommand finder is called with the arguments for each command, and
+        returns the subcommand that they specify, if any.
+        """
+        self.__command_runner = command_runner
+        self.__subcommand_finder = subcommand_finder
+
+    @staticmethod
+    def default_socket_path() -> str:
+        """
+        Get the socket path to use if one is not specified, taken from the
+        environment if it is set there.
+        """
+        if environment_path := os.getenv(LintServer.socket_path_environment_variable):
+            return environment_path
+        return os.path.join(
+            LintServer.__default_socket_directory(), LintServer.__socket_file_name
+        )
+
+    @staticmethod
+    def __default_socket_directory() -> str:
+        if runtime_directory := os.getenv(
+            LintServer.__runtime_directory_environment_variable
+        ):
+            return runtime_directory
+        user_suffix = f"-{os.getuid()}" if hasattr(os, "getuid") else ""
+        return os.path.join(tempfile.gettempdir(), f"pymarkdown{user_suffix}")
+
+    @staticmethod
+    def __create_default_socket_directory() -> None:
+        if os.getenv(LintServer.socket_path_environment_variable):
+            return
+        socket_directory = LintServer.__default_socket_directory()
+        os.makedirs(socket_directory, mode=0o700, exist_ok=True)
+        if not LintServer.is_owned_by_current_user(socket_directory) or (
+            stat.S_IMODE(os.stat(socket_directory).st_mode) & 0o077
+        ):
+            raise ValueError(
+                f"Socket directory '{socket_directory}' must only be accessible by the current user."
+            )
+
+    @staticmethod
+    def is_owned_by_current_user(path: str) -> bool:
+        """
+        Determine whether the file at the specified path exists and is owned by the
+        current user.  On platforms without user ids, only the existence of the file
+        is checked.
+        """
+        try:
+            path_status = os.stat(path)
+        except OSError:
+            return False
+        return not hasattr(os, "getuid") or path_status.st_uid == os.getuid()
+
+    @staticmethod
+    def is_listening(socket_path: str, connect_timeout: float = 1.0) -> bool:
+        """
+        Determine whether a server is listening on the socket at the specified path.
+        """
+        if not hasattr(socket, "AF_UNIX"):
+            return False
+        try:
+            with socket.socket(
+                socket.AF_UNIX, socket.SOCK_STREAM  # pylint: disable=no-member
+            ) as client_socket:
+                client_socket.settimeout(connect_timeout)
+                client_socket.connect(socket_path)
+        except OSError:
+            return False
+        return True
+
+    @staticmethod
+    def argparse_subparser_name() -> str:
+        """
+        Get the name of the subparser for the serve command.
+        """
+        return LintServer.__serve_subcommand
+
+    @staticmethod
+    def is_stdio_specified(args: argparse.Namespace) -> bool:
+        """
+        Specifies whether serving over standard input and output was specified.
+        """
+        return bool(
+            args.primary_subparser == LintServer.__serve_subcommand and args.serve_stdio
+        )
+
+    @staticmethod
+    def add_argparse_subparser(subparsers: argparse._SubParsersAction) -> None:  # type: ignore
+        """
+        Add the subparser for the serve command.
+        """
+        new_sub_parser = subparsers.add_parser(
+            LintServer.__serve_subcommand,
+            help="run as a server that keeps the plugins loaded",
+        )
+        transport_group = new_sub_parser.add_mutually_exclusive_group()
+        transport_group.add_argument(
+            "--socket",
+            dest="serve_socket_path",
+            action="store",
+            default=None,
+            help="path of the Unix domain socket to listen on",
+        )
+        transport_group.add_argument(
+            "--stdio",
+            dest="serve_stdio",
+            action="store_true",
+            default=False,
+            help="read requests from standard input instead of a socket",
+        )
+
+    def handle_argparse_subparser(self, args: argparse.Namespace) -> ApplicationResult:
+        """
+        Handle the serve command, returning once the server is stopped.
+        """
+        if args.serve_stdio:
+            self.serve_stream(sys.stdin, sys.stdout)
+        else:
+            self.serve_socket(args.serve_socket_path)
+        return ApplicationResult.SUCCESS
+
+    def serve_socket(self, socket_path: Optional[str] = None) -> None:
+        """
+        Serve requests from connections to the Unix domain socket at the specified
+        path, or at the default socket path if not specified, until a shutdown
+        request is received.
+        """
+        if not hasattr(socket, "AF_UNIX"):
+            raise ValueError(
+                "Unix domain sockets are not supported on this platform.  Use --stdio instead."
+            )
+        if not socket_path:
+            LintServer.__create_default_socket_directory()
+            socket_path = LintServer.default_socket_path()
+        if os.path.exists(socket_path):
+            if LintServer.is_listening(socket_path):
+                raise ValueError(f"A server is already listening on '{socket_path}'.")
+            os.remove(socket_path)
+
+        with socket.socket(
+            socket.AF_UNIX, socket.SOCK_STREAM  # pylint: disable=no-member
+        ) as server_socket:
+            server_socket.bind(socket_path)
+            try:
+                os.chmod(socket_path, 0o600)
+                server_socket.listen()
+                LOGGER.info("Server listening on '%s'.", socket_path)
+                keep_serving = True
+                while keep_serving:
+                    client_socket, _ = server_socket.accept()
+                    with client_socket, client_socket.makefile(
+                        "rw", encoding="utf-8", newline="\n"
+                    ) as client_stream:
+                        keep_serving = self.serve_stream(client_stream, client_stream)
+            except KeyboardInterrupt:
+                LOGGER.info("Server interrupted.")
+            finally:
+                os.remove(socket_path)
+
+    def serve_stream(self, input_stream: TextIO, output_stream: TextIO) -> bool:
+        """
+        Serve requests from the input stream until it is closed, returning False
+        if a shutdown request was received.
+        """
+        for next_line in input_stream:
+            if not next_line.strip():
+                continue
+            response, keep_serving = self.handle_request(next_line)
+            output_stream.write(json.dumps(response) + "\n")
+            output_stream.flush()
+            if not keep_serving:
+                return False
+        return True
+
+    def handle_request(self, request_line: str) -> Tuple[Dict[str, Any], bool]:
+        """
+        Handle a single request, returning the response and whether the server
+        should keep serving requests.
+        """
+        try:
+            request = json.loads(request_line)
+        except ValueError as this_exception:
+            return (
+                LintServer.__error_response(
+                    None, LintServer.__parse_error, str(this_exception)
+                ),
+                True,
+            )
+
+        if (
+            not isinstance(request, dict)
+            or request.get("jsonrpc") != "2.0"
+            or not isinstance(request.get("method"), str)
+        ):
+            return (
+                LintServer.__error_response(
+                    None,
+                    LintServer.__invalid_request_error,
+                    "Request must be a JSON-RPC 2.0 request object.",
+                ),
+                True,
+            )
+
+        request_id = request.get("id")
+        if request["method"] == "shutdown":
+            LOGGER.info("Server shutdown requested.")
+            return {"jsonrpc": "2.0", "id": request_id, "result": None}, False
+        if request["method"] != "run":
+            return (
+                LintServer.__error_response(
+                    request_id,
+                    LintServer.__method_not_found_error,
+                    f"Method '{request['method']}' is not supported.",
+                ),
+                True,
+            )
+        return self.__handle_run_request(request_id, request.get("params")), True
+
+    def __handle_run_request(self, request_id: Any, parameters: Any) -> Dict[str, Any]:
+        if error_message := self.__verify_run_parameters(parameters):
+            return LintServer.__error_response(
+                request_id, LintServer.__invalid_params_error, error_message
+            )
+
+        saved_directory = os.getcwd()
+        try:
+            os.chdir(parameters.get("cwd") or saved_directory)
+        except OSError as this_exception:
+            return LintServer.__error_response(
+                request_id, LintServer.__invalid_params_error, str(this_exception)
+            )
+        try:
+            LOGGER.info("Running command: %s", str(parameters["arguments"]))
+            return_code, std_out, std_err = self.__command_runner(
+                parameters["arguments"], parameters.get("stdin")
+            )
+        finally:
+            os.chdir(saved_directory)
+        return {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "result": {
+                "return_code": return_code,
+                "stdout": std_out,
+                "stderr": std_err,
+            },
+        }
+
+    def __verify_run_parameters(self, parameters: Any) -> Optional[str]:
+        if not isinstance(parameters, dict):
+            return "Parameters must be an object."
+        arguments = parameters.get("arguments")
+        if not isinstance(arguments, list) or not all(
+            isinstance(next_argument, str) for next_argument in arguments
+        ):
+            return "Parameter 'arguments' must be a list of strings."
+        if (
+            self.__subcommand_finder
+            and self.__subcommand_finder(arguments) == LintServer.__serve_subcommand
+        ):
+            return "The serve command cannot be run by the server."
+        for parameter_name in ("cwd", "stdin"):
+            if parameters.get(parameter_name) is not None and not isinstance(
+                parameters[parameter_name], str
+            ):
+                return f"Parameter '{parameter_name}' must be a string."
+        return None
+
+    @staticmethod
+    def __error_response(
+        request_id: Any, error_code: int, error_message: str
+    ) -> Dict[str, Any]:
+        return {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "error": {"code": error_code, "message": error_message},
+        }
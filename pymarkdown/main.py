@@ -3,11 +3,16 @@ Module to provide for a simple implementation of a title case algorithm.
 """
 
 import argparse
+import contextlib
+import io
+import json
 import logging
 import os
 import runpy
+import sys
 import traceback
-from typing import List, Optional, Tuple, cast
+from collections import OrderedDict
+from typing import Callable, List, Optional, Tuple, cast
 
 from application_file_scanner import (
     ApplicationFileScanner,
@@ -21,15 +26,20 @@ from application_properties.application_properties_utilities import (
 
 from pymarkdown.application_configuration_helper import ApplicationConfigurationHelper
 from pymarkdown.application_logging import ApplicationLogging
+from pymarkdown.benchmark.benchmark_helper import BenchmarkHelper
 from pymarkdown.extension_manager.extension_manager import ExtensionManager
 from pymarkdown.file_scan_helper import FileScanHelper
 from pymarkdown.general.bad_tokenization_error import BadTokenizationError
 from pymarkdown.general.main_presentation import MainPresentation
 from pymarkdown.general.parser_logger import ParserLogger
+from pymarkdown.general.parser_logging_stripper import StrippedLoggingFinder
 from pymarkdown.general.tokenized_markdown import TokenizedMarkdown
+from pymarkdown.lint_server import LintServer
 from pymarkdown.plugin_manager.bad_plugin_error import BadPluginError
 from pymarkdown.plugin_manager.plugin_manager import PluginManager
+from pymarkdown.profile_report_helper import ProfileReportHelper
 from pymarkdown.return_code_helper import ApplicationResult, ReturnCodeHelper
+from pymarkdown.structured_output_presentation import StructuredOutputPresentation
 
 POGGER = ParserLogger(logging.getLogger(__name__))
 
@@ -70,6 +80,7 @@ class PyMarkdownLint:
             )
         )
         self.__tokenizer: Optional[TokenizedMarkdown] = None
+        self.__did_report_error = False
         self.__plugins: PluginManager = PluginManager(self.__presentation)
         self.__extensions: ExtensionManager = ExtensionManager(self.__presentation)
 
@@ -80,6 +91,13 @@ class PyMarkdownLint:
         """
         return self.__version_number
 
+    @property
+    def did_report_error(self) -> bool:
+        """
+        Whether any errors were reported since the application was last started.
+        """
+        return self.__did_report_error
+
     @staticmethod
     def __get_semantic_version() -> str:
         file_path = __file__
@@ -109,6 +127,11 @@ class PyMarkdownLint:
         if self.__logging:
             self.__logging.initialize(args)
         ParserLogger.sync_on_next_call()
+        if StrippedLoggingFinder.is_installed() and LOGGER.isEnabledFor(logging.INFO):
+            LOGGER.warning(
+                "Parser logging is not available, as the %s environment variable is set.",
+                StrippedLoggingFinder.environment_variable_name,
+            )
 
         if direct_args is None:
             LOGGER.debug("Using supplied command line arguments.")
@@ -119,6 +142,19 @@ class PyMarkdownLint:
         return args
 
     def __parse_arguments(self, direct_args: Optional[List[str]]) -> argparse.Namespace:
+        parser = PyMarkdownLint.__create_argument_parser()
+        parse_arguments = parser.parse_args(args=direct_args)
+
+        if not parse_arguments.primary_subparser:
+            parser.print_help()
+            ReturnCodeHelper.exit_application(ApplicationResult.COMMAND_LINE_ERROR)
+        elif parse_arguments.primary_subparser == "version":
+            print(f"{self.__version_number}")
+            ReturnCodeHelper.exit_application(ApplicationResult.SUCCESS)
+        return parse_arguments
+
+    @staticmethod
+    def __create_argument_parser() -> argparse.ArgumentParser:
         parser = argparse.ArgumentParser(description="Lint any found Markdown files.")
 
         parser.add_argument(
@@ -205,30 +241,26 @@ class PyMarkdownLint:
         )
         ApplicationLogging.add_default_command_line_arguments(parser)
         ReturnCodeHelper.add_command_line_arguments(parser)
+        ProfileReportHelper.add_command_line_arguments(parser)
 
         subparsers = parser.add_subparsers(dest="primary_subparser")
         ExtensionManager.add_argparse_subparser(subparsers)
         FileScanHelper.add_argparse_subparser(subparsers, True)
         PluginManager.add_argparse_subparser(subparsers)
         FileScanHelper.add_argparse_subparser(subparsers, False)
+        LintServer.add_argparse_subparser(subparsers)
+        BenchmarkHelper.add_argparse_subparser(subparsers)
 
         subparsers.add_parser("version", help="version of the application")
-
-        parse_arguments = parser.parse_args(args=direct_args)
-
-        if not parse_arguments.primary_subparser:
-            parser.print_help()
-            ReturnCodeHelper.exit_application(ApplicationResult.COMMAND_LINE_ERROR)
-        elif parse_arguments.primary_subparser == "version":
-            print(f"{self.__version_number}")
-            ReturnCodeHelper.exit_application(ApplicationResult.SUCCESS)
-        return parse_arguments
+        return parser
 
     def __set_initial_state(self, args: argparse.Namespace) -> None:
 
         # Set the return code first, to ensure any command line flags take effect as soon as possible.
         ReturnCodeHelper.set_initial_state(args, self.__properties)
         if self.__logging:
+            if LintServer.is_stdio_specified(args):
+                self.__logging.log_to_standard_error()
             self.__logging.pre_initialize_with_args(args)
 
         # return code helper initial state
@@ -253,6 +285,18 @@ class PyMarkdownLint:
             ReturnCodeHelper.exit_application(
                 self.__extensions.handle_argparse_subparser(args)
             )
+        if args.primary_subparser == LintServer.argparse_subparser_name():
+            ReturnCodeHelper.exit_application(
+                LintServer(
+                    LintServerCommandRunner().run, PyMarkdownLint.find_subcommand
+                ).handle_argparse_subparser(args)
+            )
+        if args.primary_subparser == BenchmarkHelper.argparse_subparser_name():
+            ReturnCodeHelper.exit_application(
+                BenchmarkHelper(
+                    self.__properties, self.__presentation, self.__show_stack_trace
+                ).handle_argparse_subparser(args)
+            )
 
     def __initialize_plugins(self, args: argparse.Namespace) -> None:
         try:
@@ -345,6 +389,7 @@ class PyMarkdownLint:
         exit_on_error: bool = True,
         print_prefix: str = "\n\n",
     ) -> None:
+        self.__did_report_error = True
         LOGGER.warning(formatted_error, exc_info=thrown_error)
 
         stack_trace = (
@@ -379,8 +424,9 @@ class PyMarkdownLint:
         #     self.__handle_error("No matching files found.", None, exit_on_error=False)
         #     return ApplicationResult.NO_FILES_TO_SCAN
 
-        POGGER.info("Initializing parser.")
-        self.__initialize_parser()
+        if self.__tokenizer is None:
+            POGGER.info("Initializing parser.")
+            self.__initialize_parser()
 
         POGGER.info("Processing files with parser.")
         assert (
@@ -394,11 +440,33 @@ class PyMarkdownLint:
             self.__handle_error,
             self.__properties,
         )
-        did_fix_any_files, did_fail_any_file, no_plugins_active_for_fix = (
-            fsh.process_files_to_scan(
-                args, use_standard_in, files_to_scan, self.__string_to_scan
-            )
+        phase_timer = ProfileReportHelper.create_phase_timer(args)
+        fsh.set_phase_timer(phase_timer)
+        self.__plugins.set_phase_timer(phase_timer)
+        structured_presentation = StructuredOutputPresentation.create_if_enabled(
+            args, self.__presentation, self.__version_number
         )
+        if structured_presentation:
+            self.__plugins.set_presentation(structured_presentation)
+        try:
+            with (
+                phase_timer.measure(ProfileReportHelper.total_phase)
+                if phase_timer
+                else contextlib.nullcontext()
+            ):
+                did_fix_any_files, did_fail_any_file, no_plugins_active_for_fix = (
+                    fsh.process_files_to_scan(
+                        args, use_standard_in, files_to_scan, self.__string_to_scan
+                    )
+                )
+        finally:
+            if structured_presentation:
+                structured_presentation.finish()
+                self.__plugins.set_presentation(self.__presentation)
+        if phase_timer:
+            ProfileReportHelper.report_phase_times(
+                args, phase_timer, self.__presentation
+            )
         if no_plugins_active_for_fix:
             scan_result = ApplicationResult.FIXED_NO_PLUGINS
         elif did_fail_any_file:
@@ -453,13 +521,173 @@ class PyMarkdownLint:
             did_only_list_files,
         )
 
+    @staticmethod
+    def run_with_captured_output(
+        direct_args: List[str], standard_input: Optional[str] = None
+    ) -> Tuple[int, str, str]:
+        """
+        Run the application with the specified arguments using a new instance,
+        returning the return code and anything written to standard output and
+        standard error.  If specified, the standard input is used in place of
+        the actual standard input.
+        """
+        return PyMarkdownLint.run_function_with_captured_output(
+            lambda: PyMarkdownLint().main(direct_args), standard_input
+        )
+
+    @staticmethod
+    def run_function_with_captured_output(
+        run_function: Callable[[], None], standard_input: Optional[str] = None
+    ) -> Tuple[int, str, str]:
+        """
+        Call the specified function, which is expected to exit the application,
+        returning the return code and anything written to standard output and
+        standard error.  If specified, the standard input is used in place of
+        the actual standard input.
+        """
+        std_out, std_err = io.StringIO(), io.StringIO()
+        saved_stdin = sys.stdin
+        return_code = 0
+        try:
+            if standard_input is not None:
+                sys.stdin = io.StringIO(standard_input)
+            with contextlib.redirect_stdout(std_out), contextlib.redirect_stderr(
+                std_err
+            ):
+                run_function()
+        except SystemExit as this_exception:
+            return_code = (
+                this_exception.code if isinstance(this_exception.code, int) else 1
+            )
+        finally:
+            sys.stdin = saved_stdin
+        return return_code, std_out.getvalue(), std_err.getvalue()
+
     # pylint: disable=broad-exception-caught
+    def initialize_for_scanning(
+        self, direct_args: List[str]
+    ) -> Tuple[argparse.Namespace, ApplicationProperties]:
+        """
+        Initialize the application with the specified arguments, including the
+        plugins, the extensions, and the parser, without scanning anything.  The
+        returned arguments and configuration can then be used to create scan helpers
+        that scan with that configuration.  Any errors are reported, and exit the
+        application, in the same manner as the main function.
+        """
+        args: Optional[argparse.Namespace] = None
+        try:
+            args = self.__initialize_subsystems(direct_args)
+            self.__initialize_parser()
+        except ValueError as this_exception:
+            formatted_error = f"Configuration Error: {this_exception}"
+            self.__handle_error(formatted_error, this_exception)
+        except Exception as this_exception:
+            formatted_error = (
+                f"Unexpected Error({type(this_exception).__name__}): {this_exception}"
+            )
+            self.__handle_error(formatted_error, this_exception)
+        finally:
+            if self.__logging:
+                self.__logging.terminate()
+            self.__logging = None
+        assert args is not None, "Any errors while initializing exit the application."
+        return args, self.__properties
+
     def main(self, direct_args: Optional[List[str]] = None) -> None:
         """
         Main entrance point.
         """
+        self.__scan_and_exit(lambda: self.__initialize_subsystems(direct_args))
+
+    def rescan(self, direct_args: List[str]) -> None:
+        """
+        Run a scan command with the specified arguments, reusing the configuration,
+        plugins, extensions, and parser of an instance that was already initialized
+        by the `initialize_for_scanning` function.  The arguments must have the same
+        scan configuration, as returned by the `find_scan_configuration` function,
+        as the arguments that the instance was initialized with.  Any errors are
+        reported, and exit the application, in the same manner as the main function.
+        """
+        self.__scan_and_exit(lambda: self.__reset_for_rescan(direct_args))
+
+    @staticmethod
+    def find_scan_configuration(direct_args: List[str]) -> Optional[str]:
+        """
+        Find the configuration that a command with the specified arguments would scan
+        with, including the configuration loaded from any configuration files.  The
+        returned string is the same for any two commands that only differ in the paths
+        that they scan.  If the arguments are not valid, or are not for a command that
+        scans, None is returned.
+        """
+        args = PyMarkdownLint.__parse_arguments_quietly(direct_args)
+        if args is None or not FileScanHelper.is_scan_specified(args):
+            return None
+
+        configuration_errors: List[str] = []
+        properties = ApplicationProperties(allow_separator_in_keys=True)
+        ApplicationConfigurationHelper.apply_configuration_layers(
+            args,
+            properties,
+            lambda formatted_error, _: configuration_errors.append(formatted_error),
+        )
+        if configuration_errors:
+            return None
+        scan_arguments = dict(vars(args))
+        scan_arguments.pop("paths", None)
+        return json.dumps(
+            {
+                "arguments": scan_arguments,
+                "properties": {
+                    next_name: properties.get_property(next_name, object)
+                    for next_name in properties.property_names
+                },
+                "strict": properties.strict_mode,
+            },
+            sort_keys=True,
+            default=str,
+        )
+
+    @staticmethod
+    def find_subcommand(direct_args: List[str]) -> Optional[str]:
+        """
+        Find the subcommand, such as `scan`, that the specified arguments are for.
+        If the arguments are not valid, or do not specify a subcommand, None is
+        returned.
+        """
+        args = PyMarkdownLint.__parse_arguments_quietly(direct_args)
+        return args.primary_subparser if args is not None else None
+
+    @staticmethod
+    def __parse_arguments_quietly(
+        direct_args: List[str],
+    ) -> Optional[argparse.Namespace]:
         try:
-            args = self.__initialize_subsystems(direct_args)
+            with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(
+                io.StringIO()
+            ):
+                return PyMarkdownLint.__create_argument_parser().parse_args(
+                    args=direct_args
+                )
+        except SystemExit:
+            return None
+
+    def __reset_for_rescan(self, direct_args: List[str]) -> argparse.Namespace:
+        assert (
+            self.__tokenizer is not None
+        ), "Only an instance that was initialized for scanning can rescan."
+        ReturnCodeHelper.reset()
+        self.__did_report_error = False
+        args = self.__parse_arguments(direct_args)
+        ReturnCodeHelper.set_initial_state(args, self.__properties)
+        self.__plugins.number_of_scan_failures = 0
+        self.__plugins.number_of_pragma_failures = 0
+        return args
+
+    def __scan_and_exit(
+        self, initialize_function: Callable[[], argparse.Namespace]
+    ) -> None:
+        try:
+            args = initialize_function()
 
             (
                 use_standard_in,
@@ -500,5 +728,83 @@ class PyMarkdownLint:
 # pylint: enable=too-many-instance-attributes
 
 
+class LintServerCommandRunner:
+    """
+    Class to provide for running the commands sent to the lint server, keeping an
+    initialized instance of PyMarkdownLint for each configuration that is scanned
+    with.
+
+    A command that scans is run by the instance that was initialized for the same
+    scan configuration, as returned by the `find_scan_configuration` function, in
+    the same directory, creating and initializing that instance if needed.  As the
+    configuration files are loaded again for each command, any changes to them are
+    picked up by the next command.  Only the most recently used instances are kept,
+    and an instance that reports an error is not used again.  Any other command is
+    run by a new instance.
+
+    Each command uses the logging set up for the server itself, so that the logging
+    arguments of one command cannot change the logging for the commands after it.
+    """
+
+    default_maximum_scanners = 8
+    """Default number of initialized instances to keep before the least recently
+    used is removed.
+    """
+
+    def __init__(self, maximum_scanners: int = default_maximum_scanners) -> None:
+        """
+        Initialize a new instance of the LintServerCommandRunner class.
+        """
+        self.__maximum_scanners = maximum_scanners
+        self.__scanners: "OrderedDict[Tuple[str, str], PyMarkdownLint]" = OrderedDict()
+
+    @property
+    def scanner_count(self) -> int:
+        """
+        Number of initialized instances that are being kept.
+        """
+        return len(self.__scanners)
+
+    def run(
+        self, direct_args: List[str], standard_input: Optional[str] = None
+    ) -> Tuple[int, str, str]:
+        """
+        Run the command with the specified arguments, returning the return code and
+        anything written to standard output and standard error.
+        """
+        scan_configuration = PyMarkdownLint.find_scan_configuration(direct_args)
+        if scan_configuration is None:
+            return PyMarkdownLint.run_function_with_captured_output(
+                lambda: PyMarkdownLint(inherit_logging=True).main(direct_args),
+                standard_input,
+            )
+
+        scanner_key = (os.getcwd(), scan_configuration)
+        scanner = self.__scanners.pop(scanner_key, None)
+        is_new_scanner = scanner is None
+        if scanner is None:
+            LOGGER.info("Initializing a new scanner for the command.")
+            scanner = PyMarkdownLint(inherit_logging=True)
+        command_result = PyMarkdownLint.run_function_with_captured_output(
+            lambda: LintServerCommandRunner.__initialize_and_rescan(
+                scanner, is_new_scanner, direct_args
+            ),
+            standard_input,
+        )
+        if not scanner.did_report_error:
+            self.__scanners[scanner_key] = scanner
+            while len(self.__scanners) > self.__maximum_scanners:
+                self.__scanners.popitem(last=False)
+        return command_result
+
+    @staticmethod
+    def __initialize_and_rescan(
+        scanner: PyMarkdownLint, is_new_scanner: bool, direct_args: List[str]
+    ) -> None:
+        if is_new_scanner:
+            scanner.initialize_for_scanning(direct_args)
+        scanner.rescan(direct_args)
+
+
 if __name__ == "__main__":
     PyMarkdownLint().main()
@@ -0,0 +1,124 @@
+"""
+Module to provide for the scanning of multiple files using a pool of processes.
+"""
+
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Generator, List, Optional, Set, Tuple
+
+from pymarkdown.general.main_presentation import MainPresentation
+from pymarkdown.general.parser_logger import ParserLogger
+from pymarkdown.plugin_manager.plugin_scan_failure import (
+    PluginScanFailure,
+    RecordedScanEvent,
+)
+
+POGGER = ParserLogger(logging.getLogger(__name__))
+
+PhaseMeasurements = Tuple[Dict[str, float], Dict[str, int]]
+WorkerScanResult = Tuple[List[RecordedScanEvent], Optional[PhaseMeasurements]]
+
+
+class RecordingPresentation(MainPresentation):
+    """
+    Class to provide for a presentation layer that records any scan results
+    instead of outputting them, allowing them to be replayed at a later time.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize a new instance of the RecordingPresentation class.
+        """
+        self.recorded_events: List[RecordedScanEvent] = []
+
+    def print_pragma_failure(
+        self, scan_file: str, line_number: int, pragma_error: str
+    ) -> None:
+        """
+        Record a failure to compile the pragma.
+        """
+        self.recorded_events.append((scan_file, line_number, pragma_error))
+
+    def print_scan_failure(self, scan_failure: PluginScanFailure) -> None:
+        """
+        Record a scan failure for a specific file and location.
+        """
+        self.recorded_events.append(scan_failure)
+
+
+# pylint: disable=too-few-public-methods
+class ParallelScanHelper:
+    """
+    Class to provide for the scanning of multiple files using a pool of processes.
+
+    Each worker process is set up once using the supplied initializer, and then
+    scans the files that it is handed using the supplied worker function.  Instead
+    of outputting any results, the worker records them and hands them back to the
+    main process, where they are replayed in the same order that the files were
+    supplied in, along with the time taken by each phase of the scan if the worker
+    was asked to measure them.  If a file cannot be scanned cleanly by a worker, `None` is returned
+    for that file, allowing the caller to rescan that file serially and report any
+    errors in the normal manner.
+    """
+
+    __maximum_chunk_size = 32
+
+    def __init__(
+        self,
+        number_of_jobs: int,
+        initializer: Callable[..., None],
+        initializer_arguments: Tuple[Any, ...],
+        worker_function: Callable[
+            [Tuple[str, Set[str], bool]], Optional[WorkerScanResult]
+        ],
+    ) -> None:
+        """
+        Initialize a new instance of the ParallelScanHelper class.
+        """
+        self.__number_of_jobs = number_of_jobs
+        self.__initializer = initializer
+        self.__initializer_arguments = initializer_arguments
+        self.__worker_function = worker_function
+
+    def scan_files(
+        self, files_to_scan: List[Tuple[str, Set[str], bool]]
+    ) -> Generator[Optional[WorkerScanResult], None, None]:
+        """
+        Scan each of the files, yielding the recorded events and phase measurements
+        for each file in the same order that the files were provided.
+        """
+
+        chunk_size = min(
+            ParallelScanHelper.__maximum_chunk_size,
+            max(1, len(files_to_scan) // (self.__number_of_jobs * 4)),
+        )
+        POGGER.info(
+            "Scanning $ files with $ jobs and a chunk size of $.",
+            len(files_to_scan),
+            self.__number_of_jobs,
+            chunk_size,
+        )
+        files_yielded = 0
+        try:
+            with ProcessPoolExecutor(
+                max_workers=self.__number_of_jobs,
+                initializer=self.__initializer,
+                initargs=self.__initializer_arguments,
+            ) as executor:
+                for next_result in executor.map(
+                    self.__worker_function,
+                    files_to_scan,
+                    chunksize=chunk_size,
+                ):
+                    files_yielded += 1
+                    yield next_result
+        except BrokenProcessPool:
+            POGGER.info(
+                "Process pool was unable to complete, scanning remaining files serially."
+            )
+            for _ in files_to_scan[files_yielded:]:
+                yield None
+
+
+# pylint: enable=too-few-public-methods
@@ -4,7 +4,8 @@ Module to provide for an encapsulation of a plugin that was discovered.
 
 # pylint: disable=too-many-instance-attributes
 from dataclasses import dataclass
-from typing import List, Optional
+from functools import cached_property
+from typing import Callable, FrozenSet, List, Optional
 
 from pymarkdown.plugin_manager.rule_plugin import RulePlugin
 
@@ -15,12 +16,16 @@ class FoundPlugin:
     Encapsulation of a plugin that was discovered.  While similar to the PluginDetails
     class, this is meant for an internal representation of the plugin, and not the
     external information provided.
+
+    Note that the instance of the plugin is only created the first time that it is
+    needed, allowing plugins described by a manifest to be registered without
+    importing their modules.
     """
 
     plugin_id: str
     plugin_names: List[str]
     plugin_description: str
-    plugin_instance: RulePlugin
+    plugin_instance_loader: Callable[[], RulePlugin]
     plugin_enabled_by_default: bool
     plugin_version: str
     plugin_interface_version: int
@@ -30,6 +35,14 @@ class FoundPlugin:
     plugin_supports_fix: bool
     plugin_fix_level: int
     plugin_identifiers: List[str]
+    plugin_token_names: Optional[FrozenSet[str]] = None
+
+    @cached_property
+    def plugin_instance(self) -> RulePlugin:
+        """
+        Get the instance of the plugin, loading it if it has not been loaded yet.
+        """
+        return self.plugin_instance_loader()
 
 
 # pylint: enable=too-many-instance-attributes
@@ -3,7 +3,7 @@ Module to provide details about a plugin, supplied by the plugin.
 """
 
 from dataclasses import dataclass
-from typing import Optional, Union
+from typing import List, Optional, Union
 
 
 # pylint: disable=too-many-instance-attributes
@@ -68,6 +68,22 @@ class PluginDetailsV3(PluginDetailsV2):
     """
 
 
+@dataclass(frozen=True)
+class PluginDetailsV4(PluginDetailsV3):
+    """
+    Class to provide details about a plugin, supplied by the plugin.
+    """
+
+    plugin_interface_version: int = 4
+    """Interface version.
+    """
+    plugin_token_types: Optional[List[type]] = None
+    """Optional list of the token types that the `next_token` function is called for.
+    The end tokens for each of those token types are also included.  If not provided,
+    the `next_token` function is called for every token.
+    """
+
+
 @dataclass(frozen=True)
 class QueryConfigItem:
     """
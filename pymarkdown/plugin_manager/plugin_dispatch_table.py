@@ -0,0 +1,57 @@
+"""
+Module to provide for a table of the plugins to call for a given event.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+
+from pymarkdown.plugin_manager.found_plugin import FoundPlugin
+from pymarkdown.plugin_manager.plugin_scan_context import PluginScanContext
+
+DispatchEntry = Tuple[FoundPlugin, PluginScanContext]
+
+
+@dataclass
+class PluginDispatchTable:
+    """
+    Class to provide for a table of the plugins to call for a given event, along
+    with the context to call each plugin with.  Each table is compiled once for the
+    arguments that are passed to the event, and is reused as long as the same
+    arguments are passed in.
+    """
+
+    context: PluginScanContext
+    context_map: Optional[Dict[str, PluginScanContext]]
+    per_file_disabled_identifiers: Optional[Set[str]]
+    entries: List[DispatchEntry]
+    entries_by_token_name: Dict[str, List[DispatchEntry]] = field(default_factory=dict)
+
+    def is_compiled_for(
+        self,
+        context: PluginScanContext,
+        context_map: Optional[Dict[str, PluginScanContext]],
+        per_file_disabled_identifiers: Optional[Set[str]],
+    ) -> bool:
+        """
+        Determine if this table was compiled for the same arguments.
+        """
+        return (
+            self.context is context
+            and self.context_map is context_map
+            and self.per_file_disabled_identifiers is per_file_disabled_identifiers
+        )
+
+    def entries_for_token_name(self, token_name: str) -> List[DispatchEntry]:
+        """
+        Get the entries for plugins that are interested in the named token.
+        """
+        token_entries = self.entries_by_token_name.get(token_name)
+        if token_entries is None:
+            token_entries = [
+                next_entry
+                for next_entry in self.entries
+                if next_entry[0].plugin_token_names is None
+                or token_name in next_entry[0].plugin_token_names
+            ]
+            self.entries_by_token_name[token_name] = token_entries
+        return token_entries
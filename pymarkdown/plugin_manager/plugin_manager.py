@@ -3,13 +3,14 @@ Module to provide classes to deal with plugins.
 """
 
 import argparse
+import functools
 import inspect
+import itertools
 import logging
 import os
 import re
 import sys
-from io import TextIOWrapper
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, FrozenSet, List, Optional, Set, TextIO, Tuple, cast
 
 from application_properties import ApplicationProperties, ApplicationPropertiesFacade
 from columnar import columnar
@@ -20,24 +21,38 @@ from pymarkdown.extensions.pragma_token import (
 )
 from pymarkdown.general.main_presentation import MainPresentation
 from pymarkdown.general.parser_helper import ParserHelper
+from pymarkdown.general.phase_timer import PhaseTimer
 from pymarkdown.plugin_manager.bad_plugin_error import BadPluginError
 from pymarkdown.plugin_manager.fix_line_record import FixLineRecord
 from pymarkdown.plugin_manager.fix_token_record import FixTokenRecord
 from pymarkdown.plugin_manager.found_plugin import FoundPlugin
-from pymarkdown.plugin_manager.plugin_details import PluginDetailsV2, QueryConfigItem
+from pymarkdown.plugin_manager.plugin_details import (
+    PluginDetailsV2,
+    PluginDetailsV4,
+    QueryConfigItem,
+)
+from pymarkdown.plugin_manager.plugin_dispatch_table import (
+    DispatchEntry,
+    PluginDispatchTable,
+)
+from pymarkdown.plugin_manager.plugin_manifest import PluginManifest
 from pymarkdown.plugin_manager.plugin_scan_context import PluginScanContext
-from pymarkdown.plugin_manager.plugin_scan_failure import PluginScanFailure
+from pymarkdown.plugin_manager.plugin_scan_failure import (
+    PluginScanFailure,
+    RecordedScanEvent,
+)
+from pymarkdown.plugin_manager.pragma_interval_index import PragmaIntervalIndex
 from pymarkdown.plugin_manager.replace_tokens_record import ReplaceTokensRecord
 from pymarkdown.plugin_manager.rule_plugin import RulePlugin
 from pymarkdown.return_code_helper import ApplicationResult
-from pymarkdown.tokens.markdown_token import MarkdownToken
+from pymarkdown.tokens.markdown_token import EndMarkdownToken, MarkdownToken
 
 LOGGER = logging.getLogger(__name__)
 
 # pylint: disable=too-many-lines
 
 
-# pylint: disable=too-many-instance-attributes
+# pylint: disable=too-many-instance-attributes,too-many-public-methods
 class PluginManager:
     """
     Manager object to take care of load and accessing plugin modules.
@@ -66,6 +81,7 @@ class PluginManager:
             self.__show_fix_debug,
         ) = (0, 0, False, False)
         self.__loaded_classes: List[Tuple[RulePlugin, str]] = []
+        self.__manifest_plugins: List[FoundPlugin] = []
 
         self.__presentation = presentation
 
@@ -73,6 +89,7 @@ class PluginManager:
         self.__document_pragma_ranges: List[Tuple[int, int, Set[str]]]
         self.__general_pragma_ranges: List[Tuple[int, int, str]]
         self.__pragma_line_numbers: List[int]
+        self.__pragma_index = PragmaIntervalIndex()
 
         self.__registered_plugins: List[FoundPlugin] = []
         self.__enabled_plugins: List[FoundPlugin] = []
@@ -82,6 +99,25 @@ class PluginManager:
         self.__enabled_plugins_for_completed_file: List[FoundPlugin] = []
         self.__all_ids: Dict[str, FoundPlugin] = {}
         self.__properties: Optional[ApplicationProperties] = None
+        self.__recorded_events: Optional[List[RecordedScanEvent]] = None
+        self.__next_token_table: Optional[PluginDispatchTable] = None
+        self.__next_line_table: Optional[PluginDispatchTable] = None
+        self.__completed_file_table: Optional[PluginDispatchTable] = None
+        self.__phase_timer: Optional[PhaseTimer] = None
+
+    def set_phase_timer(self, phase_timer: Optional[PhaseTimer]) -> None:
+        """
+        Set the timer used to measure the time taken by each plugin's `next_token`,
+        `next_line`, and `completed_file` functions, or None to stop measuring.
+        """
+        self.__phase_timer = phase_timer
+
+    def set_presentation(self, presentation: MainPresentation) -> None:
+        """
+        Set the presentation used to report any scan failures and pragma failures,
+        such as one that outputs those failures in a structured format.
+        """
+        self.__presentation = presentation
 
     # pylint: disable=too-many-arguments
     def initialize(
@@ -93,21 +129,31 @@ class PluginManager:
         properties: ApplicationProperties,
         show_stack_trace: bool,
         show_fix_debug: bool,
+        use_plugin_manifest: bool = True,
     ) -> None:
         """
         Initializes the manager by scanning for plugins, loading them, and registering them.
+
+        If the directory to search contains a plugin manifest, and the use of plugin
+        manifests is not disabled, the plugins in that directory are registered from
+        that manifest, and their modules are only imported if they are needed.
         """
         (
             self.number_of_scan_failures,
             self.number_of_pragma_failures,
             self.__loaded_classes,
+            self.__manifest_plugins,
             self.__show_stack_trace,
             self.__show_fix_debug,
             self.__properties,
-        ) = (0, 0, [], show_stack_trace, show_fix_debug, properties)
+        ) = (0, 0, [], [], show_stack_trace, show_fix_debug, properties)
 
         plugin_files = self.__find_eligible_plugins_in_directory(directory_to_search)
-        self.__load_plugins(directory_to_search, plugin_files)
+        if not (
+            use_plugin_manifest
+            and self.__load_plugins_from_manifest(directory_to_search, plugin_files)
+        ):
+            self.__load_plugins(directory_to_search, plugin_files)
 
         all_additional_paths = list(additional_paths or [])
         if new_paths := (
@@ -328,7 +374,7 @@ class PluginManager:
 
         actual_item_list = []
         if (
-            found_plugin.plugin_interface_version == 3
+            found_plugin.plugin_interface_version >= 3
             and found_plugin.plugin_instance.is_query_config_implemented_in_plugin
         ):
             try:
@@ -408,15 +454,10 @@ class PluginManager:
                 if rule_id in id_set:
                     return
 
-        if self.__document_pragma_ranges:
-            for i, j, k in self.__document_pragma_ranges:
-                if i <= scan_failure.line_number <= j and rule_id in k:
-                    return
-
-        if self.__general_pragma_ranges:
-            for i, j, m in self.__general_pragma_ranges:
-                if i <= scan_failure.line_number <= j and rule_id == m:
-                    return
+        if self.__pragma_index.is_rule_disabled_on_line(
+            rule_id, scan_failure.line_number
+        ):
+            return
 
         extra_info = (
             f" [{scan_failure.extra_error_information}]"
@@ -435,7 +476,16 @@ class PluginManager:
             extra_info,
             False,
         )
-        self.__presentation.print_scan_failure(adjusted_failure)
+        self.log_filtered_scan_failure(adjusted_failure)
+
+    def log_filtered_scan_failure(self, scan_failure: PluginScanFailure) -> None:
+        """
+        Log a scan failure that has already been filtered against any pragmas and
+        adjusted for display, such as one that was reported by a parallel worker.
+        """
+        if self.__recorded_events is not None:
+            self.__recorded_events.append(scan_failure)
+        self.__presentation.print_scan_failure(scan_failure)
         self.number_of_scan_failures += 1
 
     def log_pragma_failure(
@@ -444,9 +494,25 @@ class PluginManager:
         """
         Log the pragma error in the appropriate format.
         """
+        if self.__recorded_events is not None:
+            self.__recorded_events.append((scan_file, line_number, pragma_error))
         self.__presentation.print_pragma_failure(scan_file, line_number, pragma_error)
         self.number_of_pragma_failures += 1
 
+    def start_recording_events(self) -> None:
+        """
+        Start recording any scan failures and pragma failures that are logged, in
+        addition to presenting them.
+        """
+        self.__recorded_events = []
+
+    def stop_recording_events(self) -> List[RecordedScanEvent]:
+        """
+        Stop recording events, returning any events recorded since recording started.
+        """
+        recorded_events, self.__recorded_events = self.__recorded_events or [], None
+        return recorded_events
+
     def compile_pragmas(self, scan_file: str, pragma_lines: Dict[int, str]) -> None:
         """
         Go through the list of extracted pragmas and compile them.
@@ -469,6 +535,11 @@ class PluginManager:
                 self.__pragma_line_numbers,
             )
         PragmaExtension.end(active_general_pragmas, self.__general_pragma_ranges)
+        self.__pragma_index = PragmaIntervalIndex(
+            self.__document_pragma_ranges,
+            self.__general_pragma_ranges,
+            self.__pragma_line_numbers,
+        )
 
     @property
     def enabled_plugins(self) -> List[FoundPlugin]:
@@ -495,11 +566,12 @@ class PluginManager:
     def __snake_to_camel(cls, word: str) -> str:
         return "".join(x.capitalize() or "_" for x in word.split("_"))
 
-    def __attempt_to_load_plugin(
-        self, next_plugin_module: str, plugin_class_name: str, next_plugin_file: str
-    ) -> None:
+    @staticmethod
+    def __create_plugin_instance(
+        next_plugin_module: str, plugin_class_name: str, next_plugin_file: str
+    ) -> RulePlugin:
         """
-        Attempt to cleanly load the specified plugin.
+        Attempt to cleanly import the specified plugin and create an instance of it.
         """
         try:
             mod = __import__(next_plugin_module)
@@ -520,7 +592,7 @@ class PluginManager:
                 class_name=plugin_class_name,
                 is_constructor=True,
             ) from this_exception
-        self.__loaded_classes.append((plugin_class_instance, next_plugin_file))
+        return cast(RulePlugin, plugin_class_instance)
 
     def __load_plugins(self, directory_to_search: str, plugin_files: List[str]) -> None:
         """
@@ -533,9 +605,68 @@ class PluginManager:
         for next_plugin_file in plugin_files:
             next_plugin_module = next_plugin_file[:-3]
             plugin_class_name = self.__snake_to_camel(next_plugin_module)
-            self.__attempt_to_load_plugin(
+            plugin_class_instance = self.__create_plugin_instance(
                 next_plugin_module, plugin_class_name, next_plugin_file
             )
+            self.__loaded_classes.append((plugin_class_instance, next_plugin_file))
+
+    def __load_plugins_from_manifest(
+        self, directory_to_search: str, plugin_files: List[str]
+    ) -> bool:
+        """
+        Given an array of discovered modules, register them from the manifest in
+        their directory, deferring the import of each module until its plugin
+        is needed.  Returns False if there is no usable manifest.
+        """
+
+        manifest_entries = PluginManifest.load(directory_to_search, plugin_files)
+        if manifest_entries is None:
+            return False
+
+        if os.path.abspath(directory_to_search) not in sys.path:
+            sys.path.insert(0, os.path.abspath(directory_to_search))
+
+        for next_entry in manifest_entries:
+            next_plugin_file = next_entry["file_name"]
+            next_plugin_module = next_plugin_file[:-3]
+            self.__manifest_plugins.append(
+                PluginManifest.create_found_plugin(
+                    next_entry,
+                    functools.partial(
+                        PluginManager.__create_plugin_instance,
+                        next_plugin_module,
+                        self.__snake_to_camel(next_plugin_module),
+                        next_plugin_file,
+                    ),
+                )
+            )
+        return True
+
+    @property
+    def registered_plugins(self) -> List[FoundPlugin]:
+        """
+        Get a list of all the plugins that are registered.
+        """
+        return self.__registered_plugins
+
+    @staticmethod
+    def create_plugin_manifest(directory_to_search: str) -> str:
+        """
+        Create the text of a manifest for the plugins in the specified directory,
+        importing each of those plugins to determine its details.
+        """
+        plugin_manager = PluginManager(MainPresentation())
+        plugin_manager.initialize(
+            directory_to_search,
+            [],
+            "",
+            "",
+            ApplicationProperties(),
+            False,
+            False,
+            use_plugin_manifest=False,
+        )
+        return PluginManifest.create(plugin_manager.registered_plugins)
 
     def __determine_if_plugin_enabled(
         self,
@@ -670,6 +801,36 @@ class PluginManager:
                 class_name=type(plugin_instance).__name__, field_name=field_name
             )
 
+    @classmethod
+    def __verify_token_types_field(
+        cls, plugin_instance: RulePlugin, field_name: str, field_value: Any
+    ) -> FrozenSet[str]:
+        """
+        Verify that the detail field is a valid list of token types, returning
+        the names of those tokens and their end tokens.
+        """
+
+        if not isinstance(field_value, (list, tuple)):
+            raise BadPluginError(
+                class_name=type(plugin_instance).__name__, field_name=field_name
+            )
+        token_names: Set[str] = set()
+        for next_token_type in field_value:
+            token_name = (
+                next_token_type.get_markdown_token_type()
+                if isinstance(next_token_type, type)
+                and hasattr(next_token_type, "get_markdown_token_type")
+                else None
+            )
+            if not isinstance(token_name, str) or not token_name:
+                raise BadPluginError(
+                    class_name=type(plugin_instance).__name__, field_name=field_name
+                )
+            token_names.add(token_name)
+            token_names.add(EndMarkdownToken.get_end_token_name(token_name))
+        return frozenset(token_names)
+
+    # pylint: disable=too-many-locals
     def __get_plugin_details(
         self, plugin_instance: RulePlugin, instance_file_name: str
     ) -> FoundPlugin:
@@ -689,6 +850,7 @@ class PluginManager:
             plugin_names,
             plugin_supports_fix,
             plugin_fix_level,
+            plugin_token_types,
         ) = self.__unpack_plugin_details(plugin_instance)
 
         self.__verify_string_field(plugin_instance, "plugin_id", plugin_id)
@@ -713,12 +875,19 @@ class PluginManager:
             self.__verify_integer_field(
                 plugin_instance, "plugin_fix_level", plugin_fix_level
             )
+        plugin_token_names = (
+            None
+            if plugin_token_types is None
+            else self.__verify_token_types_field(
+                plugin_instance, "plugin_token_types", plugin_token_types
+            )
+        )
 
         plugin_object = FoundPlugin(
             plugin_id,
             plugin_names,
             plugin_description,
-            plugin_instance,
+            lambda: plugin_instance,
             plugin_enabled_by_default,
             plugin_version,
             plugin_interface_version,
@@ -728,16 +897,19 @@ class PluginManager:
             plugin_supports_fix,
             plugin_fix_level,
             [plugin_id, *plugin_names],
+            plugin_token_names,
         )
 
-        if plugin_object.plugin_interface_version not in (1, 2, 3):
+        if plugin_object.plugin_interface_version not in (1, 2, 3, 4):
             raise BadPluginError(
                 formatted_message=f"Plugin '{instance_file_name}' with an interface version "
-                + f"('{plugin_object.plugin_interface_version}') that is not '1', '2', or '3'."
+                + f"('{plugin_object.plugin_interface_version}') that is not '1', '2', '3', or '4'."
             )
 
         return plugin_object
 
+    # pylint: enable=too-many-locals
+
     # pylint: disable=too-many-locals
     def __unpack_plugin_details(self, plugin_instance: RulePlugin) -> Tuple[
         str,
@@ -751,11 +923,13 @@ class PluginManager:
         List[str],
         bool,
         int,
+        Optional[Any],
     ]:
         try:
             instance_details = plugin_instance.get_details()
             plugin_supports_fix = False
             plugin_fix_level = -1
+            plugin_token_types = None
             (
                 plugin_id,
                 plugin_name,
@@ -781,6 +955,11 @@ class PluginManager:
             ):
                 plugin_supports_fix = instance_details.plugin_supports_fix
                 plugin_fix_level = instance_details.plugin_fix_level
+            if (
+                isinstance(instance_details, PluginDetailsV4)
+                and plugin_interface_version >= 4
+            ):
+                plugin_token_types = instance_details.plugin_token_types
         except Exception as this_exception:
             raise BadPluginError(
                 class_name=type(plugin_instance).__name__,
@@ -805,6 +984,7 @@ class PluginManager:
             plugin_names,
             plugin_supports_fix,
             plugin_fix_level,
+            plugin_token_types,
         )
 
     # pylint: enable=too-many-locals
@@ -843,11 +1023,9 @@ class PluginManager:
                 )
             self.__all_ids[next_key] = plugin_object
 
-    # pylint: disable=too-many-arguments
     def __register_individual_plugin(
         self,
-        plugin_instance: RulePlugin,
-        instance_file_name: str,
+        plugin_object: FoundPlugin,
         command_line_enabled_rules: Set[str],
         command_line_disabled_rules: Set[str],
         properties: ApplicationProperties,
@@ -856,8 +1034,7 @@ class PluginManager:
         Register an individual plugin for use.
         """
 
-        plugin_object = self.__get_plugin_details(plugin_instance, instance_file_name)
-
+        instance_file_name = plugin_object.plugin_file_name
         next_key = plugin_object.plugin_id
         self.__register_plugin_id(plugin_object, instance_file_name, next_key)
         self.__register_plugin_names(plugin_object, instance_file_name)
@@ -880,8 +1057,6 @@ class PluginManager:
         ):
             self.__enabled_plugins.append(plugin_object)
 
-    # pylint: enable=too-many-arguments
-
     def __register_plugins(
         self,
         enable_rules_from_command_line: str,
@@ -909,10 +1084,15 @@ class PluginManager:
             ):
                 command_line_disabled_rules.add(next_rule_identifier.strip())
 
-        for plugin_instance, instance_file_name in self.__loaded_classes:
+        for plugin_object in itertools.chain(
+            self.__manifest_plugins,
+            (
+                self.__get_plugin_details(plugin_instance, instance_file_name)
+                for plugin_instance, instance_file_name in self.__loaded_classes
+            ),
+        ):
             self.__register_individual_plugin(
-                plugin_instance,
-                instance_file_name,
+                plugin_object,
                 command_line_enabled_rules,
                 command_line_disabled_rules,
                 properties,
@@ -954,7 +1134,34 @@ class PluginManager:
         """
         Determine if there is a pragma on the specified line.
         """
-        return line_number in self.__pragma_line_numbers
+        return self.__pragma_index.is_pragma_on_line(line_number)
+
+    def calculate_pragma_offset(self, line_number: int, line_number_delta: int) -> int:
+        """
+        Calculate the number of pragma lines skipped when moving forward the
+        specified number of lines from the specified line.
+        """
+        return self.__pragma_index.calculate_pragma_offset(
+            line_number, line_number_delta
+        )
+
+    def find_plugins_affected_by_token_names(
+        self, token_names: Set[str]
+    ) -> List[FoundPlugin]:
+        """
+        Find the enabled plugins whose results may change when tokens with any of
+        the specified names are added to or removed from a document.  Plugins that
+        examine each line, or that do not specify the token types they are
+        interested in, are always affected.  The results of any other plugins only
+        need to have their line numbers adjusted.
+        """
+        return [
+            next_plugin
+            for next_plugin in self.__enabled_plugins
+            if next_plugin in self.__enabled_plugins_for_next_line
+            or next_plugin.plugin_token_names is None
+            or not next_plugin.plugin_token_names.isdisjoint(token_names)
+        ]
 
     @classmethod
     def __find_configuration_for_plugin(
@@ -1055,6 +1262,36 @@ class PluginManager:
 
     # pylint: enable=too-many-arguments
 
+    def __get_dispatch_table(
+        self,
+        current_table: Optional[PluginDispatchTable],
+        event_plugins: List[FoundPlugin],
+        context: PluginScanContext,
+        context_map: Optional[Dict[str, PluginScanContext]],
+        per_file_disabled_identifiers: Optional[Set[str]],
+    ) -> PluginDispatchTable:
+        """
+        Get a table of the plugins that are active for the event, compiling a new
+        table only if the arguments for the event have changed.
+        """
+        if current_table is not None and current_table.is_compiled_for(
+            context, context_map, per_file_disabled_identifiers
+        ):
+            return current_table
+
+        table_entries: List[DispatchEntry] = []
+        for next_plugin in event_plugins:
+            skip_plugin, plugin_context = self.__check_for_skip_of_plugin(
+                next_plugin, context_map, context, None, per_file_disabled_identifiers
+            )
+            if not skip_plugin:
+                # Was not None on the way in, so should not be None now.
+                assert plugin_context is not None
+                table_entries.append((next_plugin, plugin_context))
+        return PluginDispatchTable(
+            context, context_map, per_file_disabled_identifiers, table_entries
+        )
+
     # pylint: disable=too-many-arguments
     def starting_new_file(
         self,
@@ -1062,7 +1299,7 @@ class PluginManager:
         actual_tokens: List[MarkdownToken],
         per_file_disabled_identifiers: Optional[Set[str]],
         fix_mode: bool = False,
-        temp_output: Optional[TextIOWrapper] = None,
+        temp_output: Optional[TextIO] = None,
         fix_token_map: Optional[Dict[MarkdownToken, List[FixTokenRecord]]] = None,
         constraint_id_list: Optional[List[str]] = None,
         replace_tokens_list: Optional[List[ReplaceTokensRecord]] = None,
@@ -1074,6 +1311,10 @@ class PluginManager:
         self.__document_pragma_ranges = []
         self.__general_pragma_ranges = []
         self.__pragma_line_numbers = []
+        self.__pragma_index = PragmaIntervalIndex()
+        self.__next_token_table = None
+        self.__next_line_table = None
+        self.__completed_file_table = None
 
         for next_plugin in self.__enabled_plugins_for_starting_new_file:
             skip_plugin, _ = self.__check_for_skip_of_plugin(
@@ -1161,21 +1402,25 @@ class PluginManager:
         # This skip added for the assert True.  Without the assert True, code coverage
         # believes that only one of the paths were covered.
         # sourcery skip: remove-assert-true
-        for next_plugin in self.__enabled_plugins_for_completed_file:
-
-            skip_plugin, temp_context = self.__check_for_skip_of_plugin(
-                next_plugin, context_map, context, None, per_file_disabled_identifiers
-            )
-            if skip_plugin:
-                continue
-            # Was not None on the way in, so should not be None now.
-            assert temp_context is not None
-            context = temp_context
-
+        self.__completed_file_table = self.__get_dispatch_table(
+            self.__completed_file_table,
+            self.__enabled_plugins_for_completed_file,
+            context,
+            context_map,
+            per_file_disabled_identifiers,
+        )
+        for next_plugin, plugin_context in self.__completed_file_table.entries:
+            context = plugin_context
             try:
                 if context.in_fix_mode:
                     context.set_current_fix_line(None)
-                next_plugin.plugin_instance.completed_file(context)
+                if self.__phase_timer is None:
+                    next_plugin.plugin_instance.completed_file(context)
+                else:
+                    with self.__phase_timer.measure(
+                        f"{next_plugin.plugin_id}.completed_file"
+                    ):
+                        next_plugin.plugin_instance.completed_file(context)
                 if context.in_fix_mode and context.current_fix_line is not None:
                     (
                         current_fix_line,
@@ -1276,20 +1521,25 @@ class PluginManager:
         Inform any listeners that a new line has been loaded.
         """
         context.line_number = line_number
-        for next_plugin in self.__enabled_plugins_for_next_line:
-            skip_plugin, temp_context = self.__check_for_skip_of_plugin(
-                next_plugin, context_map, context, None, per_file_disabled_identifiers
-            )
-            if skip_plugin:
-                continue
-            # Was not None on the way in, so should not be None now.
-            assert temp_context is not None
-            context = temp_context
-
+        self.__next_line_table = self.__get_dispatch_table(
+            self.__next_line_table,
+            self.__enabled_plugins_for_next_line,
+            context,
+            context_map,
+            per_file_disabled_identifiers,
+        )
+        for next_plugin, plugin_context in self.__next_line_table.entries:
+            context = plugin_context
             try:
                 if context.in_fix_mode:
                     self.__next_line_fix_mode_before(context, line, next_plugin)
-                next_plugin.plugin_instance.next_line(context, line)
+                if self.__phase_timer is None:
+                    next_plugin.plugin_instance.next_line(context, line)
+                else:
+                    with self.__phase_timer.measure(
+                        f"{next_plugin.plugin_id}.next_line"
+                    ):
+                        next_plugin.plugin_instance.next_line(context, line)
                 if context.current_fix_line is not None:
                     line = self.__next_line_fix_mode_after(
                         context, line, line_number, next_plugin
@@ -1322,18 +1572,25 @@ class PluginManager:
         """
         Inform any listeners of a new token that has been processed.
         """
-        for next_plugin in self.__enabled_plugins_for_next_token:
-            skip_plugin, temp_context = self.__check_for_skip_of_plugin(
-                next_plugin, context_map, context, None, per_file_disabled_identifiers
-            )
-            if skip_plugin:
-                continue
-            # Was not None on the way in, so should not be None now.
-            assert temp_context is not None
-            context = temp_context
-
+        self.__next_token_table = self.__get_dispatch_table(
+            self.__next_token_table,
+            self.__enabled_plugins_for_next_token,
+            context,
+            context_map,
+            per_file_disabled_identifiers,
+        )
+        for (
+            next_plugin,
+            plugin_context,
+        ) in self.__next_token_table.entries_for_token_name(token.token_name):
             try:
-                next_plugin.plugin_instance.next_token(context, token)
+                if self.__phase_timer is None:
+                    next_plugin.plugin_instance.next_token(plugin_context, token)
+                else:
+                    with self.__phase_timer.measure(
+                        f"{next_plugin.plugin_id}.next_token"
+                    ):
+                        next_plugin.plugin_instance.next_token(plugin_context, token)
             except Exception as this_exception:
                 actual_token = token if self.__show_stack_trace else None
 
@@ -0,0 +1,138 @@
+"""
+Module to provide for a manifest of the plugins in a directory, allowing those
+plugins to be registered without importing their modules.
+"""
+
+import json
+import logging
+import os
+from typing import Any, Callable, Dict, List, Optional
+
+from pymarkdown.plugin_manager.found_plugin import FoundPlugin
+from pymarkdown.plugin_manager.rule_plugin import RulePlugin
+
+LOGGER = logging.getLogger(__name__)
+
+
+class PluginManifest:
+    """
+    Class to provide for a manifest of the plugins in a directory, allowing those
+    plugins to be registered without importing their modules.
+
+    The manifest is generated from the plugins themselves, using the
+    `utils/generate_plugin_manifest.py` script, and is only used if it lists
+    exactly the plugin files that are present in the directory.  Otherwise, every
+    plugin in the directory is imported to determine its details.
+    """
+
+    manifest_file_name = "plugin_manifest.json"
+    __manifest_version = 1
+
+    @staticmethod
+    def load(
+        directory_to_search: str, plugin_files: List[str]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Load the entries from the manifest in the specified directory, returning
+        None if there is no usable manifest for the specified plugin files.
+        """
+        manifest_path = os.path.join(
+            directory_to_search, PluginManifest.manifest_file_name
+        )
+        if not os.path.exists(manifest_path):
+            return None
+        try:
+            with open(manifest_path, "rt", encoding="utf-8") as manifest_file:
+                manifest_document = json.load(manifest_file)
+        except (OSError, ValueError) as this_exception:
+            LOGGER.warning(
+                "Plugin manifest '%s' was not loaded (%s).",
+                manifest_path,
+                str(this_exception),
+            )
+            return None
+
+        if (
+            not isinstance(manifest_document, dict)
+            or manifest_document.get("version") != PluginManifest.__manifest_version
+            or not isinstance(manifest_document.get("plugins"), list)
+        ):
+            LOGGER.warning(
+                "Plugin manifest '%s' is not a supported manifest.", manifest_path
+            )
+            return None
+        manifest_entries: List[Dict[str, Any]] = manifest_document["plugins"]
+        if sorted(
+            next_entry.get("file_name", "") for next_entry in manifest_entries
+        ) != sorted(plugin_files):
+            LOGGER.info(
+                "Plugin manifest '%s' does not match the plugin files in its directory.",
+                manifest_path,
+            )
+            return None
+        return manifest_entries
+
+    @staticmethod
+    def create_found_plugin(
+        manifest_entry: Dict[str, Any], plugin_instance_loader: Callable[[], RulePlugin]
+    ) -> FoundPlugin:
+        """
+        Create the information for a plugin from its entry in the manifest, using
+        the loader to create the instance of the plugin when it is needed.
+        """
+        plugin_token_names = manifest_entry["token_names"]
+        return FoundPlugin(
+            manifest_entry["id"],
+            list(manifest_entry["names"]),
+            manifest_entry["description"],
+            plugin_instance_loader,
+            manifest_entry["enabled_by_default"],
+            manifest_entry["version"],
+            manifest_entry["interface_version"],
+            manifest_entry["file_name"],
+            manifest_entry["url"],
+            manifest_entry["configuration"],
+            manifest_entry["supports_fix"],
+            manifest_entry["fix_level"],
+            [manifest_entry["id"], *manifest_entry["names"]],
+            None if plugin_token_names is None else frozenset(plugin_token_names),
+        )
+
+    @staticmethod
+    def create(found_plugins: List[FoundPlugin]) -> str:
+        """
+        Create the text of a manifest describing the specified plugins.
+        """
+        manifest_entries = [
+            {
+                "file_name": next_plugin.plugin_file_name,
+                "id": next_plugin.plugin_id,
+                "names": next_plugin.plugin_names,
+                "description": next_plugin.plugin_description,
+                "enabled_by_default": next_plugin.plugin_enabled_by_default,
+                "version": next_plugin.plugin_version,
+                "interface_version": next_plugin.plugin_interface_version,
+                "url": next_plugin.plugin_url,
+                "configuration": next_plugin.plugin_configuration,
+                "supports_fix": next_plugin.plugin_supports_fix,
+                "fix_level": next_plugin.plugin_fix_level,
+                "token_names": (
+                    None
+                    if next_plugin.plugin_token_names is None
+                    else sorted(next_plugin.plugin_token_names)
+                ),
+            }
+            for next_plugin in sorted(
+                found_plugins, key=lambda plugin: plugin.plugin_file_name
+            )
+        ]
+        return (
+            json.dumps(
+                {
+                    "version": PluginManifest.__manifest_version,
+                    "plugins": manifest_entries,
+                },
+                indent=4,
+            )
+            + "\n"
+        )
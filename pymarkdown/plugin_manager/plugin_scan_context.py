@@ -4,8 +4,7 @@ Module to provide context when reporting any errors.
 
 from __future__ import annotations
 
-from io import TextIOWrapper
-from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, TextIO, Tuple, Union
 
 from typing_extensions import override
 
@@ -34,7 +33,7 @@ class PluginScanContext(PluginModifyContext):
         scan_file: str,
         actual_tokens: List[MarkdownToken],
         fix_mode: bool,
-        file_output: Optional[TextIOWrapper],
+        file_output: Optional[TextIO],
         fix_token_map: Optional[Dict[MarkdownToken, List[FixTokenRecord]]],
         replace_tokens_list: Optional[List[ReplaceTokensRecord]],
     ):
@@ -158,7 +157,7 @@ class PluginScanContext(PluginModifyContext):
         self.__current_fix_line = new_line
 
     @property
-    def file_output(self) -> TextIOWrapper:
+    def file_output(self) -> TextIO:
         """
         File object to use for writing fix information.
         """
@@ -349,12 +348,9 @@ class PluginScanContext(PluginModifyContext):
         """
         Calculate the pragma offset for a given token and line number delta.
         """
-        pragma_offset = 0
-        for line_index in range(line_number_delta):
-            modified_line_number = token.line_number + line_index + 1 + pragma_offset
-            if self.owning_manager.is_pragma_on_line(modified_line_number):
-                pragma_offset += 1
-        return pragma_offset
+        return self.owning_manager.calculate_pragma_offset(
+            token.line_number, line_number_delta
+        )
 
 
 # pylint: enable=too-many-instance-attributes
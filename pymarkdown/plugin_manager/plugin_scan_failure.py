@@ -3,7 +3,7 @@ Module to contain information about a failure reported by one of the rule plugin
 """
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Tuple, Union
 
 # pylint: disable=too-many-instance-attributes
 
@@ -36,3 +36,7 @@ class PluginScanFailure:
 
 
 # pylint: enable=too-many-instance-attributes
+
+# Each recorded event is either a scan failure, or a pragma failure in the form of
+# (file name, line number, pragma error).
+RecordedScanEvent = Union[PluginScanFailure, Tuple[str, int, str]]
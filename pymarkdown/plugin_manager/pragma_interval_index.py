@@ -0,0 +1,110 @@
+"""
+Module to provide for an index of the lines that pragmas apply to.
+"""
+
+import bisect
+from typing import Dict, Iterable, List, Set, Tuple
+
+
+class PragmaIntervalIndex:
+    """
+    Class to provide for an index of the lines that pragmas apply to, allowing
+    the checks for whether a rule is disabled on a given line, or whether a line
+    contains a pragma, to be done with a binary search instead of a linear scan.
+    """
+
+    def __init__(
+        self,
+        document_pragma_ranges: Iterable[Tuple[int, int, Set[str]]] = (),
+        general_pragma_ranges: Iterable[Tuple[int, int, str]] = (),
+        pragma_line_numbers: Iterable[int] = (),
+    ) -> None:
+        """
+        Initialize a new instance of the PragmaIntervalIndex class.
+        """
+        ranges_by_id: Dict[str, List[Tuple[int, int]]] = {}
+        for range_start, range_end, range_ids in document_pragma_ranges:
+            for range_id in range_ids:
+                ranges_by_id.setdefault(range_id, []).append((range_start, range_end))
+        for range_start, range_end, range_id in general_pragma_ranges:
+            ranges_by_id.setdefault(range_id, []).append((range_start, range_end))
+
+        self.__interval_starts_by_id: Dict[str, List[int]] = {}
+        self.__interval_ends_by_id: Dict[str, List[int]] = {}
+        for range_id, id_ranges in ranges_by_id.items():
+            (
+                self.__interval_starts_by_id[range_id],
+                self.__interval_ends_by_id[range_id],
+            ) = PragmaIntervalIndex.__merge_ranges(id_ranges)
+
+        self.__pragma_line_numbers = sorted(set(pragma_line_numbers))
+
+    @staticmethod
+    def __merge_ranges(id_ranges: List[Tuple[int, int]]) -> Tuple[List[int], List[int]]:
+        """
+        Merge any overlapping or adjacent ranges, so that the starts and ends of
+        the remaining ranges are both in ascending order.
+        """
+        interval_starts: List[int] = []
+        interval_ends: List[int] = []
+        for range_start, range_end in sorted(id_ranges):
+            if range_start > range_end:
+                continue
+            if interval_ends and range_start <= interval_ends[-1] + 1:
+                interval_ends[-1] = max(interval_ends[-1], range_end)
+            else:
+                interval_starts.append(range_start)
+                interval_ends.append(range_end)
+        return interval_starts, interval_ends
+
+    def is_rule_disabled_on_line(self, rule_id: str, line_number: int) -> bool:
+        """
+        Determine if the specified rule is disabled on the specified line by any
+        pragma that covers a range of lines.
+        """
+        if not (interval_starts := self.__interval_starts_by_id.get(rule_id)):
+            return False
+        interval_index = bisect.bisect_right(interval_starts, line_number) - 1
+        return (
+            interval_index >= 0
+            and line_number <= self.__interval_ends_by_id[rule_id][interval_index]
+        )
+
+    def is_pragma_on_line(self, line_number: int) -> bool:
+        """
+        Determine if there is a pragma on the specified line.
+        """
+        line_index = bisect.bisect_left(self.__pragma_line_numbers, line_number)
+        return (
+            line_index < len(self.__pragma_line_numbers)
+            and self.__pragma_line_numbers[line_index] == line_number
+        )
+
+    def calculate_pragma_offset(self, line_number: int, line_number_delta: int) -> int:
+        """
+        Calculate the number of pragma lines that are skipped when moving forward
+        the specified number of lines from the specified line.  Each examined line
+        that contains a pragma moves the following examined line forward by one.
+
+        Instead of examining each line in turn, this jumps directly to the next
+        pragma line, so the cost depends on the number of pragma lines that are
+        found and not on the number of lines moved.
+        """
+        pragma_offset = 0
+        next_line_number = line_number + 1
+        remaining_lines = line_number_delta
+        while remaining_lines > 0:
+            line_index = bisect.bisect_left(
+                self.__pragma_line_numbers, next_line_number
+            )
+            if line_index == len(self.__pragma_line_numbers):
+                break
+            lines_before_pragma = (
+                self.__pragma_line_numbers[line_index] - next_line_number
+            )
+            if lines_before_pragma >= remaining_lines:
+                break
+            remaining_lines -= lines_before_pragma + 1
+            pragma_offset += 1
+            next_line_number = self.__pragma_line_numbers[line_index] + 2
+        return pragma_offset
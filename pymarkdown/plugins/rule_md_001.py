@@ -8,11 +8,12 @@ from typing import List, cast
 from pymarkdown.extensions.front_matter_markdown_token import FrontMatterMarkdownToken
 from pymarkdown.plugin_manager.plugin_details import (
     PluginDetailsV2,
-    PluginDetailsV3,
+    PluginDetailsV4,
     QueryConfigItem,
 )
 from pymarkdown.plugin_manager.plugin_scan_context import PluginScanContext
 from pymarkdown.plugin_manager.rule_plugin import RulePlugin
+from pymarkdown.tokens.atx_heading_markdown_token import AtxHeadingMarkdownToken
 from pymarkdown.tokens.markdown_token import MarkdownToken
 from pymarkdown.tokens.setext_heading_markdown_token import SetextHeadingMarkdownToken
 
@@ -35,7 +36,7 @@ class RuleMd001(RulePlugin):
         """
         Get the details for the plugin.
         """
-        return PluginDetailsV3(
+        return PluginDetailsV4(
             plugin_name="heading-increment,header-increment",
             plugin_id="MD001",
             plugin_enabled_by_default=True,
@@ -44,6 +45,11 @@ class RuleMd001(RulePlugin):
             plugin_url="https://pymarkdown.readthedocs.io/en/latest/plugins/rule_md001.md",
             plugin_configuration="front_matter_title",
             plugin_supports_fix=True,
+            plugin_token_types=[
+                AtxHeadingMarkdownToken,
+                SetextHeadingMarkdownToken,
+                FrontMatterMarkdownToken,
+            ],
         )
 
     def initialize_from_config(self) -> None:
@@ -6,9 +6,15 @@ look right.
 from typing import cast
 
 from pymarkdown.general.parser_helper import ParserHelper
-from pymarkdown.plugin_manager.plugin_details import PluginDetailsV2
+from pymarkdown.plugin_manager.plugin_details import PluginDetailsV2, PluginDetailsV4
 from pymarkdown.plugin_manager.plugin_scan_context import PluginScanContext
 from pymarkdown.plugin_manager.rule_plugin import RulePlugin
+from pymarkdown.tokens.fenced_code_block_markdown_token import (
+    FencedCodeBlockMarkdownToken,
+)
+from pymarkdown.tokens.indented_code_block_markdown_token import (
+    IndentedCodeBlockMarkdownToken,
+)
 from pymarkdown.tokens.markdown_token import MarkdownToken
 from pymarkdown.tokens.text_markdown_token import TextMarkdownToken
 
@@ -30,7 +36,7 @@ class RuleMd014(RulePlugin):
         """
         Get the details for the plugin.
         """
-        return PluginDetailsV2(
+        return PluginDetailsV4(
             plugin_name="commands-show-output",
             plugin_id="MD014",
             plugin_enabled_by_default=True,
@@ -38,6 +44,11 @@ class RuleMd014(RulePlugin):
             plugin_version="0.5.0",
             plugin_url="https://pymarkdown.readthedocs.io/en/latest/plugins/rule_md014.md",
             plugin_supports_fix=False,
+            plugin_token_types=[
+                FencedCodeBlockMarkdownToken,
+                IndentedCodeBlockMarkdownToken,
+                TextMarkdownToken,
+            ],
         )
 
     def starting_new_file(self) -> None:
@@ -7,14 +7,16 @@ from typing import Dict, List, Optional, cast
 
 from pymarkdown.plugin_manager.plugin_details import (
     PluginDetails,
-    PluginDetailsV3,
+    PluginDetailsV4,
     QueryConfigItem,
 )
 from pymarkdown.plugin_manager.plugin_scan_context import PluginScanContext
 from pymarkdown.plugin_manager.rule_plugin import RulePlugin
 from pymarkdown.tokens.atx_heading_markdown_token import AtxHeadingMarkdownToken
 from pymarkdown.tokens.markdown_token import MarkdownToken
+from pymarkdown.tokens.setext_heading_markdown_token import SetextHeadingMarkdownToken
 from pymarkdown.tokens.text_markdown_token import TextMarkdownToken
+from pymarkdown.tokens.token_types import TokenTypes
 
 
 class RuleMd024(RulePlugin):
@@ -39,7 +41,7 @@ class RuleMd024(RulePlugin):
         """
         Get the details for the plugin.
         """
-        return PluginDetailsV3(
+        return PluginDetailsV4(
             plugin_name="no-duplicate-heading,no-duplicate-header",
             plugin_id="MD024",
             plugin_enabled_by_default=True,
@@ -47,6 +49,11 @@ class RuleMd024(RulePlugin):
             plugin_version="0.6.1",
             plugin_url="https://pymarkdown.readthedocs.io/en/latest/plugins/rule_md024.md",
             plugin_configuration="siblings_only, allow_different_nesting",
+            plugin_token_types=[
+                AtxHeadingMarkdownToken,
+                SetextHeadingMarkdownToken,
+                *TokenTypes.get_inline_token_types(),
+            ],
         )
 
     def initialize_from_config(self) -> None:
@@ -7,13 +7,14 @@ from typing import List, cast
 from pymarkdown.extensions.front_matter_markdown_token import FrontMatterMarkdownToken
 from pymarkdown.plugin_manager.plugin_details import (
     PluginDetails,
-    PluginDetailsV3,
+    PluginDetailsV4,
     QueryConfigItem,
 )
 from pymarkdown.plugin_manager.plugin_scan_context import PluginScanContext
 from pymarkdown.plugin_manager.rule_plugin import RulePlugin
 from pymarkdown.tokens.atx_heading_markdown_token import AtxHeadingMarkdownToken
 from pymarkdown.tokens.markdown_token import MarkdownToken
+from pymarkdown.tokens.setext_heading_markdown_token import SetextHeadingMarkdownToken
 
 
 class RuleMd025(RulePlugin):
@@ -34,7 +35,7 @@ class RuleMd025(RulePlugin):
         """
         Get the details for the plugin.
         """
-        return PluginDetailsV3(
+        return PluginDetailsV4(
             plugin_name="single-title,single-h1",
             plugin_id="MD025",
             plugin_enabled_by_default=True,
@@ -42,6 +43,11 @@ class RuleMd025(RulePlugin):
             plugin_version="0.6.1",
             plugin_url="https://pymarkdown.readthedocs.io/en/latest/plugins/rule_md025.md",
             plugin_configuration="level, front_matter_title",
+            plugin_token_types=[
+                AtxHeadingMarkdownToken,
+                SetextHeadingMarkdownToken,
+                FrontMatterMarkdownToken,
+            ],
         )
 
     @classmethod
@@ -5,9 +5,17 @@ Module to implement a plugin that looks for bare URLs in the files.
 from typing import cast
 
 from pymarkdown.general.parser_helper import ParserHelper
-from pymarkdown.plugin_manager.plugin_details import PluginDetails
+from pymarkdown.plugin_manager.plugin_details import PluginDetails, PluginDetailsV4
 from pymarkdown.plugin_manager.plugin_scan_context import PluginScanContext
 from pymarkdown.plugin_manager.rule_plugin import RulePlugin
+from pymarkdown.tokens.fenced_code_block_markdown_token import (
+    FencedCodeBlockMarkdownToken,
+)
+from pymarkdown.tokens.html_block_markdown_token import HtmlBlockMarkdownToken
+from pymarkdown.tokens.indented_code_block_markdown_token import (
+    IndentedCodeBlockMarkdownToken,
+)
+from pymarkdown.tokens.link_start_markdown_token import LinkStartMarkdownToken
 from pymarkdown.tokens.markdown_token import MarkdownToken
 from pymarkdown.tokens.text_markdown_token import TextMarkdownToken
 
@@ -32,14 +40,20 @@ class RuleMd034(RulePlugin):
         """
         Get the details for the plugin.
         """
-        return PluginDetails(
+        return PluginDetailsV4(
             plugin_name="no-bare-urls",
             plugin_id="MD034",
             plugin_enabled_by_default=True,
             plugin_description="Bare URL used",
             plugin_version="0.5.1",
-            plugin_interface_version=1,
             plugin_url="https://pymarkdown.readthedocs.io/en/latest/plugins/rule_md034.md",
+            plugin_token_types=[
+                TextMarkdownToken,
+                FencedCodeBlockMarkdownToken,
+                IndentedCodeBlockMarkdownToken,
+                HtmlBlockMarkdownToken,
+                LinkStartMarkdownToken,
+            ],
         )
 
     def starting_new_file(self) -> None:
@@ -4,7 +4,7 @@ Module to implement a plugin that looks for leading and trailing spaces within c
 
 from typing import cast
 
-from pymarkdown.plugin_manager.plugin_details import PluginDetailsV2
+from pymarkdown.plugin_manager.plugin_details import PluginDetailsV2, PluginDetailsV4
 from pymarkdown.plugin_manager.plugin_scan_context import PluginScanContext
 from pymarkdown.plugin_manager.rule_plugin import RulePlugin
 from pymarkdown.tokens.inline_code_span_markdown_token import (
@@ -22,7 +22,7 @@ class RuleMd038(RulePlugin):
         """
         Get the details for the plugin.
         """
-        return PluginDetailsV2(
+        return PluginDetailsV4(
             plugin_name="no-space-in-code",
             plugin_id="MD038",
             plugin_enabled_by_default=True,
@@ -30,6 +30,9 @@ class RuleMd038(RulePlugin):
             plugin_version="0.5.1",
             plugin_url="https://pymarkdown.readthedocs.io/en/latest/plugins/rule_md038.md",
             plugin_supports_fix=True,
+            plugin_token_types=[
+                InlineCodeSpanMarkdownToken,
+            ],
         )
 
     def next_token(self, context: PluginScanContext, token: MarkdownToken) -> None:
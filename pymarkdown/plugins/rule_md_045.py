@@ -5,7 +5,7 @@ Module to implement a plugin that looks for image elements that do not specify a
 from typing import cast
 
 from pymarkdown.general.constants import Constants
-from pymarkdown.plugin_manager.plugin_details import PluginDetails
+from pymarkdown.plugin_manager.plugin_details import PluginDetails, PluginDetailsV4
 from pymarkdown.plugin_manager.plugin_scan_context import PluginScanContext
 from pymarkdown.plugin_manager.rule_plugin import RulePlugin
 from pymarkdown.tokens.image_start_markdown_token import ImageStartMarkdownToken
@@ -21,14 +21,16 @@ class RuleMd045(RulePlugin):
         """
         Get the details for the plugin.
         """
-        return PluginDetails(
+        return PluginDetailsV4(
             plugin_name="no-alt-text",
             plugin_id="MD045",
             plugin_enabled_by_default=True,
             plugin_description="Images should have alternate text (alt text)",
             plugin_version="0.5.0",
-            plugin_interface_version=1,
             plugin_url="https://pymarkdown.readthedocs.io/en/latest/plugins/rule_md045.md",
+            plugin_token_types=[
+                ImageStartMarkdownToken,
+            ],
         )
 
     def next_token(self, context: PluginScanContext, token: MarkdownToken) -> None:
@@ -0,0 +1,150 @@
+"""
+Module to provide for a report of the time taken by each phase of a scan, and by
+each plugin, when requested from the command line.
+"""
+
+import argparse
+import json
+from typing import Any, Dict, List, Optional
+
+from columnar import columnar
+
+from pymarkdown.general.main_presentation import MainPresentation
+from pymarkdown.general.parser_helper import ParserHelper
+from pymarkdown.general.phase_timer import PhaseTimer
+
+
+class ProfileReportHelper:
+    """
+    Class to provide for a report of the time taken by each phase of a scan, and by
+    each plugin, when requested from the command line.
+
+    Each plugin's functions are reported by the plugin's identifier followed by the
+    name of the function, such as `md027.next_token`.  If the files are scanned by
+    multiple processes, the measurements from each process are added together, and
+    the time for a phase may then be more than the total time.  Any files whose
+    results are loaded from the scan cache are not scanned, and are instead counted
+    as the `scan-cache-replay` phase.
+    """
+
+    total_phase = "total"
+    report_format_version = 1
+
+    __sort_by_time = "time"
+    __sort_by_calls = "calls"
+    __sort_by_name = "name"
+
+    @staticmethod
+    def add_command_line_arguments(parser: argparse.ArgumentParser) -> None:
+        """
+        Function to add any command line arguments for this to the application.
+        """
+        parser.add_argument(
+            "--x-profile-report",
+            dest="x_profile_report",
+            action="store_true",
+            default=False,
+            help=argparse.SUPPRESS,
+        )
+        parser.add_argument(
+            "--x-profile-report-file",
+            dest="x_profile_report_file",
+            action="store",
+            default=None,
+            help=argparse.SUPPRESS,
+        )
+        parser.add_argument(
+            "--x-profile-sort",
+            dest="x_profile_sort",
+            action="store",
+            default=ProfileReportHelper.__sort_by_time,
+            choices=[
+                ProfileReportHelper.__sort_by_time,
+                ProfileReportHelper.__sort_by_calls,
+                ProfileReportHelper.__sort_by_name,
+            ],
+            help=argparse.SUPPRESS,
+        )
+
+    @staticmethod
+    def create_phase_timer(args: argparse.Namespace) -> Optional[PhaseTimer]:
+        """
+        Create the timer to measure the scan with, if a report was requested.
+        """
+        return (
+            PhaseTimer()
+            if args.x_profile_report or args.x_profile_report_file
+            else None
+        )
+
+    @staticmethod
+    def report_phase_times(
+        args: argparse.Namespace,
+        phase_timer: PhaseTimer,
+        presentation: MainPresentation,
+    ) -> None:
+        """
+        Report the time taken by each phase as a table, as a JSON file, or both.
+        """
+        if args.x_profile_report_file:
+            ProfileReportHelper.__write_report_file(
+                args.x_profile_report_file, phase_timer
+            )
+        if args.x_profile_report:
+            ProfileReportHelper.__print_report_table(
+                args.x_profile_sort, phase_timer, presentation
+            )
+
+    @staticmethod
+    def __write_report_file(report_file: str, phase_timer: PhaseTimer) -> None:
+        elapsed_times = phase_timer.elapsed_times
+        call_counts = phase_timer.call_counts
+        report_document: Dict[str, Any] = {
+            "version": ProfileReportHelper.report_format_version,
+            "phases": {
+                next_phase_name: {
+                    "calls": call_counts[next_phase_name],
+                    "seconds": elapsed_times[next_phase_name],
+                }
+                for next_phase_name in sorted(elapsed_times)
+            },
+        }
+        with open(report_file, "wt", encoding="utf-8", newline="\n") as output_file:
+            json.dump(report_document, output_file, indent=2)
+            output_file.write(ParserHelper.newline_character)
+
+    @staticmethod
+    def __print_report_table(
+        sort_order: str, phase_timer: PhaseTimer, presentation: MainPresentation
+    ) -> None:
+        elapsed_times = phase_timer.elapsed_times
+        call_counts = phase_timer.call_counts
+        if sort_order == ProfileReportHelper.__sort_by_name:
+            phase_names = sorted(elapsed_times)
+        elif sort_order == ProfileReportHelper.__sort_by_calls:
+            phase_names = sorted(
+                elapsed_times, key=lambda phase_name: -call_counts[phase_name]
+            )
+        else:
+            phase_names = sorted(
+                elapsed_times, key=lambda phase_name: -elapsed_times[phase_name]
+            )
+
+        total_time = elapsed_times.get(ProfileReportHelper.total_phase)
+        show_rows: List[List[str]] = []
+        for next_phase_name in phase_names:
+            phase_time = elapsed_times[next_phase_name]
+            show_rows.append(
+                [
+                    next_phase_name,
+                    str(call_counts[next_phase_name]),
+                    f"{phase_time:.3f}",
+                    f"{phase_time * 1000.0 / call_counts[next_phase_name]:.3f}",
+                    f"{phase_time * 100.0 / total_time:.1f}" if total_time else "",
+                ]
+            )
+        headers = ["phase", "calls", "seconds", "ms per call", "% of total"]
+        table = columnar(show_rows, headers, no_borders=True)
+        split_rows = table.split(ParserHelper.newline_character)
+        new_rows = [next_row.rstrip() for next_row in split_rows]
+        presentation.print_system_output(ParserHelper.newline_character.join(new_rows))
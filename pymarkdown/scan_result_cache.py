@@ -0,0 +1,318 @@
+"""
+Module to provide for a persistent cache of the results of scanning a file.
+"""
+
+import argparse
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from application_properties import ApplicationProperties
+
+from pymarkdown.general.parser_logger import ParserLogger
+from pymarkdown.plugin_manager.plugin_manager import PluginManager
+from pymarkdown.plugin_manager.plugin_scan_failure import (
+    PluginScanFailure,
+    RecordedScanEvent,
+)
+from pymarkdown.version import __version__
+
+POGGER = ParserLogger(logging.getLogger(__name__))
+
+
+@dataclass
+class ScanCacheStatistics:
+    """
+    Class to keep track of how the scan result cache was used.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    size_in_bytes: int = 0
+
+
+class ScanResultCache:
+    """
+    Class to provide for a persistent cache of the results of scanning a file.
+
+    Each entry is stored in its own file within the cache directory, and is keyed
+    using a hash of the file's name, the file's contents, any per-file disabled
+    identifiers, and a fingerprint of the effective configuration.  The configuration
+    fingerprint covers the version of PyMarkdown, the enabled plugins and their
+    configuration, and the enabled extensions and their configuration.  If any of
+    those change, none of the existing entries will match and the files are rescanned.
+
+    The modification time of each entry is updated whenever it is used, allowing
+    the least recently used entries to be evicted once the total size of the cache
+    goes over its maximum size.
+    """
+
+    __directory_property_name = "cache.directory"
+    __maximum_size_property_name = "cache.max_size"
+    __default_maximum_size = 50 * 1024 * 1024
+    __entry_extension = ".json"
+
+    def __init__(
+        self, cache_directory: str, maximum_size: int, configuration_fingerprint: str
+    ) -> None:
+        """
+        Initialize a new instance of the ScanResultCache class.
+        """
+        self.__cache_directory = cache_directory
+        self.__maximum_size = maximum_size
+        self.__configuration_fingerprint = configuration_fingerprint
+        self.__statistics = ScanCacheStatistics()
+        os.makedirs(self.__cache_directory, exist_ok=True)
+
+    @property
+    def statistics(self) -> ScanCacheStatistics:
+        """
+        Statistics on how the cache has been used.
+        """
+        return self.__statistics
+
+    @staticmethod
+    def create_if_enabled(
+        args: argparse.Namespace,
+        properties: ApplicationProperties,
+        plugins: PluginManager,
+    ) -> Optional["ScanResultCache"]:
+        """
+        Create a new cache if a cache directory was specified on the command line
+        or in the configuration.
+        """
+        cache_directory = args.scan_cache_directory or properties.get_string_property(
+            ScanResultCache.__directory_property_name
+        )
+        if not cache_directory:
+            return None
+        maximum_size = properties.get_integer_property(
+            ScanResultCache.__maximum_size_property_name,
+            default_value=ScanResultCache.__default_maximum_size,
+            valid_value_fn=ScanResultCache.__validate_maximum_size,
+        )
+        assert maximum_size is not None
+        fingerprint = ScanResultCache.calculate_configuration_fingerprint(
+            args, properties, plugins
+        )
+        POGGER.info(
+            "Using scan cache directory '$' with configuration fingerprint '$'.",
+            cache_directory,
+            fingerprint,
+        )
+        return ScanResultCache(cache_directory, maximum_size, fingerprint)
+
+    @staticmethod
+    def __validate_maximum_size(found_value: int) -> None:
+        if found_value < 0:
+            raise ValueError("Value must not be negative.")
+
+    @staticmethod
+    def collect_properties_under(
+        properties: ApplicationProperties, key_name: str
+    ) -> Dict[str, str]:
+        """
+        Collect the representation of each property under the specified key.
+        """
+        return {
+            property_name: repr(properties.get_property(property_name, object))
+            for property_name in properties.property_names_under(key_name)
+        }
+
+    @staticmethod
+    def calculate_configuration_fingerprint(
+        args: argparse.Namespace,
+        properties: ApplicationProperties,
+        plugins: PluginManager,
+    ) -> str:
+        """
+        Calculate a fingerprint for any configuration that may affect the results
+        of scanning a file.
+        """
+        plugin_settings: List[Any] = []
+        plugin_properties: Dict[str, str] = {}
+        for next_plugin in plugins.enabled_plugins:
+            try:
+                plugin_file_stat = os.stat(next_plugin.plugin_file_name)
+                plugin_file_state = [
+                    plugin_file_stat.st_size,
+                    plugin_file_stat.st_mtime_ns,
+                ]
+            except OSError:
+                plugin_file_state = []
+            plugin_settings.append(
+                [
+                    next_plugin.plugin_id,
+                    next_plugin.plugin_version,
+                    next_plugin.plugin_file_name,
+                    plugin_file_state,
+                ]
+            )
+            for next_identifier in next_plugin.plugin_identifiers:
+                plugin_properties.update(
+                    ScanResultCache.collect_properties_under(
+                        properties, f"plugins{properties.separator}{next_identifier}"
+                    )
+                )
+
+        fingerprint_source = {
+            "version": __version__,
+            "plugins": plugin_settings,
+            "plugin_properties": plugin_properties,
+            "enable_extensions": args.enable_extensions,
+            "extension_properties": ScanResultCache.collect_properties_under(
+                properties, "extensions"
+            ),
+        }
+        return hashlib.sha256(
+            json.dumps(fingerprint_source, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
+    def calculate_file_key(
+        self, file_name: str, per_file_disabled_identifiers: Optional[Set[str]]
+    ) -> Optional[str]:
+        """
+        Calculate the key for the specified file, returning None if the file
+        cannot be read.
+        """
+        file_hash = hashlib.sha256()
+        try:
+            with open(file_name, "rb") as file_to_hash:
+                for next_block in iter(lambda: file_to_hash.read(65536), b""):
+                    file_hash.update(next_block)
+        except OSError as this_exception:
+            POGGER.info(
+                "Unable to read file '$' for the scan cache: $",
+                file_name,
+                this_exception,
+            )
+            return None
+
+        key_source = json.dumps(
+            [
+                self.__configuration_fingerprint,
+                file_name,
+                file_hash.hexdigest(),
+                sorted(per_file_disabled_identifiers or []),
+            ]
+        )
+        return hashlib.sha256(key_source.encode("utf-8")).hexdigest()
+
+    def __entry_path(self, file_key: str) -> str:
+        return os.path.join(
+            self.__cache_directory, f"{file_key}{ScanResultCache.__entry_extension}"
+        )
+
+    def load(self, file_key: str) -> Optional[List[RecordedScanEvent]]:
+        """
+        Load the recorded events for the specified key, returning None if there
+        is no usable entry for that key.
+        """
+        entry_path = self.__entry_path(file_key)
+        try:
+            with open(entry_path, "rt", encoding="utf-8") as entry_file:
+                serialized_events = json.load(entry_file)
+            recorded_events = [
+                ScanResultCache.__deserialize_event(next_event)
+                for next_event in serialized_events
+            ]
+            os.utime(entry_path)
+        except (OSError, ValueError, TypeError, KeyError) as this_exception:
+            if os.path.exists(entry_path):
+                POGGER.info(
+                    "Unable to load scan cache entry '$': $",
+                    entry_path,
+                    this_exception,
+                )
+            self.__statistics.misses += 1
+            return None
+        self.__statistics.hits += 1
+        return recorded_events
+
+    def store(self, file_key: str, recorded_events: List[RecordedScanEvent]) -> None:
+        """
+        Store the recorded events for the specified key.
+        """
+        serialized_events = [
+            ScanResultCache.__serialize_event(next_event)
+            for next_event in recorded_events
+        ]
+        temporary_path = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                "wt",
+                dir=self.__cache_directory,
+                suffix=".tmp",
+                delete=False,
+                encoding="utf-8",
+            ) as entry_file:
+                temporary_path = entry_file.name
+                json.dump(serialized_events, entry_file)
+            os.replace(temporary_path, self.__entry_path(file_key))
+            temporary_path = None
+            self.__statistics.stores += 1
+        except OSError as this_exception:
+            POGGER.info("Unable to store scan cache entry: $", this_exception)
+        finally:
+            if temporary_path and os.path.exists(temporary_path):
+                os.remove(temporary_path)
+
+    @staticmethod
+    def __serialize_event(recorded_event: RecordedScanEvent) -> Dict[str, Any]:
+        if isinstance(recorded_event, PluginScanFailure):
+            return {"failure": dataclasses.asdict(recorded_event)}
+        return {"pragma": list(recorded_event)}
+
+    @staticmethod
+    def __deserialize_event(serialized_event: Dict[str, Any]) -> RecordedScanEvent:
+        if "failure" in serialized_event:
+            return PluginScanFailure(**serialized_event["failure"])
+        scan_file, line_number, pragma_error = serialized_event["pragma"]
+        return (scan_file, line_number, pragma_error)
+
+    def close(self) -> None:
+        """
+        Evict the least recently used entries until the cache is within its
+        maximum size, and log the statistics for the cache.
+        """
+        entries: List[Tuple[float, int, str]] = []
+        total_size = 0
+        with os.scandir(self.__cache_directory) as directory_entries:
+            for next_entry in directory_entries:
+                if next_entry.is_file() and next_entry.name.endswith(
+                    ScanResultCache.__entry_extension
+                ):
+                    entry_stat = next_entry.stat()
+                    entries.append(
+                        (entry_stat.st_mtime, entry_stat.st_size, next_entry.path)
+                    )
+                    total_size += entry_stat.st_size
+
+        if total_size > self.__maximum_size:
+            entries.sort()
+            for _, entry_size, entry_path in entries:
+                if total_size <= self.__maximum_size:
+                    break
+                try:
+                    os.remove(entry_path)
+                except OSError:
+                    continue
+                total_size -= entry_size
+                self.__statistics.evictions += 1
+        self.__statistics.size_in_bytes = total_size
+
+        POGGER.info(
+            "Scan cache: $ hits, $ misses, $ stores, $ evictions, $ bytes used.",
+            self.__statistics.hits,
+            self.__statistics.misses,
+            self.__statistics.stores,
+            self.__statistics.evictions,
+            self.__statistics.size_in_bytes,
+        )
@@ -0,0 +1,285 @@
+"""
+Module to provide for the output of scan results in a structured format, such as
+JSON Lines or SARIF, as each file's results are reported.
+"""
+
+import argparse
+import json
+import os
+import pathlib
+import urllib.parse
+from typing import Any, Dict, Optional, Tuple
+
+from pymarkdown.general.main_presentation import MainPresentation
+from pymarkdown.plugin_manager.plugin_scan_failure import PluginScanFailure
+
+
+class StructuredOutputPresentation(MainPresentation):
+    """
+    Class to provide for the output of scan results in a structured format, such as
+    JSON Lines or SARIF, as each file's results are reported.
+
+    Any other output, such as errors, is passed on to the presentation that this
+    presentation wraps.  Each result is written as soon as it is reported, with only
+    the details of each rule that was triggered being kept until the end of the scan,
+    so the memory used does not grow with the number of results.  For SARIF, the
+    `finish` function must be called once the scan has completed to close the
+    document.
+    """
+
+    text_output_format = "text"
+    json_lines_output_format = "jsonl"
+    sarif_output_format = "sarif"
+    output_formats = [text_output_format, json_lines_output_format, sarif_output_format]
+
+    __sarif_schema = "https://json.schemastore.org/sarif-2.1.0.json"
+    __sarif_version = "2.1.0"
+    __information_uri = "https://github.com/jackdewinter/pymarkdown"
+    __pragma_rule_id = "INLINE"
+
+    def __init__(
+        self,
+        wrapped_presentation: MainPresentation,
+        output_format: str,
+        application_version: str,
+    ) -> None:
+        """
+        Initialize a new instance of the StructuredOutputPresentation class.
+        """
+        assert output_format in (
+            StructuredOutputPresentation.json_lines_output_format,
+            StructuredOutputPresentation.sarif_output_format,
+        ), "Text output does not require a structured presentation."
+        self.__wrapped_presentation = wrapped_presentation
+        self.__is_sarif = (
+            output_format == StructuredOutputPresentation.sarif_output_format
+        )
+        self.__application_version = application_version
+        self.__triggered_rules: Dict[str, Tuple[str, str]] = {}
+        self.__pending_result: Optional[str] = None
+        self.__is_finished = False
+
+        if self.__is_sarif:
+            self.__wrapped_presentation.print_system_output(
+                '{"version": "'
+                + StructuredOutputPresentation.__sarif_version
+                + '", "$schema": "'
+                + StructuredOutputPresentation.__sarif_schema
+                + '", "runs": [{"results": ['
+            )
+
+    @staticmethod
+    def add_command_line_arguments(parser: argparse.ArgumentParser) -> None:
+        """
+        Function to add any command line arguments for this to the subparser.
+        """
+        parser.add_argument(
+            "--output-format",
+            dest="output_format",
+            action="store",
+            default=StructuredOutputPresentation.text_output_format,
+            choices=StructuredOutputPresentation.output_formats,
+            help="format to output any scan results in",
+        )
+
+    @staticmethod
+    def create_if_enabled(
+        args: argparse.Namespace,
+        wrapped_presentation: MainPresentation,
+        application_version: str,
+    ) -> Optional["StructuredOutputPresentation"]:
+        """
+        Create a new structured presentation if a structured output format was
+        specified on the command line.
+        """
+        output_format = getattr(
+            args, "output_format", StructuredOutputPresentation.text_output_format
+        )
+        if output_format == StructuredOutputPresentation.text_output_format:
+            return None
+        return StructuredOutputPresentation(
+            wrapped_presentation, output_format, application_version
+        )
+
+    def print_system_output(self, output_string: str) -> None:
+        """
+        Root function to output to standard out.
+        """
+        self.__wrapped_presentation.print_system_output(output_string)
+
+    def print_system_error(self, error_string: str) -> None:
+        """
+        Root function to output to standard error.
+        """
+        self.__wrapped_presentation.print_system_error(error_string)
+
+    def format_scan_error(
+        self,
+        next_file: str,
+        this_exception: Exception,
+        show_extended_information: bool = False,
+        allow_shortcut: bool = False,
+    ) -> Optional[str]:
+        """
+        Format a scan error for display.  Returning a value of None means that
+        the function has handled any required output.
+        """
+        return self.__wrapped_presentation.format_scan_error(
+            next_file, this_exception, show_extended_information, allow_shortcut
+        )
+
+    def print_fix_message(self, file_fixed: str) -> None:
+        """
+        Print a message indicating that a given file has been fixed.
+        """
+        self.__wrapped_presentation.print_fix_message(file_fixed)
+
+    def print_pragma_failure(
+        self, scan_file: str, line_number: int, pragma_error: str
+    ) -> None:
+        """
+        Output a failure to compile the pragma.
+        """
+        if self.__is_sarif:
+            self.__write_sarif_result(
+                StructuredOutputPresentation.__pragma_rule_id,
+                "error",
+                pragma_error,
+                scan_file,
+                line_number,
+                1,
+            )
+        else:
+            self.__write_json_line(
+                {
+                    "type": "pragma-error",
+                    "file_path": scan_file,
+                    "line_number": line_number,
+                    "pragma_error": pragma_error,
+                }
+            )
+
+    def print_scan_failure(self, scan_failure: PluginScanFailure) -> None:
+        """
+        Output a scan failure for a specific file and location.
+        """
+
+        # By the time that the failure is presented, any extra information has
+        # been formatted for text output as ` [information]`.
+        extra_information = (
+            scan_failure.extra_error_information[2:-1]
+            if scan_failure.extra_error_information
+            else None
+        )
+        if not self.__is_sarif:
+            self.__write_json_line(
+                {
+                    "type": "scan-failure",
+                    "scan_file": scan_failure.scan_file,
+                    "line_number": scan_failure.line_number,
+                    "column_number": scan_failure.column_number,
+                    "rule_id": scan_failure.rule_id,
+                    "rule_name": scan_failure.rule_name,
+                    "rule_description": scan_failure.rule_description,
+                    "extra_error_information": extra_information,
+                }
+            )
+            return
+
+        if scan_failure.rule_id not in self.__triggered_rules:
+            self.__triggered_rules[scan_failure.rule_id] = (
+                scan_failure.rule_name,
+                scan_failure.rule_description,
+            )
+        message_text = scan_failure.rule_description
+        if extra_information:
+            message_text += f" [{extra_information}]"
+        self.__write_sarif_result(
+            scan_failure.rule_id,
+            "warning",
+            message_text,
+            scan_failure.scan_file,
+            scan_failure.line_number,
+            scan_failure.column_number,
+        )
+
+    def finish(self) -> None:
+        """
+        Complete the output once the scan has completed, closing the SARIF document
+        with the details of each rule that was triggered.
+        """
+        if not self.__is_sarif or self.__is_finished:
+            return
+        self.__is_finished = True
+        if self.__pending_result is not None:
+            self.__wrapped_presentation.print_system_output(self.__pending_result)
+            self.__pending_result = None
+
+        tool_driver = {
+            "name": "PyMarkdown",
+            "version": self.__application_version,
+            "informationUri": StructuredOutputPresentation.__information_uri,
+            "rules": [
+                {
+                    "id": rule_id,
+                    "name": rule_name,
+                    "shortDescription": {"text": rule_description},
+                }
+                for rule_id, (rule_name, rule_description) in sorted(
+                    self.__triggered_rules.items()
+                )
+            ],
+        }
+        self.__wrapped_presentation.print_system_output(
+            '], "tool": {"driver": ' + json.dumps(tool_driver) + "}}]}"
+        )
+
+    def __write_json_line(self, record_to_write: Dict[str, Any]) -> None:
+        self.__wrapped_presentation.print_system_output(json.dumps(record_to_write))
+
+    # pylint: disable=too-many-arguments
+    def __write_sarif_result(
+        self,
+        rule_id: str,
+        result_level: str,
+        message_text: str,
+        scan_file: str,
+        line_number: int,
+        column_number: int,
+    ) -> None:
+
+        # Each result is held until the next one is reported, so that the comma
+        # separating it from that next result can be written on the same line.
+        if self.__pending_result is not None:
+            self.__wrapped_presentation.print_system_output(self.__pending_result + ",")
+
+        result_region = {"startLine": line_number}
+        if column_number > 0:
+            result_region["startColumn"] = column_number
+        self.__pending_result = json.dumps(
+            {
+                "ruleId": rule_id,
+                "level": result_level,
+                "message": {"text": message_text},
+                "locations": [
+                    {
+                        "physicalLocation": {
+                            "artifactLocation": {
+                                "uri": StructuredOutputPresentation.__create_uri(
+                                    scan_file
+                                )
+                            },
+                            "region": result_region,
+                        }
+                    }
+                ],
+            }
+        )
+
+    # pylint: enable=too-many-arguments
+
+    @staticmethod
+    def __create_uri(scan_file: str) -> str:
+        if os.path.isabs(scan_file):
+            return pathlib.Path(scan_file).as_uri()
+        return urllib.parse.quote(scan_file.replace(os.sep, "/"))
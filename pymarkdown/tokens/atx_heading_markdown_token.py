@@ -30,6 +30,11 @@ class AtxHeadingMarkdownToken(LeafMarkdownToken):
     Class to provide for an encapsulation of the atx heading element.
     """
 
+    __slots__ = (
+        "__hash_count",
+        "__remove_trailing_count",
+    )
+
     def __init__(
         self,
         hash_count: int,
@@ -54,7 +59,6 @@ class AtxHeadingMarkdownToken(LeafMarkdownToken):
             requires_end_token=True,
             can_force_close=False,
         )
-        self.__compose_extra_data_field()
 
     # pylint: disable=protected-access
     @staticmethod
@@ -74,7 +78,6 @@ class AtxHeadingMarkdownToken(LeafMarkdownToken):
             and 1 <= field_value <= 6
         ):
             self.__hash_count = field_value
-            self.__compose_extra_data_field()
             return True
 
         # Handle extracted_whitespace
@@ -94,18 +97,17 @@ class AtxHeadingMarkdownToken(LeafMarkdownToken):
         """
         return self.__remove_trailing_count
 
-    def __compose_extra_data_field(self) -> None:
+    @override
+    def _compose_extra_data_field(self) -> str:
         """
         Compose the object's self.extra_data field from the local object's variables.
         """
-        self._set_extra_data(
-            MarkdownToken.extra_data_separator.join(
-                [
-                    str(self.__hash_count),
-                    str(self.__remove_trailing_count),
-                    self.extracted_whitespace,
-                ]
-            )
+        return MarkdownToken.extra_data_separator.join(
+            [
+                str(self.__hash_count),
+                str(self.__remove_trailing_count),
+                self.extracted_whitespace,
+            ]
         )
 
     def register_for_markdown_transform(
@@ -186,11 +188,10 @@ class AtxHeadingMarkdownToken(LeafMarkdownToken):
 
     @staticmethod
     def __handle_start_atx_heading_token(
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str:
+    ) -> None:
         atx_token = cast(AtxHeadingMarkdownToken, next_token)
         previous_token = transform_state.actual_tokens[
             transform_state.actual_token_index - 1
@@ -206,17 +207,12 @@ class AtxHeadingMarkdownToken(LeafMarkdownToken):
             output_parts.append(FormatOnlyNewLineHtmlItem())
         output_parts.append(HtmlOpenTagItem(f"h{atx_token.hash_count}"))
 
-        return AtxHeadingMarkdownToken.__handle_start_atx_heading_token_old(
-            output_html, transform_state, atx_token, previous_token
-        )
-
     @staticmethod
     def __handle_end_atx_heading_token(
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str:
+    ) -> None:
         _ = next_token
 
         fenced_token_index = transform_state.actual_token_index - 1
@@ -229,36 +225,3 @@ class AtxHeadingMarkdownToken(LeafMarkdownToken):
 
         output_parts.append(HtmlCloseTagItem(f"h{fenced_token.hash_count}"))
         output_parts.append(FormatOnlyNewLineHtmlItem())
-
-        return AtxHeadingMarkdownToken.__handle_end_atx_heading_token_old(
-            output_html, fenced_token
-        )
-
-    @staticmethod
-    def __handle_start_atx_heading_token_old(
-        output_html: str,
-        transform_state: TransformState,
-        atx_token: "AtxHeadingMarkdownToken",
-        previous_token: MarkdownToken,
-    ) -> str:
-        token_parts: List[str] = [output_html]
-        if (output_html.endswith("</ol>") or output_html.endswith("</ul>")) or (
-            previous_token.is_paragraph_end and not transform_state.is_in_loose_list
-        ):
-            token_parts.append(ParserHelper.newline_character)
-        token_parts.extend(["<h", str(atx_token.hash_count), ">"])
-        return "".join(token_parts)
-
-    @staticmethod
-    def __handle_end_atx_heading_token_old(
-        output_html: str, fenced_token: SetextHeadingMarkdownToken
-    ) -> str:
-        return "".join(
-            [
-                output_html,
-                "</h",
-                str(fenced_token.hash_count),
-                ">",
-                ParserHelper.newline_character,
-            ]
-        )
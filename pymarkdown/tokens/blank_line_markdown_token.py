@@ -22,6 +22,8 @@ class BlankLineMarkdownToken(LeafMarkdownToken):
     Class to provide for an encapsulation of the blank line element.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         extracted_whitespace: str,
@@ -106,25 +108,11 @@ class BlankLineMarkdownToken(LeafMarkdownToken):
 
     @staticmethod
     def __handle_blank_line_token(
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str:
+    ) -> None:
         _ = next_token
 
         if transform_state.is_in_html_block:
             output_parts.append(HtmlBlockNewLineHtmlItem())
-
-        return BlankLineMarkdownToken.__handle_blank_line_token_old(
-            output_html, transform_state
-        )
-
-    @staticmethod
-    def __handle_blank_line_token_old(
-        output_html: str,
-        transform_state: TransformState,
-    ) -> str:
-        if transform_state.is_in_html_block:
-            output_html = f"{output_html}{ParserHelper.newline_character}"
-        return output_html
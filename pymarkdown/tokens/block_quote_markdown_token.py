@@ -37,6 +37,20 @@ class BlockQuoteMarkdownToken(ContainerMarkdownToken):
     Class to provide for an encapsulation of the block quote element.
     """
 
+    __slots__ = (
+        "__extracted_whitespace",
+        "__leading_spaces",
+        "__tabbed_leading_spaces",
+        "leading_text_index",
+        "weird_kludge_five",
+        "weird_kludge_four",
+        "weird_kludge_one",
+        "weird_kludge_seven",
+        "weird_kludge_six",
+        "weird_kludge_three",
+        "weird_kludge_two",
+    )
+
     def __init__(
         self, extracted_whitespace: str, position_marker: PositionMarker
     ) -> None:
@@ -55,7 +69,6 @@ class BlockQuoteMarkdownToken(ContainerMarkdownToken):
             "",
             position_marker=position_marker,
         )
-        self.__compose_extra_data_field()
         self.weird_kludge_one: Optional[int] = None
         self.weird_kludge_two: Optional[int] = None
         self.weird_kludge_three: bool = False
@@ -129,12 +142,15 @@ class BlockQuoteMarkdownToken(ContainerMarkdownToken):
                 self.__tabbed_leading_spaces,
             )
             newline_count = ParserHelper.count_newlines_in_text(self.__leading_spaces)
-            self.__tabbed_leading_spaces[newline_count] = tabbed_leading_spaces
+            # Replaced instead of modified, so that the change is kept in any journal.
+            self.__tabbed_leading_spaces = {
+                **self.__tabbed_leading_spaces,
+                newline_count: tabbed_leading_spaces,
+            }
             POGGER.debug(
                 "__tabbed_leading_spaces>>:$:<<",
                 self.__tabbed_leading_spaces,
             )
-        self.__compose_extra_data_field()
 
     def remove_last_bleading_space(self) -> str:
         """
@@ -149,10 +165,10 @@ class BlockQuoteMarkdownToken(ContainerMarkdownToken):
             extracted_text = self.__leading_spaces[last_separator_index + 1 :]
             self.__leading_spaces = self.__leading_spaces[:last_separator_index]
         self.leading_text_index -= 1
-        self.__compose_extra_data_field()
         return extracted_text
 
-    def __compose_extra_data_field(self) -> None:
+    @override
+    def _compose_extra_data_field(self) -> str:
         """
         Compose the object's self.extra_data field from the local object's variables.
         """
@@ -163,7 +179,7 @@ class BlockQuoteMarkdownToken(ContainerMarkdownToken):
                     "'", '"'
                 )
             )
-        self._set_extra_data(MarkdownToken.extra_data_separator.join(item_list))
+        return MarkdownToken.extra_data_separator.join(item_list)
 
     def calculate_next_bleading_space_part(
         self, increment_index: bool = True, delta: int = 0, allow_overflow: bool = False
@@ -203,7 +219,6 @@ class BlockQuoteMarkdownToken(ContainerMarkdownToken):
     def _modify_token(self, field_name: str, field_value: Union[str, int]) -> bool:
         if field_name == "bleading_spaces" and isinstance(field_value, str):
             self.__leading_spaces = field_value
-            self.__compose_extra_data_field()
             return True
         return super()._modify_token(field_name, field_value)
 
@@ -222,11 +237,10 @@ class BlockQuoteMarkdownToken(ContainerMarkdownToken):
 
     @staticmethod
     def __handle_start_block_quote_token(
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str:
+    ) -> None:
         _ = next_token
 
         transform_state.is_in_loose_list = True
@@ -245,15 +259,12 @@ class BlockQuoteMarkdownToken(ContainerMarkdownToken):
         output_parts.append(HtmlOpenTagItem("blockquote"))
         output_parts.append(FormatOnlyNewLineHtmlItem())
 
-        return BlockQuoteMarkdownToken.__handle_start_block_quote_token_old(output_html)
-
     @staticmethod
     def __handle_end_block_quote_token(
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str:
+    ) -> None:
         _ = next_token
 
         transform_state.is_in_loose_list = (
@@ -273,25 +284,5 @@ class BlockQuoteMarkdownToken(ContainerMarkdownToken):
         output_parts.append(HtmlCloseTagItem("blockquote"))
         output_parts.append(FormatOnlyNewLineHtmlItem())
 
-        return BlockQuoteMarkdownToken.__handle_end_block_quote_token_old(output_html)
-
-    @staticmethod
-    def __handle_start_block_quote_token_old(output_html: str) -> str:
-        token_parts: List[str] = []
-        if output_html and output_html[-1] != ParserHelper.newline_character:
-            token_parts.append(ParserHelper.newline_character)
-        token_parts.extend(["<blockquote>", ParserHelper.newline_character])
-        token_parts.insert(0, output_html)
-        return "".join(token_parts)
-
-    @staticmethod
-    def __handle_end_block_quote_token_old(output_html: str) -> str:
-        token_parts: List[str] = []
-        if output_html[-1] != ParserHelper.newline_character:
-            token_parts.append(ParserHelper.newline_character)
-        token_parts.extend(["</blockquote>", ParserHelper.newline_character])
-        token_parts.insert(0, output_html)
-        return "".join(token_parts)
-
 
 # pylint: enable=too-many-instance-attributes
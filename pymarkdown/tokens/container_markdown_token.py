@@ -2,8 +2,9 @@
 Module to provide for a container element that can be added to markdown parsing stream.
 """
 
+import copy
 import logging
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from pymarkdown.general.parser_logger import ParserLogger
 from pymarkdown.general.position_marker import PositionMarker
@@ -16,8 +17,21 @@ POGGER = ParserLogger(logging.getLogger(__name__))
 class ContainerMarkdownToken(MarkdownToken):
     """
     Class to provide for a container element that can be added to markdown parsing stream.
+
+    As container tokens are modified as each line is parsed, a journal of those
+    changes may be kept, allowing a copy of the token as it was at an earlier point
+    to be created only if it is needed, instead of copying the token in case that
+    it is needed.  As the fields of the tokens are kept in slots, the names of the
+    fields for each class of token are collected from the slots of that class and
+    its base classes.
     """
 
+    __slots__ = ("__journal",)
+
+    __journal_attribute_name = "_ContainerMarkdownToken__journal"
+    __unset_value = object()
+    __field_names_by_class: Dict[type, List[str]] = {}
+
     def __init__(
         self,
         token_name: str,
@@ -40,5 +54,82 @@ class ContainerMarkdownToken(MarkdownToken):
             requires_end_token=True,
         )
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        journal = getattr(self, ContainerMarkdownToken.__journal_attribute_name, None)
+        if journal is not None:
+            journal.append(
+                (name, getattr(self, name, ContainerMarkdownToken.__unset_value))
+            )
+        super().__setattr__(name, value)
+
+    def __setstate__(self, state: Any) -> None:
+        """
+        Set the fields of a copy of this token, without recording them in a journal
+        and without sharing the journal of the token that was copied.
+        """
+        dictionary_state, slot_state = (
+            state if isinstance(state, tuple) else (state, None)
+        )
+        for next_state in (dictionary_state, slot_state):
+            for field_name, field_value in (next_state or {}).items():
+                object.__setattr__(self, field_name, field_value)
+        object.__setattr__(self, ContainerMarkdownToken.__journal_attribute_name, None)
+
+    @staticmethod
+    def __get_field_names(token_class: type) -> List[str]:
+        if token_class not in ContainerMarkdownToken.__field_names_by_class:
+            field_names: List[str] = []
+            for next_class in token_class.__mro__:
+                for slot_name in next_class.__dict__.get("__slots__", ()):
+                    if slot_name.startswith("__") and not slot_name.endswith("__"):
+                        slot_name = f"_{next_class.__name__.lstrip('_')}{slot_name}"
+                    field_names.append(slot_name)
+            ContainerMarkdownToken.__field_names_by_class[token_class] = field_names
+        return ContainerMarkdownToken.__field_names_by_class[token_class]
+
+    def start_journal(self) -> int:
+        """
+        Start keeping a journal of the changes to this token, if one is not being kept
+        already, returning the position in that journal that marks the current state
+        of the token.
+        """
+        journal = getattr(self, ContainerMarkdownToken.__journal_attribute_name, None)
+        if journal is None:
+            super().__setattr__(ContainerMarkdownToken.__journal_attribute_name, [])
+            return 0
+        return len(journal)
+
+    def stop_journal(self) -> None:
+        """
+        Stop keeping a journal of the changes to this token, discarding any changes
+        that were recorded.
+        """
+        super().__setattr__(ContainerMarkdownToken.__journal_attribute_name, None)
+
+    def create_snapshot(
+        self, journal_position: Optional[int] = None
+    ) -> "ContainerMarkdownToken":
+        """
+        Create a copy of this token as it was at the specified position in its
+        journal, or as it is now if no position is specified.
+        """
+        snapshot = copy.copy(self)
+        if journal_position is not None:
+            journal_entries: List[Tuple[str, Any]] = (
+                getattr(self, ContainerMarkdownToken.__journal_attribute_name, None)
+                or []
+            )
+            for field_name, field_value in reversed(journal_entries[journal_position:]):
+                if field_value is ContainerMarkdownToken.__unset_value:
+                    object.__delattr__(snapshot, field_name)
+                else:
+                    object.__setattr__(snapshot, field_name, field_value)
+        field_names = ContainerMarkdownToken.__get_field_names(type(snapshot))
+        for field_name in field_names + list(getattr(snapshot, "__dict__", {})):
+            field_value = getattr(snapshot, field_name, None)
+            if isinstance(field_value, (dict, list)):
+                object.__setattr__(snapshot, field_name, copy.copy(field_value))
+        return snapshot
+
 
 # pylint: enable=too-many-arguments
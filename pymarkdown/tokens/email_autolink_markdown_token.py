@@ -25,6 +25,11 @@ class EmailAutolinkMarkdownToken(InlineMarkdownToken):
     Class to provide for an encapsulation of the inline email autolink element.
     """
 
+    __slots__ = (
+        "__add_angle_brackets",
+        "__autolink_text",
+    )
+
     def __init__(
         self,
         autolink_text: str,
@@ -120,11 +125,10 @@ class EmailAutolinkMarkdownToken(InlineMarkdownToken):
     @classmethod
     def __handle_email_autolink_token(
         cls,
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str:
+    ) -> None:
         _ = transform_state
 
         email_token = cast(EmailAutolinkMarkdownToken, next_token)
@@ -134,20 +138,3 @@ class EmailAutolinkMarkdownToken(InlineMarkdownToken):
         )
         output_parts.append(EmailAutolinkTextItem(email_token.autolink_text))
         output_parts.append(HtmlCloseTagItem("a"))
-
-        return cls.__handle_email_autolink_token_old(output_html, email_token)
-
-    @classmethod
-    def __handle_email_autolink_token_old(
-        cls, output_html: str, email_token: "EmailAutolinkMarkdownToken"
-    ) -> str:
-        return "".join(
-            [
-                output_html,
-                '<a href="mailto:',
-                email_token.autolink_text,
-                '">',
-                email_token.autolink_text,
-                "</a>",
-            ]
-        )
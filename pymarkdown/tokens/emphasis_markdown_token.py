@@ -21,6 +21,11 @@ class EmphasisMarkdownToken(InlineMarkdownToken):
     Class to provide for an encapsulation of the inline emphasis element.
     """
 
+    __slots__ = (
+        "__emphasis_character",
+        "__emphasis_length",
+    )
+
     def __init__(
         self,
         emphasis_length: int,
@@ -144,11 +149,10 @@ class EmphasisMarkdownToken(InlineMarkdownToken):
 
     @staticmethod
     def __handle_start_emphasis_token(
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str:
+    ) -> None:
         _ = transform_state
 
         emphasis_token = cast(EmphasisMarkdownToken, next_token)
@@ -162,17 +166,12 @@ class EmphasisMarkdownToken(InlineMarkdownToken):
                 )
             )
 
-        return EmphasisMarkdownToken.__handle_start_emphasis_token_old(
-            output_html, emphasis_token
-        )
-
     @staticmethod
     def __handle_end_emphasis_token(
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str:
+    ) -> None:
         _ = transform_state
 
         end_token = cast(EndMarkdownToken, next_token)
@@ -186,34 +185,3 @@ class EmphasisMarkdownToken(InlineMarkdownToken):
                     "em" if emphasis_token.emphasis_length == 1 else "strong"
                 )
             )
-
-        return EmphasisMarkdownToken.__handle_end_emphasis_token_old(
-            output_html, emphasis_token
-        )
-
-    @staticmethod
-    def __handle_start_emphasis_token_old(
-        output_html: str, emphasis_token: "EmphasisMarkdownToken"
-    ) -> str:
-        if emphasis_token.emphasis_character == "~":
-            return f"{output_html}<del>"
-
-        return "".join(
-            [
-                output_html,
-                "<em>" if emphasis_token.emphasis_length == 1 else "<strong>",
-            ]
-        )
-
-    @staticmethod
-    def __handle_end_emphasis_token_old(
-        output_html: str, emphasis_token: "EmphasisMarkdownToken"
-    ) -> str:
-        if emphasis_token.emphasis_character == "~":
-            return f"{output_html}</del>"
-        return "".join(
-            [
-                output_html,
-                "</em>" if emphasis_token.emphasis_length == 1 else "</strong>",
-            ]
-        )
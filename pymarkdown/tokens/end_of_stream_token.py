@@ -19,6 +19,8 @@ class SpecialMarkdownToken(MarkdownToken):
     Class to provide for an encapsulation of special stream elements.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         token_name: str,
@@ -44,6 +46,8 @@ class EndOfStreamToken(SpecialMarkdownToken):
     Class to provide for an encapsulation of the end of stream element.
     """
 
+    __slots__ = ()
+
     def __init__(self, line_number: int) -> None:
         """
         Initialize an instance of the EndOfStreamToken class.
@@ -103,10 +107,8 @@ class EndOfStreamToken(SpecialMarkdownToken):
 
     @staticmethod
     def __handle_end_of_stream_token(
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str:
+    ) -> None:
         _ = (transform_state, next_token, output_parts)
-        return output_html
@@ -34,6 +34,16 @@ class FencedCodeBlockMarkdownToken(LeafMarkdownToken):
     Class to provide for an encapsulation of the fenced code block element.
     """
 
+    __slots__ = (
+        "__extracted_text",
+        "__extracted_whitespace_before_info_string",
+        "__fence_character",
+        "__fence_count",
+        "__pre_extracted_text",
+        "__pre_text_after_extracted_text",
+        "__text_after_extracted_text",
+    )
+
     # pylint: disable=too-many-arguments
     def __init__(
         self,
@@ -75,7 +85,6 @@ class FencedCodeBlockMarkdownToken(LeafMarkdownToken):
             extracted_whitespace=extracted_whitespace,
             requires_end_token=True,
         )
-        self.__compose_extra_data_field()
 
     # pylint: enable=too-many-arguments
     # pylint: disable=protected-access
@@ -137,23 +146,22 @@ class FencedCodeBlockMarkdownToken(LeafMarkdownToken):
         """
         return self.__extracted_whitespace_before_info_string
 
-    def __compose_extra_data_field(self) -> None:
+    @override
+    def _compose_extra_data_field(self) -> str:
         """
         Compose the object's self.extra_data field from the local object's variables.
         """
-        self._set_extra_data(
-            MarkdownToken.extra_data_separator.join(
-                [
-                    self.__fence_character,
-                    str(self.__fence_count),
-                    self.__extracted_text,
-                    self.__pre_extracted_text,
-                    self.__text_after_extracted_text,
-                    self.__pre_text_after_extracted_text,
-                    self.extracted_whitespace,
-                    self.__extracted_whitespace_before_info_string,
-                ]
-            )
+        return MarkdownToken.extra_data_separator.join(
+            [
+                self.__fence_character,
+                str(self.__fence_count),
+                self.__extracted_text,
+                self.__pre_extracted_text,
+                self.__text_after_extracted_text,
+                self.__pre_text_after_extracted_text,
+                self.extracted_whitespace,
+                self.__extracted_whitespace_before_info_string,
+            ]
         )
 
     def register_for_markdown_transform(
@@ -264,7 +272,6 @@ class FencedCodeBlockMarkdownToken(LeafMarkdownToken):
             and field_value in ["~", "`"]
         ):
             self.__fence_character = field_value
-            self.__compose_extra_data_field()
             return True
         return super()._modify_token(field_name, field_value)
 
@@ -284,11 +291,10 @@ class FencedCodeBlockMarkdownToken(LeafMarkdownToken):
     @classmethod
     def __handle_start_fenced_code_block_token(
         cls,
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str:
+    ) -> None:
         transform_state.is_in_code_block = True
         transform_state.is_in_fenced_code_block = True
 
@@ -311,18 +317,13 @@ class FencedCodeBlockMarkdownToken(LeafMarkdownToken):
         output_parts.append(HtmlOpenTagItem("pre"))
         output_parts.append(HtmlOpenTagItem("code", attributes_map))
 
-        return cls.__handle_start_fenced_code_block_token_old(
-            output_html, transform_state, start_fence_token
-        )
-
     @classmethod
     def __handle_end_fenced_code_block_token(
         cls,
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str:
+    ) -> None:
         transform_state.is_in_code_block = False
         transform_state.is_in_fenced_code_block = False
 
@@ -355,84 +356,3 @@ class FencedCodeBlockMarkdownToken(LeafMarkdownToken):
         output_parts.append(HtmlCloseTagItem("code"))
         output_parts.append(HtmlCloseTagItem("pre"))
         output_parts.append(FormatOnlyNewLineHtmlItem())
-
-        return cls.__handle_end_fenced_code_block_token_old(
-            output_html, transform_state, next_token
-        )
-
-    @classmethod
-    def __handle_start_fenced_code_block_token_old(
-        cls,
-        output_html: str,
-        transform_state: TransformState,
-        start_fence_token: "FencedCodeBlockMarkdownToken",
-    ) -> str:
-        token_parts: List[str] = []
-        if (output_html.endswith("</ol>") or output_html.endswith("</ul>")) or (
-            output_html and output_html[-1] != ParserHelper.newline_character
-        ):
-            token_parts.append(ParserHelper.newline_character)
-        transform_state.is_in_code_block, transform_state.is_in_fenced_code_block = (
-            True,
-            True,
-        )
-        token_parts.append("<pre><code")
-        if start_fence_token.extracted_text:
-            token_parts.extend(
-                [' class="language-', start_fence_token.extracted_text, '"']
-            )
-        token_parts.append(">")
-
-        token_parts.insert(0, output_html)
-        return "".join(token_parts)
-
-    @classmethod
-    def __handle_end_fenced_code_block_token_old(
-        cls,
-        output_html: str,
-        transform_state: TransformState,
-        next_token: MarkdownToken,
-    ) -> str:
-        fenced_token_index = transform_state.actual_token_index - 1
-        while not transform_state.actual_tokens[
-            fenced_token_index
-        ].is_fenced_code_block:
-            fenced_token_index -= 1
-        fenced_token = cast(
-            FencedCodeBlockMarkdownToken,
-            transform_state.actual_tokens[fenced_token_index],
-        )
-
-        inner_tag_parts = ["<code"]
-        if fenced_token.extracted_text:
-            inner_tag_parts.extend(
-                [
-                    ' class="language-',
-                    fenced_token.extracted_text,
-                    '"',
-                ]
-            )
-        inner_tag_parts.append(">")
-        inner_tag = "".join(inner_tag_parts)
-        POGGER.debug(f"inner_tag>>:{inner_tag}:<<")
-
-        token_parts: List[str] = []
-        if (
-            not output_html.endswith(inner_tag)
-            and output_html[-1] != ParserHelper.newline_character
-        ):
-            token_parts.append(ParserHelper.newline_character)
-            POGGER.debug("#1")
-        elif (
-            output_html[-1] == ParserHelper.newline_character
-            and transform_state.last_token
-            and transform_state.last_token.is_text
-        ):
-            POGGER.debug("#2:$", transform_state.last_token)
-            text_token = cast(TextMarkdownToken, transform_state.last_token)
-            end_token = cast(EndMarkdownToken, next_token)
-            if not (end_token.was_forced and text_token.token_text.endswith("\n\x03")):
-                token_parts.append(ParserHelper.newline_character)
-        token_parts.extend(["</code></pre>", ParserHelper.newline_character])
-        token_parts.insert(0, output_html)
-        return "".join(token_parts)
@@ -26,6 +26,8 @@ class HardBreakMarkdownToken(InlineMarkdownToken):
     Class to provide for an encapsulation of the inline hard line break element.
     """
 
+    __slots__ = ("__line_end",)
+
     def __init__(self, line_end: str, line_number: int, column_number: int) -> None:
         """
         Initialize an instance of the HardBreakMarkdownToken class.
@@ -116,18 +118,11 @@ class HardBreakMarkdownToken(InlineMarkdownToken):
 
     @staticmethod
     def __handle_hard_break_token(
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str:
+    ) -> None:
         _ = (next_token, transform_state)
 
         output_parts.append(HtmlOpenCloseTagItem("br"))
         output_parts.append(FormatOnlyNewLineHtmlItem())
-
-        return HardBreakMarkdownToken.__handle_hard_break_token_old(output_html)
-
-    @staticmethod
-    def __handle_hard_break_token_old(output_html: str) -> str:
-        return "".join([output_html, "<br />", ParserHelper.newline_character])
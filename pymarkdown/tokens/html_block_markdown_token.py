@@ -5,7 +5,6 @@ Module to provide for an encapsulation of the html block element.
 import logging
 from typing import List, Optional
 
-from pymarkdown.general.parser_helper import ParserHelper
 from pymarkdown.general.parser_logger import ParserLogger
 from pymarkdown.general.position_marker import PositionMarker
 from pymarkdown.tokens.html_items import FormatOnlyNewLineHtmlItem, HtmlItems
@@ -26,6 +25,8 @@ class HtmlBlockMarkdownToken(LeafMarkdownToken):
     Class to provide for an encapsulation of the html block element.
     """
 
+    __slots__ = ()
+
     def __init__(
         self, position_marker: PositionMarker, extracted_whitespace: str
     ) -> None:
@@ -117,20 +118,18 @@ class HtmlBlockMarkdownToken(LeafMarkdownToken):
 
     @staticmethod
     def __handle_start_html_block_token(
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str:
+    ) -> None:
         _ = next_token
 
         transform_state.is_in_html_block = True
 
         if (
             not output_parts
-            and transform_state.transform_stack_two
-            and transform_state.transform_stack_two[-1][-1].get_raw_html_text()
-            == "<li>"
+            and transform_state.transform_stack
+            and transform_state.transform_stack[-1][-1].get_raw_html_text() == "<li>"
         ):
             output_parts.append(FormatOnlyNewLineHtmlItem())
         else:
@@ -145,45 +144,12 @@ class HtmlBlockMarkdownToken(LeafMarkdownToken):
             ):
                 output_parts.append(FormatOnlyNewLineHtmlItem())
 
-        return HtmlBlockMarkdownToken.__handle_start_html_block_token_old(
-            output_html, transform_state
-        )
-
     @staticmethod
     def __handle_end_html_block_token(
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str:
+    ) -> None:
         _ = (next_token, output_parts)
 
         transform_state.is_in_html_block = False
-
-        return output_html
-
-    @staticmethod
-    def __handle_start_html_block_token_old(
-        output_html: str, transform_state: TransformState
-    ) -> str:
-        token_parts: List[str] = []
-        if (
-            not output_html
-            and transform_state.transform_stack
-            and transform_state.transform_stack[-1].endswith("<li>")
-        ):
-            token_parts.append(ParserHelper.newline_character)
-        else:
-            previous_token = transform_state.actual_tokens[
-                transform_state.actual_token_index - 1
-            ]
-            POGGER.debug(">previous_token>$>", previous_token)
-            token_parts.append(output_html)
-            if (
-                not previous_token.is_list_end
-                and previous_token.is_paragraph_end
-                and not transform_state.is_in_loose_list
-                or previous_token.is_list_end
-            ):
-                token_parts.append(ParserHelper.newline_character)
-        return "".join(token_parts)
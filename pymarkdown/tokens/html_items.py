@@ -3,7 +3,7 @@ Module to encapsulate the transitions from Markdown to HTML.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from typing_extensions import override
 
@@ -255,3 +255,28 @@ class NormalTextItem(HtmlItems):
 
 
 # pylint: enable=too-few-public-methods
+
+
+# pylint: disable=too-few-public-methods
+class ListItemContentsHtmlItem(HtmlItems):
+    """
+    Class to encapsulate the contents of a list item, kept in their own list of
+    items until the list item ends, and then placed within the items for the list.
+    """
+
+    def __init__(self, contained_items: List[HtmlItems]):
+        self.__contained_items = contained_items
+
+    @property
+    def contained_items(self) -> List[HtmlItems]:
+        """
+        Items that make up the contents of the list item.
+        """
+        return self.__contained_items
+
+    @override
+    def get_raw_html_text(self) -> str:
+        return "".join(i.get_raw_html_text() for i in self.__contained_items)
+
+
+# pylint: enable=too-few-public-methods
@@ -5,7 +5,6 @@ Module to provide for an encapsulation of the image element.
 import logging
 from typing import Dict, List, Optional, cast
 
-from pymarkdown.general.parser_helper import ParserHelper
 from pymarkdown.general.parser_logger import ParserLogger
 from pymarkdown.links.link_helper_properties import LinkHelperProperties
 from pymarkdown.tokens.html_items import HtmlItems, HtmlOpenCloseTagItem
@@ -27,6 +26,8 @@ class ImageStartMarkdownToken(ReferenceMarkdownToken):
     Class to provide for an encapsulation of the image element.
     """
 
+    __slots__ = ("__image_alt_text",)
+
     # pylint: disable=too-many-arguments
     def __init__(
         self,
@@ -95,17 +96,13 @@ class ImageStartMarkdownToken(ReferenceMarkdownToken):
         if context.block_stack[-1].is_inline_link:
             return ""
         inline_current_token = cast(ImageStartMarkdownToken, current_token)
-        POGGER.debug(
-            f">>>>>>>>:{ParserHelper.make_value_visible(inline_current_token)}:<<<<<"
-        )
+        POGGER.debug(">>>>>>>>:$:<<<<<", inline_current_token)
         rehydrated_text = (
             ImageStartMarkdownToken.rehydrate_inline_image_text_from_token(
                 inline_current_token
             )
         )
-        POGGER.debug(
-            f">>>>>>>>:{ParserHelper.make_value_visible(rehydrated_text)}:<<<<<"
-        )
+        POGGER.debug(">>>>>>>>:$:<<<<<", rehydrated_text)
         return LinkStartMarkdownToken.insert_leading_whitespace_at_newlines(
             context, rehydrated_text
         )
@@ -133,11 +130,10 @@ class ImageStartMarkdownToken(ReferenceMarkdownToken):
     @classmethod
     def __handle_image_token(
         cls,
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str:
+    ) -> None:
         _ = transform_state
 
         image_token = cast(ImageStartMarkdownToken, next_token)
@@ -150,21 +146,3 @@ class ImageStartMarkdownToken(ReferenceMarkdownToken):
             attributes_map["title"] = image_token.link_title
 
         output_parts.append(HtmlOpenCloseTagItem("img", attributes_map))
-
-        return cls.__handle_image_token_old(output_html, image_token)
-
-    @classmethod
-    def __handle_image_token_old(
-        cls, output_html: str, image_token: "ImageStartMarkdownToken"
-    ) -> str:
-        token_parts = [
-            '<img src="',
-            image_token.link_uri,
-            '" alt="',
-            image_token.image_alt_text,
-            '" ',
-            (f'title="{image_token.link_title}" ' if image_token.link_title else ""),
-            "/>",
-        ]
-        token_parts.insert(0, output_html)
-        return "".join(token_parts)
@@ -4,6 +4,8 @@ Module to provide for an encapsulation of the indented code block element.
 
 from typing import List, Optional
 
+from typing_extensions import override
+
 from pymarkdown.general.parser_helper import ParserHelper
 from pymarkdown.tokens.html_items import (
     FormatOnlyNewLineHtmlItem,
@@ -27,6 +29,8 @@ class IndentedCodeBlockMarkdownToken(LeafMarkdownToken):
     Class to provide for an encapsulation of the indented code block element.
     """
 
+    __slots__ = ("__indented_whitespace",)
+
     def __init__(
         self, extracted_whitespace: str, line_number: int, column_number: int
     ) -> None:
@@ -43,7 +47,6 @@ class IndentedCodeBlockMarkdownToken(LeafMarkdownToken):
             extracted_whitespace=extracted_whitespace,
             requires_end_token=True,
         )
-        self.__compose_extra_data_field()
 
     # pylint: disable=protected-access
     @staticmethod
@@ -62,14 +65,13 @@ class IndentedCodeBlockMarkdownToken(LeafMarkdownToken):
         """
         return self.__indented_whitespace
 
-    def __compose_extra_data_field(self) -> None:
+    @override
+    def _compose_extra_data_field(self) -> str:
         """
         Compose the object's self.extra_data field from the local object's variables.
         """
-        self._set_extra_data(
-            MarkdownToken.extra_data_separator.join(
-                [self.extracted_whitespace, self.indented_whitespace]
-            )
+        return MarkdownToken.extra_data_separator.join(
+            [self.extracted_whitespace, self.indented_whitespace]
         )
 
     def add_indented_whitespace(self, indented_whitespace: str) -> None:
@@ -80,7 +82,6 @@ class IndentedCodeBlockMarkdownToken(LeafMarkdownToken):
             f"{self.__indented_whitespace}{ParserHelper.newline_character}"
             + f"{indented_whitespace}"
         )
-        self.__compose_extra_data_field()
 
     def register_for_markdown_transform(
         self, registration_function: RegisterMarkdownTransformHandlersProtocol
@@ -138,11 +139,10 @@ class IndentedCodeBlockMarkdownToken(LeafMarkdownToken):
 
     @staticmethod
     def __handle_start_indented_code_block_token(
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str:
+    ) -> None:
         _ = next_token
 
         transform_state.is_in_code_block = True
@@ -151,7 +151,7 @@ class IndentedCodeBlockMarkdownToken(LeafMarkdownToken):
         if (
             not output_parts
             and transform_state.transform_stack
-            and transform_state.transform_stack[-1].endswith("<li>")
+            and transform_state.transform_stack[-1][-1].get_raw_html_text() == "<li>"
         ):
             output_parts.append(FormatOnlyNewLineHtmlItem())
         elif (
@@ -168,19 +168,12 @@ class IndentedCodeBlockMarkdownToken(LeafMarkdownToken):
         output_parts.append(HtmlOpenTagItem("pre"))
         output_parts.append(HtmlOpenTagItem("code"))
 
-        return (
-            IndentedCodeBlockMarkdownToken.__handle_start_indented_code_block_token_old(
-                output_html, transform_state
-            )
-        )
-
     @staticmethod
     def __handle_end_indented_code_block_token(
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str:
+    ) -> None:
         _ = next_token
 
         transform_state.is_in_code_block = False
@@ -189,45 +182,3 @@ class IndentedCodeBlockMarkdownToken(LeafMarkdownToken):
         output_parts.append(HtmlCloseTagItem("code"))
         output_parts.append(HtmlCloseTagItem("pre"))
         output_parts.append(FormatOnlyNewLineHtmlItem())
-
-        return (
-            IndentedCodeBlockMarkdownToken.__handle_end_indented_code_block_token_old(
-                output_html
-            )
-        )
-
-    @staticmethod
-    def __handle_start_indented_code_block_token_old(
-        output_html: str, transform_state: TransformState
-    ) -> str:
-        token_parts: List[str] = []
-        do_add = True
-        if (
-            not output_html
-            and transform_state.transform_stack
-            and transform_state.transform_stack[-1].endswith("<li>")
-        ):
-            token_parts.append(ParserHelper.newline_character)
-            do_add = False
-        elif output_html and output_html[-1] != ParserHelper.newline_character:
-            token_parts.extend([ParserHelper.newline_character])
-        transform_state.is_in_code_block, transform_state.is_in_fenced_code_block = (
-            True,
-            False,
-        )
-        token_parts.append("<pre><code>")
-
-        if do_add:
-            token_parts.insert(0, output_html)
-        return "".join(token_parts)
-
-    @staticmethod
-    def __handle_end_indented_code_block_token_old(output_html: str) -> str:
-
-        token_parts = [
-            output_html,
-            ParserHelper.newline_character,
-            "</code></pre>",
-            ParserHelper.newline_character,
-        ]
-        return "".join(token_parts)
@@ -29,6 +29,14 @@ class InlineCodeSpanMarkdownToken(InlineMarkdownToken):
     Class to provide for an encapsulation of the inline code span element.
     """
 
+    __slots__ = (
+        "__extracted_start_backticks",
+        "__leading_whitespace",
+        "__span_text",
+        "__trailing_whitespace",
+        "is_in_table",
+    )
+
     # pylint: disable=too-many-arguments
     def __init__(
         self,
@@ -59,12 +67,13 @@ class InlineCodeSpanMarkdownToken(InlineMarkdownToken):
         InlineMarkdownToken.__init__(
             self,
             MarkdownToken._token_inline_code_span,
-            self.__compose_extra_data_field(),
+            None,
             line_number=line_number,
             column_number=column_number,
         )
 
-    def __compose_extra_data_field(self) -> str:
+    @override
+    def _compose_extra_data_field(self) -> str:
         """
         Compose the object's self.extra_data field from the local object's variables.
         """
@@ -81,7 +90,6 @@ class InlineCodeSpanMarkdownToken(InlineMarkdownToken):
     def _modify_token(self, field_name: str, field_value: Union[str, int]) -> bool:
         if field_name == "span_text" and isinstance(field_value, str):
             self.__span_text = field_value
-            self._set_extra_data(self.__compose_extra_data_field())
             return True
         return False
 
@@ -215,11 +223,10 @@ class InlineCodeSpanMarkdownToken(InlineMarkdownToken):
 
     @staticmethod
     def __handle_inline_code_span_token(
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str:
+    ) -> None:
         _ = transform_state
 
         code_span_token = cast(InlineCodeSpanMarkdownToken, next_token)
@@ -247,17 +254,3 @@ class InlineCodeSpanMarkdownToken(InlineMarkdownToken):
         output_parts.append(HtmlOpenTagItem("code"))
         output_parts.append(CodeSpanItem(ParserHelper.resolve_all_from_text(span_text)))
         output_parts.append(HtmlCloseTagItem("code"))
-
-        return InlineCodeSpanMarkdownToken.__handle_inline_code_span_token_old(
-            output_html, span_text
-        )
-
-    @staticmethod
-    def __handle_inline_code_span_token_old(output_html: str, span_text: str) -> str:
-        token_parts = [
-            "<code>",
-            ParserHelper.resolve_all_from_text(span_text),
-            "</code>",
-        ]
-        token_parts.insert(0, output_html)
-        return "".join(token_parts)
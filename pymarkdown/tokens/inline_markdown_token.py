@@ -18,6 +18,8 @@ class InlineMarkdownToken(MarkdownToken):
     Class to provide for a leaf element that can be added to markdown parsing stream.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         token_name: str,
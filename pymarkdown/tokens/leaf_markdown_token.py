@@ -15,6 +15,8 @@ class LeafMarkdownToken(MarkdownToken):
     Class to provide for a leaf element that can be added to markdown parsing stream.
     """
 
+    __slots__ = ("__extracted_whitespace",)
+
     # pylint: disable=too-many-arguments
     def __init__(
         self,
@@ -54,6 +56,12 @@ class LeafMarkdownToken(MarkdownToken):
         """
         return self.__extracted_whitespace
 
+    def _set_extracted_whitespace(self, extracted_whitespace: str) -> None:
+        """
+        Set the whitespace that was extracted before the processing of this element.
+        """
+        self.__extracted_whitespace = extracted_whitespace
+
     @override
     def _modify_token(self, field_name: str, field_value: Union[str, int]) -> bool:
         if field_name == "extracted_whitespace" and isinstance(field_value, str):
@@ -27,6 +27,19 @@ class LinkReferenceDefinitionMarkdownToken(LeafMarkdownToken):
     Class to provide for an encapsulation of the link reference definition element.
     """
 
+    __slots__ = (
+        "__did_add_definition",
+        "__end_whitespace",
+        "__link_destination",
+        "__link_destination_raw",
+        "__link_destination_whitespace",
+        "__link_name",
+        "__link_name_debug",
+        "__link_title",
+        "__link_title_raw",
+        "__link_title_whitespace",
+    )
+
     # pylint: disable=too-many-arguments
     def __init__(
         self,
@@ -323,14 +336,11 @@ class LinkReferenceDefinitionMarkdownToken(LeafMarkdownToken):
 
     @staticmethod
     def __handle_link_reference_definition_token(
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str:
+    ) -> None:
         _ = (transform_state, next_token, output_parts)
 
-        return output_html
-
 
 # pylint: enable=too-many-instance-attributes
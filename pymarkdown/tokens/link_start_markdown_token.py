@@ -28,6 +28,8 @@ class LinkStartMarkdownToken(ReferenceMarkdownToken):
     Class to provide for an encapsulation of the link element.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         text_from_blocks: str,
@@ -206,13 +208,9 @@ class LinkStartMarkdownToken(ReferenceMarkdownToken):
                 None,
             )
 
-            POGGER.debug(
-                f"text>before>{ParserHelper.make_value_visible(text_to_modify)}"
-            )
+            POGGER.debug("text>before>$", text_to_modify)
             text_to_modify = ParserHelper.remove_all_from_text(text_to_modify)
-            POGGER.debug(
-                f"text>after>{ParserHelper.make_value_visible(text_to_modify)}"
-            )
+            POGGER.debug("text>after>$", text_to_modify)
 
             if owning_paragraph_token:
                 paragraph_token = cast(ParagraphMarkdownToken, owning_paragraph_token)
@@ -242,11 +240,10 @@ class LinkStartMarkdownToken(ReferenceMarkdownToken):
 
     @staticmethod
     def __handle_start_link_token(
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str:
+    ) -> None:
         _ = transform_state
 
         link_token = cast(LinkStartMarkdownToken, next_token)
@@ -257,36 +254,12 @@ class LinkStartMarkdownToken(ReferenceMarkdownToken):
 
         output_parts.append(HtmlOpenTagItem("a", attributes_map))
 
-        return LinkStartMarkdownToken.__handle_start_link_token_old(
-            output_html, link_token
-        )
-
     @staticmethod
     def __handle_end_link_token(
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str:
+    ) -> None:
         _ = (next_token, transform_state)
 
         output_parts.append(HtmlCloseTagItem("a"))
-
-        return LinkStartMarkdownToken.__handle_end_link_token_old(output_html)
-
-    @staticmethod
-    def __handle_start_link_token_old(
-        output_html: str, link_token: "LinkStartMarkdownToken"
-    ) -> str:
-        token_parts = [
-            '<a href="',
-            link_token.link_uri,
-            f'" title="{link_token.link_title}' if link_token.link_title else "",
-            '">',
-        ]
-        token_parts.insert(0, output_html)
-        return "".join(token_parts)
-
-    @staticmethod
-    def __handle_end_link_token_old(output_html: str) -> str:
-        return f"{output_html}</a>"
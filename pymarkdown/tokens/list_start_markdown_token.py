@@ -23,6 +23,19 @@ class ListStartMarkdownToken(ContainerMarkdownToken):
     Class to provide for an encapsulation of a generic list start element.
     """
 
+    __slots__ = (
+        "__extracted_whitespace",
+        "__indent_level",
+        "__last_new_list_token",
+        "__leading_spaces",
+        "__list_start_content",
+        "__list_start_sequence",
+        "__tabbed_adjust",
+        "__tabbed_whitespace_to_add",
+        "is_loose",
+        "leading_spaces_index",
+    )
+
     # pylint: disable=too-many-arguments
     def __init__(
         self,
@@ -65,7 +78,6 @@ class ListStartMarkdownToken(ContainerMarkdownToken):
         )
         self.__last_new_list_token: Optional[NewListItemMarkdownToken] = None
         self.__leading_spaces: Optional[str] = None
-        self.__compose_extra_data_field()
 
     # pylint: enable=too-many-arguments
 
@@ -141,7 +153,8 @@ class ListStartMarkdownToken(ContainerMarkdownToken):
                 new_list_item_token.extracted_whitespace,
             )
 
-    def __compose_extra_data_field(self) -> None:
+    @override
+    def _compose_extra_data_field(self) -> str:
         """
         Compose the object's self.extra_data field from the local object's variables.
         """
@@ -168,7 +181,7 @@ class ListStartMarkdownToken(ContainerMarkdownToken):
             item_list.append(self.__tabbed_whitespace_to_add or "")
         if is_tabbed_adjust_valid:
             item_list.append(str(self.__tabbed_adjust))
-        self._set_extra_data(MarkdownToken.extra_data_separator.join(item_list))
+        return MarkdownToken.extra_data_separator.join(item_list)
 
     def remove_last_leading_space(self) -> Optional[str]:
         """
@@ -185,7 +198,6 @@ class ListStartMarkdownToken(ContainerMarkdownToken):
         else:
             extracted_text = self.__leading_spaces[last_separator_index + 1 :]
             self.__leading_spaces = self.__leading_spaces[:last_separator_index]
-        self.__compose_extra_data_field()
         POGGER.debug("__leading_spaces>>:$:<<", self.__leading_spaces)
         return extracted_text
 
@@ -201,7 +213,6 @@ class ListStartMarkdownToken(ContainerMarkdownToken):
             else f"{self.__leading_spaces}{ParserHelper.newline_character}{ws_add}"
         )
         POGGER.debug("__leading_spaces>>:$:<<", self.__leading_spaces)
-        self.__compose_extra_data_field()
 
     @property
     def last_new_list_token(self) -> Optional[NewListItemMarkdownToken]:
@@ -215,29 +226,23 @@ class ListStartMarkdownToken(ContainerMarkdownToken):
         Set the extracted whitespace for the token.  To be used sparingly.
         """
         self.__extracted_whitespace = new_whitespace
-        self.__compose_extra_data_field()
 
     @override
     def _modify_token(self, field_name: str, field_value: Union[str, int]) -> bool:
         if field_name == "list_start_content" and isinstance(field_value, str):
             self.__list_start_content = field_value
-            self.__compose_extra_data_field()
             return True
         if field_name == "list_start_sequence" and isinstance(field_value, str):
             self.__list_start_sequence = field_value
-            self.__compose_extra_data_field()
             return True
         if field_name == "extracted_whitespace" and isinstance(field_value, str):
             self.__extracted_whitespace = field_value
-            self.__compose_extra_data_field()
             return True
         if field_name == "indent_level" and isinstance(field_value, int):
             self.__indent_level = field_value
-            self.__compose_extra_data_field()
             return True
         if field_name == "leading_spaces" and isinstance(field_value, str):
             self.__leading_spaces = field_value
-            self.__compose_extra_data_field()
             return True
         return super()._modify_token(field_name, field_value)
 
@@ -4,7 +4,6 @@ Module to provide for an encapsulation of the list start element.
 
 from typing import Dict, List, cast
 
-from pymarkdown.general.parser_helper import ParserHelper
 from pymarkdown.tokens.html_items import (
     FormatOnlyNewLineHtmlItem,
     HtmlCloseTagItem,
@@ -26,11 +25,10 @@ class ListStartMarkdownTokenHelper:
 
     @staticmethod
     def handle_start_list_token(
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str:
+    ) -> None:
         """
         Handle the HTML transformation for the list start token.
         """
@@ -57,17 +55,12 @@ class ListStartMarkdownTokenHelper:
         transform_state.add_leading_parts.append(FormatOnlyNewLineHtmlItem())
         transform_state.add_leading_parts.append(HtmlOpenTagItem("li"))
 
-        return ListStartMarkdownTokenHelper.__handle_start_list_token_old(
-            output_html, list_token, transform_state
-        )
-
     @staticmethod
     def handle_end_list_token(
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str:
+    ) -> None:
         """
         Handle the HTML transformation for the list end token.
         """
@@ -85,41 +78,3 @@ class ListStartMarkdownTokenHelper:
         transform_state.add_trailing_parts.append(
             HtmlCloseTagItem("ul" if next_token.is_unordered_list_end else "ol")
         )
-
-        return ListStartMarkdownTokenHelper.__handle_end_list_token_old(
-            output_html, next_token, transform_state
-        )
-
-    @staticmethod
-    def __handle_start_list_token_old(
-        output_html: str,
-        list_token: ListStartMarkdownToken,
-        transform_state: TransformState,
-    ) -> str:
-        if list_token.is_ordered_list_start:
-            token_parts = ["<ol"]
-            if int(list_token.list_start_content) != 1:
-                token_parts.extend(
-                    [' start="', str(int(list_token.list_start_content)), '"']
-                )
-            token_parts.extend([">", ParserHelper.newline_character, "<li>"])
-            transform_state.add_leading_text = "".join(token_parts)
-        else:
-            transform_state.add_leading_text = "".join(
-                ["<ul>", ParserHelper.newline_character, "<li>"]
-            )
-
-        return output_html
-
-    @staticmethod
-    def __handle_end_list_token_old(
-        output_html: str, next_token: MarkdownToken, transform_state: TransformState
-    ) -> str:
-        transform_state.add_trailing_text = "".join(
-            [
-                "</li>",
-                ParserHelper.newline_character,
-                "</ul>" if next_token.is_unordered_list_end else "</ol>",
-            ]
-        )
-        return output_html
@@ -28,8 +28,25 @@ class MarkdownTokenClass(Enum):
 class MarkdownToken:
     """
     Class to provide for a base encapsulation of the markdown tokens.
+
+    As a document can produce a large number of tokens, each token class declares
+    the fields that it uses as slots instead of keeping them in a dictionary.  Any
+    token that keeps its extra data in its own fields composes that extra data from
+    those fields each time it is asked for, instead of keeping it as a string.
     """
 
+    __slots__ = (
+        "__token_name",
+        "__token_class",
+        "__extra_data",
+        "__line_number",
+        "__column_number",
+        "__is_extension",
+        "__requires_end_token",
+        "__can_force_close",
+        "__is_special",
+    )
+
     extra_data_separator = ":"
 
     _end_token_prefix = "end-"
@@ -161,6 +178,13 @@ class MarkdownToken:
         """
         Returns the extra data associated with the token.
         """
+        return self._compose_extra_data_field()
+
+    def _compose_extra_data_field(self) -> Optional[str]:
+        """
+        Compose the extra data for the token.  Tokens that keep their extra data in
+        their own fields override this to compose it from those fields.
+        """
         return self.__extra_data
 
     def _set_extra_data(self, extra_data: Optional[str]) -> None:
@@ -674,6 +698,15 @@ class MarkdownToken:
         if self.__line_number:
             self.__line_number += adjust_delta
 
+    def shift_line_number(self, line_number_delta: int) -> None:
+        """
+        Shift the line number by a given amount.  This is only for use by the
+        parser, when lines are added to or removed from the document before an
+        existing token.
+        """
+        if self.__line_number:
+            self.__line_number += line_number_delta
+
     def modify_token(
         self,
         context: PluginModifyContext,
@@ -755,6 +788,14 @@ class EndMarkdownToken(MarkdownToken):
     Class to provide for an encapsulation of the end element to a matching start.
     """
 
+    __slots__ = (
+        "__extra_end_data",
+        "__extracted_whitespace",
+        "__start_markdown_token",
+        "__type_name",
+        "__was_forced",
+    )
+
     # pylint: disable=too-many-arguments
     def __init__(
         self,
@@ -794,16 +835,22 @@ class EndMarkdownToken(MarkdownToken):
 
         MarkdownToken.__init__(
             self,
-            f"{MarkdownToken._end_token_prefix}{type_name}",
+            EndMarkdownToken.get_end_token_name(type_name),
             MarkdownTokenClass.INLINE_BLOCK,
             "",
             line_number=line_number,
             column_number=column_number,
         )
-        self.__compose_data_field()
 
     # pylint: enable=too-many-arguments
 
+    @staticmethod
+    def get_end_token_name(type_name: str) -> str:
+        """
+        Get the name of the end token for the specified type of markdown element.
+        """
+        return f"{MarkdownToken._end_token_prefix}{type_name}"
+
     @property
     def type_name(self) -> str:
         """
@@ -830,7 +877,6 @@ class EndMarkdownToken(MarkdownToken):
         Sets the extra data specifically tied to the end element. Use sparingly.
         """
         self.__extra_end_data = new_end_data
-        self.__compose_data_field()
 
     @property
     def start_markdown_token(self) -> MarkdownToken:
@@ -839,6 +885,13 @@ class EndMarkdownToken(MarkdownToken):
         """
         return self.__start_markdown_token
 
+    def set_start_markdown_token(self, start_markdown_token: MarkdownToken) -> None:
+        """
+        Sets the start markdown token that this end token is the end for.  This is
+        only for use by the parser, when the start token is replaced by a copy of it.
+        """
+        self.__start_markdown_token = start_markdown_token
+
     @property
     def was_forced(self) -> bool:
         """
@@ -846,9 +899,10 @@ class EndMarkdownToken(MarkdownToken):
         """
         return self.__was_forced
 
-    def __compose_data_field(self) -> None:
+    @override
+    def _compose_extra_data_field(self) -> str:
         """
-        Compose the object's self.extra_data field from the local object's variables.
+        Compose the object's extra data field from the local object's variables.
         """
         field_parts: List[str] = []
         if self.extra_end_data is not None:
@@ -861,16 +915,14 @@ class EndMarkdownToken(MarkdownToken):
         ):
             field_parts.append(str(self.was_forced))
 
-        self._set_extra_data(MarkdownToken.extra_data_separator.join(field_parts))
+        return MarkdownToken.extra_data_separator.join(field_parts)
 
     @override
     def _modify_token(self, field_name: str, field_value: Union[str, int]) -> bool:
         if field_name == "extracted_whitespace" and isinstance(field_value, str):
             self.__extracted_whitespace = field_value
-            self.__compose_data_field()
             return True
         if field_name == "extra_end_data" and isinstance(field_value, str):
             self.__extra_end_data = field_value
-            self.__compose_data_field()
             return True
         return False
@@ -6,7 +6,6 @@ from typing import List, Union
 
 from typing_extensions import override
 
-from pymarkdown.general.parser_helper import ParserHelper
 from pymarkdown.general.position_marker import PositionMarker
 from pymarkdown.tokens.container_markdown_token import ContainerMarkdownToken
 from pymarkdown.tokens.html_items import (
@@ -27,6 +26,12 @@ class NewListItemMarkdownToken(ContainerMarkdownToken):
     Class to provide for an encapsulation of the new list item element..
     """
 
+    __slots__ = (
+        "__extracted_whitespace",
+        "__indent_level",
+        "__list_start_content",
+    )
+
     def __init__(
         self,
         indent_level: int,
@@ -45,7 +50,7 @@ class NewListItemMarkdownToken(ContainerMarkdownToken):
         ContainerMarkdownToken.__init__(
             self,
             MarkdownToken._token_new_list_item,
-            self.__compose_extra_data_field(),
+            "",
             position_marker=position_marker,
         )
 
@@ -84,32 +89,28 @@ class NewListItemMarkdownToken(ContainerMarkdownToken):
     def _modify_token(self, field_name: str, field_value: Union[str, int]) -> bool:
         if field_name == "list_start_content" and isinstance(field_value, str):
             self.__list_start_content = field_value
-            self.__compose_extra_data_field()
             return True
         if field_name == "extracted_whitespace" and isinstance(field_value, str):
             self.__extracted_whitespace = field_value
-            self.__compose_extra_data_field()
             return True
         if field_name == "indent_level" and isinstance(field_value, int):
             self.__indent_level = field_value
-            self.__compose_extra_data_field()
             return True
         return False
 
-    def __compose_extra_data_field(self) -> str:
+    @override
+    def _compose_extra_data_field(self) -> str:
         """
         Compose the object's self.extra_data field from the local object's variables.
         """
 
-        new_field = MarkdownToken.extra_data_separator.join(
+        return MarkdownToken.extra_data_separator.join(
             [
                 str(self.__indent_level),
                 self.__extracted_whitespace,
                 self.__list_start_content,
             ]
         )
-        self._set_extra_data(new_field)
-        return new_field
 
     @staticmethod
     def register_for_html_transform(
@@ -126,11 +127,10 @@ class NewListItemMarkdownToken(ContainerMarkdownToken):
 
     @staticmethod
     def __handle_new_list_item_token(
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str:
+    ) -> None:
         _ = next_token
         transform_state.add_trailing_parts.clear()
         transform_state.add_trailing_parts.append(HtmlCloseTagItem("li"))
@@ -143,21 +143,3 @@ class NewListItemMarkdownToken(ContainerMarkdownToken):
             and output_parts[-1].get_raw_html_text() != "</a>"
         ):
             output_parts.append(FormatOnlyNewLineHtmlItem())
-
-        return NewListItemMarkdownToken.__handle_new_list_item_token_old(
-            output_html, transform_state
-        )
-
-    @staticmethod
-    def __handle_new_list_item_token_old(
-        output_html: str, transform_state: TransformState
-    ) -> str:
-        transform_state.add_trailing_text, transform_state.add_leading_text = (
-            "</li>",
-            "<li>",
-        )
-        token_parts: List[str] = []
-        if output_html and output_html[-1] == ">" and not output_html.endswith("</a>"):
-            token_parts.append(ParserHelper.newline_character)
-        token_parts.insert(0, output_html)
-        return "".join(token_parts)
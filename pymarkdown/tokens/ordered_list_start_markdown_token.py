@@ -20,6 +20,8 @@ class OrderedListStartMarkdownToken(ListStartMarkdownToken):
     Class to provide for an encapsulation of the ordered list start element.
     """
 
+    __slots__ = ()
+
     # pylint: disable=too-many-arguments
     def __init__(
         self,
@@ -2,7 +2,7 @@
 Module to provide for an encapsulation of the paragraph element.
 """
 
-from typing import List, Optional, Union, cast
+from typing import List, Optional, cast
 
 from typing_extensions import override
 
@@ -31,13 +31,17 @@ class ParagraphMarkdownToken(LeafMarkdownToken):
     Class to provide for an encapsulation of the paragraph element.
     """
 
+    __slots__ = (
+        "__final_whitespace",
+        "rehydrate_index",
+    )
+
     def __init__(
         self, extracted_whitespace: str, position_marker: PositionMarker
     ) -> None:
         """
         Initialize an instance of the ParagraphMarkdownToken class.
         """
-        self.__extracted_whitespace: str = extracted_whitespace
         self.__final_whitespace, self.rehydrate_index = (
             "",
             0,
@@ -47,9 +51,9 @@ class ParagraphMarkdownToken(LeafMarkdownToken):
             MarkdownToken._token_paragraph,
             "",
             position_marker=position_marker,
+            extracted_whitespace=extracted_whitespace,
             requires_end_token=True,
         )
-        self.__compose_extra_data_field()
 
     # pylint: disable=protected-access
     @staticmethod
@@ -61,13 +65,6 @@ class ParagraphMarkdownToken(LeafMarkdownToken):
 
     # pylint: enable=protected-access
 
-    @property
-    def extracted_whitespace(self) -> str:
-        """
-        Returns any whitespace that was extracted before the processing of this element occurred.
-        """
-        return self.__extracted_whitespace
-
     @property
     def final_whitespace(self) -> str:
         """
@@ -75,15 +72,16 @@ class ParagraphMarkdownToken(LeafMarkdownToken):
         """
         return self.__final_whitespace
 
-    def __compose_extra_data_field(self) -> None:
+    @override
+    def _compose_extra_data_field(self) -> str:
         """
         Compose the object's self.extra_data field from the local object's variables.
         """
 
-        self._set_extra_data(
-            f"{self.__extracted_whitespace}{MarkdownToken.extra_data_separator}{self.__final_whitespace}"
+        return (
+            f"{self.extracted_whitespace}{MarkdownToken.extra_data_separator}{self.__final_whitespace}"
             if self.final_whitespace
-            else self.__extracted_whitespace
+            else self.extracted_whitespace
         )
 
     def add_whitespace(self, whitespace_to_add: str) -> None:
@@ -92,10 +90,9 @@ class ParagraphMarkdownToken(LeafMarkdownToken):
         used when combining text blocks in a paragraph.
         """
 
-        self.__extracted_whitespace = (
-            f"{self.__extracted_whitespace}{whitespace_to_add}"
+        self._set_extracted_whitespace(
+            f"{self.extracted_whitespace}{whitespace_to_add}"
         )
-        self.__compose_extra_data_field()
 
     def set_final_whitespace(self, whitespace_to_set: str) -> None:
         """
@@ -104,15 +101,6 @@ class ParagraphMarkdownToken(LeafMarkdownToken):
         """
 
         self.__final_whitespace = whitespace_to_set
-        self.__compose_extra_data_field()
-
-    @override
-    def _modify_token(self, field_name: str, field_value: Union[str, int]) -> bool:
-        if field_name == "extracted_whitespace" and isinstance(field_value, str):
-            self.__extracted_whitespace = field_value
-            self.__compose_extra_data_field()
-            return True
-        return False
 
     def register_for_markdown_transform(
         self, registration_function: RegisterMarkdownTransformHandlersProtocol
@@ -193,11 +181,10 @@ class ParagraphMarkdownToken(LeafMarkdownToken):
 
     @staticmethod
     def __handle_start_paragraph_token(
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str:
+    ) -> None:
         _ = next_token
 
         if (
@@ -214,45 +201,14 @@ class ParagraphMarkdownToken(LeafMarkdownToken):
         if transform_state.is_in_loose_list:
             output_parts.append(HtmlOpenTagItem("p"))
 
-        return ParagraphMarkdownToken.__handle_start_paragraph_token_old(
-            output_html, transform_state
-        )
-
     @staticmethod
     def __handle_end_paragraph_token(
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str:
+    ) -> None:
         _ = next_token
 
         if transform_state.is_in_loose_list:
             output_parts.append(HtmlCloseTagItem("p"))
             output_parts.append(FormatOnlyNewLineHtmlItem())
-
-        return ParagraphMarkdownToken.__handle_end_paragraph_token_old(
-            output_html, transform_state
-        )
-
-    @staticmethod
-    def __handle_start_paragraph_token_old(
-        output_html: str, transform_state: TransformState
-    ) -> str:
-        token_parts: List[str] = []
-        if output_html and output_html[-1] != ParserHelper.newline_character:
-            token_parts.append(ParserHelper.newline_character)
-        if transform_state.is_in_loose_list:
-            token_parts.append("<p>")
-        token_parts.insert(0, output_html)
-        return "".join(token_parts)
-
-    @staticmethod
-    def __handle_end_paragraph_token_old(
-        output_html: str, transform_state: TransformState
-    ) -> str:
-        return (
-            f"{output_html}</p>{ParserHelper.newline_character}"
-            if transform_state.is_in_loose_list
-            else output_html
-        )
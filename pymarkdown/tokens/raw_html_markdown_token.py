@@ -28,6 +28,8 @@ class RawHtmlMarkdownToken(InlineMarkdownToken):
     Class to provide for an encapsulation of the inline raw html element.
     """
 
+    __slots__ = ("__raw_tag",)
+
     def __init__(self, raw_tag: str, line_number: int, column_number: int) -> None:
         """
         Initialize an instance of the RawHtmlMarkdownToken class.
@@ -99,15 +101,11 @@ class RawHtmlMarkdownToken(InlineMarkdownToken):
             block_paragraph_token = cast(
                 ParagraphMarkdownToken, context.block_stack[-1]
             )
-            POGGER.debug(
-                f"raw_html>>before>>{ParserHelper.make_value_visible(raw_text)}"
-            )
+            POGGER.debug("raw_html>>before>>$", raw_text)
             block_paragraph_token.rehydrate_index += (
                 ParserHelper.count_newlines_in_text(raw_text)
             )
-            POGGER.debug(
-                f"raw_html>>after>>{ParserHelper.make_value_visible(raw_text)}"
-            )
+            POGGER.debug("raw_html>>after>>$", raw_text)
         return f"<{raw_text}>"
 
     @staticmethod
@@ -123,11 +121,10 @@ class RawHtmlMarkdownToken(InlineMarkdownToken):
 
     @staticmethod
     def __handle_raw_html_token(
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str:
+    ) -> None:
         _ = transform_state
 
         raw_html_token = cast(RawHtmlMarkdownToken, next_token)
@@ -137,20 +134,3 @@ class RawHtmlMarkdownToken(InlineMarkdownToken):
                 ParserHelper.resolve_all_from_text(raw_html_token.raw_tag)
             )
         )
-
-        return RawHtmlMarkdownToken.__handle_raw_html_token_old(
-            output_html, raw_html_token
-        )
-
-    @staticmethod
-    def __handle_raw_html_token_old(
-        output_html: str, raw_html_token: "RawHtmlMarkdownToken"
-    ) -> str:
-        token_parts = [
-            "<",
-            ParserHelper.resolve_all_from_text(raw_html_token.raw_tag),
-            ">",
-        ]
-
-        token_parts.insert(0, output_html)
-        return "".join(token_parts)
@@ -17,6 +17,22 @@ class ReferenceMarkdownToken(InlineMarkdownToken):
     Base class for images and links.
     """
 
+    __slots__ = (
+        "__after_title_whitespace",
+        "__before_link_whitespace",
+        "__before_title_whitespace",
+        "__did_use_angle_start",
+        "__ex_label",
+        "__inline_title_bounding_character",
+        "__label_type",
+        "__link_title",
+        "__link_uri",
+        "__pre_link_title",
+        "__pre_link_uri",
+        "__text_from_blocks",
+        "simple_extra_data",
+    )
+
     # pylint: disable=too-many-arguments
     def __init__(
         self,
@@ -94,12 +110,10 @@ class ReferenceMarkdownToken(InlineMarkdownToken):
         assert self.__label_type is not None, "This field should be defined."
         assert self.__pre_link_uri is not None, "This field should be defined."
 
-        part_1, part_2 = self.__compose_extra_data_field(token_name)
-
         InlineMarkdownToken.__init__(
             self,
             token_name,
-            f"{part_1}{part_2}",
+            None,
             line_number=line_number,
             column_number=column_number,
             requires_end_token=requires_end_token,
@@ -242,38 +256,32 @@ class ReferenceMarkdownToken(InlineMarkdownToken):
         """
         return self.__after_title_whitespace
 
-    def __compose_extra_data_field(self, token_name: str) -> Tuple[str, str]:
+    @override
+    def _compose_extra_data_field(self) -> str:
         """
         Compose the object's self.extra_data field from the local object's variables.
         """
         extra_data = (
             f"{self.simple_extra_data}{MarkdownToken.extra_data_separator}"
-            if token_name == MarkdownToken._token_inline_image
+            if self.token_name == MarkdownToken._token_inline_image
             else self.simple_extra_data
         )
 
         # Purposefully split this way to accommodate the extra data
         assert self.__label_type is not None, "Label type must be defined."
         part_1, part_2 = self.__build_extra_data(extra_data, self.__label_type)
-        self._set_extra_data(f"{part_1}{part_2}")
-        return part_1, part_2
+        return f"{part_1}{part_2}"
 
     @override
     def _modify_token(self, field_name: str, field_value: Union[str, int]) -> bool:
         if field_name == "text_from_blocks" and isinstance(field_value, str):
             self.__text_from_blocks = field_value
-            self.__compose_extra_data_field(self.token_name)
-
             return True
         if field_name == "link_title" and isinstance(field_value, str):
             self.__link_title = field_value
-            self.__compose_extra_data_field(self.token_name)
-
             return True
         if field_name == "pre_link_title" and isinstance(field_value, str):
             self.__pre_link_title = field_value
-            self.__compose_extra_data_field(self.token_name)
-
             return True
         return False
 
@@ -4,6 +4,8 @@ Module to provide for an encapsulation of the setext heading element.
 
 from typing import List, Optional, cast
 
+from typing_extensions import override
+
 from pymarkdown.general.parser_helper import ParserHelper
 from pymarkdown.general.position_marker import PositionMarker
 from pymarkdown.tokens.html_items import (
@@ -28,6 +30,15 @@ class SetextHeadingMarkdownToken(LeafMarkdownToken):
     Class to provide for an encapsulation of the setext heading element.
     """
 
+    __slots__ = (
+        "__final_whitespace",
+        "__hash_count",
+        "__heading_character",
+        "__heading_character_count",
+        "__original_column_number",
+        "__original_line_number",
+    )
+
     # pylint: disable=too-many-arguments
     def __init__(
         self,
@@ -70,7 +81,6 @@ class SetextHeadingMarkdownToken(LeafMarkdownToken):
             requires_end_token=True,
             can_force_close=False,
         )
-        self.__compose_extra_data_field()
 
     # pylint: enable=too-many-arguments
     # pylint: disable=protected-access
@@ -132,9 +142,18 @@ class SetextHeadingMarkdownToken(LeafMarkdownToken):
         """
 
         self.__final_whitespace = whitespace_to_set
-        self.__compose_extra_data_field()
 
-    def __compose_extra_data_field(self) -> None:
+    def shift_line_number(self, line_number_delta: int) -> None:
+        """
+        Shift the line number by a given amount, including the line number
+        of the paragraph that started the heading.
+        """
+        super().shift_line_number(line_number_delta)
+        if self.__original_line_number > 0:
+            self.__original_line_number += line_number_delta
+
+    @override
+    def _compose_extra_data_field(self) -> str:
         """
         Compose the object's self.extra_data field from the local object's variables.
         """
@@ -150,7 +169,7 @@ class SetextHeadingMarkdownToken(LeafMarkdownToken):
         ]
         if self.final_whitespace:
             field_parts.append(self.final_whitespace)
-        self._set_extra_data(MarkdownToken.extra_data_separator.join(field_parts))
+        return MarkdownToken.extra_data_separator.join(field_parts)
 
     def register_for_markdown_transform(
         self, registration_function: RegisterMarkdownTransformHandlersProtocol
@@ -227,11 +246,10 @@ class SetextHeadingMarkdownToken(LeafMarkdownToken):
 
     @staticmethod
     def __handle_start_setext_heading_token(
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str:
+    ) -> None:
         _ = transform_state
 
         transform_state.is_in_setext_block = True
@@ -244,17 +262,12 @@ class SetextHeadingMarkdownToken(LeafMarkdownToken):
             HtmlOpenTagItem("h1" if setext_token.heading_character == "=" else "h2")
         )
 
-        return SetextHeadingMarkdownToken.__handle_start_setext_heading_token_old(
-            output_html, setext_token
-        )
-
     @staticmethod
     def __handle_end_setext_heading_token(
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str:
+    ) -> None:
         _ = next_token
 
         transform_state.is_in_setext_block = False
@@ -271,34 +284,3 @@ class SetextHeadingMarkdownToken(LeafMarkdownToken):
             HtmlCloseTagItem("h1" if setext_token.heading_character == "=" else "h2")
         )
         output_parts.append(FormatOnlyNewLineHtmlItem())
-
-        return SetextHeadingMarkdownToken.__handle_end_setext_heading_token_old(
-            output_html, setext_token
-        )
-
-    @staticmethod
-    def __handle_start_setext_heading_token_old(
-        output_html: str,
-        setext_token: "SetextHeadingMarkdownToken",
-    ) -> str:
-        token_parts: List[str] = []
-        if output_html.endswith("</ol>") or output_html.endswith("</ul>"):
-            token_parts.append(ParserHelper.newline_character)
-        token_parts.extend(
-            ["<h", "1" if setext_token.heading_character == "=" else "2", ">"]
-        )
-        token_parts.insert(0, output_html)
-        return "".join(token_parts)
-
-    @staticmethod
-    def __handle_end_setext_heading_token_old(
-        output_html: str, setext_token: "SetextHeadingMarkdownToken"
-    ) -> str:
-        token_parts = [
-            "</h",
-            "1" if setext_token.heading_character == "=" else "2",
-            ">",
-            ParserHelper.newline_character,
-        ]
-        token_parts.insert(0, output_html)
-        return "".join(token_parts)
@@ -12,6 +12,13 @@ class SpecialTextMarkdownToken(TextMarkdownToken):
     Class to provide for special tokens that represent exceptional inline elements.
     """
 
+    __slots__ = (
+        "__following_two",
+        "__is_active",
+        "__preceding_two",
+        "__repeat_count",
+    )
+
     # pylint: disable=too-many-arguments
     def __init__(
         self,
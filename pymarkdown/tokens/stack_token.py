@@ -56,6 +56,7 @@ class StackToken:
             extra_data,
             matching_markdown_token,
         )
+        self.__matching_markdown_token_index: Optional[int] = None
 
     def __str__(self) -> str:
         add_extra = f":{self.extra_data}" if self.extra_data else ""
@@ -99,6 +100,22 @@ class StackToken:
         Reset the matching markdown token.  To be used only when rewinding.
         """
         self.__matching_markdown_token = new_matching_markdown_token
+        self.__matching_markdown_token_index = None
+
+    @property
+    def matching_markdown_token_index(self) -> Optional[int]:
+        """
+        Returns the last known index of the matching markdown token within the
+        document.  As the document may have been changed since that index was
+        recorded, it must be verified before being used.
+        """
+        return self.__matching_markdown_token_index
+
+    def record_matching_markdown_token_index(self, token_index: int) -> None:
+        """
+        Record the index of the matching markdown token within the document.
+        """
+        self.__matching_markdown_token_index = token_index
 
     def generate_close_markdown_token_from_stack_token(
         self,
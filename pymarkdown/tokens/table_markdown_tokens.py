@@ -6,7 +6,6 @@ from typing import Dict, List, Optional, Union, cast
 
 from typing_extensions import override
 
-from pymarkdown.general.parser_helper import ParserHelper
 from pymarkdown.general.position_marker import PositionMarker
 from pymarkdown.leaf_blocks.table_block_tuple import TableRow
 from pymarkdown.tokens.html_items import (
@@ -32,6 +31,8 @@ class TableMarkdownToken(LeafMarkdownToken):
     Class to provide for an encapsulation of the main table markdown token.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         position_marker: PositionMarker,
@@ -110,67 +111,45 @@ class TableMarkdownToken(LeafMarkdownToken):
 
     @staticmethod
     def __handle_start_table_token(
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str:
+    ) -> None:
         _ = next_token
 
         if (
             not output_parts
-            and transform_state.transform_stack_two
-            and transform_state.transform_stack_two[-1][-1].get_raw_html_text()
-            == "<li>"
+            and transform_state.transform_stack
+            and transform_state.transform_stack[-1][-1].get_raw_html_text() == "<li>"
         ):
             output_parts.append(FormatOnlyNewLineHtmlItem())
         output_parts.append(HtmlOpenTagItem("table"))
         output_parts.append(FormatOnlyNewLineHtmlItem())
 
-        return TableMarkdownToken.__handle_start_table_token_old(
-            output_html, transform_state
-        )
-
     @staticmethod
     def __handle_end_table_token(
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str:
+    ) -> None:
         _ = (next_token, transform_state)
 
         output_parts.append(HtmlCloseTagItem("table"))
         output_parts.append(FormatOnlyNewLineHtmlItem())
 
-        return TableMarkdownToken.__handle_end_table_token_old(output_html)
-
-    @staticmethod
-    def __handle_start_table_token_old(
-        output_html: str, transform_state: TransformState
-    ) -> str:
-        token_parts: List[str] = []
-        if (
-            not output_html
-            and transform_state.transform_stack
-            and transform_state.transform_stack[-1].endswith("<li>")
-        ):
-            token_parts.append(ParserHelper.newline_character)
-        token_parts.extend([output_html, "<table>", ParserHelper.newline_character])
-        return "".join(token_parts)
-
-    @staticmethod
-    def __handle_end_table_token_old(
-        output_html: str,
-    ) -> str:
-        return "".join([output_html, "</table>", ParserHelper.newline_character])
-
 
 class TableMarkdownHeaderToken(LeafMarkdownToken):
     """
     Class to provide for an encapsulation of the table header markdown token.
     """
 
+    __slots__ = (
+        "__did_header_row_start_with_separator",
+        "__header_row_leading_whitespace",
+        "__header_row_trailing_whitespace",
+        "__separator_line",
+    )
+
     def __init__(
         self,
         header_table_row: TableRow,
@@ -195,24 +174,24 @@ class TableMarkdownHeaderToken(LeafMarkdownToken):
         LeafMarkdownToken.__init__(
             self,
             MarkdownToken._token_table_header,
-            extra_data=self.__compose_extra_data_field(),
+            extra_data=None,
             position_marker=position_marker,
             extracted_whitespace="",
             requires_end_token=True,
         )
 
-    def __compose_extra_data_field(self) -> Optional[str]:
+    @override
+    def _compose_extra_data_field(self) -> Optional[str]:
         """
         Compose the object's self.extra_data field from the local object's variables.
         """
         if self.__header_row_leading_whitespace is None:
-            self._set_extra_data(None)
             return None
 
         assert self.__header_row_trailing_whitespace is not None
         assert self.__header_row_trailing_whitespace is not None
         assert self.__separator_line is not None
-        composed_field = MarkdownToken.extra_data_separator.join(
+        return MarkdownToken.extra_data_separator.join(
             [
                 self.__header_row_leading_whitespace,
                 self.__header_row_trailing_whitespace,
@@ -220,8 +199,6 @@ class TableMarkdownHeaderToken(LeafMarkdownToken):
                 self.__separator_line,
             ]
         )
-        self._set_extra_data(composed_field)
-        return composed_field
 
     # pylint: disable=protected-access
     @staticmethod
@@ -262,13 +239,9 @@ class TableMarkdownHeaderToken(LeafMarkdownToken):
             field_value, str
         ):
             self.__header_row_leading_whitespace = field_value
-            extra_data = self.__compose_extra_data_field()
-            super()._set_extra_data(extra_data)
             return True
         if field_name == "separator_line" and isinstance(field_value, str):
             self.__separator_line = field_value
-            extra_data = self.__compose_extra_data_field()
-            super()._set_extra_data(extra_data)
             return True
         return super()._modify_token(field_name, field_value)
 
@@ -356,11 +329,10 @@ class TableMarkdownHeaderToken(LeafMarkdownToken):
 
     @staticmethod
     def __handle_start_table_token(
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str:
+    ) -> None:
         _ = (transform_state, next_token)
 
         output_parts.append(HtmlOpenTagItem("thead"))
@@ -368,15 +340,12 @@ class TableMarkdownHeaderToken(LeafMarkdownToken):
         output_parts.append(HtmlOpenTagItem("tr"))
         output_parts.append(FormatOnlyNewLineHtmlItem())
 
-        return TableMarkdownHeaderToken.__handle_start_table_token_old(output_html)
-
     @staticmethod
     def __handle_end_table_token(
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str:
+    ) -> None:
         _ = (next_token, transform_state)
 
         output_parts.append(HtmlCloseTagItem("tr"))
@@ -384,40 +353,17 @@ class TableMarkdownHeaderToken(LeafMarkdownToken):
         output_parts.append(HtmlCloseTagItem("thead"))
         output_parts.append(FormatOnlyNewLineHtmlItem())
 
-        return TableMarkdownHeaderToken.__handle_end_table_token_old(output_html)
-
-    @staticmethod
-    def __handle_start_table_token_old(
-        output_html: str,
-    ) -> str:
-        token_parts = [
-            "<thead>",
-            ParserHelper.newline_character,
-            "<tr>",
-            ParserHelper.newline_character,
-        ]
-        token_parts.insert(0, output_html)
-        return "".join(token_parts)
-
-    @staticmethod
-    def __handle_end_table_token_old(
-        output_html: str,
-    ) -> str:
-        token_parts = [
-            "</tr>",
-            ParserHelper.newline_character,
-            "</thead>",
-            ParserHelper.newline_character,
-        ]
-        token_parts.insert(0, output_html)
-        return "".join(token_parts)
-
 
 class TableMarkdownHeaderItemToken(LeafMarkdownToken):
     """
     Class to provide for an encapsulation of the table header item markdown token.
     """
 
+    __slots__ = (
+        "__column_alignment",
+        "__leading_whitespace",
+    )
+
     def __init__(
         self,
         leading_whitespace: str,
@@ -433,7 +379,7 @@ class TableMarkdownHeaderItemToken(LeafMarkdownToken):
         LeafMarkdownToken.__init__(
             self,
             MarkdownToken._token_table_header_item,
-            extra_data=self.__compose_extra_data_field(),
+            extra_data=None,
             line_number=line_number,
             column_number=column_number,
             extracted_whitespace=leading_whitespace,
@@ -455,18 +401,17 @@ class TableMarkdownHeaderItemToken(LeafMarkdownToken):
 
     # pylint: enable=protected-access
 
-    def __compose_extra_data_field(self) -> Optional[str]:
+    @override
+    def _compose_extra_data_field(self) -> Optional[str]:
         """
         Compose the object's self.extra_data field from the local object's variables.
         """
-        composed_field = MarkdownToken.extra_data_separator.join(
+        return MarkdownToken.extra_data_separator.join(
             [
                 self.__leading_whitespace,
                 self.__column_alignment if self.__column_alignment is not None else "",
             ]
         )
-        self._set_extra_data(composed_field)
-        return composed_field
 
     def register_for_markdown_transform(
         self, registration_function: RegisterMarkdownTransformHandlersProtocol
@@ -520,69 +465,39 @@ class TableMarkdownHeaderItemToken(LeafMarkdownToken):
 
     @staticmethod
     def __handle_start_table_token(
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str:
+    ) -> None:
         _ = (transform_state, next_token)
 
         table_token = cast(TableMarkdownHeaderItemToken, next_token)
 
-        if table_token.column_alignment:
-            text_to_add = f'<th align="{table_token.column_alignment}">'
-        else:
-            text_to_add = "<th>"
-
         attributes_map: Dict[str, str] = {}
         if table_token.column_alignment:
             attributes_map["align"] = table_token.column_alignment
 
         output_parts.append(HtmlOpenTagItem("th", attributes_map))
 
-        return TableMarkdownHeaderItemToken.__handle_start_table_token_old(
-            output_html, text_to_add
-        )
-
     @staticmethod
     def __handle_end_table_token(
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str:
+    ) -> None:
         _ = (next_token, transform_state)
 
         output_parts.append(HtmlCloseTagItem("th"))
         output_parts.append(FormatOnlyNewLineHtmlItem())
 
-        return TableMarkdownHeaderItemToken.__handle_end_table_token_old(output_html)
-
-    @staticmethod
-    def __handle_start_table_token_old(output_html: str, text_to_add: str) -> str:
-        return "".join(
-            [
-                output_html,
-                text_to_add,
-            ]
-        )
-
-    @staticmethod
-    def __handle_end_table_token_old(output_html: str) -> str:
-        return "".join(
-            [
-                output_html,
-                "</th>",
-                ParserHelper.newline_character,
-            ]
-        )
-
 
 class TableMarkdownBodyToken(LeafMarkdownToken):
     """
     Class to provide for an encapsulation of the table header markdown token.
     """
 
+    __slots__ = ()
+
     def __init__(self, line_number: int, column_number: int) -> None:
         """
         Initialize an instance of the TableMarkdownBodyToken class.
@@ -659,56 +574,39 @@ class TableMarkdownBodyToken(LeafMarkdownToken):
 
     @staticmethod
     def __handle_start_table_token(
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str:
+    ) -> None:
         _ = (transform_state, next_token)
 
         output_parts.append(HtmlOpenTagItem("tbody"))
         output_parts.append(FormatOnlyNewLineHtmlItem())
 
-        return TableMarkdownBodyToken.__handle_start_table_token_old(output_html)
-
     @staticmethod
     def __handle_end_table_token(
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str:
+    ) -> None:
         _ = (next_token, transform_state)
 
         output_parts.append(HtmlCloseTagItem("tbody"))
         output_parts.append(FormatOnlyNewLineHtmlItem())
 
-        return TableMarkdownBodyToken.__handle_end_table_token_old(output_html)
-
-    @staticmethod
-    def __handle_start_table_token_old(
-        output_html: str,
-    ) -> str:
-        return "".join(
-            [
-                output_html,
-                "<tbody>",
-                ParserHelper.newline_character,
-            ]
-        )
-
-    @staticmethod
-    def __handle_end_table_token_old(
-        output_html: str,
-    ) -> str:
-        return "".join([output_html, "</tbody>", ParserHelper.newline_character])
-
 
 class TableMarkdownRowToken(LeafMarkdownToken):
     """
     Class to provide for an encapsulation of the table header markdown token.
     """
 
+    __slots__ = (
+        "__delta",
+        "__did_start_with_separator",
+        "__leading_whitespace",
+        "__trailing_whitespace",
+    )
+
     # pylint: disable=too-many-arguments
     def __init__(
         self,
@@ -729,7 +627,7 @@ class TableMarkdownRowToken(LeafMarkdownToken):
         LeafMarkdownToken.__init__(
             self,
             MarkdownToken._token_table_row,
-            extra_data=self.__compose_extra_data_field(),
+            extra_data=None,
             line_number=line_number,
             column_number=column_number,
             extracted_whitespace="",
@@ -738,11 +636,12 @@ class TableMarkdownRowToken(LeafMarkdownToken):
 
     # pylint: enable=too-many-arguments
 
-    def __compose_extra_data_field(self) -> Optional[str]:
+    @override
+    def _compose_extra_data_field(self) -> Optional[str]:
         """
         Compose the object's self.extra_data field from the local object's variables.
         """
-        composed_field = MarkdownToken.extra_data_separator.join(
+        return MarkdownToken.extra_data_separator.join(
             [
                 self.__leading_whitespace,
                 self.__trailing_whitespace,
@@ -750,8 +649,6 @@ class TableMarkdownRowToken(LeafMarkdownToken):
                 str(self.__delta),
             ]
         )
-        self._set_extra_data(composed_field)
-        return composed_field
 
     @property
     def leading_whitespace(self) -> str:
@@ -777,8 +674,6 @@ class TableMarkdownRowToken(LeafMarkdownToken):
     def _modify_token(self, field_name: str, field_value: Union[str, int]) -> bool:
         if field_name == "leading_whitespace" and isinstance(field_value, str):
             self.__leading_whitespace = field_value
-            extra_data = self.__compose_extra_data_field()
-            super()._set_extra_data(extra_data)
             return True
         return super()._modify_token(field_name, field_value)
 
@@ -857,25 +752,21 @@ class TableMarkdownRowToken(LeafMarkdownToken):
 
     @staticmethod
     def __handle_start_table_token(
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str:
+    ) -> None:
         _ = (transform_state, next_token)
 
         output_parts.append(HtmlOpenTagItem("tr"))
         output_parts.append(FormatOnlyNewLineHtmlItem())
 
-        return TableMarkdownRowToken.__handle_start_table_token_old(output_html)
-
     @staticmethod
     def __handle_end_table_token(
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str:
+    ) -> None:
         _ = (transform_state, next_token)
 
         for _i in range(
@@ -892,45 +783,17 @@ class TableMarkdownRowToken(LeafMarkdownToken):
         output_parts.append(HtmlCloseTagItem("tr"))
         output_parts.append(FormatOnlyNewLineHtmlItem())
 
-        return TableMarkdownRowToken.__handle_end_table_token_old(
-            output_html, next_token
-        )
-
-    @staticmethod
-    def __handle_start_table_token_old(output_html: str) -> str:
-        return "".join(
-            [
-                output_html,
-                "<tr>",
-                ParserHelper.newline_character,
-            ]
-        )
-
-    @staticmethod
-    def __handle_end_table_token_old(
-        output_html: str,
-        next_token: MarkdownToken,
-    ) -> str:
-
-        token_parts: List[str] = []
-        for _i in range(
-            cast(
-                TableMarkdownRowToken,
-                cast(EndMarkdownToken, next_token).start_markdown_token,
-            ).delta
-        ):
-            token_parts.append(f"<td></td>{ParserHelper.newline_character}")
-            break
-        token_parts.extend(("</tr>", ParserHelper.newline_character))
-        token_parts.insert(0, output_html)
-        return "".join(token_parts)
-
 
 class TableMarkdownRowItemToken(LeafMarkdownToken):
     """
     Class to provide for an encapsulation of the table header markdown token.
     """
 
+    __slots__ = (
+        "__column_alignment",
+        "__leading_whitespace",
+    )
+
     def __init__(
         self,
         leading_whitespace: str,
@@ -946,7 +809,7 @@ class TableMarkdownRowItemToken(LeafMarkdownToken):
         LeafMarkdownToken.__init__(
             self,
             MarkdownToken._token_table_row_item,
-            extra_data=self.__compose_extra_data_field(),
+            extra_data=None,
             line_number=line_number,
             column_number=column_number,
             extracted_whitespace=leading_whitespace,
@@ -973,18 +836,17 @@ class TableMarkdownRowItemToken(LeafMarkdownToken):
 
     # pylint: enable=protected-access
 
-    def __compose_extra_data_field(self) -> Optional[str]:
+    @override
+    def _compose_extra_data_field(self) -> Optional[str]:
         """
         Compose the object's self.extra_data field from the local object's variables.
         """
-        composed_field = MarkdownToken.extra_data_separator.join(
+        return MarkdownToken.extra_data_separator.join(
             [
                 self.leading_whitespace,
                 self.column_alignment if self.column_alignment is not None else "",
             ]
         )
-        self._set_extra_data(composed_field)
-        return composed_field
 
     def register_for_markdown_transform(
         self, registration_function: RegisterMarkdownTransformHandlersProtocol
@@ -1038,11 +900,10 @@ class TableMarkdownRowItemToken(LeafMarkdownToken):
 
     @staticmethod
     def __handle_start_table_token(
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str:
+    ) -> None:
         _ = (transform_state, next_token)
 
         table_token = cast(TableMarkdownRowItemToken, next_token)
@@ -1051,38 +912,13 @@ class TableMarkdownRowItemToken(LeafMarkdownToken):
             attributes_map["align"] = table_token.column_alignment
         output_parts.append(HtmlOpenTagItem("td", attributes_map))
 
-        return TableMarkdownRowItemToken.__handle_start_table_token_old(
-            output_html, table_token
-        )
-
     @staticmethod
     def __handle_end_table_token(
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str:
+    ) -> None:
         _ = (next_token, transform_state)
 
         output_parts.append(HtmlCloseTagItem("td"))
         output_parts.append(FormatOnlyNewLineHtmlItem())
-
-        return TableMarkdownRowItemToken.__handle_end_table_token_old(output_html)
-
-    @staticmethod
-    def __handle_start_table_token_old(
-        output_html: str, table_token: "TableMarkdownRowItemToken"
-    ) -> str:
-        if table_token.column_alignment:
-            text_to_add = f'<td align="{table_token.column_alignment}">'
-        else:
-            text_to_add = "<td>"
-        token_parts = [text_to_add]
-        token_parts.insert(0, output_html)
-        return "".join(token_parts)
-
-    @staticmethod
-    def __handle_end_table_token_old(
-        output_html: str,
-    ) -> str:
-        return "".join([output_html, "</td>", ParserHelper.newline_character])
@@ -39,6 +39,13 @@ class TextMarkdownToken(InlineMarkdownToken):
     Class to provide for an encapsulation of the text element.
     """
 
+    __slots__ = (
+        "__end_whitespace",
+        "__extracted_whitespace",
+        "__tabified_text",
+        "__token_text",
+    )
+
     # pylint: disable=too-many-arguments
     def __init__(
         self,
@@ -69,7 +76,6 @@ class TextMarkdownToken(InlineMarkdownToken):
             column_number=column_number,
             is_special=is_special,
         )
-        self.__compose_extra_data_field()
 
     # pylint: enable=too-many-arguments
     # pylint: disable=protected-access
@@ -84,7 +90,6 @@ class TextMarkdownToken(InlineMarkdownToken):
 
     def _set_token_text(self, new_text: str) -> None:
         self.__token_text = new_text
-        self.__compose_extra_data_field()
 
     @property
     def token_text(self) -> str:
@@ -130,21 +135,19 @@ class TextMarkdownToken(InlineMarkdownToken):
     def _modify_token(self, field_name: str, field_value: Union[str, int]) -> bool:
         if field_name == "token_text" and isinstance(field_value, str):
             self.__token_text = field_value
-            self.__compose_extra_data_field()
 
             return True
         if field_name == "end_whitespace" and isinstance(field_value, str):
             self.__end_whitespace = field_value
-            self.__compose_extra_data_field()
 
             return True
         if field_name == "extracted_whitespace" and isinstance(field_value, str):
             self.__extracted_whitespace = field_value
-            self.__compose_extra_data_field()
             return True
         return False
 
-    def __compose_extra_data_field(self) -> None:
+    @override
+    def _compose_extra_data_field(self) -> str:
         """
         Compose the object's self.extra_data field from the local object's variables.
         """
@@ -154,7 +157,7 @@ class TextMarkdownToken(InlineMarkdownToken):
             data_field_parts.append(self.__end_whitespace)
         elif self.__tabified_text:
             data_field_parts.extend(("", self.__tabified_text))
-        self._set_extra_data(MarkdownToken.extra_data_separator.join(data_field_parts))
+        return MarkdownToken.extra_data_separator.join(data_field_parts)
 
     def remove_final_whitespace(self) -> str:
         """
@@ -194,7 +197,6 @@ class TextMarkdownToken(InlineMarkdownToken):
                     + collected_whitespace_length
                 ]
                 self.__tabified_text = self.__tabified_text[:first_non_whitespace_index]
-        self.__compose_extra_data_field()
         return removed_whitespace
 
     def combine(
@@ -258,7 +260,6 @@ class TextMarkdownToken(InlineMarkdownToken):
             f"{self.__token_text}{ParserHelper.newline_character}{blank_line_sequence}"
             + f"{prefix_whitespace}{text_to_combine}"
         )
-        self.__compose_extra_data_field()
         return removed_whitespace
 
     def __combine_only_text_blocks(self, other_text_token: MarkdownToken) -> str:
@@ -274,7 +275,6 @@ class TextMarkdownToken(InlineMarkdownToken):
                 if self.end_whitespace is not None
                 else the_other_text_token.end_whitespace
             )
-        self.__compose_extra_data_field()
         return ""
 
     def __combine_handle_whitespace(
@@ -342,25 +342,21 @@ class TextMarkdownToken(InlineMarkdownToken):
 
         prefix_text = ""
         current_text_token = cast(TextMarkdownToken, current_token)
-        POGGER.debug(
-            f">>rehydrate_text>>:{ParserHelper.make_value_visible(current_text_token.token_text)}:<<"
-        )
+        POGGER.debug(">>rehydrate_text>>:$:<<", current_text_token.token_text)
         # main_text = ParserHelper.resolve_noops_from_text(current_text_token.token_text)
         main_text = ParserHelper.remove_all_from_text(
             current_text_token.token_text, include_noops=True
         )
 
-        POGGER.debug(f"<<rehydrate_text>>{ParserHelper.make_value_visible(main_text)}")
+        POGGER.debug("<<rehydrate_text>>$", main_text)
 
         POGGER.debug(
-            f">>leading_whitespace>>:{ParserHelper.make_value_visible(current_text_token.extracted_whitespace)}:<<"
+            ">>leading_whitespace>>:$:<<", current_text_token.extracted_whitespace
         )
         leading_whitespace = ParserHelper.remove_all_from_text(
             current_text_token.extracted_whitespace
         )
-        POGGER.debug(
-            f"<<leading_whitespace>>:{ParserHelper.make_value_visible(leading_whitespace)}:<<"
-        )
+        POGGER.debug("<<leading_whitespace>>:$:<<", leading_whitespace)
 
         extra_line = ""
         # assert context.block_stack
@@ -390,9 +386,10 @@ class TextMarkdownToken(InlineMarkdownToken):
             )
 
         POGGER.debug(
-            f"<<prefix_text>>{ParserHelper.make_value_visible(prefix_text)}"
-            + f"<<leading_whitespace>>{ParserHelper.make_value_visible(leading_whitespace)}"
-            + f"<<main_text>>{ParserHelper.make_value_visible(main_text)}<<"
+            "<<prefix_text>>$<<leading_whitespace>>$<<main_text>>$<<",
+            prefix_text,
+            leading_whitespace,
+            main_text,
         )
         return "".join([prefix_text, leading_whitespace, main_text, extra_line])
 
@@ -508,10 +505,8 @@ class TextMarkdownToken(InlineMarkdownToken):
 
             main_text = ParserHelper.newline_character.join(rejoined_token_text)
         else:
-            POGGER.debug(f"main_text>>{ParserHelper.make_value_visible(main_text)}")
-            POGGER.debug(
-                f"current_token>>{ParserHelper.make_value_visible(current_token)}"
-            )
+            POGGER.debug("main_text>>$", main_text)
+            POGGER.debug("current_token>>$", current_token)
             if current_token.end_whitespace and current_token.end_whitespace.endswith(
                 ParserHelper.whitespace_split_character
             ):
@@ -531,11 +526,10 @@ class TextMarkdownToken(InlineMarkdownToken):
 
     @staticmethod
     def __handle_text_token(
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str:
+    ) -> None:
         """
         Handle the text token.
         """
@@ -543,28 +537,28 @@ class TextMarkdownToken(InlineMarkdownToken):
         adjusted_text_token = ParserHelper.resolve_all_from_text(text_token.token_text)
 
         if transform_state.is_in_code_block:
-            return TextMarkdownToken.__handle_text_token_code(
-                output_html, output_parts, text_token, adjusted_text_token
+            TextMarkdownToken.__handle_text_token_code(
+                output_parts, text_token, adjusted_text_token
             )
-        if transform_state.is_in_html_block:
-            return TextMarkdownToken.__handle_text_token_html(
-                output_html, output_parts, text_token, adjusted_text_token
+        elif transform_state.is_in_html_block:
+            TextMarkdownToken.__handle_text_token_html(
+                output_parts, text_token, adjusted_text_token
             )
-        if transform_state.is_in_setext_block:
-            return TextMarkdownToken.__handle_text_token_setext(
-                output_html, output_parts, adjusted_text_token
+        elif transform_state.is_in_setext_block:
+            TextMarkdownToken.__handle_text_token_setext(
+                output_parts, adjusted_text_token
+            )
+        else:
+            TextMarkdownToken.__handle_text_token_normal(
+                output_parts, text_token, adjusted_text_token
             )
-        return TextMarkdownToken.__handle_text_token_normal(
-            output_html, output_parts, text_token, adjusted_text_token
-        )
 
     @staticmethod
     def __handle_text_token_code(
-        output_html: str,
         output_parts: List[HtmlItems],
         text_token: "TextMarkdownToken",
         adjusted_text_token: str,
-    ) -> str:
+    ) -> None:
         token_parts: List[str] = []
         POGGER.debug(
             "text_token.extracted_whitespace>:$:<", text_token.extracted_whitespace
@@ -584,15 +578,12 @@ class TextMarkdownToken(InlineMarkdownToken):
         if code_block_text := "".join(token_parts):
             output_parts.append(CodeBlockItem(code_block_text))
 
-        return TextMarkdownToken.__handle_text_token_code_old(output_html, token_parts)
-
     @staticmethod
     def __handle_text_token_html(
-        output_html: str,
         output_parts: List[HtmlItems],
         text_token: "TextMarkdownToken",
         adjusted_text_token: str,
-    ) -> str:
+    ) -> None:
         POGGER.debug(
             "text_token.extracted_whitespace>:$:<", text_token.extracted_whitespace
         )
@@ -610,36 +601,24 @@ class TextMarkdownToken(InlineMarkdownToken):
         ]
         output_parts.append(HtmlBlockItem("".join(token_parts)))
 
-        return TextMarkdownToken.__handle_text_token_html_old(output_html, token_parts)
-
     @staticmethod
     def __handle_text_token_setext(
-        output_html: str,
         output_parts: List[HtmlItems],
         adjusted_text_token: str,
-    ) -> str:
+    ) -> None:
         output_parts.append(SetExtTextItem(adjusted_text_token))
 
-        return TextMarkdownToken.__handle_text_token_setext_old(
-            output_html, adjusted_text_token
-        )
-
     @staticmethod
     def __handle_text_token_normal(
-        output_html: str,
         output_parts: List[HtmlItems],
         text_token: "TextMarkdownToken",
         adjusted_text_token: str,
-    ) -> str:
+    ) -> None:
         normal_text_content = TextMarkdownToken.__compose_text_token_normal(
             text_token, adjusted_text_token
         )
         output_parts.append(NormalTextItem(normal_text_content))
 
-        return TextMarkdownToken.__handle_text_token_normal_old(
-            output_html, normal_text_content
-        )
-
     @staticmethod
     def __compose_text_token_normal(
         text_token: "TextMarkdownToken",
@@ -750,29 +729,3 @@ class TextMarkdownToken(InlineMarkdownToken):
         processed_lines.append(current_line)
 
         arrays_to_combine.append(processed_lines)
-
-    @staticmethod
-    def __handle_text_token_code_old(output_html: str, token_parts: List[str]) -> str:
-        token_parts.insert(0, output_html)
-        return "".join(token_parts)
-
-    @staticmethod
-    def __handle_text_token_html_old(output_html: str, token_parts: List[str]) -> str:
-        token_parts.insert(0, output_html)
-        return "".join(token_parts)
-
-    @staticmethod
-    def __handle_text_token_normal_old(
-        output_html: str, normal_text_content: str
-    ) -> str:
-        token_parts: List[str] = [normal_text_content]
-        token_parts.insert(0, output_html)
-        return "".join(token_parts)
-
-    @staticmethod
-    def __handle_text_token_setext_old(
-        output_html: str, adjusted_text_token: str
-    ) -> str:
-        token_parts: List[str] = [adjusted_text_token]
-        token_parts.insert(0, output_html)
-        return "".join(token_parts)
@@ -29,6 +29,11 @@ class ThematicBreakMarkdownToken(LeafMarkdownToken):
     Class to provide for an encapsulation of the thematic break element.
     """
 
+    __slots__ = (
+        "__rest_of_line",
+        "__start_character",
+    )
+
     def __init__(
         self,
         start_character: str,
@@ -40,12 +45,11 @@ class ThematicBreakMarkdownToken(LeafMarkdownToken):
         Initialize an instance of the ThematicBreakMarkdownToken class.
         """
         self.__start_character = start_character
-        self.__extracted_whitespace = extracted_whitespace
         self.__rest_of_line = rest_of_line
         LeafMarkdownToken.__init__(
             self,
             MarkdownToken._token_thematic_break,
-            self.__compose_extra_data_field(),
+            None,
             position_marker=position_marker,
             extracted_whitespace=extracted_whitespace,
         )
@@ -67,25 +71,22 @@ class ThematicBreakMarkdownToken(LeafMarkdownToken):
         """
         return self.__rest_of_line
 
-    def __compose_extra_data_field(self) -> str:
+    @override
+    def _compose_extra_data_field(self) -> str:
         """
         Compose the object's self.extra_data field from the local object's variables.
         """
-        x = MarkdownToken.extra_data_separator.join(
-            [self.__start_character, self.__extracted_whitespace, self.__rest_of_line]
+        return MarkdownToken.extra_data_separator.join(
+            [self.__start_character, self.extracted_whitespace, self.__rest_of_line]
         )
-        self._set_extra_data(x)
-        return x
 
     @override
     def _modify_token(self, field_name: str, field_value: Union[str, int]) -> bool:
         if field_name == "start_character" and isinstance(field_value, str):
             self.__start_character = field_value
-            self.__compose_extra_data_field()
             return True
         if field_name == "rest_of_line" and isinstance(field_value, str):
             self.__rest_of_line = field_value
-            self.__compose_extra_data_field()
             return True
         return super()._modify_token(field_name, field_value)
 
@@ -136,11 +137,10 @@ class ThematicBreakMarkdownToken(LeafMarkdownToken):
 
     @staticmethod
     def __handle_thematic_break_token(
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str:
+    ) -> None:
         _ = (next_token, transform_state)
 
         if (
@@ -156,20 +156,3 @@ class ThematicBreakMarkdownToken(LeafMarkdownToken):
             output_parts.append(FormatOnlyNewLineHtmlItem())
         output_parts.append(HtmlOpenCloseTagItem("hr"))
         output_parts.append(FormatOnlyNewLineHtmlItem())
-
-        return ThematicBreakMarkdownToken.__handle_thematic_break_token_old(
-            output_html,
-        )
-
-    @staticmethod
-    def __handle_thematic_break_token_old(
-        output_html: str,
-    ) -> str:
-        token_parts: List[str] = []
-
-        if output_html and output_html[-1] != ParserHelper.newline_character:
-            token_parts.append(ParserHelper.newline_character)
-
-        token_parts.extend(["<hr />", ParserHelper.newline_character])
-        token_parts.insert(0, output_html)
-        return "".join(token_parts)
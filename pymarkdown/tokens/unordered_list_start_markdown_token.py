@@ -20,6 +20,8 @@ class UnorderedListStartMarkdownToken(ListStartMarkdownToken):
     Class to provide for an encapsulation of the unordered list start element.
     """
 
+    __slots__ = ()
+
     # pylint: disable=too-many-arguments
     def __init__(
         self,
@@ -26,6 +26,12 @@ class UriAutolinkMarkdownToken(InlineMarkdownToken):
     Class to provide for an encapsulation of the inline uri autolink element.
     """
 
+    __slots__ = (
+        "__add_angle_brackets",
+        "__add_http_prefix",
+        "__autolink_text",
+    )
+
     __uri_autolink_html_character_escape_map = {
         "<": "&lt;",
         ">": "&gt;",
@@ -145,11 +151,10 @@ class UriAutolinkMarkdownToken(InlineMarkdownToken):
     @classmethod
     def __handle_uri_autolink(
         cls,
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str:
+    ) -> None:
         _ = transform_state
 
         autolink_token = cast(UriAutolinkMarkdownToken, next_token)
@@ -188,27 +193,3 @@ class UriAutolinkMarkdownToken(InlineMarkdownToken):
             )
         )
         output_parts.append(HtmlCloseTagItem("a"))
-
-        return cls.__handle_uri_autolink_old(
-            output_html, tag_text_parts, autolink_token
-        )
-
-    @classmethod
-    def __handle_uri_autolink_old(
-        cls,
-        output_html: str,
-        tag_text_parts: List[str],
-        autolink_token: "UriAutolinkMarkdownToken",
-    ) -> str:
-        token_parts = [
-            '<a href="',
-            "http://" if autolink_token.add_http_prefix else "",
-            "".join(tag_text_parts),
-            '">',
-            InlineHelper.append_text(
-                "", autolink_token.autolink_text, add_text_signature=False
-            ),
-            "</a>",
-        ]
-        token_parts.insert(0, output_html)
-        return "".join(token_parts)
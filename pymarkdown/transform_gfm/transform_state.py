@@ -27,13 +27,10 @@ class TransformState:
             self.__actual_tokens,
             self.__actual_token_index,
         ) = (False, False, False, False, True, actual_tokens, 0)
-        self.__add_trailing_text: str = ""
-        self.__add_leading_text: str = ""
         self.__add_leading_parts: List[HtmlItems] = []
         self.__add_trailing_parts: List[HtmlItems] = []
         self.__next_token: Optional[MarkdownToken] = None
-        self.__transform_stack: List[str] = []
-        self.__transform_stack_two: List[List[HtmlItems]] = []
+        self.__transform_stack: List[List[HtmlItems]] = []
         self.__last_token: Optional[MarkdownToken] = None
 
     @property
@@ -107,58 +104,24 @@ class TransformState:
         self.__is_in_loose_list = value
 
     @property
-    def transform_stack(self) -> List[str]:
+    def transform_stack(self) -> List[List[HtmlItems]]:
         """
-        Stack used to keep track of scope within the generator.
+        Stack used to keep track of the HtmlItems for each list item that contains
+        the current list item, each ending with the open tag for its list item.
         """
         return self.__transform_stack
 
-    @property
-    def transform_stack_two(self) -> List[List[HtmlItems]]:
-        """
-        Stack used to keep track of HtmlItems scope within the generator.
-        """
-        return self.__transform_stack_two
-
-    @property
-    def add_trailing_text(self) -> str:
-        """
-        Keep track of trailing text.
-        """
-        return self.__add_trailing_text
-
-    @add_trailing_text.setter
-    def add_trailing_text(self, value: str) -> None:
-        """
-        Set trailing text to keep track of.
-        """
-        self.__add_trailing_text = value
-
-    @property
-    def add_leading_text(self) -> str:
-        """
-        Keep track of leading text.
-        """
-        return self.__add_leading_text
-
-    @add_leading_text.setter
-    def add_leading_text(self, value: str) -> None:
-        """
-        Set leading text to keep track of.
-        """
-        self.__add_leading_text = value
-
     @property
     def add_leading_parts(self) -> List[HtmlItems]:
         """
-        Keep track of leading text.
+        Keep track of the items to add before the contents of a list item.
         """
         return self.__add_leading_parts
 
     @property
     def add_trailing_parts(self) -> List[HtmlItems]:
         """
-        Keep track of leading text.
+        Keep track of the items to add after the contents of a list item.
         """
         return self.__add_trailing_parts
 
@@ -2,12 +2,17 @@
 Module to provide for a transformation from markdown tokens to html for GFM.
 """
 
+import io
 import logging
-from typing import List
+from typing import IO, Iterator, List
 
 from pymarkdown.general.parser_helper import ParserHelper
 from pymarkdown.general.parser_logger import ParserLogger
-from pymarkdown.tokens.html_items import FormatOnlyNewLineHtmlItem, HtmlItems
+from pymarkdown.tokens.html_items import (
+    FormatOnlyNewLineHtmlItem,
+    HtmlItems,
+    ListItemContentsHtmlItem,
+)
 from pymarkdown.tokens.markdown_token import MarkdownToken
 from pymarkdown.transform_gfm.transform_state import TransformState
 from pymarkdown.transform_gfm.transform_to_gfm_token_handlers import (
@@ -37,6 +42,10 @@ class TransformToGfm:
         "<ol>",
         '<ol start="',
     ]
+    __start_text_length = max(
+        len(i) for i in add_trailing_text_tokens + ["<blockquote>"]
+    )
+    __end_text_length = len("</ul>")
 
     def __init__(self) -> None:
         """
@@ -48,10 +57,20 @@ class TransformToGfm:
         """
         Transform the tokens into html.
         """
+        output_stream = io.StringIO()
+        self.transform_to_stream(actual_tokens, output_stream)
+        return output_stream.getvalue()
+
+    def transform_to_stream(
+        self, actual_tokens: List[MarkdownToken], output_stream: IO[str]
+    ) -> None:
+        """
+        Transform the tokens into html, writing that html to the stream as each
+        top-level element is completed.
+        """
         POGGER.debug("\n\n---\n")
-        transform_state, output_html, actual_tokens_size = (
+        transform_state, actual_tokens_size = (
             TransformState(actual_tokens),
-            "",
             len(actual_tokens),
         )
 
@@ -62,129 +81,142 @@ class TransformToGfm:
         ), "Initial state must be set properly."
 
         output_parts: List[HtmlItems] = []
+        pending_text = ""
 
         for next_token in transform_state.actual_tokens:
-            output_html = self.__token_handlers.apply_transformation(
+            self.__token_handlers.apply_transformation(
                 transform_state,
                 actual_tokens,
                 actual_tokens_size,
                 next_token,
-                output_html,
                 output_parts,
             )
 
             POGGER.debug("======")
             POGGER.debug(
-                "add_trailing_text-->$<--",
-                transform_state.add_trailing_text,
+                "add_trailing_parts-->$<--",
+                transform_state.add_trailing_parts,
             )
-            POGGER.debug("add_leading_text -->$<--", transform_state.add_leading_text)
-            POGGER.debug("output_html    -->$<--", output_html)
+            POGGER.debug("add_leading_parts -->$<--", transform_state.add_leading_parts)
+            POGGER.debug("output_parts   -->$<--", output_parts)
 
-            if transform_state.add_trailing_text:
-                output_html = self.__apply_trailing_text(
-                    output_html, transform_state, output_parts
-                )
-                POGGER.debug("output_html    -->$<--", output_html)
+            if transform_state.add_trailing_parts:
+                output_parts = self.__apply_trailing_text(transform_state, output_parts)
+                POGGER.debug("output_parts   -->$<--", output_parts)
 
-            if transform_state.add_leading_text:
-                output_html = self.__apply_leading_text(
-                    output_html, transform_state, output_parts
-                )
-                POGGER.debug("output_html    -->$<--", output_html)
+            if transform_state.add_leading_parts:
+                output_parts = self.__apply_leading_text(transform_state, output_parts)
+                POGGER.debug("output_parts   -->$<--", output_parts)
 
             POGGER.debug("------")
             POGGER.debug("next_token     -->$<--", next_token)
-            POGGER.debug("output_html    -->$<--", output_html)
             POGGER.debug("transform_stack-->$<--", transform_state.transform_stack)
-            POGGER.debug(
-                "transform_stack_two-->$<--", transform_state.transform_stack_two
-            )
+
+            # Outside of any list, only the last item is ever looked at again, so
+            # any items before it can be written out.
+            if not transform_state.transform_stack and len(output_parts) > 1:
+                pending_text = self.__write_items(
+                    output_parts[:-1], output_stream, pending_text
+                )
+                del output_parts[:-1]
 
             transform_state.last_token = next_token
             transform_state.actual_token_index += 1
-        if output_html and output_html[-1] == ParserHelper.newline_character:
-            output_html = output_html[:-1]
-        POGGER.debug("output_html    -->$<--", output_html)
-
-        combined_output_parts = "".join([x.get_raw_html_text() for x in output_parts])
-        if (
-            combined_output_parts
-            and combined_output_parts[-1] == ParserHelper.newline_character
-        ):
-            combined_output_parts = combined_output_parts[:-1]
 
-        assert output_html == combined_output_parts
+        pending_text = self.__write_items(output_parts, output_stream, pending_text)
+        if pending_text and pending_text[-1] == ParserHelper.newline_character:
+            pending_text = pending_text[:-1]
+        if pending_text:
+            output_stream.write(pending_text)
 
-        return output_html
+    @staticmethod
+    def __write_items(
+        items_to_write: List[HtmlItems], output_stream: IO[str], pending_text: str
+    ) -> str:
+        """
+        Write the text for each of the items to the stream, holding back the last
+        of that text so that a newline at the very end of the html can be removed.
+        """
+        item_iterators: List[Iterator[HtmlItems]] = [iter(items_to_write)]
+        while item_iterators:
+            next_item = next(item_iterators[-1], None)
+            if next_item is None:
+                item_iterators.pop()
+            elif isinstance(next_item, ListItemContentsHtmlItem):
+                item_iterators.append(iter(next_item.contained_items))
+            elif item_text := next_item.get_raw_html_text():
+                if pending_text:
+                    output_stream.write(pending_text)
+                pending_text = item_text
+        return pending_text
+
+    @staticmethod
+    def __get_text_at_start(output_parts: List[HtmlItems], minimum_length: int) -> str:
+        collected_text: List[str] = []
+        collected_length = 0
+        for next_part in output_parts:
+            if collected_length >= minimum_length:
+                break
+            next_text = next_part.get_raw_html_text()
+            collected_text.append(next_text)
+            collected_length += len(next_text)
+        return "".join(collected_text)
+
+    @staticmethod
+    def __get_text_at_end(output_parts: List[HtmlItems], minimum_length: int) -> str:
+        collected_text: List[str] = []
+        collected_length = 0
+        for next_part in reversed(output_parts):
+            if collected_length >= minimum_length:
+                break
+            next_text = next_part.get_raw_html_text()
+            collected_text.insert(0, next_text)
+            collected_length += len(next_text)
+        return "".join(collected_text)
 
     @classmethod
     def __apply_trailing_text(
-        cls, output_html: str, transform_state: TransformState, abc: List[HtmlItems]
-    ) -> str:
+        cls, transform_state: TransformState, output_parts: List[HtmlItems]
+    ) -> List[HtmlItems]:
         """
-        Apply any trailing text to the output.
+        Apply any trailing text to the output, placing the contents of the list
+        item that just ended into the items for its list.
         """
-        POGGER.debug("__apply_trailing_text>:$:<", output_html)
+        list_parts = transform_state.transform_stack.pop()
+        starting_text = cls.__get_text_at_start(output_parts, cls.__start_text_length)
 
-        g = "".join(i.get_raw_html_text() for i in transform_state.add_trailing_parts)
-        assert g == transform_state.add_trailing_text
+        if starting_text.startswith(tuple(TransformToGfm.add_trailing_text_tokens)):
+            list_parts.append(FormatOnlyNewLineHtmlItem())
+        elif list_parts[-1].get_raw_html_text().endswith(
+            "<li>"
+        ) and starting_text.startswith("<blockquote>"):
+            list_parts.append(FormatOnlyNewLineHtmlItem())
 
-        trailing_part = [transform_state.transform_stack.pop()]
-        stack_elements = transform_state.transform_stack_two.pop()
+        if output_parts:
+            list_parts.append(ListItemContentsHtmlItem(output_parts))
 
-        for next_token_to_test in TransformToGfm.add_trailing_text_tokens:
-            if output_html.startswith(next_token_to_test):
-                trailing_part.append(ParserHelper.newline_character)
-                stack_elements.append(FormatOnlyNewLineHtmlItem())
-                break
-
-        POGGER.debug("trailing_part>:$:<", trailing_part)
-        if trailing_part[-1].endswith("<li>") and output_html.startswith(
-            "<blockquote>"
+        if cls.__get_text_at_end(output_parts, cls.__end_text_length).endswith(
+            ("</ul>", "</ol>")
         ):
-            trailing_part.append(ParserHelper.newline_character)
-            stack_elements.append(FormatOnlyNewLineHtmlItem())
-
-        trailing_part.append(output_html)
-        stack_elements.extend(abc)
-
-        POGGER.debug("trailing_part>:$:<", trailing_part)
-        if output_html.endswith("</ul>") or output_html.endswith("</ol>"):
-            trailing_part.append(ParserHelper.newline_character)
-            stack_elements.append(FormatOnlyNewLineHtmlItem())
-        trailing_part.append(transform_state.add_trailing_text)
-        stack_elements.extend(transform_state.add_trailing_parts)
-
-        combined_text = "".join(trailing_part)
-        POGGER.debug("__apply_trailing_text>:$:<", combined_text)
-        abc.clear()
-        abc.extend(stack_elements)
-        return combined_text
+            list_parts.append(FormatOnlyNewLineHtmlItem())
+        list_parts.extend(transform_state.add_trailing_parts)
+        return list_parts
 
     @classmethod
     def __apply_leading_text(
-        cls, output_html: str, transform_state: TransformState, abc: List[HtmlItems]
-    ) -> str:
+        cls, transform_state: TransformState, output_parts: List[HtmlItems]
+    ) -> List[HtmlItems]:
         """
-        Apply any leading text to the output.
+        Apply any leading text to the output, starting a new list of items for the
+        contents of the list item.
         """
+        ending_text = cls.__get_text_at_end(output_parts, 1)
+        if ending_text and ending_text[-1] != ParserHelper.newline_character:
+            output_parts.append(FormatOnlyNewLineHtmlItem())
+        output_parts.extend(transform_state.add_leading_parts)
 
-        g = "".join(i.get_raw_html_text() for i in transform_state.add_leading_parts)
-        assert g == transform_state.add_leading_text
-
-        if output_html and output_html[-1] != ParserHelper.newline_character:
-            abc.append(FormatOnlyNewLineHtmlItem())
-            output_html = f"{output_html}{ParserHelper.newline_character}{transform_state.add_leading_text}"
-        else:
-            output_html = f"{output_html}{transform_state.add_leading_text}"
-
-        abc.extend(transform_state.add_leading_parts)
-        transform_state.transform_stack.append(output_html)
-        transform_state.transform_stack_two.append(abc[:])
-
-        abc.clear()
-        return ""
+        transform_state.transform_stack.append(output_parts)
+        return []
 
 
 # pylint: enable=too-few-public-methods
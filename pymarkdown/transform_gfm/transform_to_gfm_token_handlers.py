@@ -92,14 +92,11 @@ class TransformToGfmTokenHandlers:
         actual_tokens: List[MarkdownToken],
         actual_tokens_size: int,
         next_token: MarkdownToken,
-        output_html: str,
         output_parts: List[HtmlItems],
-    ) -> str:
+    ) -> None:
         """
         Apply the required tranformation for the current token.
         """
-        transform_state.add_trailing_text = ""
-        transform_state.add_leading_text = ""
         transform_state.add_leading_parts.clear()
         transform_state.add_trailing_parts.clear()
         transform_state.next_token = None
@@ -111,11 +108,7 @@ class TransformToGfmTokenHandlers:
         if next_token.token_name in self.__start_token_handlers:
             start_handler_fn = self.__start_token_handlers[next_token.token_name]
             POGGER.debug("next_token>:$:<", next_token)
-            POGGER.debug("output_html>:$:<", output_html)
-            output_html = start_handler_fn(
-                output_html, output_parts, next_token, transform_state
-            )
-            POGGER.debug("output_html>:$:<", output_html)
+            start_handler_fn(output_parts, next_token, transform_state)
 
         elif next_token.is_end_token:
             end_token = cast(EndMarkdownToken, next_token)
@@ -125,16 +118,11 @@ class TransformToGfmTokenHandlers:
                 )
             end_handler_fn = self.__end_token_handlers[end_token.type_name]
             POGGER.debug("end_token>:$:<", end_token)
-            POGGER.debug("output_html>:$:<", output_html)
-            output_html = end_handler_fn(
-                output_html, output_parts, end_token, transform_state
-            )
-            POGGER.debug("output_html>:$:<", output_html)
+            end_handler_fn(output_parts, end_token, transform_state)
         else:
             raise AssertionError(
                 f"Markdown token type {type(next_token)} not supported."
             )
-        return output_html
 
     # pylint: enable=too-many-arguments
 
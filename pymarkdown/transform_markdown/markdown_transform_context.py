@@ -144,11 +144,10 @@ class StartHtmlTokenTransformProtocol(Protocol):
 
     def __call__(  # noqa: E704
         self,
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str: ...  # pragma: no cover
+    ) -> None: ...  # pragma: no cover
 
 
 # pylint: enable=too-few-public-methods
@@ -162,11 +161,10 @@ class EndHtmlTokenTransformProtocol(Protocol):
 
     def __call__(  # noqa: E704
         self,
-        output_html: str,
         output_parts: List[HtmlItems],
         next_token: MarkdownToken,
         transform_state: TransformState,
-    ) -> str: ...  # pragma: no cover
+    ) -> None: ...  # pragma: no cover
 
 
 # pylint: enable=too-few-public-methods
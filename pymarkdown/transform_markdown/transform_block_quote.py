@@ -53,14 +53,12 @@ class TransformBlockQuote:
             matching_list_token = (
                 container_list_token.last_new_list_token or container_list_token
             )
-            POGGER.debug(
-                f">matching_list_token>{ParserHelper.make_value_visible(matching_list_token)}"
-            )
+            POGGER.debug(">matching_list_token>$", matching_list_token)
 
-            POGGER.debug(f">current_token.line_number>{current_token.line_number}")
+            POGGER.debug(">current_token.line_number>$", current_token.line_number)
             POGGER.debug(
-                ">container_token_stack[token_stack_index].line_number>"
-                + f"{container_list_token.line_number}"
+                ">container_token_stack[token_stack_index].line_number>$",
+                container_list_token.line_number,
             )
 
         if (
@@ -76,12 +74,8 @@ class TransformBlockQuote:
         else:
             already_existing_whitespace = None
 
-        POGGER.debug(
-            f">bquote>current_token>{ParserHelper.make_value_visible(current_token)}"
-        )
-        POGGER.debug(
-            f">bquote>next_token>{ParserHelper.make_value_visible(next_token)}"
-        )
+        POGGER.debug(">bquote>current_token>$", current_token)
+        POGGER.debug(">bquote>next_token>$", next_token)
 
         selected_leading_sequence = (
             ""
@@ -90,13 +84,13 @@ class TransformBlockQuote:
             and current_token.line_number == next_token.line_number
             else new_instance.calculate_next_bleading_space_part()
         )
-        POGGER.debug(f">bquote>selected_leading_sequence>{selected_leading_sequence}<")
+        POGGER.debug(">bquote>selected_leading_sequence>$<", selected_leading_sequence)
 
         POGGER.debug(
-            f">bquote>already_existing_whitespace>:{already_existing_whitespace}:<"
+            ">bquote>already_existing_whitespace>:$:<", already_existing_whitespace
         )
         POGGER.debug(
-            f">bquote>selected_leading_sequence>:{selected_leading_sequence}:<"
+            ">bquote>selected_leading_sequence>:$:<", selected_leading_sequence
         )
         if already_existing_whitespace and selected_leading_sequence.startswith(
             already_existing_whitespace
@@ -105,7 +99,7 @@ class TransformBlockQuote:
                 len(already_existing_whitespace) :
             ]
             POGGER.debug(
-                f">bquote>new selected_leading_sequence>{selected_leading_sequence}<"
+                ">bquote>new selected_leading_sequence>$<", selected_leading_sequence
             )
         return selected_leading_sequence
 
@@ -114,28 +108,26 @@ class TransformBlockQuote:
         context: MarkdownTransformContext, current_token: BlockQuoteMarkdownToken
     ) -> Tuple[int, bool, BlockQuoteMarkdownToken]:
         POGGER.debug(
-            f">bquote>tabbed_bleading_spaces>{ParserHelper.make_value_visible(current_token.tabbed_bleading_spaces)}"
+            ">bquote>tabbed_bleading_spaces>$", current_token.tabbed_bleading_spaces
         )
         new_instance = copy.deepcopy(current_token)
         POGGER.debug(
-            f">bquote>tabbed_bleading_spaces>{ParserHelper.make_value_visible(new_instance.tabbed_bleading_spaces)}"
+            ">bquote>tabbed_bleading_spaces>$", new_instance.tabbed_bleading_spaces
         )
         new_instance.leading_text_index = 0
         context.container_token_stack.append(new_instance)
         context.original_container_token_stack.append(current_token)
         context.container_token_indents.append(IndentAdjustment())
 
-        POGGER.debug(f">bquote>{ParserHelper.make_value_visible(new_instance)}")
-        POGGER.debug(
-            f">self.container_token_stack>{ParserHelper.make_value_visible(context.container_token_stack)}"
-        )
+        POGGER.debug(">bquote>$", new_instance)
+        POGGER.debug(">self.container_token_stack>$", context.container_token_stack)
         token_stack_index = TransformBlockQuote.__search_backward_for_block_quote_start(
             context
         )
         are_tokens_viable = (
             len(context.container_token_stack) > 1 and token_stack_index >= 0
         )
-        POGGER.debug(f">are_tokens_viable>{are_tokens_viable}")
+        POGGER.debug(">are_tokens_viable>$", are_tokens_viable)
         return token_stack_index, are_tokens_viable, new_instance
 
     @staticmethod
@@ -148,9 +140,9 @@ class TransformBlockQuote:
             and context.container_token_stack[token_stack_index].is_block_quote_start
         ):
             token_stack_index -= 1
-        POGGER.debug(f">token_stack_index>{token_stack_index}")
+        POGGER.debug(">token_stack_index>$", token_stack_index)
         POGGER.debug(
-            f">token_stack_token-->{ParserHelper.make_value_visible(context.container_token_stack[token_stack_index])}"
+            ">token_stack_token-->$", context.container_token_stack[token_stack_index]
         )
         return token_stack_index
 
@@ -167,9 +159,7 @@ class TransformBlockQuote:
         #     f"current_start_block_token>:{ParserHelper.make_value_visible(current_start_token)}:<"
         # )
         current_end_token_extra = current_end_token.extra_end_data
-        POGGER.debug(
-            f"current_end_token_extra>:{ParserHelper.make_value_visible(current_end_token_extra)}:<"
-        )
+        POGGER.debug("current_end_token_extra>:$:<", current_end_token_extra)
         start_leading_index = current_start_token.leading_text_index
 
         assert (
@@ -178,12 +168,8 @@ class TransformBlockQuote:
         split_start_leading = current_start_token.bleading_spaces.split(
             ParserHelper.newline_character
         )
-        POGGER.debug(
-            f"start_leading_index>>:{ParserHelper.make_value_visible(start_leading_index)}:<"
-        )
-        POGGER.debug(
-            f"split_start_leading>>:{ParserHelper.make_value_visible(split_start_leading)}:<"
-        )
+        POGGER.debug("start_leading_index>>:$:<", start_leading_index)
+        POGGER.debug("split_start_leading>>:$:<", split_start_leading)
 
         return (
             current_start_token,
@@ -218,18 +204,15 @@ class TransformBlockQuote:
             and current_end_token_extra is not None
             else ""
         )
-        POGGER.debug(
-            f">>{ParserHelper.make_value_visible(actual_tokens[token_index:])}"
-        )
         search_index = token_index + 1
         while (
             search_index < len(actual_tokens)
             and actual_tokens[search_index].is_container_end_token
         ):
             search_index += 1
-        POGGER.debug(f">>{search_index}")
+        POGGER.debug(">>$", search_index)
         any_non_container_end_tokens = search_index < len(actual_tokens)
-        POGGER.debug(f">>{any_non_container_end_tokens}")
+        POGGER.debug(">>$", any_non_container_end_tokens)
 
         del context.container_token_indents[-1]
         if context.container_token_indents and any_non_container_end_tokens:
@@ -29,6 +29,7 @@ class MarkdownChangeRecord:
     item_b: int
     item_c: MarkdownToken
     item_d: Optional[EndMarkdownToken]
+    start_token_index: int
 
 
 # pylint: disable=too-few-public-methods
@@ -47,9 +48,14 @@ class TransformContainers:
         transformed_data_length_before_add: int,
         actual_tokens: List[MarkdownToken],
         new_list_item_map: Dict[str, List[Tuple[int, int, int]]],
+        token_index: int,
     ) -> str:
         """
         Handle the current token as far as it concerns any containers.
+
+        The offsets recorded for the containers are relative to the start of
+        the transformed data, which only needs to hold the text since the
+        outermost open container started.
         """
         if (
             current_token.is_block_quote_start
@@ -62,6 +68,7 @@ class TransformContainers:
                 transformed_data_length_before_add,
                 current_token,
                 new_list_item_map,
+                token_index,
             )
         elif current_token.is_block_quote_end or current_token.is_list_end:
             transformed_data = TransformContainers.__transform_container_end(
@@ -76,6 +83,7 @@ class TransformContainers:
 
     # pylint: enable=too-many-arguments
 
+    # pylint: disable=too-many-arguments
     @staticmethod
     def __transform_container_start(
         container_stack: List[MarkdownToken],
@@ -83,13 +91,19 @@ class TransformContainers:
         transformed_data_length_before_add: int,
         current_token: MarkdownToken,
         new_list_item_map: Dict[str, List[Tuple[int, int, int]]],
+        token_index: int,
     ) -> None:
         if not container_stack:
             container_records.clear()
-        container_stack.append(current_token)
+        if not current_token.is_new_list_item:
+            container_stack.append(current_token)
         container_records.append(
             MarkdownChangeRecord(
-                True, transformed_data_length_before_add, current_token, None
+                True,
+                transformed_data_length_before_add,
+                current_token,
+                None,
+                token_index,
             )
         )
         if current_token.is_list_start:
@@ -112,6 +126,8 @@ class TransformContainers:
         # POGGER.debug(">>" + ParserHelper.make_value_visible(container_stack))
         # POGGER.debug(">>" + ParserHelper.make_value_visible(container_records))
 
+    # pylint: enable=too-many-arguments
+
     # pylint: disable=too-many-arguments
     @staticmethod
     def __transform_container_end(
@@ -123,25 +139,25 @@ class TransformContainers:
         new_list_item_map: Dict[str, List[Tuple[int, int, int]]],
     ) -> str:
         current_end_token = cast(EndMarkdownToken, current_token)
-        POGGER.debug(
-            f"END:{ParserHelper.make_value_visible(current_end_token.start_markdown_token)}"
-        )
-        while container_stack and container_stack[-1].is_new_list_item:
-            container_stack.pop()
-
+        POGGER.debug("END:$", current_end_token.start_markdown_token)
+        started_token = container_stack.pop()
         MarkdownToken.assert_tokens_are_same_except_for_line_number(
-            container_stack.pop(), current_end_token.start_markdown_token
+            started_token, current_end_token.start_markdown_token
         )
+        start_record_index = len(container_records) - 1
+        while container_records[start_record_index].item_c is not started_token:
+            start_record_index -= 1
         container_records.append(
             MarkdownChangeRecord(
                 False,
                 len(transformed_data),
                 current_end_token.start_markdown_token,
                 current_end_token,
+                container_records[start_record_index].start_token_index,
             )
         )
-        POGGER.debug(f">>{ParserHelper.make_value_visible(container_stack)}")
-        POGGER.debug(f">>{ParserHelper.make_value_visible(container_records)}")
+        POGGER.debug(">>$", container_stack)
+        POGGER.debug(">>$", container_records)
 
         if not container_stack:
             record_item = container_records[0]
@@ -153,10 +169,10 @@ class TransformContainers:
                 [],
                 new_list_item_map,
             )
-            POGGER.debug(f"pre>:{transformed_data[: start_index]}:<")
-            POGGER.debug(f"adj>:{adjusted_text}:<")
+            POGGER.debug("pre>:$:<", transformed_data[:start_index])
+            POGGER.debug("adj>:$:<", adjusted_text)
             transformed_data = transformed_data[:start_index] + adjusted_text
-            POGGER.debug(f"trn>:{transformed_data}:<")
+            POGGER.debug("trn>:$:<", transformed_data)
 
         return transformed_data
 
@@ -837,10 +853,7 @@ class TransformContainers:
         record_index = -1
         current_changed_record = None
         is_in_multiline_paragraph = False
-        POGGER.debug(
-            ">>split_container_text>>"
-            + ParserHelper.make_value_visible(split_container_text)
-        )
+        POGGER.debug(">>split_container_text>>$", split_container_text)
 
         for container_line_index, container_line in enumerate(
             split_container_text
@@ -1020,17 +1033,13 @@ class TransformContainers:
         current_changed_record = None
         did_move_ahead = False
 
-        POGGER.debug(f"({container_text_index})")
-        POGGER.debug(
-            f"({record_index + 1}):{ParserHelper.make_value_visible(container_records[1])}"
-        )
+        POGGER.debug("($)", container_text_index)
+        POGGER.debug("($):$", record_index + 1, container_records[1])
         while record_index + 1 < len(container_records) and container_records[
             record_index + 1
         ].item_b <= (container_text_index + container_line_length):
             record_index += 1
-        POGGER.debug(
-            f"({record_index + 1}):{ParserHelper.make_value_visible(container_records[1])}"
-        )
+        POGGER.debug("($):$", record_index + 1, container_records[1])
         removed_token_indices: List[int] = []
         removed_tokens: List[MarkdownToken] = []
         while old_record_index != record_index:
@@ -1047,9 +1056,7 @@ class TransformContainers:
                 removed_token_indices,
             )
 
-        POGGER.debug(
-            f"   removed_tokens={ParserHelper.make_value_visible(removed_tokens)}"
-        )
+        POGGER.debug("   removed_tokens=$", removed_tokens)
         return (
             record_index,
             did_move_ahead,
@@ -1075,7 +1082,9 @@ class TransformContainers:
             container_records[old_record_index + 1],
         )
         POGGER.debug(
-            f"   current_changed_record({str(old_record_index + 1)})-->{ParserHelper.make_value_visible(current_changed_record)}"
+            "   current_changed_record($)-->$",
+            str(old_record_index + 1),
+            current_changed_record,
         )
         if current_changed_record.is_container_start:
             token_stack.append(current_changed_record.item_c)
@@ -1089,13 +1098,9 @@ class TransformContainers:
                 current_changed_record,
             )
 
-        POGGER.debug(
-            f"   -->current_changed_recordx>{ParserHelper.make_value_visible(current_changed_record)}"
-        )
-        POGGER.debug(f"   -->{ParserHelper.make_value_visible(token_stack)}")
-        POGGER.debug(
-            f"   -->{ParserHelper.make_value_visible(container_token_indices)}"
-        )
+        POGGER.debug("   -->current_changed_recordx>$", current_changed_record)
+        POGGER.debug("   -->$", token_stack)
+        POGGER.debug("   -->$", container_token_indices)
         return old_record_index + 1, did_move_ahead, current_changed_record
 
     # pylint: enable=too-many-arguments
@@ -1108,10 +1113,8 @@ class TransformContainers:
         removed_token_indices: List[int],
         current_changed_record: Optional[MarkdownChangeRecord],
     ) -> None:
-        POGGER.debug(f"   -->{ParserHelper.make_value_visible(token_stack)}")
-        POGGER.debug(
-            f"   -->{ParserHelper.make_value_visible(container_token_indices)}"
-        )
+        POGGER.debug("   -->$", token_stack)
+        POGGER.debug("   -->$", container_token_indices)
 
         if token_stack[-1].is_new_list_item:
             removed_tokens.append(token_stack.pop())
@@ -1218,8 +1221,8 @@ class TransformContainers:
         elif token_stack[-1].is_new_list_item:
             token_stack.pop()
             container_token_indices.pop()
-        POGGER.debug(f" -->{ParserHelper.make_value_visible(token_stack)}")
-        POGGER.debug(f" -->{ParserHelper.make_value_visible(container_token_indices)}")
+        POGGER.debug(" -->$", token_stack)
+        POGGER.debug(" -->$", container_token_indices)
 
     # pylint: enable=too-many-arguments,too-many-boolean-expressions
 
@@ -1372,8 +1375,8 @@ class TransformContainers:
         nested_list_start_index = TransformContainers.__get_last_list_index_on_stack(
             token_stack
         )
-        POGGER.debug(f" afbq={len(token_stack) - 1}")
-        POGGER.debug(f" nested_list_start_index={nested_list_start_index}")
+        POGGER.debug(" afbq=$", len(token_stack) - 1)
+        POGGER.debug(" nested_list_start_index=$", nested_list_start_index)
         if nested_list_start_index == -1:
             POGGER.debug(" nope")
             return container_line
@@ -1563,13 +1566,12 @@ class TransformContainers:
                 TransformContainers.__find_last_block_quote_on_stack(token_stack)
             )
             if nested_block_start_index != -1:
-                POGGER.debug(f"nested_block_start_index>{nested_block_start_index}")
+                POGGER.debug("nested_block_start_index>$", nested_block_start_index)
                 previous_token = token_stack[nested_block_start_index]
+                POGGER.debug("previous=$", previous_token)
                 POGGER.debug(
-                    f"previous={ParserHelper.make_value_visible(previous_token)}"
-                )
-                POGGER.debug(
-                    f" applied_leading_spaces_to_start_of_container_line->{applied_leading_spaces_to_start_of_container_line}"
+                    " applied_leading_spaces_to_start_of_container_line->$",
+                    applied_leading_spaces_to_start_of_container_line,
                 )
                 inner_token_index = container_token_indices[nested_block_start_index]
                 # POGGER.debug(
@@ -1670,12 +1672,12 @@ class TransformContainers:
             ParserHelper.newline_character
         )
         POGGER.debug(
-            f"inner_token_index={inner_token_index} < len(split)={len(split_leading_spaces)}"
+            "inner_token_index=$ < len(split)=$",
+            inner_token_index,
+            len(split_leading_spaces),
         )
         assert inner_token_index < len(split_leading_spaces)
-        POGGER.debug(
-            f" adj-->container_line>:{ParserHelper.make_value_visible(container_line)}:<"
-        )
+        POGGER.debug(" adj-->container_line>:$:<", container_line)
 
         token_leading_spaces = split_leading_spaces[inner_token_index]
         if (
@@ -1691,9 +1693,7 @@ class TransformContainers:
             token_leading_spaces = ""
 
         container_line = token_leading_spaces + container_line
-        POGGER.debug(
-            f" adj-->container_line>:{ParserHelper.make_value_visible(container_line)}:<"
-        )
+        POGGER.debug(" adj-->container_line>:$:<", container_line)
         return container_line
 
     # pylint: disable=too-many-arguments
@@ -1831,7 +1831,7 @@ class TransformContainers:
                 removed_block_token.weird_kludge_one is None
                 or removed_block_token.weird_kludge_one <= 1
             )
-            POGGER.debug(f"new_list_item_adjust:{new_list_item_adjust}")
+            POGGER.debug("new_list_item_adjust:$", new_list_item_adjust)
 
             if new_list_item_adjust and container_line:
                 new_list_item_adjust = TransformContainers.__look_for_container_prefix(
@@ -2057,7 +2057,7 @@ class TransformContainers:
             True,
             new_list_item_map,
         )
-        POGGER.debug(f"adj_line->:{adj_line}:")
+        POGGER.debug("adj_line->:$:", adj_line)
         adj_line = TransformContainers.__adjust(
             nested_list_start_index,
             token_stack,
@@ -2067,7 +2067,7 @@ class TransformContainers:
             True,
             new_list_item_map,
         )
-        POGGER.debug(f"adj_line->:{adj_line}:")
+        POGGER.debug("adj_line->:$:", adj_line)
         return adj_line + container_line
 
     # pylint: enable=too-many-arguments
@@ -2082,14 +2082,10 @@ class TransformContainers:
         container_line: str,
         actual_tokens: List[MarkdownToken],
     ) -> Tuple[int, bool, str, bool]:
-        POGGER.debug(
-            f" -->did_move_ahead>{ParserHelper.make_value_visible(did_move_ahead)}"
-        )
-        POGGER.debug(f" -->{ParserHelper.make_value_visible(token_stack)}")
-        POGGER.debug(f" -->{ParserHelper.make_value_visible(container_token_indices)}")
-        POGGER.debug(
-            f" -->current_changed_record>{ParserHelper.make_value_visible(current_changed_record)}"
-        )
+        POGGER.debug(" -->did_move_ahead>$", did_move_ahead)
+        POGGER.debug(" -->$", token_stack)
+        POGGER.debug(" -->$", container_token_indices)
+        POGGER.debug(" -->current_changed_record>$", current_changed_record)
 
         is_list_start_after_two_block_starts = (
             TransformContainers.__apply_primary_transformation_start(
@@ -2152,7 +2148,7 @@ class TransformContainers:
         last_container_token_index: int,
         container_line: str,
     ) -> Tuple[str, bool]:
-        POGGER.debug(f" container->{ParserHelper.make_value_visible(token_stack[-1])}")
+        POGGER.debug(" container->$", token_stack[-1])
         did_adjust_due_to_block_quote_start = False
         tabbed_leading_space: Optional[str] = None
         if token_stack[-1].is_block_quote_start:
@@ -2184,18 +2180,14 @@ class TransformContainers:
         if split_leading_spaces is not None and last_container_token_index < len(
             split_leading_spaces
         ):
-            POGGER.debug(f" -->{ParserHelper.make_value_visible(split_leading_spaces)}")
-            POGGER.debug(
-                f" primary-->container_line>:{ParserHelper.make_value_visible(container_line)}:<"
-            )
+            POGGER.debug(" -->$", split_leading_spaces)
+            POGGER.debug(" primary-->container_line>:$:<", container_line)
             container_line = (
                 tabbed_leading_space + container_line
                 if tabbed_leading_space
                 else split_leading_spaces[last_container_token_index] + container_line
             )
-            POGGER.debug(
-                f" -->container_line>:{ParserHelper.make_value_visible(container_line)}:<"
-            )
+            POGGER.debug(" -->container_line>:$:<", container_line)
         else:
             did_adjust_due_to_block_quote_start = False
         return container_line, did_adjust_due_to_block_quote_start
@@ -2207,10 +2199,8 @@ class TransformContainers:
     ) -> bool:
         if current_changed_record and current_changed_record.item_c.is_list_start:
             list_start_token = current_changed_record.item_c
-            list_start_token_index = actual_tokens.index(list_start_token)
-            POGGER.debug(
-                f" -->list_start_token_index>{ParserHelper.make_value_visible(list_start_token_index)}"
-            )
+            list_start_token_index = current_changed_record.start_token_index
+            POGGER.debug(" -->list_start_token_index>$", list_start_token_index)
 
             # pylint: disable=too-many-boolean-expressions
             if (
@@ -2246,7 +2236,7 @@ class TransformContainers:
             if line_to_surpass > line_number:
                 calculated_indent_level = new_indent_level
         delta = calculated_indent_level - len(container_line)
-        POGGER.debug(f"delta->{delta}")
+        POGGER.debug("delta->$", delta)
         container_line += " " * delta
         return container_line
 
@@ -2286,13 +2276,13 @@ class TransformContainers:
         inner_token_index = container_token_indices[nested_list_start_index]
         assert inner_token_index < len(split_leading_spaces)
         POGGER.debug(
-            f"inner_index->{str(container_token_indices[nested_list_start_index])}"
+            "inner_index->$", str(container_token_indices[nested_list_start_index])
         )
         if apply_change_to_container_line:
             container_line = split_leading_spaces[inner_token_index] + container_line
         container_token_indices[nested_list_start_index] += 1
         POGGER.debug(
-            f"inner_index->{str(container_token_indices[nested_list_start_index])}"
+            "inner_index->$", str(container_token_indices[nested_list_start_index])
         )
         return container_line
 
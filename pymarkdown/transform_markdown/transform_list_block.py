@@ -40,13 +40,11 @@ class TransformListBlock:
         assert (
             next_token is not None
         ), "If there is a start token, must be at least an end token."
-        POGGER.debug(
-            f">>current_token>>{ParserHelper.make_value_visible(current_token)}<<"
-        )
+        POGGER.debug(">>current_token>>$<<", current_token)
         current_list_token = cast(ListStartMarkdownToken, current_token)
 
         extracted_whitespace = current_list_token.extracted_whitespace
-        POGGER.debug(f">>extracted_whitespace>>{extracted_whitespace}<<")
+        POGGER.debug(">>extracted_whitespace>>$<<", extracted_whitespace)
         had_weird_block_quote_in_list = False
         if previous_token:
             (
@@ -62,8 +60,8 @@ class TransformListBlock:
                 previous_token,
                 extracted_whitespace,
             )
-            POGGER.debug(f">>extracted_whitespace>>{extracted_whitespace}<<")
-            POGGER.debug(f">>post_adjust_whitespace>>{post_adjust_whitespace}<<")
+            POGGER.debug(">>extracted_whitespace>>$<<", extracted_whitespace)
+            POGGER.debug(">>post_adjust_whitespace>>$<<", post_adjust_whitespace)
         else:
             previous_indent, post_adjust_whitespace, was_within_block_token = (
                 0,
@@ -72,16 +70,14 @@ class TransformListBlock:
             )
 
         POGGER.debug(
-            f">>had_weird_block_quote_in_list>>{had_weird_block_quote_in_list}<<"
+            ">>had_weird_block_quote_in_list>>$<<", had_weird_block_quote_in_list
         )
         context.container_token_stack.append(copy.deepcopy(current_list_token))
         context.original_container_token_stack.append(current_list_token)
         context.container_token_indents.append(IndentAdjustment())
 
-        POGGER.debug(f">>extracted_whitespace>>{extracted_whitespace}<<")
-        POGGER.debug(
-            f">>transformed_data>>{ParserHelper.make_value_visible(transformed_data)}<<"
-        )
+        POGGER.debug(">>extracted_whitespace>>$<<", extracted_whitespace)
+        POGGER.debug(">>transformed_data>>$<<", transformed_data)
 
         if was_within_block_token:
             adjustment_since_newline = 0
@@ -92,8 +88,8 @@ class TransformListBlock:
             ) = TransformListBlock.adjust_whitespace_for_block_quote(
                 transformed_data, extracted_whitespace
             )
-        POGGER.debug(f">>adjustment_since_newline>>{adjustment_since_newline}<<")
-        POGGER.debug(f">>extracted_whitespace>>{extracted_whitespace}<<")
+        POGGER.debug(">>adjustment_since_newline>>$<<", adjustment_since_newline)
+        POGGER.debug(">>extracted_whitespace>>$<<", extracted_whitespace)
 
         return TransformListBlock.__rehydrate_list_start_calculate_start(
             current_list_token,
@@ -157,7 +153,7 @@ class TransformListBlock:
         #     transformed_data_since_newline
         # )
         POGGER.debug(
-            f">>transformed_data_since_newline>>:{transformed_data_since_newline}:<<"
+            ">>transformed_data_since_newline>>:$:<<", transformed_data_since_newline
         )
         # POGGER.debug(f">>adjustment_since_newline>>:{adjustment_since_newline}:<<")
         # POGGER.debug(
@@ -171,8 +167,8 @@ class TransformListBlock:
         # ):
         #     adjustment_since_newline = transformed_data_since_newline_size
         #     extracted_whitespace = extracted_whitespace[adjustment_since_newline:]
-        POGGER.debug(f">>adjustment_since_newline>>:{adjustment_since_newline}:<<")
-        POGGER.debug(f">>extracted_whitespace>>:{extracted_whitespace}:<<")
+        POGGER.debug(">>adjustment_since_newline>>:$:<<", adjustment_since_newline)
+        POGGER.debug(">>extracted_whitespace>>:$:<<", extracted_whitespace)
         return adjustment_since_newline, extracted_whitespace
 
     @staticmethod
@@ -246,11 +242,11 @@ class TransformListBlock:
                 previous_token,
             )
 
-        POGGER.debug(f"xx>>previous_indent:{previous_indent}:")
-        POGGER.debug(f"xx>>extracted_whitespace:{extracted_whitespace}:")
-        POGGER.debug(f"xx>>was_within_block_token:{was_within_block_token}:")
-        POGGER.debug(f"xx>>post_adjust_whitespace:{post_adjust_whitespace}:")
-        POGGER.debug(f"xx>>did_container_start_midline:{did_container_start_midline}:")
+        POGGER.debug("xx>>previous_indent:$:", previous_indent)
+        POGGER.debug("xx>>extracted_whitespace:$:", extracted_whitespace)
+        POGGER.debug("xx>>was_within_block_token:$:", was_within_block_token)
+        POGGER.debug("xx>>post_adjust_whitespace:$:", post_adjust_whitespace)
+        POGGER.debug("xx>>did_container_start_midline:$:", did_container_start_midline)
         return (
             previous_indent,
             extracted_whitespace,
@@ -276,27 +272,22 @@ class TransformListBlock:
     ]:
         previous_indent, was_within_block_token = 0, False
         post_adjust_whitespace: Optional[str] = None
+        POGGER.debug("rlspt>>current_token>>$<<", current_token)
+        POGGER.debug("rlspt>>previous_token>>$<<", previous_token)
+        POGGER.debug("rlspt>>extracted_whitespace>>$<<", extracted_whitespace)
         POGGER.debug(
-            f"rlspt>>current_token>>{ParserHelper.make_value_visible(current_token)}<<"
-        )
-        POGGER.debug(
-            f"rlspt>>previous_token>>{ParserHelper.make_value_visible(previous_token)}<<"
-        )
-        POGGER.debug(
-            f"rlspt>>extracted_whitespace>>{ParserHelper.make_value_visible(extracted_whitespace)}<<"
-        )
-        POGGER.debug(
-            f"rls>>self.context.container_token_stack>>{ParserHelper.make_value_visible(context.container_token_stack)}<<"
+            "rls>>self.context.container_token_stack>>$<<",
+            context.container_token_stack,
         )
         containing_block_quote_token = TransformListBlock.__look_for_last_block_token(
             context
         )
         POGGER.debug(
-            f"rls>>containing_block_quote_token>>{ParserHelper.make_value_visible(containing_block_quote_token)}<<"
+            "rls>>containing_block_quote_token>>$<<", containing_block_quote_token
         )
 
         token_stack_index = len(context.container_token_stack) - 1
-        POGGER.debug(f"rls>>token_stack_index2>>{token_stack_index}<<")
+        POGGER.debug("rls>>token_stack_index2>>$<<", token_stack_index)
 
         containing_list_token, deeper_containing_block_quote_token = None, None
         if (
@@ -346,11 +337,9 @@ class TransformListBlock:
             if ParserHelper.newline_character in previous_block_token.bleading_spaces
             else len(previous_block_token.bleading_spaces)
         )
+        POGGER.debug("adj->current_token>>:$:<<", current_token)
         POGGER.debug(
-            f"adj->current_token>>:{ParserHelper.make_value_visible(current_token)}:<<"
-        )
-        POGGER.debug(
-            f"adj->containing_block_quote_token>>:{ParserHelper.make_value_visible(containing_block_quote_token)}:<<"
+            "adj->containing_block_quote_token>>:$:<<", containing_block_quote_token
         )
         assert (
             current_token.line_number == containing_block_quote_token.line_number
@@ -365,7 +354,9 @@ class TransformListBlock:
         block_quote_leading_space_length = len(block_quote_leading_space)
 
         POGGER.debug(
-            f"bq->len>>:{block_quote_leading_space}: {block_quote_leading_space_length}"
+            "bq->len>>:$: $",
+            block_quote_leading_space,
+            block_quote_leading_space_length,
         )
 
         post_adjust_whitespace = "".ljust(
@@ -373,7 +364,9 @@ class TransformListBlock:
         )
         extracted_whitespace = ""
         POGGER.debug(
-            f"post_adjust_whitespace:{post_adjust_whitespace}: extracted_whitespace:{extracted_whitespace}:"
+            "post_adjust_whitespace:$: extracted_whitespace:$:",
+            post_adjust_whitespace,
+            extracted_whitespace,
         )
         return previous_indent, post_adjust_whitespace, extracted_whitespace
 
@@ -388,9 +381,9 @@ class TransformListBlock:
             )
         )
         previous_indent = len(block_quote_leading_space)
-        POGGER.debug(f"adj->rls>>previous_indent>>:{previous_indent}:<<")
+        POGGER.debug("adj->rls>>previous_indent>>:$:<<", previous_indent)
         POGGER.debug(
-            f"adj->rls>>current_token.indent_level>>:{current_token.indent_level}:<<"
+            "adj->rls>>current_token.indent_level>>:$:<<", current_token.indent_level
         )
 
         return True, previous_indent
@@ -484,9 +477,7 @@ class TransformListBlock:
             ),
             None,
         )
-        POGGER.debug(
-            f">>found_block_token>>{ParserHelper.make_value_visible(found_token)}<"
-        )
+        POGGER.debug(">>found_block_token>>$<", found_token)
         return cast(BlockQuoteMarkdownToken, found_token) if found_token else None
 
     @staticmethod
@@ -544,15 +535,17 @@ class TransformListBlock:
         list_start_content_length: int,
         current_token: Union[ListStartMarkdownToken, NewListItemMarkdownToken],
     ) -> str:
-        POGGER.debug(f"adj->starting_whitespace>>:{starting_whitespace}:<<")
+        POGGER.debug("adj->starting_whitespace>>:$:<<", starting_whitespace)
         POGGER.debug(
-            f"adj->containing_list_token.indent_level>>:{containing_list_token.indent_level}:<<"
+            "adj->containing_list_token.indent_level>>:$:<<",
+            containing_list_token.indent_level,
         )
         POGGER.debug(
-            f"adj->block_quote_leading_space_length>>:{block_quote_leading_space_length}:<<"
+            "adj->block_quote_leading_space_length>>:$:<<",
+            block_quote_leading_space_length,
         )
-        POGGER.debug(f"adj->list_leading_space_length>>:{list_leading_space_length}:<<")
-        POGGER.debug(f"list_start_content_length:{list_start_content_length}:<<")
+        POGGER.debug("adj->list_leading_space_length>>:$:<<", list_leading_space_length)
+        POGGER.debug("list_start_content_length:$:<<", list_start_content_length)
 
         pad_to_length = (
             current_token.column_number - 1
@@ -564,10 +557,10 @@ class TransformListBlock:
                 - list_start_content_length
             )
         )
-        POGGER.debug(f"pad_to_length:{pad_to_length}:<<")
-        POGGER.debug(f"adj->starting_whitespace>>:{starting_whitespace}:<<")
+        POGGER.debug("pad_to_length:$:<<", pad_to_length)
+        POGGER.debug("adj->starting_whitespace>>:$:<<", starting_whitespace)
         post_adjust_whitespace = starting_whitespace.ljust(pad_to_length, " ")
-        POGGER.debug(f"adj->post_adjust_whitespace>>:{post_adjust_whitespace}:<<")
+        POGGER.debug("adj->post_adjust_whitespace>>:$:<<", post_adjust_whitespace)
         return post_adjust_whitespace
 
     # pylint: enable=too-many-arguments
@@ -582,16 +575,14 @@ class TransformListBlock:
         white_space_length = (
             len(current_token.extracted_whitespace) + block_quote_leading_space_length
         )
-        POGGER.debug(f"adj->len(ws)>>:{white_space_length}:<<")
+        POGGER.debug("adj->len(ws)>>:$:<<", white_space_length)
         extracted_whitespace = (
             "".ljust(white_space_length - previous_indent, " ")
             if white_space_length > previous_indent
             else ""
         )
-        POGGER.debug(f"adj->previous_indent>>:{previous_indent}:<<")
-        POGGER.debug(
-            f"adj->extracted_whitespace>>:{ParserHelper.make_value_visible(extracted_whitespace)}:<<"
-        )
+        POGGER.debug("adj->previous_indent>>:$:<<", previous_indent)
+        POGGER.debug("adj->extracted_whitespace>>:$:<<", extracted_whitespace)
         return previous_indent, extracted_whitespace
 
     @staticmethod
@@ -601,15 +592,14 @@ class TransformListBlock:
         deeper_containing_block_quote_token: BlockQuoteMarkdownToken,
         current_token: Union[ListStartMarkdownToken, NewListItemMarkdownToken],
     ) -> Tuple[bool, str, bool, int, bool]:
-        POGGER.debug(
-            f"previous_token:{ParserHelper.make_value_visible(previous_token)}:"
-        )
+        POGGER.debug("previous_token:$:", previous_token)
         # if previous_token.is_end_token:
         #     POGGER.debug(
         #         f"previous_token.start_markdown_token:{previous_token.start_markdown_token}:"
         #     )
         POGGER.debug(
-            f"deeper_containing_block_quote_token:{ParserHelper.make_value_visible(deeper_containing_block_quote_token)}:"
+            "deeper_containing_block_quote_token:$:",
+            deeper_containing_block_quote_token,
         )
         had_weird_block_quote_in_list = False
         do_perform_block_quote_ending = False
@@ -617,15 +607,17 @@ class TransformListBlock:
             previous_end_token = cast(EndMarkdownToken, previous_token)
             if previous_end_token.start_markdown_token.is_block_quote_start:
                 had_weird_block_quote_in_list = True
-                POGGER.debug(f"previous_token:{previous_token}:")
+                POGGER.debug("previous_token:$:", previous_token)
                 POGGER.debug(
-                    f"previous_token.start_markdown_token:{previous_end_token.start_markdown_token}:"
+                    "previous_token.start_markdown_token:$:",
+                    previous_end_token.start_markdown_token,
                 )
                 block_quote_token = cast(
                     BlockQuoteMarkdownToken, previous_end_token.start_markdown_token
                 )
                 POGGER.debug(
-                    f"previous_token.start_markdown_token.leading_spaces:{block_quote_token.bleading_spaces}:"
+                    "previous_token.start_markdown_token.leading_spaces:$:",
+                    block_quote_token.bleading_spaces,
                 )
                 assert (
                     block_quote_token.bleading_spaces is not None
@@ -634,15 +626,15 @@ class TransformListBlock:
                     block_quote_token.bleading_spaces, "\n"
                 )
                 previous_start_line = block_quote_token.line_number
-                POGGER.debug(f"newline_count:{newline_count}:")
-                POGGER.debug(f"previous_start_line:{previous_start_line}:")
+                POGGER.debug("newline_count:$:", newline_count)
+                POGGER.debug("previous_start_line:$:", previous_start_line)
                 projected_start_line = previous_start_line + (
                     newline_count + 1
                 )  # 044lld off by 2  044lle off by 1
                 if block_quote_token.weird_kludge_two:
                     projected_start_line += block_quote_token.weird_kludge_two
-                POGGER.debug(f"projected_start_line:{projected_start_line}:")
-                POGGER.debug(f"current_token.line_number:{current_token.line_number}:")
+                POGGER.debug("projected_start_line:$:", projected_start_line)
+                POGGER.debug("current_token.line_number:$:", current_token.line_number)
                 do_perform_block_quote_ending = (
                     projected_start_line != current_token.line_number
                 )
@@ -663,11 +655,9 @@ class TransformListBlock:
             deeper_containing_block_quote_token,
             had_weird_block_quote_in_list,
         )
-        POGGER.debug(
-            f"block_quote_leading_space:{ParserHelper.make_value_visible(block_quote_leading_space)}:"
-        )
+        POGGER.debug("block_quote_leading_space:$:", block_quote_leading_space)
 
-        POGGER.debug(f"starting_whitespace:{starting_whitespace}:")
+        POGGER.debug("starting_whitespace:$:", starting_whitespace)
         return (
             check_list_for_indent,
             starting_whitespace,
@@ -694,9 +684,7 @@ class TransformListBlock:
                 previous_token.is_end_token
             ), "Block quote ending must indicate an end token."
             previous_end_token = cast(EndMarkdownToken, previous_token)
-            POGGER.debug(
-                f">>{ParserHelper.make_value_visible(previous_end_token.start_markdown_token)}"
-            )
+            POGGER.debug(">>$", previous_end_token.start_markdown_token)
             previous_block_quote_token = cast(
                 BlockQuoteMarkdownToken, previous_end_token.start_markdown_token
             )
@@ -706,10 +694,8 @@ class TransformListBlock:
             split_leading_spaces = previous_block_quote_token.bleading_spaces.split(
                 ParserHelper.newline_character
             )
-            POGGER.debug(f"split_leading_spaces>>{split_leading_spaces}")
-            POGGER.debug(
-                f"current_token>>{ParserHelper.make_value_visible(current_token)}"
-            )
+            POGGER.debug("split_leading_spaces>>$", split_leading_spaces)
+            POGGER.debug("current_token>>$", current_token)
             # if (
             #     current_token.is_new_list_item
             #     and len(split_leading_spaces) <= 2
@@ -729,18 +715,19 @@ class TransformListBlock:
                 deeper_containing_block_quote_token is not None
             ), "This condition must exist for the logic to be here."
             POGGER.debug(
-                f"adj->deeper_containing_block_quote_token.line_number>>:{deeper_containing_block_quote_token.line_number}:<<"
+                "adj->deeper_containing_block_quote_token.line_number>>:$:<<",
+                deeper_containing_block_quote_token.line_number,
             )
 
             POGGER.debug(
-                f"adj->current_token.line_number>>:{current_token.line_number}:<<"
+                "adj->current_token.line_number>>:$:<<", current_token.line_number
             )
             # line_number_delta = ParserHelper.count_newlines_in_text(transformed_data) - current_token.line_number
             line_number_delta = (
                 current_token.line_number
                 - deeper_containing_block_quote_token.line_number
             )
-            POGGER.debug(f"index:{line_number_delta}")
+            POGGER.debug("index:$", line_number_delta)
             assert deeper_containing_block_quote_token
             # if deeper_containing_block_quote_token:
             adjust_token_index = next(  # pragma: no cover
@@ -766,9 +753,7 @@ class TransformListBlock:
                     ParserHelper.newline_character
                 )
             )
-            POGGER.debug(
-                f"split_leading_spaces:{ParserHelper.make_value_visible(split_leading_spaces)}"
-            )
+            POGGER.debug("split_leading_spaces:$", split_leading_spaces)
 
             block_quote_leading_space = split_leading_spaces[line_number_delta]
             if had_weird_block_quote_in_list:
@@ -797,13 +782,13 @@ class TransformListBlock:
             if current_token.is_unordered_list_start
             else f"{extracted_whitespace}{current_token.list_start_content}{current_token.list_start_sequence}"
         )
-        POGGER.debug(f">>start_sequence>>:{start_sequence}:<<")
+        POGGER.debug(">>start_sequence>>:$:<<", start_sequence)
         old_start_sequence = start_sequence
         if next_token.is_blank_line:
             POGGER.debug("blank-line")
-            POGGER.debug(f">>next_token.column_number>>:{next_token.column_number}:<<")
+            POGGER.debug(">>next_token.column_number>>:$:<<", next_token.column_number)
             POGGER.debug(
-                f">>current_token.column_number>>:{current_token.column_number}:<<"
+                ">>current_token.column_number>>:$:<<", current_token.column_number
             )
             list_content_length = 1
             if not current_token.is_unordered_list_start:
@@ -824,19 +809,17 @@ class TransformListBlock:
             # POGGER.debug(
             #     f">>current_token.indent_level>>:{current_token.indent_level}:<<"
             # )
-            POGGER.debug(f">>previous_indent>>:{previous_indent}:<<")
-            POGGER.debug(f">>adjustment_since_newline>>:{adjustment_since_newline}:<<")
+            POGGER.debug(">>previous_indent>>:$:<<", previous_indent)
+            POGGER.debug(">>adjustment_since_newline>>:$:<<", adjustment_since_newline)
             requested_indent = (
                 current_token.indent_level
                 + len(extracted_whitespace)
                 - (current_token.column_number - 1)
             )
-            POGGER.debug(f">>requested_indent>>:{requested_indent}:<<")
+            POGGER.debug(">>requested_indent>>:$:<<", requested_indent)
             start_sequence = start_sequence.ljust(requested_indent, " ")
-        POGGER.debug(
-            f">>current_token>>:{ParserHelper.make_value_visible(current_token)}:<<"
-        )
-        POGGER.debug(f">>next_token>>:{ParserHelper.make_value_visible(next_token)}:<<")
+        POGGER.debug(">>current_token>>:$:<<", current_token)
+        POGGER.debug(">>next_token>>:$:<<", next_token)
 
         start_sequence = TransformListBlock.__rehydrate_list_start_calculate_start_calc(
             current_token,
@@ -856,28 +839,26 @@ class TransformListBlock:
         old_start_sequence: str,
         post_adjust_whitespace: Optional[str],
     ) -> str:
-        POGGER.debug(f">>tabbed_adjust>>:{str(current_token.tabbed_adjust)}:<<")
+        POGGER.debug(">>tabbed_adjust>>:$:<<", str(current_token.tabbed_adjust))
         if current_token.tabbed_adjust >= 0:
-            POGGER.debug(f">>start_sequence>>:{start_sequence}:<<")
-            POGGER.debug(f">>old_start_sequence>>:{old_start_sequence}:<<")
+            POGGER.debug(">>start_sequence>>:$:<<", start_sequence)
+            POGGER.debug(">>old_start_sequence>>:$:<<", old_start_sequence)
             spaces_to_consume = current_token.tabbed_adjust + 1
-            POGGER.debug(f">>spaces_to_consume>>:{str(spaces_to_consume)}:<<")
+            POGGER.debug(">>spaces_to_consume>>:$:<<", str(spaces_to_consume))
             start_sequence = (
                 start_sequence[: len(old_start_sequence)]
                 + "\t"
                 + start_sequence[len(old_start_sequence) + spaces_to_consume :]
             )
-            POGGER.debug(
-                f">>start_sequence>>:{ParserHelper.make_value_visible(start_sequence)}:<<"
-            )
+            POGGER.debug(">>start_sequence>>:$:<<", start_sequence)
 
-        POGGER.debug(f"<<start_sequence<<:{start_sequence}:<<")
+        POGGER.debug("<<start_sequence<<:$:<<", start_sequence)
         if post_adjust_whitespace:
             POGGER.debug(
-                f"<<post_adjust_whitespace<<(post):{post_adjust_whitespace}:<<"
+                "<<post_adjust_whitespace<<(post):$:<<", post_adjust_whitespace
             )
             start_sequence = post_adjust_whitespace + start_sequence
-            POGGER.debug(f"<<start_sequence<<(post):{start_sequence}:<<")
+            POGGER.debug("<<start_sequence<<(post):$:<<", start_sequence)
 
         if current_token.tabbed_extracted_whitespace is not None:
             start_sequence = (
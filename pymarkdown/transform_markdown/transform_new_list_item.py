@@ -61,8 +61,8 @@ class TransformNewListItem:
         ) = TransformListBlock.adjust_whitespace_for_block_quote(
             transformed_data, current_list_token.extracted_whitespace
         )
-        POGGER.debug(f"rnli->adjustment_since_newline>:{adjustment_since_newline}:")
-        POGGER.debug(f"rnli->extracted_whitespace>:{extracted_whitespace}:")
+        POGGER.debug("rnli->adjustment_since_newline>:$:", adjustment_since_newline)
+        POGGER.debug("rnli->extracted_whitespace>:$:", extracted_whitespace)
 
         did_container_start_midline = False
         had_weird_block_quote_in_list = False
@@ -81,11 +81,11 @@ class TransformNewListItem:
         )
         # else:
         #     previous_indent, post_adjust_whitespace = (0, None)
-        POGGER.debug(f">>previous_indent>>{previous_indent}<<")
-        POGGER.debug(f">>extracted_whitespace2>>{extracted_whitespace2}<<")
-        POGGER.debug(f">>post_adjust_whitespace>>{post_adjust_whitespace}<<")
+        POGGER.debug(">>previous_indent>>$<<", previous_indent)
+        POGGER.debug(">>extracted_whitespace2>>$<<", extracted_whitespace2)
+        POGGER.debug(">>post_adjust_whitespace>>$<<", post_adjust_whitespace)
         POGGER.debug(
-            f">>had_weird_block_quote_in_list>>{had_weird_block_quote_in_list}<<"
+            ">>had_weird_block_quote_in_list>>$<<", had_weird_block_quote_in_list
         )
 
         adjustment_since_newline = (
@@ -101,15 +101,15 @@ class TransformNewListItem:
             else extracted_whitespace
         )
 
-        POGGER.debug(f"rnli->whitespace_to_use>:{whitespace_to_use}:")
-        POGGER.debug(f"rnli->adjustment_since_newline>:{adjustment_since_newline}:")
-        POGGER.debug(f"rnli->extracted_whitespace>:{extracted_whitespace}:")
+        POGGER.debug("rnli->whitespace_to_use>:$:", whitespace_to_use)
+        POGGER.debug("rnli->adjustment_since_newline>:$:", adjustment_since_newline)
+        POGGER.debug("rnli->extracted_whitespace>:$:", extracted_whitespace)
         start_sequence = (
             f"{whitespace_to_use}{current_list_token.list_start_content}"
             + f"{list_start_token.list_start_sequence}"
         )
 
-        POGGER.debug(f"rnli->start_sequence>:{start_sequence}:")
+        POGGER.debug("rnli->start_sequence>:$:", start_sequence)
         start_sequence = (
             TransformNewListItem.__rehydrate_next_list_item_blank_line(
                 start_sequence, current_list_token, next_token
@@ -126,7 +126,7 @@ class TransformNewListItem:
                 )
             )
         )
-        POGGER.debug(f"rnli->start_sequence>:{start_sequence}:")
+        POGGER.debug("rnli->start_sequence>:$:", start_sequence)
         return start_sequence
 
     # pylint: enable=too-many-locals
@@ -178,27 +178,31 @@ class TransformNewListItem:
             POGGER.debug("did not start midline")
             calculated_indent = list_start_token.indent_level - adjustment_since_newline
             POGGER.debug(
-                f"calculated_indent:{calculated_indent} = indent_level:{list_start_token.indent_level} - adjustment_since_newline:{adjustment_since_newline}"
+                "calculated_indent:$ = indent_level:$ - adjustment_since_newline:$",
+                calculated_indent,
+                list_start_token.indent_level,
+                adjustment_since_newline,
             )
             POGGER.debug(
-                f"had_weird_block_quote_in_list:{had_weird_block_quote_in_list}"
+                "had_weird_block_quote_in_list:$", had_weird_block_quote_in_list
             )
             if had_weird_block_quote_in_list:
-                POGGER.debug(f"calculated_indent:{calculated_indent}")
+                POGGER.debug("calculated_indent:$", calculated_indent)
                 calculated_indent += 2
-                POGGER.debug(f"calculated_indent:{calculated_indent}")
+                POGGER.debug("calculated_indent:$", calculated_indent)
             POGGER.debug(
-                f"rnli->calculated_indent={calculated_indent} = "
-                + f"indent_level={list_start_token.indent_level} - "
-                + f"adjustment_since_newline={adjustment_since_newline}"
+                "rnli->calculated_indent=$ = indent_level=$ - adjustment_since_newline=$",
+                calculated_indent,
+                list_start_token.indent_level,
+                adjustment_since_newline,
             )
-            POGGER.debug(f"start_sequence:{start_sequence}")
+            POGGER.debug("start_sequence:$", start_sequence)
             start_sequence = start_sequence.ljust(calculated_indent, " ")
 
             # TODO This is a kludge.  The calc_indent is not properly computed.
             if not start_sequence.endswith(" "):
                 start_sequence = f"{start_sequence} "
-            POGGER.debug(f"start_sequence:{start_sequence}")
+            POGGER.debug("start_sequence:$", start_sequence)
         return start_sequence
 
     # pylint: enable=too-many-arguments
@@ -209,9 +213,9 @@ class TransformNewListItem:
         current_token: NewListItemMarkdownToken,
         next_token: MarkdownToken,
     ) -> str:
-        POGGER.debug(f">>next_token.column_number>>:{next_token.column_number}:<<")
+        POGGER.debug(">>next_token.column_number>>:$:<<", next_token.column_number)
         POGGER.debug(
-            f">>current_token.column_number>>:{current_token.column_number}:<<"
+            ">>current_token.column_number>>:$:<<", current_token.column_number
         )
         start_content_length = 1
         if current_token.list_start_content:
@@ -230,9 +234,7 @@ class TransformNewListItem:
         adjustment_since_newline: int,
         current_token: MarkdownToken,
     ) -> int:
-        POGGER.debug(
-            f"rnli->container_token_stack>:{ParserHelper.make_value_visible(context.container_token_stack)}:"
-        )
+        POGGER.debug("rnli->container_token_stack>:$:", context.container_token_stack)
         stack_index = len(context.container_token_stack) - 1
         found_block_quote_token: Optional[BlockQuoteMarkdownToken] = None
         while stack_index >= 0:
@@ -242,9 +244,7 @@ class TransformNewListItem:
                 )
                 break
             stack_index -= 1
-        POGGER.debug(
-            f"rnli->found_block_quote_token>:{ParserHelper.make_value_visible(found_block_quote_token)}:"
-        )
+        POGGER.debug("rnli->found_block_quote_token>:$:", found_block_quote_token)
         if found_block_quote_token:
             line_number_delta = (
                 current_token.line_number - found_block_quote_token.line_number
@@ -256,7 +256,7 @@ class TransformNewListItem:
             )
             leading_space = split_leading_spaces[line_number_delta]
 
-            POGGER.debug(f"rnli->leading_space>:{leading_space}:")
+            POGGER.debug("rnli->leading_space>:$:", leading_space)
             adjustment_since_newline = len(leading_space)
         return adjustment_since_newline
 
@@ -184,10 +184,16 @@ class TransformToMarkdown:
     def transform(self, actual_tokens: List[MarkdownToken]) -> str:  # noqa: C901
         """
         Transform the incoming token stream back into Markdown.
+
+        Once no containers are open, the text transformed so far cannot change,
+        so it is moved into a list of completed parts.  That keeps the text that
+        is added to, and that the containers are applied to, to the text since
+        the outermost open container started.
         """
         container_stack: List[MarkdownToken] = []
         container_records: List[MarkdownChangeRecord] = []
         new_list_item_map: Dict[str, List[Tuple[int, int, int]]] = {}
+        completed_parts: List[str] = []
         (
             transformed_data,
             previous_token,
@@ -207,9 +213,7 @@ class TransformToMarkdown:
                 else None
             )
 
-            POGGER.debug(
-                f"pre-h>current_token>:{ParserHelper.make_value_visible(current_token)}:"
-            )
+            POGGER.debug("pre-h>current_token>:$:", current_token)
             (
                 new_data,
                 pragma_token,
@@ -222,17 +226,11 @@ class TransformToMarkdown:
                 token_index,
             )
 
-            POGGER.debug(
-                f"post-h>new_data>:{ParserHelper.make_value_visible(new_data)}:"
-            )
+            POGGER.debug("post-h>new_data>:$:", new_data)
             transformed_data_length_before_add = len(transformed_data)
-            POGGER.debug(
-                f"post-h>transformed_data>:{ParserHelper.make_value_visible(transformed_data)}:"
-            )
+            POGGER.debug("post-h>transformed_data>:$:", transformed_data)
             transformed_data += new_data
-            POGGER.debug(
-                f"post-h>transformed_data>:{ParserHelper.make_value_visible(transformed_data)}:"
-            )
+            POGGER.debug("post-h>transformed_data>:$:", transformed_data)
 
             transformed_data = TransformContainers.handle_current_token(
                 current_token,
@@ -242,13 +240,18 @@ class TransformToMarkdown:
                 transformed_data_length_before_add,
                 actual_tokens,
                 new_list_item_map,
+                token_index,
             )
+            if not container_stack and transformed_data:
+                completed_parts.append(transformed_data)
+                transformed_data = ""
 
             POGGER.debug("---")
             previous_token = current_token
 
+        completed_parts.append(transformed_data)
         transformed_data = self.__correct_for_final_newline(
-            transformed_data, actual_tokens
+            "".join(completed_parts), actual_tokens
         )
         transformed_data = (
             transformed_data.replace(ParserLogger.start_range_sequence, "")
@@ -293,15 +296,11 @@ class TransformToMarkdown:
         )
 
         for next_line_number in ordered_lines:
-            POGGER.debug(
-                f"pragma-->{ParserHelper.make_value_visible(ordered_lines[next_line_number])}<--"
-            )
+            POGGER.debug("pragma-->$<--", ordered_lines[next_line_number])
             detabified_pragma = TabHelper.detabify_string(
                 ordered_lines[next_line_number]
             )
-            POGGER.debug(
-                f"pragma-->{ParserHelper.make_value_visible(detabified_pragma)}<--"
-            )
+            POGGER.debug("pragma-->$<--", detabified_pragma)
 
             abs_line_number = abs(next_line_number)
             if abs_line_number == 1:
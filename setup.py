@@ -46,6 +46,7 @@ def load_readme_file():
 # Note, the below function does not always work, so we use this until we can find out why it is not working.
 PACKAGE_MODULES = [
     "pymarkdown",
+    "pymarkdown.benchmark",
     "pymarkdown.block_quotes",
     "pymarkdown.coalesce",
     "pymarkdown.container_blocks",
@@ -130,6 +131,7 @@ setup(
         "console_scripts": [
             "pymarkdown=pymarkdown.__main__:main",
             "pymarkdownlnt=pymarkdown.__main__:main",
+            "pymarkdown-client=pymarkdown.lint_client:main",
         ],
     },
     packages=get_package_modules(),
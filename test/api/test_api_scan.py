@@ -3,6 +3,7 @@ Module for directly using PyMarkdown's scan api.
 """
 
 import os
+import tempfile
 from test.utils import (
     assert_if_lists_different,
     assert_that_exception_is_raised,
@@ -10,6 +11,7 @@ from test.utils import (
     write_temporary_configuration,
 )
 from typing import List, Tuple, cast
+from unittest.mock import patch
 
 import py  # type: ignore[import-untyped]
 import pytest
@@ -151,6 +153,53 @@ def test_api_scan_for_non_matching_glob() -> None:
     )
 
 
+def test_api_scan_path_iter_same_as_scan_path() -> None:
+    """
+    Test to make sure that scanning a path one file at a time reports the
+    same results, in the same order, as scanning that path all at once.
+    """
+
+    # Arrange
+    source_path = os.path.join("test", "resources", "rules", "md047")
+    api = PyMarkdownApi()
+    expected_result = api.scan_path(source_path)
+    expected_files = api.list_path(source_path).matching_files
+
+    # Act
+    file_results = list(api.scan_path_iter(source_path))
+
+    # Assert
+    assert len(file_results) == len(expected_files)
+    assert [
+        next_failure
+        for next_result in file_results
+        for next_failure in next_result.scan_failures
+    ] == expected_result.scan_failures
+    for next_file, next_result in zip(expected_files, file_results):
+        assert all(
+            next_failure.scan_file == next_file
+            for next_failure in next_result.scan_failures
+        )
+
+
+def test_api_scan_path_iter_for_non_existant_file() -> None:
+    """
+    Test to make sure that scanning a non-existant file one file at a time
+    raises the same exception as scanning it all at once.
+    """
+
+    # Arrange
+    source_path = "does-not-exist.md"
+
+    # Act & Assert
+    assert_that_exception_is_raised(
+        PyMarkdownApiNoFilesFoundException,
+        "No matching files found.",
+        lambda path_to_scan: list(PyMarkdownApi().scan_path_iter(path_to_scan)),
+        source_path,
+    )
+
+
 def test_api_scan_for_non_markdown_file() -> None:
     """
     Test to make sure that scanning for a file that does not have markdown
@@ -397,6 +446,28 @@ def test_api_scan_string_test() -> None:
     assert not scan_result.pragma_errors
 
 
+def test_api_scan_string_test_without_temporary_file() -> None:
+    """
+    Test to make sure that a string is scanned without writing it to a temporary
+    file, and that its line endings are translated as they are for a file.
+    """
+
+    # Arrange
+    source_string = "# Heading\r\n\r\nSome text."
+    source_path = "in-memory"
+
+    # Act
+    with patch("tempfile.NamedTemporaryFile", side_effect=AssertionError):
+        scan_result = PyMarkdownApi().scan_string(source_string)
+
+    # Assert
+    assert len(scan_result.scan_failures) == 1
+    assert scan_result.scan_failures[0].partial_equals(
+        PyMarkdownScanFailure(source_path, 3, 10, "MD047", "", "", None)
+    )
+    assert not scan_result.pragma_errors
+
+
 def test_api_scan_string_test_good_file_after_disables() -> None:
     """
     Test to make sure that an empty path to scan is reported as an error.
@@ -1071,6 +1142,126 @@ Testo con caratteri accentati: à è ò ù
     assert scan_result.scan_failures[1].rule_id == "MD041"
 
 
+def test_api_scan_with_parallelism() -> None:
+    """
+    Test to make sure that scanning multiple files with multiple processes
+    returns the same results, in the same order, as a single process.
+    """
+
+    # Arrange
+    source_path = os.path.join("test", "resources", "rules", "md047")
+    single_process_result = PyMarkdownApi().scan_path(source_path)
+
+    # Act
+    scan_result = PyMarkdownApi().set_parallelism(2).scan_path(source_path)
+
+    # Assert
+    assert scan_result
+    assert single_process_result.scan_failures
+    assert scan_result.scan_failures == single_process_result.scan_failures
+    assert scan_result.pragma_errors == single_process_result.pragma_errors
+
+
+def test_api_scan_with_bad_parallelism() -> None:
+    """
+    Test to make sure that the number of processes must be a positive integer.
+    """
+
+    # Arrange
+    expected_output = "Parameter named 'number_of_processes' must be an integer greater than or equal to 1."
+
+    # Act & Assert
+    caught_exception = assert_that_exception_is_raised(
+        PyMarkdownApiArgumentException,
+        expected_output,
+        PyMarkdownApi().set_parallelism,
+        0,
+    )
+
+    # Assert
+    assert (
+        cast(PyMarkdownApiArgumentException, caught_exception).argument_name
+        == "number_of_processes"
+    )
+
+
+def test_api_scan_and_render_path() -> None:
+    """
+    Test to make sure that scanning and rendering a path returns the same results
+    as scanning that path, rendering the same HTML with any number of processes.
+    """
+
+    # Arrange
+    source_path = os.path.join("test", "resources", "rules", "md047")
+    scan_only_result = PyMarkdownApi().scan_path(source_path)
+
+    with tempfile.TemporaryDirectory() as html_directory:
+        with tempfile.TemporaryDirectory() as parallel_html_directory:
+
+            # Act
+            scan_result = PyMarkdownApi().scan_and_render_path(
+                source_path, html_directory
+            )
+            parallel_scan_result = (
+                PyMarkdownApi()
+                .set_parallelism(2)
+                .scan_and_render_path(source_path, parallel_html_directory)
+            )
+            html_file_names = sorted(
+                i for i in os.listdir(html_directory) if i.endswith(".html")
+            )
+            with open(
+                os.path.join(html_directory, "end_with_blank_line.html"),
+                "rt",
+                encoding="utf-8",
+            ) as html_file:
+                html_text = html_file.read()
+            with open(
+                os.path.join(parallel_html_directory, "end_with_blank_line.html"),
+                "rt",
+                encoding="utf-8",
+            ) as html_file:
+                parallel_html_text = html_file.read()
+
+    # Assert
+    assert scan_only_result.scan_failures
+    assert scan_result.scan_failures == scan_only_result.scan_failures
+    assert parallel_scan_result.scan_failures == scan_only_result.scan_failures
+    assert html_file_names == [
+        "empty.html",
+        "end_with_blank_line.html",
+        "end_with_no_blank_line.html",
+        "end_with_no_blank_line_and_spaces.html",
+    ]
+    assert html_text.startswith("<h1>This is a test</h1>")
+    assert parallel_html_text == html_text
+
+
+def test_api_scan_and_render_path_bad_html_directory() -> None:
+    """
+    Test to make sure that an empty html directory is reported as an error.
+    """
+
+    # Arrange
+    source_path = os.path.join("test", "resources", "rules", "md047")
+    expected_output = "Parameter named 'html_directory' cannot be empty."
+
+    # Act & Assert
+    caught_exception = assert_that_exception_is_raised(
+        PyMarkdownApiArgumentException,
+        expected_output,
+        PyMarkdownApi().scan_and_render_path,
+        source_path,
+        "",
+    )
+
+    # Assert
+    assert (
+        cast(PyMarkdownApiArgumentException, caught_exception).argument_name
+        == "html_directory"
+    )
+
+
 # change print_system_error to also accept optional exception?
 # OR
 # move format_error into presentation?
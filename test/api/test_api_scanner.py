@@ -0,0 +1,508 @@
+"""
+Module for directly using PyMarkdown's reusable scanner api.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from test.utils import (
+    assert_that_exception_is_raised,
+    create_temporary_markdown_file,
+    write_temporary_configuration,
+)
+from typing import Any, List
+from unittest.mock import patch
+
+import py  # type: ignore[import-untyped]
+
+from pymarkdown.api import (
+    PyMarkdownApi,
+    PyMarkdownApiArgumentException,
+    PyMarkdownApiException,
+    PyMarkdownApiNoFilesFoundException,
+    PyMarkdownScanPathResult,
+)
+from pymarkdown.general.incremental_tokenizer import IncrementalEdit
+from pymarkdown.general.tokenized_markdown import TokenizedMarkdown
+from pymarkdown.tokens.markdown_token import MarkdownToken
+
+__DOCUMENT_TO_EDIT = """# Heading 1
+
+Some paragraph
+text that is long enough to trip the line length rule, as it goes past eighty characters.
+
+- item 1
++ item 2
+
+### Heading 3
+
+<!-- pyml disable-next-line md013-->
+This line is also long enough to trip the line length rule, but that rule is disabled.
+
+> quote
+
+# Heading 1
+"""
+
+__REPLACEMENT_LINES = [
+    [],
+    ["new text"],
+    ["```"],
+    ["* another item", ""],
+    ["## Heading 2"],
+    ["<!-- pyml disable md001-->"],
+]
+
+
+def __create_documents_to_scan(document_count: int) -> List[str]:
+    return [
+        f"# Heading {document_index}\n"
+        + "This line is long enough to trip the line length rule, "
+        * (2 * (document_index % 3))
+        + "\n\nThis mentions javascript and python.\n"
+        + ("* item\n+ item\n" if document_index % 2 else "")
+        for document_index in range(document_count)
+    ]
+
+
+def test_api_scanner_scan_string_same_as_api() -> None:
+    """
+    Test to make sure that scanning a string with a scanner returns the same
+    results as scanning that string with the api directly.
+    """
+
+    # Arrange
+    api = PyMarkdownApi().set_string_property(
+        "plugins.md044.names", "JavaScript,Python"
+    )
+    documents_to_scan = __create_documents_to_scan(4)
+    expected_results = [
+        api.scan_string(next_document) for next_document in documents_to_scan
+    ]
+
+    # Act
+    scanner = api.create_scanner()
+    actual_results = [
+        scanner.scan_string(next_document) for next_document in documents_to_scan
+    ]
+
+    # Assert
+    assert actual_results == expected_results
+    assert any(
+        next_failure.rule_id == "MD044"
+        for next_failure in actual_results[0].scan_failures
+    )
+    assert any(
+        next_failure.rule_id == "MD013"
+        for next_failure in actual_results[1].scan_failures
+    )
+
+
+def test_api_scanner_scan_string_from_multiple_threads() -> None:
+    """
+    Test to make sure that scanning strings from multiple threads at the same time
+    returns the same results as scanning them one at a time, even though the rule
+    plugins keep state for the document that they are scanning.
+    """
+
+    # Arrange
+    scanner = (
+        PyMarkdownApi()
+        .set_string_property("plugins.md044.names", "JavaScript,Python")
+        .create_scanner()
+    )
+    documents_to_scan = __create_documents_to_scan(12)
+    expected_results = [
+        scanner.scan_string(next_document) for next_document in documents_to_scan
+    ]
+
+    # Act
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        actual_results: List[PyMarkdownScanPathResult] = list(
+            executor.map(scanner.scan_string, documents_to_scan)
+        )
+
+    # Assert
+    assert actual_results == expected_results
+
+
+def test_api_scanner_not_affected_by_later_configuration() -> None:
+    """
+    Test to make sure that changing the configuration of the api after the scanner
+    is created does not change the configuration that the scanner uses.
+    """
+
+    # Arrange
+    api = PyMarkdownApi()
+    scanner = api.create_scanner()
+    api.disable_rule_by_identifier("md041")
+
+    # Act
+    scan_result = scanner.scan_string("some text\n")
+
+    # Assert
+    assert [next_failure.rule_id for next_failure in scan_result.scan_failures] == [
+        "MD041"
+    ]
+
+
+def test_api_scanner_scan_file() -> None:
+    """
+    Test to make sure that scanning a file with a scanner returns the same results
+    as scanning that file with the api directly.
+    """
+
+    # Arrange
+    source_path = os.path.join(
+        "test", "resources", "rules", "md047", "end_with_no_blank_line.md"
+    )
+    scanner = PyMarkdownApi().create_scanner()
+    expected_result = PyMarkdownApi().scan_path(source_path)
+
+    # Act
+    scan_result = scanner.scan_file(source_path)
+
+    # Assert
+    assert scan_result == expected_result
+    assert scan_result.scan_failures
+
+
+def test_api_scanner_scan_file_with_per_file_ignores(
+    tmpdir: py._path.local.LocalPath,
+) -> None:
+    """
+    Test to make sure that scanning a file with a scanner respects any per-file
+    ignores in the configuration.
+    """
+
+    # Arrange
+    source_path = os.path.join(
+        "test", "resources", "rules", "md047", "end_with_no_blank_line.md"
+    )
+    supplied_configuration = {
+        "plugins": {"per-file-ignores": {"end_with_*.md": "md047"}}
+    }
+    configuration_file_name = write_temporary_configuration(
+        supplied_configuration, directory=tmpdir
+    )
+    scanner = (
+        PyMarkdownApi()
+        .configuration_file_path(configuration_file_name)
+        .create_scanner()
+    )
+
+    # Act
+    scan_result = scanner.scan_file(source_path)
+
+    # Assert
+    assert not scan_result.scan_failures
+
+
+def test_api_scanner_bad_arguments() -> None:
+    """
+    Test to make sure that the arguments to the scanner are verified.
+    """
+
+    # Arrange
+    scanner = PyMarkdownApi().create_scanner()
+
+    # Act & Assert
+    assert_that_exception_is_raised(
+        PyMarkdownApiArgumentException,
+        "Parameter named 'string_to_scan' cannot be empty.",
+        scanner.scan_string,
+        " ",
+    )
+    assert_that_exception_is_raised(
+        PyMarkdownApiArgumentException,
+        "Parameter named 'file_to_scan' cannot be empty.",
+        scanner.scan_file,
+        "",
+    )
+    assert_that_exception_is_raised(
+        PyMarkdownApiNoFilesFoundException,
+        "No matching files found.",
+        scanner.scan_file,
+        os.path.join("test", "resources", "rules", "md047", "does-not-exist.md"),
+    )
+
+
+def test_api_scanner_bad_configuration(
+    tmpdir: py._path.local.LocalPath,
+) -> None:
+    """
+    Test to make sure that an error loading the configuration is reported when the
+    scanner is created.
+    """
+
+    # Arrange
+    configuration_file_name = write_temporary_configuration(
+        "{", directory=tmpdir, file_name_suffix=".json"
+    )
+
+    # Act & Assert
+    assert_that_exception_is_raised(
+        PyMarkdownApiException,
+        f"Specified configuration file '{configuration_file_name}' is not a valid JSON file: "
+        + "Expecting property name enclosed in double quotes: line 1 column 2 (char 1).",
+        PyMarkdownApi()
+        .configuration_file_path(configuration_file_name)
+        .disable_json5_configuration()
+        .create_scanner,
+    )
+
+
+def test_api_scanner_tokenization_error() -> None:
+    """
+    Test to make sure that an error while scanning is raised as an exception, and
+    that the scanner can still be used afterwards.
+    """
+
+    # Arrange
+    scanner = (
+        PyMarkdownApi().enable_extension_by_identifier("front-matter").create_scanner()
+    )
+
+    # Act & Assert
+    assert_that_exception_is_raised(
+        PyMarkdownApiException,
+        "Unexpected Error(BadTokenizationError): An unhandled error occurred processing the document.",
+        scanner.scan_string,
+        "---\ntest: assert\n---\n",
+    )
+    assert not scanner.scan_string("# Heading\n").scan_failures
+
+
+def test_api_scanner_tokenization_error_with_continue_on_error(
+    tmpdir: py._path.local.LocalPath,
+) -> None:
+    """
+    Test to make sure that an error while scanning is reported as a critical error
+    if the api was set to continue on errors.
+    """
+
+    # Arrange
+    scanner = (
+        PyMarkdownApi()
+        .enable_extension_by_identifier("front-matter")
+        .enable_continue_on_error()
+        .create_scanner()
+    )
+
+    with create_temporary_markdown_file(
+        "---\ntest: assert\n---\n", directory=tmpdir
+    ) as file_name:
+
+        # Act
+        scan_result = scanner.scan_file(file_name)
+
+    # Assert
+    assert not scan_result.scan_failures
+    assert scan_result.critical_errors == [
+        f"{file_name}:0:0: An unhandled error occurred processing the document."
+    ]
+
+
+def test_api_scanner_fix_string_same_as_api() -> None:
+    """
+    Test to make sure that fixing a string with a scanner returns the same
+    results as fixing that string with the api directly, and that the string
+    is fixed without any temporary files being written.
+    """
+
+    # Arrange
+    api = PyMarkdownApi()
+    documents_to_fix = [
+        "# This is a test\n\nThe line after this line should be blank.\n",
+        "# This is a test\n\nThe line after this line should be blank.",
+        "My list\n1. Item 1\n 2. Item 2\n",
+    ]
+    scanner = api.create_scanner()
+
+    # Act
+    with patch("tempfile.NamedTemporaryFile", side_effect=AssertionError):
+        expected_results = [
+            api.fix_string(next_document) for next_document in documents_to_fix
+        ]
+        actual_results = [
+            scanner.fix_string(next_document) for next_document in documents_to_fix
+        ]
+
+    # Assert
+    assert actual_results == expected_results
+    assert [next_result.was_fixed for next_result in actual_results] == [
+        False,
+        True,
+        True,
+    ]
+    assert actual_results[1].fixed_file == documents_to_fix[0]
+
+
+def test_api_scanner_fix_string_after_scan_reuses_tokens() -> None:
+    """
+    Test to make sure that fixing or scanning a string that a scanner has just
+    scanned does not tokenize that string again, while still returning the same
+    results as fixing that string with the api directly.
+    """
+
+    # Arrange
+    api = PyMarkdownApi()
+    document_to_fix = "# This is a test\nThe line after this line should be blank."
+    expected_result = api.fix_string(document_to_fix)
+    scanner = api.create_scanner()
+    original_transform = TokenizedMarkdown.transform_from_provider
+    tokenized_count = 0
+
+    def __count_transform(
+        self: TokenizedMarkdown, *args: Any, **kwargs: Any
+    ) -> List[MarkdownToken]:
+        nonlocal tokenized_count
+        tokenized_count += 1
+        return original_transform(self, *args, **kwargs)
+
+    # Act
+    with patch.object(TokenizedMarkdown, "transform_from_provider", __count_transform):
+        scan_result = scanner.scan_string(document_to_fix)
+        fix_result = scanner.fix_string(document_to_fix)
+        rescan_result = scanner.scan_string(document_to_fix)
+
+    # Assert
+    assert tokenized_count == 1
+    assert fix_result == expected_result
+    assert fix_result.was_fixed
+    assert rescan_result == scan_result
+    assert [next_failure.rule_id for next_failure in scan_result.scan_failures] == [
+        "MD022",
+        "MD047",
+    ]
+
+
+def test_api_scanner_scan_string_for_edits_same_as_scan_string() -> None:
+    """
+    Test to make sure that scanning a string so that it can be edited returns the
+    same results as scanning that string, having scanned it with every rule.
+    """
+
+    # Arrange
+    scanner = PyMarkdownApi().create_scanner()
+    expected_result = scanner.scan_string(__DOCUMENT_TO_EDIT)
+
+    # Act
+    scan_result = scanner.scan_string_for_edits(__DOCUMENT_TO_EDIT)
+
+    # Assert
+    assert scan_result.scan_failures == expected_result.scan_failures
+    assert scan_result.pragma_errors == expected_result.pragma_errors
+    assert scan_result.source_text == __DOCUMENT_TO_EDIT
+    assert "md013" in scan_result.scanned_rule_ids
+    assert "md025" in scan_result.scanned_rule_ids
+
+
+def test_api_scanner_scan_edit_keeps_failures_of_unaffected_rules() -> None:
+    """
+    Test to make sure that an edit to a block quote only scans with the rules that
+    can be affected by it, and that the failures of the other rules are kept with
+    their line numbers adjusted for the lines added by the edit, including for an
+    edit to the result of an earlier edit.
+    """
+
+    # Arrange
+    scanner = PyMarkdownApi().create_scanner()
+    previous_result = scanner.scan_string_for_edits(__DOCUMENT_TO_EDIT)
+    first_edit = IncrementalEdit(14, 14, ["> a longer", "> quote"])
+    second_edit = IncrementalEdit(15, 15, ["> quote", ">", "> with more"])
+
+    # Act
+    first_result = scanner.scan_edit(previous_result, first_edit)
+    second_result = scanner.scan_edit(first_result, second_edit)
+
+    # Assert
+    for scan_result in (first_result, second_result):
+        expected_result = scanner.scan_string(scan_result.source_text)
+        assert scan_result.scan_failures == expected_result.scan_failures
+        assert scan_result.pragma_errors == expected_result.pragma_errors
+        assert "md013" in scan_result.scanned_rule_ids
+        assert "md025" not in scan_result.scanned_rule_ids
+    assert second_result.source_text.endswith(
+        "> a longer\n> quote\n>\n> with more\n\n# Heading 1\n"
+    )
+    assert [
+        [
+            next_failure.line_number
+            for next_failure in scan_result.scan_failures
+            if next_failure.rule_id == "MD025"
+        ]
+        for scan_result in (previous_result, first_result, second_result)
+    ] == [[16], [17], [19]]
+
+
+def test_api_scanner_scan_edit_with_pragma_scans_with_every_rule() -> None:
+    """
+    Test to make sure that an edit that adds a pragma scans with every rule, as
+    the pragma may change the failures reported by any rule.
+    """
+
+    # Arrange
+    scanner = PyMarkdownApi().create_scanner()
+    previous_result = scanner.scan_string_for_edits(__DOCUMENT_TO_EDIT)
+    edit = IncrementalEdit(3, 2, ["<!-- pyml disable md025-->"])
+
+    # Act
+    scan_result = scanner.scan_edit(previous_result, edit)
+
+    # Assert
+    assert scan_result.scanned_rule_ids == previous_result.scanned_rule_ids
+    assert not [
+        next_failure
+        for next_failure in scan_result.scan_failures
+        if next_failure.rule_id == "MD025"
+    ]
+
+
+def test_api_scanner_scan_edit_same_as_scan_string_for_every_line() -> None:
+    """
+    Test to make sure that replacing, inserting, or removing lines at every
+    position within the document returns the same results as scanning the
+    edited string.  To keep the test quick, each position
+    is only tested with a rotating sample of the replacement lines.
+    """
+
+    # Arrange
+    scanner = PyMarkdownApi().create_scanner()
+    scan_result = scanner.scan_string_for_edits(__DOCUMENT_TO_EDIT)
+    line_count = len(__DOCUMENT_TO_EDIT.split("\n"))
+
+    # Act & Assert
+    for first_line_number in range(1, line_count + 1):
+        for last_line_number in (first_line_number - 1, first_line_number):
+            replacement_lines = __REPLACEMENT_LINES[
+                (2 * first_line_number + last_line_number) % len(__REPLACEMENT_LINES)
+            ]
+            edited_result = scanner.scan_edit(
+                scan_result,
+                IncrementalEdit(first_line_number, last_line_number, replacement_lines),
+            )
+            expected_result = scanner.scan_string(edited_result.source_text)
+            assert (edited_result.scan_failures, edited_result.pragma_errors) == (
+                expected_result.scan_failures,
+                expected_result.pragma_errors,
+            ), f"{first_line_number}, {last_line_number}, {replacement_lines}"
+
+
+def test_api_scanner_scan_edit_bad_edit() -> None:
+    """
+    Test to make sure that an edit outside of the scanned string is reported as a
+    bad argument.
+    """
+
+    # Arrange
+    scanner = PyMarkdownApi().create_scanner()
+    previous_result = scanner.scan_string_for_edits("# Heading\n")
+
+    # Act & Assert
+    assert_that_exception_is_raised(
+        PyMarkdownApiArgumentException,
+        "First line number 4 must be between 1 and 3.",
+        scanner.scan_edit,
+        previous_result,
+        IncrementalEdit(4, 4, []),
+    )
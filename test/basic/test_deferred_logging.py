@@ -0,0 +1,145 @@
+"""
+Module to make sure that the messages for the logging calls are only formatted
+if those messages are logged.
+"""
+
+import ast
+import os
+from typing import Iterator, List
+
+import pymarkdown
+
+__logger_names = {"POGGER", "LOGGER"}
+__visible_function_names = {"make_value_visible", "make_whitespace_visible"}
+
+
+def __is_constant_text(format_node: ast.expr) -> bool:
+    if isinstance(format_node, ast.BinOp):
+        return (
+            isinstance(format_node.op, ast.Add)
+            and __is_constant_text(format_node.left)
+            and __is_constant_text(format_node.right)
+        )
+    return isinstance(format_node, ast.Constant) and isinstance(format_node.value, str)
+
+
+def __is_eager_format(format_node: ast.expr) -> bool:
+    if isinstance(format_node, (ast.JoinedStr, ast.BinOp)):
+        return not __is_constant_text(format_node)
+    return (
+        isinstance(format_node, ast.Call)
+        and isinstance(format_node.func, ast.Attribute)
+        and format_node.func.attr == "format"
+    )
+
+
+def __is_eager_argument(argument_node: ast.expr) -> bool:
+    return any(
+        isinstance(next_node, ast.Call)
+        and isinstance(next_node.func, ast.Attribute)
+        and next_node.func.attr in __visible_function_names
+        for next_node in ast.walk(argument_node)
+    )
+
+
+def __walk_statements(parent_node: ast.AST) -> Iterator[ast.stmt]:
+    """
+    Walk the statements within the node, without walking their expressions, as the
+    logging calls are always made as statements of their own.
+    """
+    for _, field_value in ast.iter_fields(parent_node):
+        if not isinstance(field_value, list):
+            continue
+        for next_node in field_value:
+            if isinstance(next_node, ast.stmt):
+                yield next_node
+            if isinstance(next_node, (ast.stmt, ast.excepthandler, ast.match_case)):
+                yield from __walk_statements(next_node)
+
+
+def __find_eager_logging_calls(source_text: str, file_name: str) -> List[str]:
+    eager_calls: List[str] = []
+    if not any(next_name in source_text for next_name in __logger_names):
+        return eager_calls
+    for next_statement in __walk_statements(ast.parse(source_text, filename=file_name)):
+        if not isinstance(next_statement, ast.Expr):
+            continue
+        next_node = next_statement.value
+        if not (
+            isinstance(next_node, ast.Call)
+            and isinstance(next_node.func, ast.Attribute)
+            and isinstance(next_node.func.value, ast.Name)
+            and next_node.func.value.id in __logger_names
+            and next_node.args
+        ):
+            continue
+        if __is_eager_format(next_node.args[0]) or any(
+            __is_eager_argument(next_argument) for next_argument in next_node.args[1:]
+        ):
+            eager_calls.append(f"{file_name}:{next_node.lineno}")
+    return eager_calls
+
+
+def test_deferred_logging_finds_eager_calls() -> None:
+    """
+    Test to make sure that logging calls that format their messages before
+    the call are found, and that calls that defer that formatting are not.
+    """
+
+    # Arrange
+    source_text = """
+POGGER.debug(f"value={value}")
+POGGER.debug("value=" + str(value))
+POGGER.debug("value={}".format(value))
+POGGER.debug("value=$", ParserHelper.make_value_visible(value))
+LOGGER.debug("value=%s", ParserHelper.make_whitespace_visible(value))
+POGGER.debug("value=$", value)
+POGGER.debug("first=$" + ",second=$", value, other_value)
+POGGER.debug("first=$" + ",second=$" + ",third=$", value, other_value, last_value)
+POGGER.debug_with_visible_whitespace("value=$", value)
+LOGGER.debug("value=%s", value)
+other_logger.debug(f"value={value}")
+"""
+
+    # Act
+    eager_calls = __find_eager_logging_calls(source_text, "sample.py")
+
+    # Assert
+    assert eager_calls == [
+        "sample.py:2",
+        "sample.py:3",
+        "sample.py:4",
+        "sample.py:5",
+        "sample.py:6",
+    ]
+
+
+def test_deferred_logging_in_package() -> None:
+    """
+    Test to make sure that none of the logging calls in the package format their
+    messages before the call, as that formatting is done even if the message is
+    not logged.
+    """
+
+    # Arrange
+    package_directory = os.path.dirname(pymarkdown.__file__)
+
+    # Act
+    eager_calls: List[str] = []
+    for directory_path, _, file_names in os.walk(package_directory):
+        for next_file_name in sorted(file_names):
+            if not next_file_name.endswith(".py"):
+                continue
+            file_path = os.path.join(directory_path, next_file_name)
+            with open(file_path, "rt", encoding="utf-8") as source_file:
+                eager_calls.extend(
+                    __find_eager_logging_calls(
+                        source_file.read(),
+                        os.path.relpath(file_path, package_directory),
+                    )
+                )
+
+    # Assert
+    assert not eager_calls, "Logging calls with eager formatting:\n" + "\n".join(
+        eager_calls
+    )
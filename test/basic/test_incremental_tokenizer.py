@@ -0,0 +1,276 @@
+"""
+Module to provide tests for the incremental tokenization of a document.
+"""
+
+from test.utils import create_tokenizer
+from typing import List
+
+import pytest
+
+from pymarkdown.general.bad_tokenization_error import BadTokenizationError
+from pymarkdown.general.incremental_tokenizer import (
+    IncrementalEdit,
+    IncrementalTokenizer,
+)
+from pymarkdown.tokens.markdown_token import EndMarkdownToken
+
+__SAMPLE_DOCUMENT = """# Heading 1
+
+Some paragraph
+text.
+
+- item 1
+- item 2
+
+<!-- pyml disable-next-line md013-->
+```text
+code
+```
+
+> quote
+
+Final paragraph.
+"""
+
+__REPLACEMENT_LINES = [
+    [],
+    [""],
+    ["new text"],
+    ["```"],
+    ["- another item"],
+    ["    indented", ""],
+    ["<!-- pyml disable md001-->"],
+    ["===", "more text"],
+]
+
+
+def __create_incremental_tokenizer() -> IncrementalTokenizer:
+    return IncrementalTokenizer(create_tokenizer(), verify_with_full_parse=True)
+
+
+def __tokens_as_strings(
+    incremental_tokenizer: IncrementalTokenizer, text: str
+) -> List[str]:
+    return [
+        str(next_token) for next_token in incremental_tokenizer.tokenize(text).tokens
+    ]
+
+
+def test_incremental_tokenizer_edit_within_paragraph() -> None:
+    """
+    Test that an edit within a single paragraph only parses the blocks around
+    that paragraph, and produces the same tokens as a full parse.
+    """
+
+    # Arrange
+    incremental_tokenizer = __create_incremental_tokenizer()
+    previous_tokenization = incremental_tokenizer.tokenize(__SAMPLE_DOCUMENT)
+    edit = IncrementalEdit(4, 4, ["more", "text."])
+
+    # Act
+    new_tokenization = incremental_tokenizer.apply_edit(previous_tokenization, edit)
+
+    # Assert
+    assert not new_tokenization.was_fully_parsed
+    assert new_tokenization.first_parsed_line_number == 3
+    assert new_tokenization.last_parsed_line_number == 6
+    assert new_tokenization.line_number_delta == 1
+    assert "para" in new_tokenization.parsed_token_names
+    assert "block-quote" not in new_tokenization.parsed_token_names
+    assert [str(next_token) for next_token in new_tokenization.tokens] == (
+        __tokens_as_strings(incremental_tokenizer, new_tokenization.source_text)
+    )
+
+
+def test_incremental_tokenizer_edit_opening_fenced_code_block() -> None:
+    """
+    Test that an edit that opens a fenced code block extends the parsed region
+    until the end of the document.
+    """
+
+    # Arrange
+    incremental_tokenizer = __create_incremental_tokenizer()
+    previous_tokenization = incremental_tokenizer.tokenize(__SAMPLE_DOCUMENT)
+    edit = IncrementalEdit(3, 2, ["~~~", ""])
+
+    # Act
+    new_tokenization = incremental_tokenizer.apply_edit(previous_tokenization, edit)
+
+    # Assert
+    assert not new_tokenization.was_fully_parsed
+    assert new_tokenization.last_parsed_line_number == len(
+        new_tokenization.source_lines
+    )
+    assert new_tokenization.tokens[-1].is_pragma
+
+
+def test_incremental_tokenizer_with_link_reference_definition() -> None:
+    """
+    Test that any edit to a document with a link reference definition is
+    handled with a full parse.
+    """
+
+    # Arrange
+    incremental_tokenizer = __create_incremental_tokenizer()
+    previous_tokenization = incremental_tokenizer.tokenize(
+        "[link]\n\nparagraph\n\n[link]: /url\n"
+    )
+    edit = IncrementalEdit(3, 3, ["changed"])
+
+    # Act
+    new_tokenization = incremental_tokenizer.apply_edit(previous_tokenization, edit)
+
+    # Assert
+    assert new_tokenization.was_fully_parsed
+    assert new_tokenization.source_text == "[link]\n\nchanged\n\n[link]: /url\n"
+
+
+def test_incremental_tokenizer_with_bad_edit() -> None:
+    """
+    Test that an edit outside of the document is reported as an error.
+    """
+
+    # Arrange
+    incremental_tokenizer = __create_incremental_tokenizer()
+    previous_tokenization = incremental_tokenizer.tokenize("line 1\nline 2")
+
+    # Act & Assert
+    with pytest.raises(ValueError):
+        incremental_tokenizer.apply_edit(
+            previous_tokenization, IncrementalEdit(4, 4, [])
+        )
+    with pytest.raises(ValueError):
+        incremental_tokenizer.apply_edit(
+            previous_tokenization, IncrementalEdit(2, 3, [])
+        )
+
+
+def test_incremental_tokenizer_leaves_previous_tokenization_unchanged() -> None:
+    """
+    Test that applying an edit that moves the tokens after it does not change the
+    tokens of the previous tokenization.
+    """
+
+    # Arrange
+    incremental_tokenizer = __create_incremental_tokenizer()
+    previous_tokenization = incremental_tokenizer.tokenize(__SAMPLE_DOCUMENT)
+    expected_tokens = [str(next_token) for next_token in previous_tokenization.tokens]
+    edit = IncrementalEdit(3, 2, ["new text", "", "more new text", ""])
+
+    # Act
+    new_tokenization = incremental_tokenizer.apply_edit(previous_tokenization, edit)
+
+    # Assert
+    assert not new_tokenization.was_fully_parsed
+    assert new_tokenization.line_number_delta == 4
+    assert [
+        str(next_token) for next_token in previous_tokenization.tokens
+    ] == expected_tokens
+
+
+def test_incremental_tokenizer_shares_tokens_if_line_count_unchanged() -> None:
+    """
+    Test that an edit that does not change the number of lines in the document
+    shares the tokens after the edit with the previous tokenization.
+    """
+
+    # Arrange
+    incremental_tokenizer = __create_incremental_tokenizer()
+    previous_tokenization = incremental_tokenizer.tokenize(__SAMPLE_DOCUMENT)
+    edit = IncrementalEdit(4, 4, ["changed."])
+
+    # Act
+    new_tokenization = incremental_tokenizer.apply_edit(previous_tokenization, edit)
+
+    # Assert
+    assert not new_tokenization.was_fully_parsed
+    assert new_tokenization.tokens[-3] is previous_tokenization.tokens[-3]
+
+
+def test_incremental_tokenizer_end_tokens_refer_to_copied_start_tokens() -> None:
+    """
+    Test that once the tokens after the edit are copied to adjust their line
+    numbers, each copied end token refers to the copy of its start token.
+    """
+
+    # Arrange
+    incremental_tokenizer = __create_incremental_tokenizer()
+    previous_tokenization = incremental_tokenizer.tokenize(__SAMPLE_DOCUMENT)
+    edit = IncrementalEdit(3, 2, ["new text", ""])
+
+    # Act
+    new_tokenization = incremental_tokenizer.apply_edit(previous_tokenization, edit)
+
+    # Assert
+    new_token_ids = {id(next_token) for next_token in new_tokenization.tokens}
+    previous_token_ids = {id(next_token) for next_token in previous_tokenization.tokens}
+    end_tokens = [
+        next_token
+        for next_token in new_tokenization.tokens
+        if isinstance(next_token, EndMarkdownToken)
+        and next_token.start_markdown_token.line_number
+        > new_tokenization.last_parsed_line_number
+    ]
+    assert end_tokens
+    for next_token in end_tokens:
+        assert id(next_token) not in previous_token_ids
+        assert id(next_token.start_markdown_token) in new_token_ids
+
+
+def test_incremental_tokenizer_without_keeping_previous_tokenization() -> None:
+    """
+    Test that if the previous tokenization does not need to be kept, the tokens
+    after the edit are shared with it and adjusted in place.
+    """
+
+    # Arrange
+    incremental_tokenizer = __create_incremental_tokenizer()
+    previous_tokenization = incremental_tokenizer.tokenize(__SAMPLE_DOCUMENT)
+    last_paragraph_token = previous_tokenization.tokens[-6]
+    edit = IncrementalEdit(3, 2, ["new text", ""])
+
+    # Act
+    new_tokenization = incremental_tokenizer.apply_edit(
+        previous_tokenization, edit, keep_previous_tokenization=False
+    )
+
+    # Assert
+    assert not new_tokenization.was_fully_parsed
+    assert new_tokenization.tokens[-6] is last_paragraph_token
+    assert last_paragraph_token.line_number == 18
+
+
+def test_incremental_tokenizer_matches_full_parse_for_every_line() -> None:
+    """
+    Test that replacing, inserting, or removing lines at every position within
+    the sample document produces the same tokens as a full parse.  To keep the test quick,
+    each position is only tested with a rotating sample of the replacement lines.
+    """
+
+    # Arrange
+    incremental_tokenizer = __create_incremental_tokenizer()
+    previous_tokenization = incremental_tokenizer.tokenize(__SAMPLE_DOCUMENT)
+    line_count = len(previous_tokenization.source_lines)
+    replacement_count = len(__REPLACEMENT_LINES)
+
+    # Act & Assert
+    for first_line_number in range(1, line_count + 1):
+        for last_line_number in (first_line_number - 1, first_line_number):
+            sample_index = 2 * first_line_number + last_line_number
+            for replacement_lines in (
+                __REPLACEMENT_LINES[sample_index % replacement_count],
+                __REPLACEMENT_LINES[
+                    (sample_index + replacement_count // 2) % replacement_count
+                ],
+            ):
+                try:
+                    incremental_tokenizer.apply_edit(
+                        previous_tokenization,
+                        IncrementalEdit(
+                            first_line_number, last_line_number, replacement_lines
+                        ),
+                    )
+                except BadTokenizationError as this_exception:
+                    assert "differs from a full parse" not in str(
+                        this_exception
+                    ), f"{first_line_number}, {last_line_number}, {replacement_lines}"
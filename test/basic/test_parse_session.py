@@ -0,0 +1,98 @@
+"""
+Tests to make sure that documents can be tokenized at the same time from
+different threads.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from test.utils import create_tokenizer
+from typing import List, Tuple
+
+from pymarkdown.general.tokenized_markdown import TokenizedMarkdown
+
+__THREAD_COUNT = 4
+__DOCUMENT_COUNT = 8
+
+
+def __create_tokenizer(enable_strikethrough: bool = False) -> TokenizedMarkdown:
+    return create_tokenizer(
+        {"extensions": {"markdown-strikethrough": {"enabled": True}}}
+        if enable_strikethrough
+        else None
+    )
+
+
+def __create_document(document_index: int) -> str:
+    paragraphs = [
+        f"A [shared] reference and a [local-{document_index % 5}] reference.\n"
+        for _ in range(4)
+    ]
+    return (
+        "".join(paragraphs)
+        + f"\n[shared]: /url-{document_index} 'title {document_index}'\n"
+        + f"[local-{document_index % 5}]: /local-{document_index}\n"
+        + "\n~~struck~~ text\n"
+    )
+
+
+def __tokenize(tokenizer: TokenizedMarkdown, source_text: str) -> List[str]:
+    return [str(next_token) for next_token in tokenizer.transform(source_text)]
+
+
+def test_parse_session_concurrent_conflicting_link_definitions() -> None:
+    """
+    Test to make sure that documents that define the same link references with
+    different destinations are tokenized the same when they are tokenized at the
+    same time by one tokenizer, as when they are tokenized one at a time.
+    """
+
+    # Arrange
+    tokenizer = __create_tokenizer()
+    documents = [
+        __create_document(document_index) for document_index in range(__DOCUMENT_COUNT)
+    ]
+    expected_tokens = [
+        __tokenize(tokenizer, next_document) for next_document in documents
+    ]
+
+    # Act
+    with ThreadPoolExecutor(max_workers=__THREAD_COUNT) as executor:
+        actual_tokens = list(
+            executor.map(lambda text: __tokenize(tokenizer, text), documents)
+        )
+
+    # Assert
+    for document_index, next_tokens in enumerate(actual_tokens):
+        assert next_tokens == expected_tokens[document_index]
+        assert f"/url-{document_index}" in "".join(next_tokens)
+
+
+def test_parse_session_concurrent_tokenizers_with_different_extensions() -> None:
+    """
+    Test to make sure that two tokenizers with different extensions enabled can
+    tokenize documents at the same time without affecting each other.
+    """
+
+    # Arrange
+    plain_tokenizer = __create_tokenizer()
+    strikethrough_tokenizer = __create_tokenizer(enable_strikethrough=True)
+    work_items: List[Tuple[TokenizedMarkdown, str]] = [
+        (
+            strikethrough_tokenizer if document_index % 2 else plain_tokenizer,
+            __create_document(document_index),
+        )
+        for document_index in range(__DOCUMENT_COUNT)
+    ]
+    expected_tokens = [
+        __tokenize(tokenizer, next_document) for tokenizer, next_document in work_items
+    ]
+
+    # Act
+    with ThreadPoolExecutor(max_workers=__THREAD_COUNT) as executor:
+        actual_tokens = list(
+            executor.map(lambda item: __tokenize(item[0], item[1]), work_items)
+        )
+
+    # Assert
+    assert actual_tokens == expected_tokens
+    assert "[emphasis(" in "".join(expected_tokens[1])
+    assert "[emphasis(" not in "".join(expected_tokens[0])
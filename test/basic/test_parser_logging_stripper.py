@@ -0,0 +1,249 @@
+"""
+Module to provide tests for loading the modules with their parser logging calls
+removed.
+"""
+
+import ast
+import contextlib
+import importlib.util
+import os
+import subprocess
+import sys
+import tempfile
+import types
+from test.markdown_scanner import MarkdownScanner
+from typing import Dict, List, Optional
+from unittest.mock import patch
+
+import pytest
+
+from pymarkdown.general.parser_logging_stripper import (
+    ParserLoggingStripper,
+    StrippedLoggingFinder,
+    StrippedLoggingLoader,
+)
+
+
+def __run_pymarkdown(
+    arguments: List[str], extra_environment: Optional[Dict[str, str]] = None
+) -> "subprocess.CompletedProcess[str]":
+    run_environment = dict(os.environ)
+    run_environment.update(extra_environment or {})
+    return subprocess.run(
+        [sys.executable, *arguments],
+        capture_output=True,
+        text=True,
+        check=False,
+        env=run_environment,
+    )
+
+
+def __patch_with_stripped_modules(
+    module_names: List[str], exit_stack: contextlib.ExitStack
+) -> int:
+    """
+    Load each module again with its logging calls removed, and patch the functions
+    of the classes in the loaded module over those of the classes in the normal
+    module, returning the number of functions that were patched.
+    """
+    patched_function_count = 0
+    for module_name in module_names:
+        normal_module = importlib.import_module(module_name)
+        module_path = normal_module.__file__
+        assert module_path is not None
+        module_loader = StrippedLoggingLoader(module_name, module_path)
+        module_spec = importlib.util.spec_from_file_location(
+            module_name, module_path, loader=module_loader
+        )
+        assert module_spec is not None
+        stripped_module = importlib.util.module_from_spec(module_spec)
+        with patch.object(sys, "dont_write_bytecode", True):
+            module_loader.exec_module(stripped_module)
+
+        for class_name, stripped_class in vars(stripped_module).items():
+            if (
+                not isinstance(stripped_class, type)
+                or stripped_class.__module__ != module_name
+            ):
+                continue
+            normal_class = getattr(normal_module, class_name)
+            for function_name, stripped_function in vars(stripped_class).items():
+                if isinstance(
+                    stripped_function,
+                    (staticmethod, classmethod, types.FunctionType),
+                ):
+                    exit_stack.enter_context(
+                        patch.object(normal_class, function_name, stripped_function)
+                    )
+                    patched_function_count += 1
+    return patched_function_count
+
+
+def test_parser_logging_stripper_removes_logging_calls() -> None:
+    """
+    Test to make sure that only the statements that call the parser logger are
+    removed, keeping any blocks that are left empty valid.
+    """
+
+    # Arrange
+    source_text = """
+import logging
+POGGER = ParserLogger(logging.getLogger(__name__))
+LOGGER = logging.getLogger(__name__)
+
+def sample_function(value):
+    POGGER.debug("value=$", value)
+    if value:
+        POGGER.info("true branch")
+    else:
+        LOGGER.debug("false branch")
+        POGGER.debug_with_visible_whitespace("false branch=$", value)
+    try:
+        value = POGGER.is_debug_enabled
+    finally:
+        POGGER.debug("finally")
+    return value
+"""
+    expected_source = """import logging
+POGGER = ParserLogger(logging.getLogger(__name__))
+LOGGER = logging.getLogger(__name__)
+
+def sample_function(value):
+    if value:
+        pass
+    else:
+        LOGGER.debug('false branch')
+    try:
+        value = POGGER.is_debug_enabled
+    finally:
+        pass
+    return value"""
+
+    # Act
+    stripped_tree = ParserLoggingStripper.strip_source(source_text, "sample.py")
+
+    # Assert
+    assert ast.unparse(stripped_tree) == expected_source
+    compile(stripped_tree, "sample.py", "exec")
+
+
+def test_parser_logging_stripper_used_when_requested() -> None:
+    """
+    Test to make sure that the parser's modules are only loaded with their logging
+    calls removed if requested by the environment variable.
+    """
+
+    # Arrange
+    variable_name = StrippedLoggingFinder.environment_variable_name
+    requested_by_value: Dict[str, bool] = {}
+
+    # Act
+    for next_value in ("", "0", "1", "yes"):
+        with patch.dict(os.environ, {variable_name: next_value}):
+            requested_by_value[next_value] = StrippedLoggingFinder.is_requested()
+
+    # Assert
+    assert requested_by_value == {"": False, "0": False, "1": True, "yes": True}
+
+
+def test_parser_logging_stripper_loader_reuses_cached_code() -> None:
+    """
+    Test to make sure that a module's stripped code is cached the first time that
+    it is loaded, and read from that cache the next time.
+    """
+
+    # Arrange
+    with tempfile.TemporaryDirectory(dir=os.getcwd()) as tmp_dir_path:
+        module_path = os.path.join(tmp_dir_path, "sample_module.py")
+        with open(module_path, "wt", encoding="utf-8") as module_file:
+            module_file.write('POGGER.debug("removed")\nSAMPLE_VALUE = 1\n')
+        module_loader = StrippedLoggingLoader("sample_module", module_path)
+
+        # Act
+        with patch.object(sys, "dont_write_bytecode", False), patch.object(
+            sys, "pycache_prefix", None
+        ):
+            uncached_code = module_loader.get_code("sample_module")
+            with patch.object(
+                ParserLoggingStripper, "strip_source", side_effect=AssertionError
+            ):
+                cached_code = module_loader.get_code("sample_module")
+        cached_file_names = os.listdir(os.path.join(tmp_dir_path, "__pycache__"))
+
+    # Assert
+    assert uncached_code is not None and cached_code is not None
+    assert cached_code.co_names == uncached_code.co_names == ("SAMPLE_VALUE",)
+    assert len(cached_file_names) == 1
+    assert ".opt-pymarkdownstripped1." in cached_file_names[0]
+
+
+def test_parser_logging_stripper_scan_results_unchanged(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that scanning with the logging calls removed from the
+    parser's modules reports the same results as scanning with the normal modules.
+    """
+
+    # Arrange
+    stripped_module_names = [
+        "pymarkdown.general.tokenized_markdown",
+        "pymarkdown.container_blocks.container_block_leaf_processor",
+        "pymarkdown.block_quotes.block_quote_processor",
+        "pymarkdown.block_quotes.block_quote_count_helper",
+        "pymarkdown.list_blocks.list_block_create_new_handler",
+        "pymarkdown.list_blocks.list_block_processor",
+        "pymarkdown.leaf_blocks.fenced_leaf_block_processor",
+        "pymarkdown.inline.inline_line_end_helper",
+    ]
+    scan_arguments = [
+        "scan",
+        os.path.join(
+            "test", "resources", "rules", "md027", "bad_block_quote_fenced_last.md"
+        ),
+        os.path.join(
+            "test", "resources", "rules", "md027", "bad_block_quote_full_link.md"
+        ),
+        os.path.join("test", "resources", "rules", "md032"),
+    ]
+    normal_results = scanner_default.invoke_main(arguments=scan_arguments)
+
+    # Act
+    with contextlib.ExitStack() as exit_stack:
+        patched_function_count = __patch_with_stripped_modules(
+            stripped_module_names, exit_stack
+        )
+        stripped_results = scanner_default.invoke_main(arguments=scan_arguments)
+
+    # Assert
+    assert patched_function_count > len(stripped_module_names)
+    assert normal_results.std_out.getvalue()
+    assert stripped_results.return_code == normal_results.return_code
+    assert stripped_results.std_out.getvalue() == normal_results.std_out.getvalue()
+    assert stripped_results.std_err.getvalue() == normal_results.std_err.getvalue()
+
+
+@pytest.mark.timeout(30)
+def test_parser_logging_stripper_installed_when_requested() -> None:
+    """
+    Test to make sure that, if requested by the environment variable, the finder
+    is installed when the `pymarkdown` package is imported, and loads the parser's
+    modules with the stripping loader.
+    """
+
+    # Arrange
+    script_text = (
+        "import pymarkdown.general.tokenized_markdown as tokenized_markdown;"
+        + "from pymarkdown.general.parser_logging_stripper import StrippedLoggingFinder;"
+        + "print(StrippedLoggingFinder.is_installed());"
+        + "print(type(tokenized_markdown.__loader__).__name__)"
+    )
+
+    # Act
+    stripped_process = __run_pymarkdown(
+        ["-c", script_text], {StrippedLoggingFinder.environment_variable_name: "1"}
+    )
+
+    # Assert
+    assert stripped_process.returncode == 0
+    assert stripped_process.stdout.splitlines() == ["True", "StrippedLoggingLoader"]
@@ -0,0 +1,43 @@
+"""
+Tests for the ParserState class.
+"""
+
+from test.basic.test_container_grab_bag import Bob
+
+import pytest
+
+from pymarkdown.general.position_marker import PositionMarker
+from pymarkdown.tokens.block_quote_markdown_token import BlockQuoteMarkdownToken
+from pymarkdown.tokens.paragraph_markdown_token import ParagraphMarkdownToken
+from pymarkdown.tokens.stack_token import BlockQuoteStackToken, DocumentStackToken
+
+
+def test_parser_state_find_matching_markdown_token_index() -> None:
+    """
+    Test to make sure that the index of a stack token's matching markdown token is
+    recorded once found, and is found again if the document changes.
+    """
+
+    # Arrange
+    parser_state = Bob().parser_state
+    block_quote_token = BlockQuoteMarkdownToken("", PositionMarker(2, 1, "> "))
+    stack_token = BlockQuoteStackToken(block_quote_token)
+    parser_state.token_stack.extend([DocumentStackToken(), stack_token])
+    parser_state.token_document.extend(
+        [ParagraphMarkdownToken("", PositionMarker(1, 1, "")), block_quote_token]
+    )
+
+    # Act
+    first_index = parser_state.find_matching_markdown_token_index(stack_token)
+    recorded_index = stack_token.matching_markdown_token_index
+    parser_state.token_document.insert(
+        0, ParagraphMarkdownToken("", PositionMarker(1, 1, ""))
+    )
+    second_index = parser_state.find_matching_markdown_token_index(stack_token)
+    del parser_state.token_document[1:]
+
+    # Assert
+    assert first_index == recorded_index == 1
+    assert second_index == stack_token.matching_markdown_token_index == 2
+    with pytest.raises(ValueError):
+        parser_state.find_matching_markdown_token_index(stack_token)
@@ -0,0 +1,85 @@
+"""
+Module to provide tests for the pragma interval index.
+"""
+
+from typing import Set
+
+from pymarkdown.plugin_manager.pragma_interval_index import PragmaIntervalIndex
+
+
+def __calculate_pragma_offset_line_by_line(
+    pragma_line_numbers: Set[int], line_number: int, line_number_delta: int
+) -> int:
+    pragma_offset = 0
+    for line_index in range(line_number_delta):
+        modified_line_number = line_number + line_index + 1 + pragma_offset
+        if modified_line_number in pragma_line_numbers:
+            pragma_offset += 1
+    return pragma_offset
+
+
+def test_pragma_interval_index_empty() -> None:
+    """
+    Test that an empty index does not disable anything or contain any pragmas.
+    """
+
+    # Arrange
+    pragma_index = PragmaIntervalIndex()
+
+    # Act
+    is_disabled = pragma_index.is_rule_disabled_on_line("md001", 1)
+    is_pragma = pragma_index.is_pragma_on_line(1)
+    pragma_offset = pragma_index.calculate_pragma_offset(1, 10)
+
+    # Assert
+    assert not is_disabled
+    assert not is_pragma
+    assert pragma_offset == 0
+
+
+def test_pragma_interval_index_overlapping_ranges() -> None:
+    """
+    Test that overlapping and adjacent ranges from both types of pragma are
+    merged for each rule, and that the ends of each range are included.
+    """
+
+    # Arrange
+    pragma_index = PragmaIntervalIndex(
+        [(3, 5, {"md001", "md002"}), (20, 25, {"md001"})],
+        [(4, 10, "md001"), (11, 12, "md001"), (30, 29, "md002")],
+    )
+
+    # Act
+    md001_disabled_lines = [
+        i for i in range(1, 31) if pragma_index.is_rule_disabled_on_line("md001", i)
+    ]
+    md002_disabled_lines = [
+        i for i in range(1, 31) if pragma_index.is_rule_disabled_on_line("md002", i)
+    ]
+
+    # Assert
+    assert md001_disabled_lines == list(range(3, 13)) + list(range(20, 26))
+    assert md002_disabled_lines == [3, 4, 5]
+
+
+def test_pragma_interval_index_pragma_offset_matches_line_by_line() -> None:
+    """
+    Test that the pragma offset matches the result of examining each line in
+    turn, including for consecutive pragma lines.
+    """
+
+    # Arrange
+    pragma_line_numbers = {2, 5, 6, 7, 12, 20, 21}
+    pragma_index = PragmaIntervalIndex(pragma_line_numbers=pragma_line_numbers)
+
+    # Act & Assert
+    for line_number in range(0, 25):
+        for line_number_delta in range(0, 15):
+            assert pragma_index.calculate_pragma_offset(
+                line_number, line_number_delta
+            ) == __calculate_pragma_offset_line_by_line(
+                pragma_line_numbers, line_number, line_number_delta
+            ), f"line_number={line_number}, line_number_delta={line_number_delta}"
+    assert [i for i in range(1, 25) if pragma_index.is_pragma_on_line(i)] == sorted(
+        pragma_line_numbers
+    )
@@ -3,11 +3,14 @@ Module to provide tests for source providers.
 """
 
 import os
+import tempfile
 from typing import Optional
 
 from pymarkdown.general.source_providers import (
     FileSourceProvider,
     InMemorySourceProvider,
+    ResettableSourceProvider,
+    StreamingFileSourceProvider,
 )
 
 
@@ -210,3 +213,142 @@ def test_source_provider_file_two_lines_with_blank_between_and_trailing() -> Non
     __verify_line(expected_third_line, actual_third_line)
     __verify_line(expected_fourth_line, actual_fourth_line)
     __verify_line(expected_fifth_line, actual_fifth_line)
+
+
+def test_source_provider_streaming_file_empty() -> None:
+    """
+    Test the streaming file source provider with an empty file.
+    """
+
+    # Arrange
+    source_provider = StreamingFileSourceProvider(
+        __generate_source_path("empty-file.txt")
+    )
+    expected_first_line = ""
+    expected_second_line = None
+
+    # Act
+    actual_first_line = source_provider.get_next_line()
+    actual_second_line = source_provider.get_next_line()
+
+    # Assert
+    __verify_line(expected_first_line, actual_first_line)
+    __verify_line(expected_second_line, actual_second_line)
+    assert source_provider.did_final_line_end_with_newline
+
+
+def test_source_provider_streaming_file_two_lines() -> None:
+    """
+    Test the streaming file source provider with two lines of input and no
+    trailing newline.
+    """
+
+    # Arrange
+    source_provider = StreamingFileSourceProvider(
+        __generate_source_path("double-line.txt")
+    )
+    expected_first_line = "this is the first line"
+    expected_second_line = "this is the second line"
+    expected_third_line = None
+
+    # Act
+    actual_first_line = source_provider.get_next_line()
+    actual_second_line = source_provider.get_next_line()
+    actual_third_line = source_provider.get_next_line()
+
+    # Assert
+    __verify_line(expected_first_line, actual_first_line)
+    __verify_line(expected_second_line, actual_second_line)
+    __verify_line(expected_third_line, actual_third_line)
+    assert source_provider.is_at_end_of_file
+    assert not source_provider.did_final_line_end_with_newline
+
+
+def test_source_provider_streaming_file_matches_file_after_reset() -> None:
+    """
+    Test the streaming file source provider provides the same lines as the
+    file source provider, including after being reset part way through.
+    """
+
+    # Arrange
+    source_path = __generate_source_path("double-line-with-blank-and-trailing.txt")
+    file_provider = FileSourceProvider(source_path)
+    streaming_provider = StreamingFileSourceProvider(source_path)
+    expected_lines = []
+    while (next_line := file_provider.get_next_line()) is not None:
+        expected_lines.append(next_line)
+
+    # Act
+    streaming_provider.get_next_line()
+    streaming_provider.get_next_line()
+    streaming_provider.reset_to_start()
+    actual_lines = []
+    while (next_line := streaming_provider.get_next_line()) is not None:
+        actual_lines.append(next_line)
+
+    # Assert
+    assert actual_lines == expected_lines
+    assert (
+        streaming_provider.did_final_line_end_with_newline
+        == file_provider.did_final_line_end_with_newline
+    )
+
+
+def test_source_provider_in_memory_matches_file_after_reset() -> None:
+    """
+    Test the in memory source provider provides the same lines as the file
+    source provider, including after being reset part way through.
+    """
+
+    # Arrange
+    source_path = __generate_source_path("double-line-with-blank-and-trailing.txt")
+    file_provider = FileSourceProvider(source_path)
+    with open(source_path, "rt", encoding="utf-8") as source_file:
+        in_memory_provider = InMemorySourceProvider(source_file.read())
+    expected_lines = []
+    while (next_line := file_provider.get_next_line()) is not None:
+        expected_lines.append(next_line)
+
+    # Act
+    in_memory_provider.get_next_line()
+    in_memory_provider.get_next_line()
+    in_memory_provider.reset_to_start()
+    actual_lines = []
+    while (next_line := in_memory_provider.get_next_line()) is not None:
+        actual_lines.append(next_line)
+
+    # Assert
+    assert actual_lines == expected_lines
+    assert in_memory_provider.is_at_end_of_file
+    assert (
+        in_memory_provider.did_final_line_end_with_newline
+        == file_provider.did_final_line_end_with_newline
+    )
+
+
+def test_source_provider_from_file_uses_streaming_for_large_files() -> None:
+    """
+    Test that a streaming file source provider is only used for files at or
+    above the streaming threshold.
+    """
+
+    # Arrange
+    saved_threshold = ResettableSourceProvider.streaming_threshold_in_bytes
+    with tempfile.NamedTemporaryFile(
+        "wt", suffix=".md", delete=False, encoding="utf-8"
+    ) as source_file:
+        source_file.write("# Heading\n")
+        source_path = source_file.name
+
+    # Act
+    try:
+        small_provider = ResettableSourceProvider.from_file(source_path)
+        ResettableSourceProvider.streaming_threshold_in_bytes = 10
+        large_provider = ResettableSourceProvider.from_file(source_path)
+    finally:
+        ResettableSourceProvider.streaming_threshold_in_bytes = saved_threshold
+        os.remove(source_path)
+
+    # Assert
+    assert isinstance(small_provider, FileSourceProvider)
+    assert isinstance(large_provider, StreamingFileSourceProvider)
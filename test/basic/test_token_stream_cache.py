@@ -0,0 +1,230 @@
+"""
+Module to provide tests for the cache of the tokens produced by tokenizing a
+document.
+"""
+
+from test.tokens.mock_plugin_modify_context import MockPluginModifyContext
+from test.utils import create_tokenizer
+from typing import List
+
+import pytest
+
+from pymarkdown.general.source_providers import InMemorySourceProvider
+from pymarkdown.general.token_stream_cache import TokenStreamCache
+from pymarkdown.general.tokenized_markdown import TokenizedMarkdown
+from pymarkdown.tokens.markdown_token import MarkdownToken
+
+__SAMPLE_DOCUMENT = """# Heading 1
+
+Some *paragraph*
+text.
+
+- item 1
+- item 2
+
+> quote
+"""
+
+
+def __get_tokens(
+    token_cache: TokenStreamCache,
+    tokenizer: TokenizedMarkdown,
+    source_text: str,
+    tokenized_texts: List[str],
+) -> List[MarkdownToken]:
+    def __tokenize() -> List[MarkdownToken]:
+        tokenized_texts.append(source_text)
+        return tokenizer.transform_from_provider(
+            InMemorySourceProvider(source_text), do_add_end_of_stream_token=True
+        )
+
+    return token_cache.get_tokens(
+        source_text, tokenizer.configuration_fingerprint, __tokenize
+    )
+
+
+def test_token_stream_cache_reuses_tokens_for_same_contents() -> None:
+    """
+    Test to make sure that asking for the tokens of the same contents a second
+    time returns the same tokens without tokenizing those contents again.
+    """
+
+    # Arrange
+    tokenizer = create_tokenizer()
+    token_cache = TokenStreamCache()
+    tokenized_texts: List[str] = []
+    expected_tokens = [
+        str(next_token)
+        for next_token in tokenizer.transform_from_provider(
+            InMemorySourceProvider(__SAMPLE_DOCUMENT), do_add_end_of_stream_token=True
+        )
+    ]
+
+    # Act
+    first_tokens = __get_tokens(
+        token_cache, tokenizer, __SAMPLE_DOCUMENT, tokenized_texts
+    )
+    second_tokens = __get_tokens(
+        token_cache, tokenizer, __SAMPLE_DOCUMENT, tokenized_texts
+    )
+
+    # Assert
+    assert tokenized_texts == [__SAMPLE_DOCUMENT]
+    assert [str(next_token) for next_token in first_tokens] == expected_tokens
+    assert [str(next_token) for next_token in second_tokens] == expected_tokens
+    assert (token_cache.hit_count, token_cache.miss_count) == (1, 1)
+
+
+def test_token_stream_cache_returns_copy_of_tokens() -> None:
+    """
+    Test to make sure that any changes to the returned tokens, as are made when
+    the tokens are fixed, do not change the tokens returned for later requests.
+    """
+
+    # Arrange
+    tokenizer = create_tokenizer()
+    token_cache = TokenStreamCache()
+    tokenized_texts: List[str] = []
+    first_tokens = __get_tokens(
+        token_cache, tokenizer, __SAMPLE_DOCUMENT, tokenized_texts
+    )
+    expected_tokens = [str(next_token) for next_token in first_tokens]
+    second_tokens = __get_tokens(
+        token_cache, tokenizer, __SAMPLE_DOCUMENT, tokenized_texts
+    )
+
+    # Act
+    first_tokens.clear()
+    second_tokens[0].adjust_line_number(MockPluginModifyContext(), 10)
+    second_tokens.pop()
+    third_tokens = __get_tokens(
+        token_cache, tokenizer, __SAMPLE_DOCUMENT, tokenized_texts
+    )
+
+    # Assert
+    assert tokenized_texts == [__SAMPLE_DOCUMENT]
+    assert [str(next_token) for next_token in third_tokens] == expected_tokens
+    assert all(
+        third_token is not second_token
+        for third_token, second_token in zip(third_tokens, second_tokens)
+    )
+
+
+def test_token_stream_cache_tokenizes_different_contents() -> None:
+    """
+    Test to make sure that contents that differ by a single character are
+    tokenized separately.
+    """
+
+    # Arrange
+    tokenizer = create_tokenizer()
+    token_cache = TokenStreamCache()
+    tokenized_texts: List[str] = []
+    changed_document = __SAMPLE_DOCUMENT.replace("# Heading 1", "## Heading 1")
+
+    # Act
+    __get_tokens(token_cache, tokenizer, __SAMPLE_DOCUMENT, tokenized_texts)
+    changed_tokens = __get_tokens(
+        token_cache, tokenizer, changed_document, tokenized_texts
+    )
+
+    # Assert
+    assert tokenized_texts == [__SAMPLE_DOCUMENT, changed_document]
+    assert str(changed_tokens[0]).startswith("[atx(1,1):2:")
+
+
+def test_token_stream_cache_tokenizes_with_different_configuration() -> None:
+    """
+    Test to make sure that the same contents are tokenized again if they are
+    tokenized with a different set of extensions enabled.
+    """
+
+    # Arrange
+    default_tokenizer = create_tokenizer()
+    front_matter_tokenizer = create_tokenizer(enabled_extensions="front-matter")
+    token_cache = TokenStreamCache()
+    tokenized_texts: List[str] = []
+    source_text = "---\ntitle: abc\n---\n" + __SAMPLE_DOCUMENT
+
+    # Act
+    default_tokens = __get_tokens(
+        token_cache, default_tokenizer, source_text, tokenized_texts
+    )
+    front_matter_tokens = __get_tokens(
+        token_cache, front_matter_tokenizer, source_text, tokenized_texts
+    )
+
+    # Assert
+    assert (
+        default_tokenizer.configuration_fingerprint
+        != front_matter_tokenizer.configuration_fingerprint
+    )
+    assert (
+        create_tokenizer().configuration_fingerprint
+        == default_tokenizer.configuration_fingerprint
+    )
+    assert tokenized_texts == [source_text, source_text]
+    assert str(default_tokens[0]).startswith("[tbreak(")
+    assert str(front_matter_tokens[0]).startswith("[front-matter(")
+
+
+def test_token_stream_cache_removes_least_recently_used() -> None:
+    """
+    Test to make sure that once the cache is full, the entry that was used least
+    recently is removed to make room for a new entry.
+    """
+
+    # Arrange
+    tokenizer = create_tokenizer()
+    token_cache = TokenStreamCache(maximum_entries=2)
+    tokenized_texts: List[str] = []
+    first_text, second_text, third_text = "# first\n", "# second\n", "# third\n"
+    __get_tokens(token_cache, tokenizer, first_text, tokenized_texts)
+    __get_tokens(token_cache, tokenizer, second_text, tokenized_texts)
+    __get_tokens(token_cache, tokenizer, first_text, tokenized_texts)
+
+    # Act
+    __get_tokens(token_cache, tokenizer, third_text, tokenized_texts)
+    __get_tokens(token_cache, tokenizer, first_text, tokenized_texts)
+    __get_tokens(token_cache, tokenizer, second_text, tokenized_texts)
+
+    # Assert
+    assert tokenized_texts == [first_text, second_text, third_text, second_text]
+
+
+def test_token_stream_cache_clear() -> None:
+    """
+    Test to make sure that clearing the cache causes the contents to be
+    tokenized again.
+    """
+
+    # Arrange
+    tokenizer = create_tokenizer()
+    token_cache = TokenStreamCache()
+    tokenized_texts: List[str] = []
+    __get_tokens(token_cache, tokenizer, __SAMPLE_DOCUMENT, tokenized_texts)
+
+    # Act
+    token_cache.clear()
+    __get_tokens(token_cache, tokenizer, __SAMPLE_DOCUMENT, tokenized_texts)
+
+    # Assert
+    assert tokenized_texts == [__SAMPLE_DOCUMENT, __SAMPLE_DOCUMENT]
+
+
+def test_token_stream_cache_with_bad_maximum_entries() -> None:
+    """
+    Test to make sure that the cache must be able to hold at least one entry.
+    """
+
+    # Arrange
+    maximum_entries = 0
+
+    # Act
+    with pytest.raises(ValueError) as raised_exception:
+        TokenStreamCache(maximum_entries=maximum_entries)
+
+    # Assert
+    assert str(raised_exception.value) == (
+        "Maximum number of entries must be at least 1."
+    )
@@ -0,0 +1,31 @@
+"""
+Module to implement a sample plugin that has a bad list of token types.
+"""
+
+from pymarkdown.plugin_manager.plugin_details import PluginDetailsV4
+from pymarkdown.plugin_manager.rule_plugin import RulePlugin
+
+
+class BadTokenTypes(RulePlugin):
+    """
+    Class to implement a sample plugin that has a bad list of token types.
+    """
+
+    def get_details(self):
+        """
+        Get the details for the plugin.
+        """
+        return PluginDetailsV4(
+            plugin_name="bad-token-types",
+            plugin_id="MDE008",
+            plugin_enabled_by_default=True,
+            plugin_description="Test for a bad list of token types",
+            plugin_version="0.0.0",
+            plugin_token_types=["atx"],
+        )
+
+    def next_token(self, context, token):
+        """
+        Event that a new token is being processed.
+        """
+        _ = (context, token)
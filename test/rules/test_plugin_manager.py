@@ -1233,7 +1233,70 @@ def test_markdown_with_dash_dash_add_plugin_with_bad_interface_version(
     expected_results = ExpectedResults(
         return_code=1,
         expected_error="""BadPluginError encountered while loading plugins:
-Plugin 'bad_interface_version.py' with an interface version ('-1') that is not '1', '2', or '3'.
+Plugin 'bad_interface_version.py' with an interface version ('-1') that is not '1', '2', '3', or '4'.
+""",
+    )
+
+    # Act
+    execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+    # Assert
+    execute_results.assert_results(expected_results=expected_results)
+
+
+def test_markdown_with_dash_dash_add_plugin_with_token_types(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that a plugin that declares the token types it is interested
+    in is only called for those tokens and their end tokens.
+    """
+
+    # Arrange
+    source_path, _ = __generate_source_path("end_with_blank_line.md")
+    supplied_arguments = [
+        "--add-plugin",
+        "test/resources/plugins/token_types/plugin_token_types.py",
+        "scan",
+        source_path,
+    ]
+
+    expected_results = ExpectedResults(
+        return_code=0,
+        expected_output="""MD997>>next_token:atx
+MD997>>next_token:end-atx
+""",
+    )
+
+    # Act
+    execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+    # Assert
+    execute_results.assert_results(expected_results=expected_results)
+
+
+def test_markdown_with_dash_dash_add_plugin_with_bad_token_types(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure we get an error logged if a plugin returns token types that
+    are not token classes.
+    """
+
+    # Arrange
+    source_path, _ = __generate_source_path("end_with_blank_line.md")
+    plugin_path = generate_path_to_bad_plugin("bad_token_types.py")
+    supplied_arguments = [
+        "--add-plugin",
+        plugin_path,
+        "scan",
+        source_path,
+    ]
+
+    expected_results = ExpectedResults(
+        return_code=1,
+        expected_error="""BadPluginError encountered while loading plugins:
+Plugin class 'BadTokenTypes' returned an improperly typed value for field name 'plugin_token_types'.
 """,
     )
 
@@ -2276,6 +2339,46 @@ Fixed: {temp_source_path}"""
         assert_file_is_as_expected(temp_source_path, expected_file_contents)
 
 
+def test_markdown_fixed_issue_keeps_file_mode_and_leaves_no_temporary_files(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that fixing a file replaces it with a file that has the
+    same mode, and that no temporary files are left beside it.
+    """
+
+    # Arrange
+    source_path, _ = __generate_source_path("end_with_no_blank_line.md", "md047")
+    with copy_to_temp_file(source_path) as temp_source_path:
+        os.chmod(temp_source_path, 0o640)
+        original_mode = os.stat(temp_source_path).st_mode
+        temp_directory = os.path.dirname(temp_source_path)
+        original_directory_entries = set(os.listdir(temp_directory))
+        supplied_arguments = [
+            "--disable-rules",
+            "md009,md011,md013",
+            "fix",
+            temp_source_path,
+        ]
+
+        expected_results = ExpectedResults(
+            return_code=3, expected_output=f"Fixed: {temp_source_path}"
+        )
+        expected_file_contents = read_contents_of_text_file(temp_source_path) + "\n"
+
+        # Act
+        execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+        # Assert
+        execute_results.assert_results(expected_results=expected_results)
+        assert_file_is_as_expected(temp_source_path, expected_file_contents)
+        assert os.stat(temp_source_path).st_mode == original_mode
+        assert (
+            not {i for i in os.listdir(temp_directory) if i.endswith(".tmp")}
+            - original_directory_entries
+        )
+
+
 def test_markdown_fixed_issue_line_with_debug_and_file_debug_on(
     scanner_default: MarkdownScanner,
 ) -> None:
@@ -2338,17 +2441,16 @@ FixLineRecord(source='completed_file', line_number=4, plugin_id='md047')"""
         assert first_section[2] == initial_file_contents.replace("\n", "\\n")
         assert first_section[3] == "--"
 
-        last_section = std_out_split[-7:]
+        last_section = std_out_split[-6:]
         print(last_section)
         assert last_section[0] == ""
         assert last_section[1].startswith("--") and last_section[1].endswith("--")
         assert last_section[2] == expected_file_contents.replace("\n", "\\n")
         assert last_section[3] == "--"
-        assert last_section[4].startswith("Copy ")
-        assert last_section[5].startswith("Remove:")
-        assert last_section[6] == f"Fixed: {temp_source_path}"
+        assert last_section[4] == f"Write: {temp_source_path}"
+        assert last_section[5] == f"Fixed: {temp_source_path}"
 
-        middle_section = std_out_split[4:-7]
+        middle_section = std_out_split[4:-6]
         print(middle_section)
         split_output = expected_output.splitlines()
         print(split_output)
@@ -2421,18 +2523,16 @@ We skipped out a 2nd level heading in this document
         assert first_section[2] == initial_file_contents.replace("\n", "\\n")
         assert first_section[3] == "--"
 
-        last_section = std_out_split[-8:]
+        last_section = std_out_split[-6:]
         print(last_section)
         assert last_section[0] == ""
         assert last_section[1].startswith("--") and last_section[1].endswith("--")
         assert last_section[2] == expected_file_contents.replace("\n", "\\n")
         assert last_section[3] == "--"
-        assert last_section[4].startswith("Copy ")
-        assert last_section[5].startswith("Remove:")
-        assert last_section[6].startswith("Remove:")
-        assert last_section[7] == f"Fixed: {temp_source_path}"
+        assert last_section[4] == f"Write: {temp_source_path}"
+        assert last_section[5] == f"Fixed: {temp_source_path}"
 
-        # middle_section = std_out_split[4:-8]
+        # middle_section = std_out_split[4:-6]
         # print("-->")
         # print("\n".join(middle_section))
         # print("<--")
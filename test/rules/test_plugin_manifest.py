@@ -0,0 +1,173 @@
+"""
+Module to provide tests related to the manifest of the plugins that are
+included with PyMarkdown.
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from typing import List, Set
+
+from application_properties import ApplicationProperties
+
+from pymarkdown.general.main_presentation import MainPresentation
+from pymarkdown.plugin_manager.plugin_manager import PluginManager
+from pymarkdown.plugin_manager.plugin_manifest import PluginManifest
+
+__PLUGINS_DIRECTORY = os.path.join("pymarkdown", "plugins")
+
+
+def __find_rule_modules_imported_by(arguments: List[str]) -> Set[str]:
+    """
+    Run PyMarkdown in a new interpreter, reporting the rule modules that were
+    imported, as listed by Python's `-X importtime` option.
+    """
+    completed_process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "pymarkdown", *arguments],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    imported_modules = {
+        next_line.split("|")[-1].strip()
+        for next_line in completed_process.stderr.splitlines()
+        if next_line.startswith("import time:")
+    }
+    return {
+        next_module
+        for next_module in imported_modules
+        if next_module.startswith("rule_md_") or next_module.startswith("rule_pml_")
+    }
+
+
+def __initialize_plugin_manager(directory_to_search: str) -> PluginManager:
+    plugin_manager = PluginManager(MainPresentation())
+    plugin_manager.initialize(
+        directory_to_search, [], "", "", ApplicationProperties(), False, False
+    )
+    return plugin_manager
+
+
+def test_plugin_manifest_is_up_to_date() -> None:
+    """
+    Test to make sure that the manifest for the plugins included with PyMarkdown
+    matches those plugins.  If this fails, run `utils/generate_plugin_manifest.py`.
+    """
+
+    # Arrange
+    manifest_path = os.path.join(__PLUGINS_DIRECTORY, PluginManifest.manifest_file_name)
+    with open(manifest_path, "rt", encoding="utf-8") as manifest_file:
+        expected_manifest_text = manifest_file.read()
+
+    # Act
+    actual_manifest_text = PluginManager.create_plugin_manifest(__PLUGINS_DIRECTORY)
+
+    # Assert
+    assert actual_manifest_text == expected_manifest_text
+
+
+def test_plugin_manifest_used_to_register_plugins() -> None:
+    """
+    Test to make sure that the plugins in a directory with a manifest are
+    registered from that manifest, and only loaded when needed.
+    """
+
+    # Arrange
+    with tempfile.TemporaryDirectory() as plugins_directory:
+        shutil.copy(
+            os.path.join(__PLUGINS_DIRECTORY, "plugin_one.py"), plugins_directory
+        )
+        manifest_text = PluginManager.create_plugin_manifest(plugins_directory)
+        manifest_document = json.loads(manifest_text)
+        manifest_document["plugins"][0]["description"] = "From the manifest"
+        with open(
+            os.path.join(plugins_directory, PluginManifest.manifest_file_name),
+            "wt",
+            encoding="utf-8",
+        ) as manifest_file:
+            json.dump(manifest_document, manifest_file)
+
+        # Act
+        plugin_manager = __initialize_plugin_manager(plugins_directory)
+        registered_plugin = plugin_manager.registered_plugins[0]
+        was_loaded_before_use = "plugin_instance" in registered_plugin.__dict__
+        plugin_details = registered_plugin.plugin_instance.get_details()
+
+    # Assert
+    assert registered_plugin.plugin_description == "From the manifest"
+    assert not was_loaded_before_use
+    assert plugin_details.plugin_id == "MD999"
+
+
+def test_plugin_manifest_ignored_if_plugin_files_differ() -> None:
+    """
+    Test to make sure that a manifest that does not list exactly the plugin files
+    in its directory is ignored, and the plugins are loaded instead.
+    """
+
+    # Arrange
+    with tempfile.TemporaryDirectory() as plugins_directory:
+        with open(
+            os.path.join(plugins_directory, PluginManifest.manifest_file_name),
+            "wt",
+            encoding="utf-8",
+        ) as manifest_file:
+            json.dump({"version": 1, "plugins": []}, manifest_file)
+        shutil.copy(
+            os.path.join(__PLUGINS_DIRECTORY, "plugin_one.py"), plugins_directory
+        )
+
+        # Act
+        plugin_manager = __initialize_plugin_manager(plugins_directory)
+
+    # Assert
+    assert plugin_manager.all_plugin_ids == ["md999"]
+    assert plugin_manager.registered_plugins[0].plugin_description == "Debug plugin"
+
+
+def test_plugin_manifest_startup_only_imports_enabled_rules() -> None:
+    """
+    Test to make sure that a cold start of PyMarkdown to scan a single file only
+    imports the modules for the rules that are enabled.  As importing every rule
+    module is a large part of the startup time, this guards against changes that
+    would make startup slower again.
+    """
+
+    # Arrange
+    path_to_scan = os.path.join(
+        "test", "resources", "rules", "md047", "end_with_blank_line.md"
+    )
+
+    # Act
+    restricted_modules = __find_rule_modules_imported_by(
+        ["--disable-rules", "*", "--enable-rules", "md047", "scan", path_to_scan]
+    )
+
+    # Assert
+    assert restricted_modules == {"rule_md_047"}
+
+
+def test_plugin_manifest_default_configuration_only_loads_enabled_rules() -> None:
+    """
+    Test to make sure that applying the default configuration only loads the
+    rules that are enabled by default, leaving the rules that are disabled by
+    default, such as the deprecated rules, unloaded.
+    """
+
+    # Arrange
+    plugin_manager = __initialize_plugin_manager(__PLUGINS_DIRECTORY)
+
+    # Act
+    plugin_manager.apply_configuration(ApplicationProperties())
+    loaded_plugin_ids = {
+        next_plugin.plugin_id
+        for next_plugin in plugin_manager.registered_plugins
+        if "plugin_instance" in next_plugin.__dict__
+    }
+
+    # Assert
+    assert "md047" in loaded_plugin_ids
+    assert not {"md002", "md006", "pml100"} & loaded_plugin_ids
@@ -18,9 +18,14 @@ if sys.version_info < (3, 13):
         "-ae ALTERNATE_EXTENSIONS, --alternate-extensions ALTERNATE_EXTENSIONS"
     )
     EXCLUSIONS_X = "-e PATH_EXCLUSIONS, --exclude PATH_EXCLUSIONS"
+    JOBS_X = """-j SCAN_JOBS, --jobs SCAN_JOBS
+                        number of processes to use when scanning multiple
+                        files"""
 else:
     ALT_EXTENSIONS_X = "-ae, --alternate-extensions ALTERNATE_EXTENSIONS"
     EXCLUSIONS_X = "-e, --exclude PATH_EXCLUSIONS"
+    JOBS_X = """-j, --jobs SCAN_JOBS  number of processes to use when scanning multiple
+                        files"""
 
 # pylint: disable=too-many-lines
 
@@ -35,7 +40,10 @@ def test_markdown_with_dash_h(scanner_default: MarkdownScanner) -> None:
 
     expected_results = ExpectedResults(
         expected_output=f"""usage: main.py scan [-h] [-l] [-r] [-ae ALTERNATE_EXTENSIONS]
-                    [-e PATH_EXCLUSIONS] [--respect-gitignore]
+                    [-e PATH_EXCLUSIONS] [--respect-gitignore] [-j SCAN_JOBS]
+                    [--cache-directory SCAN_CACHE_DIRECTORY]
+                    [--html-directory SCAN_HTML_DIRECTORY]
+                    [--output-format {{text,jsonl,sarif}}]
                     path [path ...]
 
 positional arguments:
@@ -55,6 +63,15 @@ positional arguments:
                         one or more paths to exclude from the search. Can be a
                         glob pattern.
   --respect-gitignore   respect any setting in the local .gitignore file.
+  {JOBS_X}
+  --cache-directory SCAN_CACHE_DIRECTORY
+                        directory used to cache the scan results for unchanged
+                        files
+  --html-directory SCAN_HTML_DIRECTORY
+                        directory to render the HTML for each scanned file
+                        into
+  --output-format {{text,jsonl,sarif}}
+                        format to output any scan results in
 """
     )
 
@@ -79,7 +96,10 @@ def test_markdown_with_dash_l_only(scanner_default: MarkdownScanner) -> None:
     expected_results = ExpectedResults(
         return_code=2,
         expected_error="""usage: main.py scan [-h] [-l] [-r] [-ae ALTERNATE_EXTENSIONS]
-                    [-e PATH_EXCLUSIONS] [--respect-gitignore]
+                    [-e PATH_EXCLUSIONS] [--respect-gitignore] [-j SCAN_JOBS]
+                    [--cache-directory SCAN_CACHE_DIRECTORY]
+                    [--html-directory SCAN_HTML_DIRECTORY]
+                    [--output-format {text,jsonl,sarif}]
                     path [path ...]
 main.py scan: error: the following arguments are required: path
 """,
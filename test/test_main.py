@@ -54,17 +54,21 @@ def test_markdown_with_no_parameters(scanner_default: MarkdownScanner) -> None:
                [--log-level {CRITICAL,ERROR,WARNING,INFO,DEBUG}]
                [--log-file LOG_FILE]
                [--return-code-scheme {default,minimal,explicit}]
-               {extensions,fix,plugins,scan,scan-stdin,version} ...
+               {extensions,fix,plugins,scan,scan-stdin,serve,bench,version}
+               ...
 
 Lint any found Markdown files.
 
 positional arguments:
-  {extensions,fix,plugins,scan,scan-stdin,version}
+  {extensions,fix,plugins,scan,scan-stdin,serve,bench,version}
     extensions          extension commands
     fix                 fix the Markdown files in any specified paths
     plugins             plugin commands
     scan                scan the Markdown files in any specified paths
     scan-stdin          scan the standard input as a Markdown file
+    serve               run as a server that keeps the plugins loaded
+    bench               measure how fast the benchmark corpora are scanned and
+                        fixed
     version             version of the application
 
 {ARGPARSE_X}
@@ -129,17 +133,21 @@ def test_markdown_with_no_parameters_through_module(
                    [--log-level {CRITICAL,ERROR,WARNING,INFO,DEBUG}]
                    [--log-file LOG_FILE]
                    [--return-code-scheme {default,minimal,explicit}]
-                   {extensions,fix,plugins,scan,scan-stdin,version} ...
+                   {extensions,fix,plugins,scan,scan-stdin,serve,bench,version}
+                   ...
 
 Lint any found Markdown files.
 
 positional arguments:
-  {extensions,fix,plugins,scan,scan-stdin,version}
+  {extensions,fix,plugins,scan,scan-stdin,serve,bench,version}
     extensions          extension commands
     fix                 fix the Markdown files in any specified paths
     plugins             plugin commands
     scan                scan the Markdown files in any specified paths
     scan-stdin          scan the standard input as a Markdown file
+    serve               run as a server that keeps the plugins loaded
+    bench               measure how fast the benchmark corpora are scanned and
+                        fixed
     version             version of the application
 
 {ARGPARSE_X}
@@ -204,17 +212,21 @@ def test_markdown_with_no_parameters_through_main(
                [--log-level {CRITICAL,ERROR,WARNING,INFO,DEBUG}]
                [--log-file LOG_FILE]
                [--return-code-scheme {default,minimal,explicit}]
-               {extensions,fix,plugins,scan,scan-stdin,version} ...
+               {extensions,fix,plugins,scan,scan-stdin,serve,bench,version}
+               ...
 
 Lint any found Markdown files.
 
 positional arguments:
-  {extensions,fix,plugins,scan,scan-stdin,version}
+  {extensions,fix,plugins,scan,scan-stdin,serve,bench,version}
     extensions          extension commands
     fix                 fix the Markdown files in any specified paths
     plugins             plugin commands
     scan                scan the Markdown files in any specified paths
     scan-stdin          scan the standard input as a Markdown file
+    serve               run as a server that keeps the plugins loaded
+    bench               measure how fast the benchmark corpora are scanned and
+                        fixed
     version             version of the application
 
 {ARGPARSE_X}
@@ -275,17 +287,21 @@ def test_markdown_with_dash_h(scanner_default: MarkdownScanner) -> None:
                [--log-level {CRITICAL,ERROR,WARNING,INFO,DEBUG}]
                [--log-file LOG_FILE]
                [--return-code-scheme {default,minimal,explicit}]
-               {extensions,fix,plugins,scan,scan-stdin,version} ...
+               {extensions,fix,plugins,scan,scan-stdin,serve,bench,version}
+               ...
 
 Lint any found Markdown files.
 
 positional arguments:
-  {extensions,fix,plugins,scan,scan-stdin,version}
+  {extensions,fix,plugins,scan,scan-stdin,serve,bench,version}
     extensions          extension commands
     fix                 fix the Markdown files in any specified paths
     plugins             plugin commands
     scan                scan the Markdown files in any specified paths
     scan-stdin          scan the standard input as a Markdown file
+    serve               run as a server that keeps the plugins loaded
+    bench               measure how fast the benchmark corpora are scanned and
+                        fixed
     version             version of the application
 
 {ARGPARSE_X}
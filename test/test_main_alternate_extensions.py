@@ -111,7 +111,10 @@ def test_markdown_with_dash_ae_with_invalid_file_extension_no_period(
     expected_results = ExpectedResults(
         return_code=2,
         expected_error="""usage: main.py scan [-h] [-l] [-r] [-ae ALTERNATE_EXTENSIONS]
-                    [-e PATH_EXCLUSIONS] [--respect-gitignore]
+                    [-e PATH_EXCLUSIONS] [--respect-gitignore] [-j SCAN_JOBS]
+                    [--cache-directory SCAN_CACHE_DIRECTORY]
+                    [--html-directory SCAN_HTML_DIRECTORY]
+                    [--output-format {text,jsonl,sarif}]
                     path [path ...]
 main.py scan: error: argument -ae/--alternate-extensions: Extension 'md' must start with a period.""",
     )
@@ -142,7 +145,10 @@ def test_markdown_with_dash_ae_with_invalid_file_extension_no_alphanum(
     expected_results = ExpectedResults(
         return_code=2,
         expected_error="""usage: main.py scan [-h] [-l] [-r] [-ae ALTERNATE_EXTENSIONS]
-                    [-e PATH_EXCLUSIONS] [--respect-gitignore]
+                    [-e PATH_EXCLUSIONS] [--respect-gitignore] [-j SCAN_JOBS]
+                    [--cache-directory SCAN_CACHE_DIRECTORY]
+                    [--html-directory SCAN_HTML_DIRECTORY]
+                    [--output-format {text,jsonl,sarif}]
                     path [path ...]
 main.py scan: error: argument -ae/--alternate-extensions: Extension '.*' must only contain alphanumeric characters after the period.""",
     )
@@ -173,7 +179,10 @@ def test_markdown_with_dash_ae_with_invalid_file_extension_only_period(
     expected_results = ExpectedResults(
         return_code=2,
         expected_error="""usage: main.py scan [-h] [-l] [-r] [-ae ALTERNATE_EXTENSIONS]
-                    [-e PATH_EXCLUSIONS] [--respect-gitignore]
+                    [-e PATH_EXCLUSIONS] [--respect-gitignore] [-j SCAN_JOBS]
+                    [--cache-directory SCAN_CACHE_DIRECTORY]
+                    [--html-directory SCAN_HTML_DIRECTORY]
+                    [--output-format {text,jsonl,sarif}]
                     path [path ...]
 main.py scan: error: argument -ae/--alternate-extensions: Extension '.' must have at least one character after the period.""",
     )
@@ -204,7 +213,10 @@ def test_markdown_with_dash_ae_with_invalid_file_extension_semicolon_as_sep(
     expected_results = ExpectedResults(
         return_code=2,
         expected_error="""usage: main.py scan [-h] [-l] [-r] [-ae ALTERNATE_EXTENSIONS]
-                    [-e PATH_EXCLUSIONS] [--respect-gitignore]
+                    [-e PATH_EXCLUSIONS] [--respect-gitignore] [-j SCAN_JOBS]
+                    [--cache-directory SCAN_CACHE_DIRECTORY]
+                    [--html-directory SCAN_HTML_DIRECTORY]
+                    [--output-format {text,jsonl,sarif}]
                     path [path ...]
 main.py scan: error: argument -ae/--alternate-extensions: Extension '.md;.txt' must only contain alphanumeric characters after the period.""",
     )
@@ -235,7 +247,10 @@ def test_markdown_with_dash_ae_with_invalid_file_extension_empty(
     expected_results = ExpectedResults(
         return_code=2,
         expected_error="""usage: main.py scan [-h] [-l] [-r] [-ae ALTERNATE_EXTENSIONS]
-                    [-e PATH_EXCLUSIONS] [--respect-gitignore]
+                    [-e PATH_EXCLUSIONS] [--respect-gitignore] [-j SCAN_JOBS]
+                    [--cache-directory SCAN_CACHE_DIRECTORY]
+                    [--html-directory SCAN_HTML_DIRECTORY]
+                    [--output-format {text,jsonl,sarif}]
                     path [path ...]
 main.py scan: error: argument -ae/--alternate-extensions: Alternate extensions cannot be an empty string.""",
     )
@@ -0,0 +1,284 @@
+"""
+Module to provide tests related to the "bench" command.
+"""
+
+import json
+import os
+import tempfile
+from test.markdown_scanner import MarkdownScanner
+from test.pytest_execute import ExpectedResults
+from typing import Any, Dict
+
+from pymarkdown.benchmark.benchmark_corpus import BenchmarkCorpora
+from pymarkdown.benchmark.benchmark_helper import BenchmarkHelper
+from pymarkdown.general.phase_timer import PhaseTimer
+
+__CORPUS_NAME = "long-block-quotes"
+
+
+def __run_bench_to_file(
+    scanner: MarkdownScanner, output_directory: str
+) -> Dict[str, Any]:
+    output_file = os.path.join(output_directory, "results.json")
+    scan_results = scanner.invoke_main(
+        arguments=[
+            "bench",
+            "--corpus",
+            __CORPUS_NAME,
+            "--repeat",
+            "1",
+            "--output-file",
+            output_file,
+        ]
+    )
+    assert scan_results.return_code == 0
+    with open(output_file, "rt", encoding="utf-8") as input_file:
+        benchmark_results: Dict[str, Any] = json.load(input_file)
+    return benchmark_results
+
+
+def __write_baseline(output_directory: str, seconds: float) -> str:
+    baseline_results = {
+        "version": BenchmarkHelper.results_format_version,
+        "corpora": {__CORPUS_NAME: {"scan": {"seconds": seconds, "phases": {}}}},
+    }
+    baseline_file = os.path.join(output_directory, "baseline.json")
+    with open(baseline_file, "wt", encoding="utf-8") as output_file:
+        json.dump(baseline_results, output_file)
+    return baseline_file
+
+
+def test_markdown_with_bench_output_file(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that the bench command writes the time taken to scan and fix
+    each corpus, and each phase of doing so, to the output file.
+    """
+
+    # Arrange
+    with tempfile.TemporaryDirectory() as output_directory:
+
+        # Act
+        benchmark_results = __run_bench_to_file(scanner_default, output_directory)
+
+    # Assert
+    assert benchmark_results["version"] == 1
+    assert benchmark_results["scale"] == 1
+    assert benchmark_results["repeat"] == 1
+    assert list(benchmark_results["corpora"]) == [__CORPUS_NAME]
+    corpus_results = benchmark_results["corpora"][__CORPUS_NAME]
+    assert corpus_results["documents"] == 1
+    assert corpus_results["lines"] == 250
+    assert corpus_results["scan"]["errors"] == 0
+    assert corpus_results["scan"]["seconds"] > 0.0
+    assert sorted(corpus_results["scan"]["phases"]) == sorted(
+        [
+            PhaseTimer.block_pass_phase,
+            PhaseTimer.coalesce_phase,
+            PhaseTimer.inline_phase,
+            PhaseTimer.plugin_tokens_phase,
+            PhaseTimer.plugin_lines_phase,
+        ]
+    )
+    assert sorted(corpus_results["fix"]["phases"]) == sorted(
+        [
+            PhaseTimer.block_pass_phase,
+            PhaseTimer.coalesce_phase,
+            PhaseTimer.inline_phase,
+            PhaseTimer.fix_tokens_phase,
+            PhaseTimer.fix_lines_phase,
+        ]
+    )
+
+
+def test_markdown_with_bench_skip_fix(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that the bench command only measures scanning if asked to
+    skip fixing, and reports the results as a table.
+    """
+
+    # Arrange
+    supplied_arguments = [
+        "bench",
+        "--corpus",
+        __CORPUS_NAME,
+        "--repeat",
+        "1",
+        "--skip-fix",
+    ]
+
+    # Act
+    execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+    # Assert
+    assert execute_results.return_code == 0
+    output_lines = execute_results.std_out.getvalue().splitlines()
+    assert output_lines[1].split() == ["CORPUS", "OPERATION", "PHASE", "SECONDS"]
+    assert [next_line.split()[:3] for next_line in output_lines[3:] if next_line] == [
+        [__CORPUS_NAME, "scan", "total"],
+        [__CORPUS_NAME, "scan", PhaseTimer.block_pass_phase],
+        [__CORPUS_NAME, "scan", PhaseTimer.coalesce_phase],
+        [__CORPUS_NAME, "scan", PhaseTimer.inline_phase],
+        [__CORPUS_NAME, "scan", PhaseTimer.plugin_tokens_phase],
+        [__CORPUS_NAME, "scan", PhaseTimer.plugin_lines_phase],
+    ]
+    assert not execute_results.std_err.getvalue()
+
+
+def test_markdown_with_bench_compare_without_regression(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that comparing against results that were slower does not
+    report any regressions.
+    """
+
+    # Arrange
+    with tempfile.TemporaryDirectory() as output_directory:
+        baseline_file = __write_baseline(output_directory, 1000.0)
+        supplied_arguments = [
+            "bench",
+            "--corpus",
+            __CORPUS_NAME,
+            "--repeat",
+            "1",
+            "--skip-fix",
+            "--compare",
+            baseline_file,
+        ]
+
+        # Act
+        execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+    # Assert
+    assert execute_results.return_code == 0
+    output_lines = execute_results.std_out.getvalue().splitlines()
+    assert output_lines[1].split() == [
+        "CORPUS",
+        "OPERATION",
+        "PHASE",
+        "SECONDS",
+        "BASELINE",
+        "CHANGE",
+    ]
+    assert output_lines[3].split()[4] == "1000.000"
+    assert not execute_results.std_err.getvalue()
+
+
+def test_markdown_with_bench_compare_with_regression(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that comparing against results that were faster by more than
+    the threshold reports a regression.
+    """
+
+    # Arrange
+    with tempfile.TemporaryDirectory() as output_directory:
+        baseline_file = __write_baseline(output_directory, 0.001)
+        supplied_arguments = [
+            "bench",
+            "--corpus",
+            __CORPUS_NAME,
+            "--repeat",
+            "1",
+            "--skip-fix",
+            "--compare",
+            baseline_file,
+            "--threshold",
+            "50",
+        ]
+
+        # Act
+        execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+    # Assert
+    assert execute_results.return_code == 1
+    error_lines = execute_results.std_err.getvalue().splitlines()
+    assert len(error_lines) == 1
+    assert error_lines[0].startswith(
+        f"Regression: scan of corpus '{__CORPUS_NAME}' took "
+    )
+    assert error_lines[0].endswith(
+        " slower than the 0.001 seconds it was compared against."
+    )
+
+
+def test_markdown_with_bench_compare_with_bad_file(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that comparing against a file that does not contain benchmark
+    results reports an error before anything is measured.
+    """
+
+    # Arrange
+    with tempfile.TemporaryDirectory() as output_directory:
+        baseline_file = os.path.join(output_directory, "baseline.json")
+        with open(baseline_file, "wt", encoding="utf-8") as output_file:
+            output_file.write('{"version": 0}')
+        supplied_arguments = ["bench", "--compare", baseline_file]
+
+        expected_results = ExpectedResults(
+            return_code=1,
+            expected_output="",
+            expected_error=f"File '{baseline_file}' does not contain benchmark results that can be compared against.\n",
+        )
+
+        # Act
+        execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+    # Assert
+    execute_results.assert_results(expected_results=expected_results)
+
+
+def test_markdown_with_bench_bad_scale(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that the scale must be a positive integer.
+    """
+
+    # Arrange
+    supplied_arguments = ["bench", "--scale", "0"]
+
+    # Act
+    execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+    # Assert
+    assert execute_results.return_code == 2
+    assert execute_results.std_err.getvalue().endswith(
+        "main.py bench: error: argument --scale: Value '0' is not a positive integer.\n"
+    )
+
+
+def test_bench_corpora_are_reproducible() -> None:
+    """
+    Test to make sure that each corpus is the same every time that it is created,
+    and grows with the scale.
+    """
+
+    # Arrange
+    corpus_names = BenchmarkCorpora.corpus_names()
+
+    # Act
+    first_corpora = [
+        BenchmarkCorpora.create_corpus(next_corpus_name, 1)
+        for next_corpus_name in corpus_names
+    ]
+    second_corpora = [
+        BenchmarkCorpora.create_corpus(next_corpus_name, 1)
+        for next_corpus_name in corpus_names
+    ]
+    scaled_corpora = [
+        BenchmarkCorpora.create_corpus(next_corpus_name, 2)
+        for next_corpus_name in corpus_names
+    ]
+
+    # Assert
+    assert first_corpora == second_corpora
+    for first_corpus, scaled_corpus in zip(first_corpora, scaled_corpora):
+        assert scaled_corpus.line_count == 2 * first_corpus.line_count
@@ -0,0 +1,204 @@
+"""
+Module to provide tests related to the "--html-directory" option.
+"""
+
+import os
+import shutil
+import tempfile
+from test.markdown_scanner import MarkdownScanner
+from test.pytest_execute import ExpectedResults
+from test.utils import create_tokenizer
+from typing import Dict
+
+from pymarkdown.transform_gfm.transform_to_gfm import TransformToGfm
+
+
+def __render_expected_html(source_path: str) -> str:
+    tokenizer = create_tokenizer()
+    with open(source_path, "rt", encoding="utf-8") as source_file:
+        actual_tokens = tokenizer.transform(
+            source_file.read(), do_add_end_of_stream_token=True
+        )
+    return TransformToGfm().transform(actual_tokens) + "\n"
+
+
+def __read_html_files(html_directory: str) -> Dict[str, str]:
+    html_files: Dict[str, str] = {}
+    for directory_path, _, file_names in os.walk(html_directory):
+        for next_file_name in file_names:
+            if next_file_name.endswith(".html"):
+                full_path = os.path.join(directory_path, next_file_name)
+                with open(full_path, "rt", encoding="utf-8") as html_file:
+                    html_files[os.path.relpath(full_path, html_directory)] = (
+                        html_file.read()
+                    )
+    return html_files
+
+
+def test_markdown_with_html_directory_renders_each_file(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that scanning with an HTML directory reports the same
+    results as a normal scan, while rendering each scanned file into HTML.
+    """
+
+    # Arrange
+    path_to_scan = os.path.join("test", "resources", "rules", "md047")
+    scan_results = scanner_default.invoke_main(arguments=["scan", path_to_scan])
+    expected_results = ExpectedResults(
+        return_code=scan_results.return_code,
+        expected_output=scan_results.std_out.getvalue(),
+        expected_error=scan_results.std_err.getvalue(),
+    )
+
+    with tempfile.TemporaryDirectory() as html_directory:
+        supplied_arguments = ["scan", "--html-directory", html_directory, path_to_scan]
+
+        # Act
+        execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+        html_files = __read_html_files(html_directory)
+
+    # Assert
+    assert expected_results.expected_output
+    execute_results.assert_results(expected_results=expected_results)
+    assert sorted(html_files) == sorted(
+        f"{os.path.splitext(i)[0]}.html" for i in os.listdir(path_to_scan)
+    )
+    for next_html_name, next_html in html_files.items():
+        source_path = os.path.join(
+            path_to_scan, f"{os.path.splitext(next_html_name)[0]}.md"
+        )
+        assert next_html == __render_expected_html(source_path)
+
+
+def test_markdown_with_html_directory_skips_unchanged_files(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that a second scan only renders the files that changed,
+    and renders any HTML file that was removed from the HTML directory.
+    """
+
+    # Arrange
+    with tempfile.TemporaryDirectory() as source_directory:
+        with tempfile.TemporaryDirectory() as html_directory:
+            shutil.copytree(
+                os.path.join("test", "resources", "rules", "md047"),
+                source_directory,
+                dirs_exist_ok=True,
+            )
+            supplied_arguments = [
+                "scan",
+                "--html-directory",
+                html_directory,
+                source_directory,
+            ]
+            scanner_default.invoke_main(arguments=supplied_arguments)
+            for next_html_name in os.listdir(html_directory):
+                if next_html_name.endswith(".html"):
+                    with open(
+                        os.path.join(html_directory, next_html_name),
+                        "wt",
+                        encoding="utf-8",
+                    ) as html_file:
+                        html_file.write("stale")
+
+            changed_path = os.path.join(source_directory, "end_with_blank_line.md")
+            with open(changed_path, "at", encoding="utf-8") as changed_file:
+                changed_file.write("\nMore *text*.\n")
+            os.remove(os.path.join(html_directory, "empty.html"))
+
+            # Act
+            scanner_default.invoke_main(arguments=supplied_arguments)
+            html_files = __read_html_files(html_directory)
+
+    # Assert
+    assert html_files["end_with_blank_line.html"].endswith(
+        "<p>More <em>text</em>.</p>\n"
+    )
+    assert html_files["empty.html"] == "\n"
+    assert html_files["end_with_no_blank_line.html"] == "stale"
+    assert html_files["end_with_no_blank_line_and_spaces.html"] == "stale"
+
+
+def test_markdown_with_html_directory_and_dash_j(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that rendering with multiple processes reports the same
+    results, and renders the same HTML, as a single process.
+    """
+
+    # Arrange
+    path_to_scan = os.path.join("test", "resources", "rules", "md047")
+    with tempfile.TemporaryDirectory() as html_directory:
+        scan_results = scanner_default.invoke_main(
+            arguments=["scan", "--html-directory", html_directory, path_to_scan]
+        )
+        expected_html_files = __read_html_files(html_directory)
+    expected_results = ExpectedResults(
+        return_code=scan_results.return_code,
+        expected_output=scan_results.std_out.getvalue(),
+        expected_error=scan_results.std_err.getvalue(),
+    )
+
+    with tempfile.TemporaryDirectory() as html_directory:
+        supplied_arguments = [
+            "scan",
+            "-j",
+            "2",
+            "--html-directory",
+            html_directory,
+            path_to_scan,
+        ]
+
+        # Act
+        execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+        html_files = __read_html_files(html_directory)
+
+    # Assert
+    execute_results.assert_results(expected_results=expected_results)
+    assert html_files == expected_html_files
+
+
+def test_markdown_with_html_directory_and_cached_results(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that files whose scan results are cached are still
+    rendered if their HTML is not up to date.
+    """
+
+    # Arrange
+    path_to_scan = os.path.join("test", "resources", "rules", "md047")
+    with tempfile.TemporaryDirectory() as cache_directory:
+        scan_results = scanner_default.invoke_main(
+            arguments=["scan", "--cache-directory", cache_directory, path_to_scan]
+        )
+        expected_results = ExpectedResults(
+            return_code=scan_results.return_code,
+            expected_output=scan_results.std_out.getvalue(),
+            expected_error=scan_results.std_err.getvalue(),
+        )
+
+        with tempfile.TemporaryDirectory() as html_directory:
+            supplied_arguments = [
+                "scan",
+                "--cache-directory",
+                cache_directory,
+                "--html-directory",
+                html_directory,
+                path_to_scan,
+            ]
+
+            # Act
+            execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+            html_files = __read_html_files(html_directory)
+
+    # Assert
+    execute_results.assert_results(expected_results=expected_results)
+    assert len(html_files) == 4
+    assert html_files["end_with_blank_line.html"] == __render_expected_html(
+        os.path.join(path_to_scan, "end_with_blank_line.md")
+    )
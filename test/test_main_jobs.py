@@ -0,0 +1,102 @@
+"""
+Module to provide tests related to the "-j" option.
+"""
+
+import os
+from test.markdown_scanner import MarkdownScanner
+from test.pytest_execute import ExpectedResults
+
+
+def test_markdown_with_dash_j_matches_single_process(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that scanning multiple files with multiple processes
+    reports the same results, in the same order, as a single process.
+    """
+
+    # Arrange
+    path_to_scan = os.path.join("test", "resources", "rules", "md047")
+    single_process_results = scanner_default.invoke_main(
+        arguments=["scan", path_to_scan]
+    )
+    expected_results = ExpectedResults(
+        return_code=single_process_results.return_code,
+        expected_output=single_process_results.std_out.getvalue(),
+        expected_error=single_process_results.std_err.getvalue(),
+    )
+    supplied_arguments = ["scan", "-j", "2", path_to_scan]
+
+    # Act
+    execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+    # Assert
+    assert expected_results.expected_output
+    execute_results.assert_results(expected_results=expected_results)
+
+
+def test_markdown_with_dash_j_and_bad_plugin(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that an error raised within a worker process is reported
+    the same way as it would be if a single process was used.
+    """
+
+    # Arrange
+    plugin_path = os.path.join(
+        "test", "resources", "plugins", "bad", "bad_next_token.py"
+    )
+    path_to_scan = os.path.join("test", "resources", "rules", "md047")
+    single_process_results = scanner_default.invoke_main(
+        arguments=["--add-plugin", plugin_path, "scan", path_to_scan]
+    )
+    expected_results = ExpectedResults(
+        return_code=single_process_results.return_code,
+        expected_output=single_process_results.std_out.getvalue(),
+        expected_error=single_process_results.std_err.getvalue(),
+    )
+    supplied_arguments = [
+        "--add-plugin",
+        plugin_path,
+        "scan",
+        "-j",
+        "2",
+        path_to_scan,
+    ]
+
+    # Act
+    execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+    # Assert
+    assert expected_results.expected_return_code == 1
+    execute_results.assert_results(expected_results=expected_results)
+
+
+def test_markdown_with_dash_j_zero(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that the number of jobs must be a positive integer.
+    """
+
+    # Arrange
+    path_to_scan = os.path.join("test", "resources", "rules", "md047")
+    supplied_arguments = ["scan", "-j", "0", path_to_scan]
+
+    expected_results = ExpectedResults(
+        return_code=2,
+        expected_error="""usage: main.py scan [-h] [-l] [-r] [-ae ALTERNATE_EXTENSIONS]
+                    [-e PATH_EXCLUSIONS] [--respect-gitignore] [-j SCAN_JOBS]
+                    [--cache-directory SCAN_CACHE_DIRECTORY]
+                    [--html-directory SCAN_HTML_DIRECTORY]
+                    [--output-format {text,jsonl,sarif}]
+                    path [path ...]
+main.py scan: error: argument -j/--jobs: Value '0' is not a positive integer.""",
+    )
+
+    # Act
+    execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+    # Assert
+    execute_results.assert_results(expected_results=expected_results)
@@ -129,7 +129,8 @@ def test_markdown_with_dash_dash_log_level_invalid(
                [--log-level {CRITICAL,ERROR,WARNING,INFO,DEBUG}]
                [--log-file LOG_FILE]
                [--return-code-scheme {default,minimal,explicit}]
-               {extensions,fix,plugins,scan,scan-stdin,version} ...
+               {extensions,fix,plugins,scan,scan-stdin,serve,bench,version}
+               ...
 main.py: error: argument --log-level: invalid validate_log_level_type value: 'invalid'
 """,
     )
@@ -200,6 +201,32 @@ def test_markdown_with_dash_dash_log_level_info_with_file(
         )
 
 
+def test_markdown_with_dash_dash_log_file_removes_handler_when_done(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that the handler added to log to a file is removed once the
+    command is done, so that later logging is not written to that file.
+    """
+
+    # Arrange
+    source_path, _ = __generate_source_path("end_with_blank_line.md")
+    with create_temporary_file_for_reuse() as log_file_name:
+        supplied_arguments = ["--log-file", log_file_name, "scan", source_path]
+
+        # Act
+        execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+        # Assert
+        execute_results.assert_results(expected_results=ExpectedResults())
+        assert not [
+            next_handler
+            for next_handler in logging.getLogger().handlers
+            if isinstance(next_handler, logging.FileHandler)
+            and next_handler.baseFilename == os.path.abspath(log_file_name)
+        ]
+
+
 def test_markdown_with_dash_dash_log_level_info_with_file_as_directory(
     scanner_default: MarkdownScanner, tmpdir: py._path.local.LocalPath
 ) -> None:
@@ -0,0 +1,228 @@
+"""
+Module to provide tests related to the "--output-format" option.
+"""
+
+import json
+import os
+from test.markdown_scanner import MarkdownScanner
+from test.pytest_execute import ExpectedResults
+
+from pymarkdown.version import __version__
+
+
+def test_markdown_with_output_format_jsonl(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that scan failures and pragma errors are output as one
+    JSON object per line, all to standard output.
+    """
+
+    # Arrange
+    source_path = os.path.abspath(
+        os.path.join(
+            "test",
+            "resources",
+            "pragmas",
+            "atx_heading_with_multiple_spaces_bad_command.md",
+        )
+    )
+    supplied_arguments = ["scan", "--output-format", "jsonl", source_path]
+
+    # Act
+    execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+    # Assert
+    assert execute_results.return_code == 1
+    assert not execute_results.std_err.getvalue()
+    assert [
+        json.loads(next_line)
+        for next_line in execute_results.std_out.getvalue().splitlines()
+    ] == [
+        {
+            "type": "pragma-error",
+            "file_path": source_path,
+            "line_number": 1,
+            "pragma_error": "Inline configuration command 'bad' not understood.",
+        },
+        {
+            "type": "scan-failure",
+            "scan_file": source_path,
+            "line_number": 2,
+            "column_number": 1,
+            "rule_id": "MD019",
+            "rule_name": "no-multiple-space-atx",
+            "rule_description": "Multiple spaces are present after hash character on Atx Heading.",
+            "extra_error_information": None,
+        },
+    ]
+
+
+def test_markdown_with_output_format_jsonl_from_stdin(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that the output format can be used when scanning from
+    standard input, with any extra information output without its formatting.
+    """
+
+    # Arrange
+    supplied_arguments = ["scan-stdin", "--output-format", "jsonl"]
+    supplied_standard_input = "# test"
+
+    # Act
+    execute_results = scanner_default.invoke_main(
+        arguments=supplied_arguments, standard_input_to_use=supplied_standard_input
+    )
+
+    # Assert
+    assert execute_results.return_code == 1
+    assert [
+        (next_record["scan_file"], next_record["rule_id"])
+        for next_record in map(
+            json.loads, execute_results.std_out.getvalue().splitlines()
+        )
+    ] == [("stdin", "MD022"), ("stdin", "MD047")]
+    assert (
+        json.loads(execute_results.std_out.getvalue().splitlines()[0])[
+            "extra_error_information"
+        ]
+        == "Expected: 1; Actual: 0; Below"
+    )
+
+
+def test_markdown_with_output_format_jsonl_with_dash_j(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that scanning multiple files with multiple processes
+    outputs the same results, in the same order, as a single process.
+    """
+
+    # Arrange
+    path_to_scan = os.path.join("test", "resources", "rules", "md047")
+    single_process_results = scanner_default.invoke_main(
+        arguments=["scan", "--output-format", "jsonl", path_to_scan]
+    )
+    expected_results = ExpectedResults(
+        return_code=single_process_results.return_code,
+        expected_output=single_process_results.std_out.getvalue(),
+        expected_error=single_process_results.std_err.getvalue(),
+    )
+    supplied_arguments = ["scan", "-j", "2", "--output-format", "jsonl", path_to_scan]
+
+    # Act
+    execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+    # Assert
+    assert expected_results.expected_output
+    execute_results.assert_results(expected_results=expected_results)
+
+
+def test_markdown_with_output_format_sarif(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that scan failures and pragma errors are output as a
+    single SARIF document, listing each rule that was triggered.
+    """
+
+    # Arrange
+    source_path = os.path.abspath(
+        os.path.join(
+            "test",
+            "resources",
+            "pragmas",
+            "atx_heading_with_multiple_spaces_bad_command.md",
+        )
+    )
+    supplied_arguments = ["scan", "--output-format", "sarif", source_path]
+
+    # Act
+    execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+    # Assert
+    assert execute_results.return_code == 1
+    assert not execute_results.std_err.getvalue()
+    sarif_document = json.loads(execute_results.std_out.getvalue())
+    assert sarif_document["version"] == "2.1.0"
+    assert len(sarif_document["runs"]) == 1
+    sarif_run = sarif_document["runs"][0]
+    assert sarif_run["tool"]["driver"]["name"] == "PyMarkdown"
+    assert sarif_run["tool"]["driver"]["version"] == __version__
+    assert sarif_run["tool"]["driver"]["rules"] == [
+        {
+            "id": "MD019",
+            "name": "no-multiple-space-atx",
+            "shortDescription": {
+                "text": "Multiple spaces are present after hash character on Atx Heading."
+            },
+        }
+    ]
+    assert [
+        (
+            next_result["ruleId"],
+            next_result["level"],
+            next_result["locations"][0]["physicalLocation"]["region"],
+        )
+        for next_result in sarif_run["results"]
+    ] == [
+        ("INLINE", "error", {"startLine": 1, "startColumn": 1}),
+        ("MD019", "warning", {"startLine": 2, "startColumn": 1}),
+    ]
+    assert sarif_run["results"][1]["locations"][0]["physicalLocation"][
+        "artifactLocation"
+    ]["uri"].startswith("file://")
+
+
+def test_markdown_with_output_format_sarif_without_failures(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that a valid SARIF document is output even if there are
+    no scan failures to report.
+    """
+
+    # Arrange
+    source_path = os.path.join("test", "resources", "rules", "md047", "empty.md")
+    supplied_arguments = ["scan", "--output-format", "sarif", source_path]
+
+    # Act
+    execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+    # Assert
+    assert execute_results.return_code == 0
+    sarif_run = json.loads(execute_results.std_out.getvalue())["runs"][0]
+    assert not sarif_run["results"]
+    assert not sarif_run["tool"]["driver"]["rules"]
+
+
+def test_markdown_with_output_format_sarif_and_bad_plugin(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that the SARIF document is still completed if the scan
+    is stopped by an error, with that error reported to standard error.
+    """
+
+    # Arrange
+    plugin_path = os.path.join(
+        "test", "resources", "plugins", "bad", "bad_next_token.py"
+    )
+    path_to_scan = os.path.join("test", "resources", "rules", "md047")
+    supplied_arguments = [
+        "--add-plugin",
+        plugin_path,
+        "scan",
+        "--output-format",
+        "sarif",
+        path_to_scan,
+    ]
+
+    # Act
+    execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+    # Assert
+    assert execute_results.return_code == 1
+    assert "BadPluginError" in execute_results.std_err.getvalue()
+    assert "runs" in json.loads(execute_results.std_out.getvalue())
@@ -0,0 +1,231 @@
+"""
+Module to provide tests related to the "--x-profile-report" option.
+"""
+
+import json
+import os
+import tempfile
+from test.markdown_scanner import MarkdownScanner
+from typing import Dict, List
+
+from pymarkdown.general.phase_timer import PhaseTimer
+
+
+def __find_report_rows(report_output: str) -> Dict[str, List[str]]:
+    report_rows: Dict[str, List[str]] = {}
+    for next_line in report_output.splitlines():
+        split_line = next_line.split()
+        if len(split_line) == 5 and split_line[1].isdigit():
+            report_rows[split_line[0]] = split_line
+    return report_rows
+
+
+def test_markdown_with_x_profile_report(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that the profile report lists each phase of the scan and each
+    plugin function that was called, with the number of times that it was called.
+    """
+
+    # Arrange
+    source_path = os.path.join(
+        "test", "resources", "rules", "md047", "end_with_no_blank_line.md"
+    )
+    supplied_arguments = [
+        "--x-profile-report",
+        "--x-profile-sort",
+        "name",
+        "scan",
+        source_path,
+    ]
+
+    # Act
+    execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+    # Assert
+    assert execute_results.return_code == 1
+    output_text = execute_results.std_out.getvalue()
+    assert output_text.startswith(
+        f"{os.path.abspath(source_path)}:3:41: MD047: Each file should end with a single newline "
+        + "character. (single-trailing-newline)\n"
+    )
+    report_rows = __find_report_rows(output_text)
+    assert list(report_rows) == sorted(report_rows)
+    assert report_rows["total"][1] == "1"
+    assert report_rows["total"][4] == "100.0"
+    assert report_rows[PhaseTimer.block_pass_phase][1] == "1"
+    assert report_rows[PhaseTimer.coalesce_phase][1] == "2"
+    assert report_rows[PhaseTimer.inline_phase][1] == "1"
+    assert report_rows[PhaseTimer.plugin_tokens_phase][1] == "1"
+    assert report_rows[PhaseTimer.plugin_lines_phase][1] == "1"
+    assert report_rows["md003.next_token"][1] == "8"
+    assert report_rows["md009.next_line"][1] == "3"
+    assert report_rows["md047.completed_file"][1] == "1"
+
+
+def test_markdown_with_x_profile_report_sorted_by_calls(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that the profile report can be sorted by the number of times
+    that each phase was called.
+    """
+
+    # Arrange
+    supplied_arguments = [
+        "--x-profile-report",
+        "--x-profile-sort",
+        "calls",
+        "scan",
+        os.path.join(
+            "test", "resources", "rules", "md047", "end_with_no_blank_line.md"
+        ),
+    ]
+
+    # Act
+    execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+    # Assert
+    call_counts = [
+        int(next_row[1])
+        for next_row in __find_report_rows(execute_results.std_out.getvalue()).values()
+    ]
+    assert call_counts[0] == 8
+    assert call_counts == sorted(call_counts, reverse=True)
+
+
+def test_markdown_with_x_profile_report_file(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that the profile report can be written to a JSON file
+    instead of being output as a table.
+    """
+
+    # Arrange
+    source_path = os.path.join(
+        "test", "resources", "rules", "md047", "end_with_no_blank_line.md"
+    )
+    with tempfile.TemporaryDirectory() as output_directory:
+        report_file = os.path.join(output_directory, "profile.json")
+        supplied_arguments = [
+            "--x-profile-report-file",
+            report_file,
+            "scan",
+            source_path,
+        ]
+
+        # Act
+        execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+        with open(report_file, "rt", encoding="utf-8") as input_file:
+            report_document = json.load(input_file)
+
+    # Assert
+    assert execute_results.return_code == 1
+    assert execute_results.std_out.getvalue() == (
+        f"{os.path.abspath(source_path)}:3:41: MD047: Each file should end with a single newline "
+        + "character. (single-trailing-newline)\n"
+    )
+    assert report_document["version"] == 1
+    report_phases = report_document["phases"]
+    assert list(report_phases) == sorted(report_phases)
+    assert report_phases["total"]["calls"] == 1
+    assert report_phases["md003.next_token"]["calls"] == 8
+    assert report_phases["md009.next_line"]["calls"] == 3
+    assert report_phases["md047.completed_file"]["calls"] == 1
+    assert all(next_phase["seconds"] >= 0.0 for next_phase in report_phases.values())
+
+
+def test_markdown_with_x_profile_report_and_fix(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that the profile report includes the fix phases when fixing.
+    """
+
+    # Arrange
+    with tempfile.TemporaryDirectory() as output_directory:
+        source_path = os.path.join(output_directory, "test.md")
+        with open(source_path, "wt", encoding="utf-8") as output_file:
+            output_file.write("# Heading\nSome text.")
+        supplied_arguments = [
+            "--x-profile-report",
+            "fix",
+            source_path,
+        ]
+
+        # Act
+        execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+    # Assert
+    assert execute_results.return_code == 3
+    report_rows = __find_report_rows(execute_results.std_out.getvalue())
+    assert PhaseTimer.fix_tokens_phase in report_rows
+    assert PhaseTimer.fix_lines_phase in report_rows
+    assert "md047.next_line" in report_rows
+
+
+def test_markdown_with_x_profile_report_and_dash_j(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that the profile report includes the phases measured by each
+    of the worker processes when scanning with multiple processes.
+    """
+
+    # Arrange
+    source_path = os.path.join("test", "resources", "rules", "md047")
+    file_count = len(os.listdir(source_path))
+    supplied_arguments = [
+        "--x-profile-report",
+        "scan",
+        "-j",
+        "2",
+        source_path,
+    ]
+
+    # Act
+    execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+    # Assert
+    assert execute_results.return_code == 1
+    report_rows = __find_report_rows(execute_results.std_out.getvalue())
+    assert report_rows["total"][1] == "1"
+    assert report_rows[PhaseTimer.block_pass_phase][1] == str(file_count)
+    assert report_rows["md047.completed_file"][1] == str(file_count)
+
+
+def test_markdown_with_x_profile_report_and_scan_cache(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that files whose results are loaded from the scan cache are
+    counted as a phase of their own instead of being measured as scanned.
+    """
+
+    # Arrange
+    source_path = os.path.join(
+        "test", "resources", "rules", "md047", "end_with_no_blank_line.md"
+    )
+    with tempfile.TemporaryDirectory() as cache_directory:
+        supplied_arguments = [
+            "--x-profile-report",
+            "scan",
+            "--cache-directory",
+            cache_directory,
+            source_path,
+        ]
+        first_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+        # Act
+        execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+    # Assert
+    assert execute_results.return_code == 1
+    first_rows = __find_report_rows(first_results.std_out.getvalue())
+    report_rows = __find_report_rows(execute_results.std_out.getvalue())
+    assert PhaseTimer.scan_cache_replay_phase not in first_rows
+    assert report_rows[PhaseTimer.scan_cache_replay_phase][1] == "1"
+    assert PhaseTimer.block_pass_phase not in report_rows
+    assert "md047.completed_file" not in report_rows
@@ -45,7 +45,8 @@ def test_markdown_return_code_command_line_bad(
                [--log-level {CRITICAL,ERROR,WARNING,INFO,DEBUG}]
                [--log-file LOG_FILE]
                [--return-code-scheme {default,minimal,explicit}]
-               {extensions,fix,plugins,scan,scan-stdin,version} ...
+               {extensions,fix,plugins,scan,scan-stdin,serve,bench,version}
+               ...
 main.py: error: argument --return-code-scheme: invalid __validate_return_code_scheme value: 'invalid'""",
     )
 
@@ -131,7 +132,10 @@ def test_markdown_return_code_default_command_line_error(
     expected_results = ExpectedResults(
         return_code=2,
         expected_error="""usage: main.py scan [-h] [-l] [-r] [-ae ALTERNATE_EXTENSIONS]
-                    [-e PATH_EXCLUSIONS] [--respect-gitignore]
+                    [-e PATH_EXCLUSIONS] [--respect-gitignore] [-j SCAN_JOBS]
+                    [--cache-directory SCAN_CACHE_DIRECTORY]
+                    [--html-directory SCAN_HTML_DIRECTORY]
+                    [--output-format {text,jsonl,sarif}]
                     path [path ...]
 main.py scan: error: the following arguments are required: path
 """,
@@ -330,7 +334,10 @@ def test_markdown_return_code_minimal_command_line_error(
     expected_results = ExpectedResults(
         return_code=2,
         expected_error="""usage: main.py scan [-h] [-l] [-r] [-ae ALTERNATE_EXTENSIONS]
-                    [-e PATH_EXCLUSIONS] [--respect-gitignore]
+                    [-e PATH_EXCLUSIONS] [--respect-gitignore] [-j SCAN_JOBS]
+                    [--cache-directory SCAN_CACHE_DIRECTORY]
+                    [--html-directory SCAN_HTML_DIRECTORY]
+                    [--output-format {text,jsonl,sarif}]
                     path [path ...]
 main.py scan: error: the following arguments are required: path
 """,
@@ -0,0 +1,168 @@
+"""
+Module to provide tests related to the "--cache-directory" option.
+"""
+
+import os
+import tempfile
+from test.markdown_scanner import MarkdownScanner
+from test.pytest_execute import ExpectedResults
+
+from pymarkdown.plugin_manager.plugin_scan_failure import PluginScanFailure
+from pymarkdown.scan_result_cache import ScanResultCache
+
+
+def __count_cache_entries(cache_directory: str) -> int:
+    return len([i for i in os.listdir(cache_directory) if i.endswith(".json")])
+
+
+def test_markdown_with_cache_directory_reuses_results(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that a second scan with the same cache directory reports
+    the same results as the first scan, using the cached entries.
+    """
+
+    # Arrange
+    path_to_scan = os.path.join("test", "resources", "rules", "md047")
+    uncached_results = scanner_default.invoke_main(arguments=["scan", path_to_scan])
+    expected_results = ExpectedResults(
+        return_code=uncached_results.return_code,
+        expected_output=uncached_results.std_out.getvalue(),
+        expected_error=uncached_results.std_err.getvalue(),
+    )
+
+    with tempfile.TemporaryDirectory() as cache_directory:
+        supplied_arguments = [
+            "scan",
+            "--cache-directory",
+            cache_directory,
+            path_to_scan,
+        ]
+        first_results = scanner_default.invoke_main(arguments=supplied_arguments)
+        first_entry_count = __count_cache_entries(cache_directory)
+
+        # Act
+        second_results = scanner_default.invoke_main(arguments=supplied_arguments)
+        second_entry_count = __count_cache_entries(cache_directory)
+
+    # Assert
+    assert expected_results.expected_output
+    first_results.assert_results(expected_results=expected_results)
+    second_results.assert_results(expected_results=expected_results)
+    assert first_entry_count == 4
+    assert second_entry_count == 4
+
+
+def test_markdown_with_cache_directory_and_changed_configuration(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that changing the configuration of an enabled plugin does
+    not reuse results cached with the previous configuration.
+    """
+
+    # Arrange
+    path_to_scan = os.path.join(
+        "test", "resources", "rules", "md013", "good_small_line.md"
+    )
+    with tempfile.TemporaryDirectory() as cache_directory:
+        scanner_default.invoke_main(
+            arguments=["scan", "--cache-directory", cache_directory, path_to_scan]
+        )
+
+        supplied_arguments = [
+            "--set",
+            "plugins.md013.line_length=$#20",
+            "scan",
+            "--cache-directory",
+            cache_directory,
+            path_to_scan,
+        ]
+        expected_results = ExpectedResults(
+            return_code=1,
+            expected_output=f"{os.path.abspath(path_to_scan)}:1:1: MD013: Line length "
+            + "[Expected: 20, Actual: 38] (line-length)",
+        )
+
+        # Act
+        execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+        entry_count = __count_cache_entries(cache_directory)
+
+    # Assert
+    execute_results.assert_results(expected_results=expected_results)
+    assert entry_count == 2
+
+
+def test_markdown_with_cache_directory_and_pragma_failure(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that pragma failures are replayed from the cache.
+    """
+
+    # Arrange
+    path_to_scan = os.path.join(
+        "test",
+        "resources",
+        "pragmas",
+        "atx_heading_with_multiple_spaces_no_command.md",
+    )
+    with tempfile.TemporaryDirectory() as cache_directory:
+        supplied_arguments = [
+            "scan",
+            "--cache-directory",
+            cache_directory,
+            path_to_scan,
+        ]
+        scanner_default.invoke_main(arguments=supplied_arguments)
+
+        expected_results = ExpectedResults(
+            return_code=1,
+            expected_output=f"{os.path.abspath(path_to_scan)}:2:1: MD019: Multiple spaces are present after hash character on Atx Heading. (no-multiple-space-atx)",
+            expected_error=f"{os.path.abspath(path_to_scan)}:1:1: INLINE: Inline configuration specified without command.",
+        )
+
+        # Act
+        execute_results = scanner_default.invoke_main(arguments=supplied_arguments)
+
+    # Assert
+    execute_results.assert_results(expected_results=expected_results)
+
+
+def test_scan_result_cache_round_trip_and_eviction() -> None:
+    """
+    Test to make sure that the cache stores and loads entries, treats a corrupted
+    entry as a miss, and evicts the least recently used entries when it grows
+    beyond its maximum size.
+    """
+
+    # Arrange
+    scan_failure = PluginScanFailure(
+        "some.md", 1, 2, "MD999", "rule-name", "Rule description", None, False
+    )
+    with tempfile.TemporaryDirectory() as cache_directory:
+        scan_cache = ScanResultCache(cache_directory, 0, "fingerprint")
+
+        # Act
+        scan_cache.store("first", [scan_failure, ("some.md", 3, "Bad pragma.")])
+        loaded_events = scan_cache.load("first")
+        with open(
+            os.path.join(cache_directory, "second.json"), "wt", encoding="utf-8"
+        ) as corrupted_file:
+            corrupted_file.write("not json")
+        corrupted_events = scan_cache.load("second")
+        missing_events = scan_cache.load("third")
+        scan_cache.close()
+        entry_count = __count_cache_entries(cache_directory)
+
+    # Assert
+    assert loaded_events == [scan_failure, ("some.md", 3, "Bad pragma.")]
+    assert corrupted_events is None
+    assert missing_events is None
+    assert entry_count == 0
+    assert scan_cache.statistics.hits == 1
+    assert scan_cache.statistics.misses == 2
+    assert scan_cache.statistics.stores == 1
+    assert scan_cache.statistics.evictions == 2
+    assert scan_cache.statistics.size_in_bytes == 0
@@ -0,0 +1,518 @@
+"""
+Module to provide tests related to the "serve" command and its client.
+"""
+
+import json
+import os
+import socket
+import stat
+import subprocess  # nosec B404
+import sys
+import tempfile
+import threading
+from test.markdown_scanner import MarkdownScanner
+from test.pytest_execute import ExpectedResults
+from typing import Any, Dict, List, Optional, Tuple
+from unittest.mock import patch
+
+import pytest
+
+from pymarkdown.lint_client import LintClient
+from pymarkdown.lint_server import LintServer
+from pymarkdown.main import LintServerCommandRunner, PyMarkdownLint
+
+
+def __build_request(request_id: int, method_name: str, parameters: Any) -> str:
+    return json.dumps(
+        {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "method": method_name,
+            "params": parameters,
+        }
+    )
+
+
+def __build_responses(responses: List[Dict[str, Any]]) -> str:
+    return "\n".join(json.dumps(next_response) for next_response in responses)
+
+
+def __start_socket_server(socket_path: Optional[str]) -> threading.Thread:
+    server_thread = threading.Thread(
+        target=LintServer(LintServerCommandRunner().run).serve_socket,
+        args=(socket_path,),
+    )
+    server_thread.start()
+    lint_client = LintClient(socket_path)
+    for _ in range(100):
+        if lint_client.is_server_running():
+            break
+        threading.Event().wait(0.05)
+    return server_thread
+
+
+def __run_version_command(
+    arguments: List[str], standard_input: Optional[str]
+) -> Tuple[int, str, str]:
+    _ = (arguments, standard_input)
+    return 0, "0.0.0\n", ""
+
+
+def test_markdown_with_serve_stdio(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that commands sent to the server over standard input are
+    run the same way as they would be from the command line.
+    """
+
+    # Arrange
+    path_to_scan = os.path.join("test", "resources", "rules", "md047")
+    scan_results = scanner_default.invoke_main(arguments=["scan", path_to_scan])
+    supplied_arguments = ["serve", "--stdio"]
+    supplied_standard_input = "\n".join(
+        [
+            __build_request(1, "run", {"arguments": ["scan", path_to_scan]}),
+            "",
+            __build_request(2, "run", {"arguments": ["scan-stdin"], "stdin": "# test"}),
+            __build_request(3, "shutdown", {}),
+            __build_request(4, "run", {"arguments": ["version"]}),
+        ]
+    )
+    expected_results = ExpectedResults(
+        return_code=0,
+        expected_output=__build_responses(
+            [
+                {
+                    "jsonrpc": "2.0",
+                    "id": 1,
+                    "result": {
+                        "return_code": 1,
+                        "stdout": scan_results.std_out.getvalue(),
+                        "stderr": "",
+                    },
+                },
+                {
+                    "jsonrpc": "2.0",
+                    "id": 2,
+                    "result": {
+                        "return_code": 1,
+                        "stdout": "stdin:1:1: MD022: Headings should be surrounded by blank lines. "
+                        + "[Expected: 1; Actual: 0; Below] (blanks-around-headings,blanks-around-headers)\n"
+                        + "stdin:1:6: MD047: Each file should end with a single newline character. "
+                        + "(single-trailing-newline)\n",
+                        "stderr": "",
+                    },
+                },
+                {"jsonrpc": "2.0", "id": 3, "result": None},
+            ]
+        ),
+    )
+
+    # Act
+    execute_results = scanner_default.invoke_main(
+        arguments=supplied_arguments, standard_input_to_use=supplied_standard_input
+    )
+
+    # Assert
+    assert scan_results.return_code == 1
+    execute_results.assert_results(expected_results=expected_results)
+
+
+def test_markdown_with_serve_stdio_and_bad_requests(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that requests that are not valid are reported with the
+    matching JSON-RPC errors, without stopping the server.
+    """
+
+    # Arrange
+    supplied_arguments = ["serve", "--stdio"]
+    supplied_standard_input = "\n".join(
+        [
+            "not json",
+            json.dumps(["not", "an", "object"]),
+            __build_request(1, "unknown", {}),
+            __build_request(2, "run", ["scan"]),
+            __build_request(3, "run", {"arguments": "scan"}),
+            __build_request(4, "run", {"arguments": ["serve", "--stdio"]}),
+            __build_request(5, "run", {"arguments": ["version"], "cwd": 1}),
+            __build_request(
+                6, "run", {"arguments": ["version"], "cwd": "/does/not/exist"}
+            ),
+        ]
+    )
+    expected_results = ExpectedResults(
+        return_code=0,
+        expected_output=__build_responses(
+            [
+                {
+                    "jsonrpc": "2.0",
+                    "id": None,
+                    "error": {
+                        "code": -32700,
+                        "message": "Expecting value: line 1 column 1 (char 0)",
+                    },
+                },
+                {
+                    "jsonrpc": "2.0",
+                    "id": None,
+                    "error": {
+                        "code": -32600,
+                        "message": "Request must be a JSON-RPC 2.0 request object.",
+                    },
+                },
+                {
+                    "jsonrpc": "2.0",
+                    "id": 1,
+                    "error": {
+                        "code": -32601,
+                        "message": "Method 'unknown' is not supported.",
+                    },
+                },
+                {
+                    "jsonrpc": "2.0",
+                    "id": 2,
+                    "error": {
+                        "code": -32602,
+                        "message": "Parameters must be an object.",
+                    },
+                },
+                {
+                    "jsonrpc": "2.0",
+                    "id": 3,
+                    "error": {
+                        "code": -32602,
+                        "message": "Parameter 'arguments' must be a list of strings.",
+                    },
+                },
+                {
+                    "jsonrpc": "2.0",
+                    "id": 4,
+                    "error": {
+                        "code": -32602,
+                        "message": "The serve command cannot be run by the server.",
+                    },
+                },
+                {
+                    "jsonrpc": "2.0",
+                    "id": 5,
+                    "error": {
+                        "code": -32602,
+                        "message": "Parameter 'cwd' must be a string.",
+                    },
+                },
+                {
+                    "jsonrpc": "2.0",
+                    "id": 6,
+                    "error": {
+                        "code": -32602,
+                        "message": "[Errno 2] No such file or directory: '/does/not/exist'",
+                    },
+                },
+            ]
+        ),
+    )
+
+    # Act
+    execute_results = scanner_default.invoke_main(
+        arguments=supplied_arguments, standard_input_to_use=supplied_standard_input
+    )
+
+    # Assert
+    execute_results.assert_results(expected_results=expected_results)
+
+
+def test_lint_client_without_server(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that the client runs the command within the current
+    process if there is no server listening on the socket.
+    """
+
+    # Arrange
+    path_to_scan = os.path.join("test", "resources", "rules", "md047")
+    scan_results = scanner_default.invoke_main(arguments=["scan", path_to_scan])
+    with tempfile.TemporaryDirectory() as socket_directory:
+        lint_client = LintClient(os.path.join(socket_directory, "missing.sock"))
+
+        # Act
+        is_server_running = lint_client.is_server_running()
+        client_result = lint_client.run(["scan", path_to_scan])
+
+    # Assert
+    assert not is_server_running
+    assert not client_result.was_run_by_server
+    assert client_result.return_code == scan_results.return_code
+    assert client_result.std_out == scan_results.std_out.getvalue()
+    assert client_result.std_err == scan_results.std_err.getvalue()
+
+
+@pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="Unix domain sockets are not supported."
+)
+def test_lint_client_with_socket_server(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that the client sends the command to a server listening
+    on the socket, and that the server removes the socket once it is stopped.
+    """
+
+    # Arrange
+    path_to_scan = os.path.join("test", "resources", "rules", "md047")
+    scan_results = scanner_default.invoke_main(arguments=["scan", path_to_scan])
+    with tempfile.TemporaryDirectory() as socket_directory:
+        socket_path = os.path.join(socket_directory, "server.sock")
+        server_thread = __start_socket_server(socket_path)
+        lint_client = LintClient(socket_path)
+
+        # Act
+        client_result = lint_client.run(["scan", path_to_scan])
+        did_shutdown = lint_client.shutdown_server()
+        server_thread.join(10)
+        is_socket_present = os.path.exists(socket_path)
+
+    # Assert
+    assert client_result.was_run_by_server
+    assert client_result.return_code == scan_results.return_code
+    assert client_result.std_out == scan_results.std_out.getvalue()
+    assert client_result.std_err == scan_results.std_err.getvalue()
+    assert did_shutdown
+    assert not server_thread.is_alive()
+    assert not is_socket_present
+
+
+@pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="Unix domain sockets are not supported."
+)
+def test_lint_client_with_socket_server_owned_by_other_user(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that the client does not send the command to a server
+    listening on a socket that is owned by another user, running the command
+    within the current process instead.
+    """
+
+    # Arrange
+    path_to_scan = os.path.join("test", "resources", "rules", "md047")
+    scan_results = scanner_default.invoke_main(arguments=["scan", path_to_scan])
+    with tempfile.TemporaryDirectory() as socket_directory:
+        socket_path = os.path.join(socket_directory, "server.sock")
+        server_thread = __start_socket_server(socket_path)
+        lint_client = LintClient(socket_path)
+        other_user_id = os.getuid() + 1  # pylint: disable=no-member
+
+        # Act
+        with patch("os.getuid", return_value=other_user_id):
+            is_server_running = lint_client.is_server_running()
+            client_result = lint_client.run(["scan", path_to_scan])
+        did_shutdown = lint_client.shutdown_server()
+        server_thread.join(10)
+
+    # Assert
+    assert not is_server_running
+    assert not client_result.was_run_by_server
+    assert client_result.return_code == scan_results.return_code
+    assert client_result.std_out == scan_results.std_out.getvalue()
+    assert did_shutdown
+
+
+def test_lint_server_default_socket_path_in_runtime_directory() -> None:
+    """
+    Test to make sure that the default socket is placed in the runtime directory
+    for the user, if there is one.
+    """
+
+    # Arrange
+    with tempfile.TemporaryDirectory() as runtime_directory, patch.dict(
+        os.environ, {"XDG_RUNTIME_DIR": runtime_directory}
+    ):
+        os.environ.pop(LintServer.socket_path_environment_variable, None)
+
+        # Act
+        socket_path = LintServer.default_socket_path()
+
+    # Assert
+    assert socket_path == os.path.join(runtime_directory, "pymarkdown.sock")
+
+
+@pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="Unix domain sockets are not supported."
+)
+def test_lint_server_default_socket_in_private_directory() -> None:
+    """
+    Test to make sure that, without a runtime directory, the default socket is
+    placed in a directory within the temporary directory that, like the socket,
+    is only accessible by the current user.
+    """
+
+    # Arrange
+    with tempfile.TemporaryDirectory() as temporary_directory, patch.dict(
+        os.environ
+    ), patch("tempfile.gettempdir", return_value=temporary_directory):
+        os.environ.pop("XDG_RUNTIME_DIR", None)
+        os.environ.pop(LintServer.socket_path_environment_variable, None)
+        socket_path = LintServer.default_socket_path()
+        server_thread = __start_socket_server(None)
+        lint_client = LintClient()
+
+        # Act
+        directory_mode = stat.S_IMODE(os.stat(os.path.dirname(socket_path)).st_mode)
+        socket_mode = stat.S_IMODE(os.stat(socket_path).st_mode)
+        did_shutdown = lint_client.shutdown_server()
+        server_thread.join(10)
+
+    # Assert
+    assert os.path.dirname(os.path.dirname(socket_path)) == temporary_directory
+    assert directory_mode == 0o700
+    assert socket_mode == 0o600
+    assert did_shutdown
+
+
+@pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="Unix domain sockets are not supported."
+)
+def test_lint_server_default_socket_directory_accessible_by_others() -> None:
+    """
+    Test to make sure that the server does not listen on the default socket if
+    its directory already exists and can be accessed by other users.
+    """
+
+    # Arrange
+    with tempfile.TemporaryDirectory() as temporary_directory, patch.dict(
+        os.environ
+    ), patch("tempfile.gettempdir", return_value=temporary_directory):
+        os.environ.pop("XDG_RUNTIME_DIR", None)
+        os.environ.pop(LintServer.socket_path_environment_variable, None)
+        socket_directory = os.path.dirname(LintServer.default_socket_path())
+        os.mkdir(socket_directory)
+        os.chmod(socket_directory, 0o777)  # nosec B103
+
+        # Act
+        with pytest.raises(ValueError) as raised_exception:
+            LintServer(__run_version_command).serve_socket()
+
+    # Assert
+    assert (
+        str(raised_exception.value)
+        == f"Socket directory '{socket_directory}' must only be accessible by the current user."
+    )
+
+
+def test_lint_server_only_rejects_serve_subcommand() -> None:
+    """
+    Test to make sure that only a command for the serve subcommand is rejected,
+    not one that only has `serve` as the value of an argument.
+    """
+
+    # Arrange
+    lint_server = LintServer(__run_version_command, PyMarkdownLint.find_subcommand)
+    commands_to_run = [
+        ["--stack-trace", "serve", "--stdio"],
+        ["scan", "serve"],
+        ["--config", "serve", "scan", "README.md"],
+    ]
+
+    # Act
+    responses = [
+        lint_server.handle_request(
+            __build_request(request_id, "run", {"arguments": next_command})
+        )[0]
+        for request_id, next_command in enumerate(commands_to_run)
+    ]
+
+    # Assert
+    assert responses[0]["error"]["message"] == (
+        "The serve command cannot be run by the server."
+    )
+    assert responses[1]["result"]["stdout"] == "0.0.0\n"
+    assert responses[2]["result"]["stdout"] == "0.0.0\n"
+
+
+def test_lint_server_command_runner_reuses_scanner_for_same_configuration(
+    scanner_default: MarkdownScanner,
+) -> None:
+    """
+    Test to make sure that scans with the same configuration are run by the same
+    initialized scanner, with the same results as running them from the command
+    line, and that a scan with a different configuration gets its own scanner.
+    """
+
+    # Arrange
+    first_path = os.path.join("test", "resources", "rules", "md047")
+    second_path = os.path.join("test", "resources", "rules", "md022")
+    expected_results = [
+        scanner_default.invoke_main(
+            arguments=next_arguments, suppress_first_line_heading_rule=False
+        )
+        for next_arguments in (
+            ["scan", first_path],
+            ["scan", second_path],
+            ["-d", "md022", "scan", second_path],
+        )
+    ]
+    command_runner = LintServerCommandRunner()
+
+    # Act
+    first_result = command_runner.run(["scan", first_path])
+    second_result = command_runner.run(["scan", second_path])
+    count_after_same_configuration = command_runner.scanner_count
+    third_result = command_runner.run(["-d", "md022", "scan", second_path])
+
+    # Assert
+    assert count_after_same_configuration == 1
+    assert command_runner.scanner_count == 2
+    for actual_result, expected_result in zip(
+        (first_result, second_result, third_result), expected_results
+    ):
+        assert actual_result == (
+            expected_result.return_code,
+            expected_result.std_out.getvalue(),
+            expected_result.std_err.getvalue(),
+        )
+
+
+def test_lint_server_command_runner_does_not_reuse_scanner_after_error() -> None:
+    """
+    Test to make sure that a scanner that reports an error is not kept.
+    """
+
+    # Arrange
+    command_runner = LintServerCommandRunner()
+
+    # Act
+    command_result = command_runner.run(["scan", "/does/not/exist.md"])
+
+    # Assert
+    assert command_result[0] == 1
+    assert command_runner.scanner_count == 0
+
+
+def test_markdown_with_serve_stdio_and_stack_trace() -> None:
+    """
+    Test to make sure that the logging enabled by the `--stack-trace` flag is not
+    written to standard output, where it would be mixed in with the responses.
+    """
+
+    # Arrange
+    supplied_standard_input = __build_request(1, "run", {"arguments": ["version"]})
+
+    # Act
+    completed_process = subprocess.run(  # nosec B603
+        [sys.executable, "-m", "pymarkdown", "--stack-trace", "serve", "--stdio"],
+        input=supplied_standard_input,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    # Assert
+    assert completed_process.returncode == 0
+    response_lines = completed_process.stdout.splitlines()
+    assert len(response_lines) == 1
+    assert json.loads(response_lines[0])["id"] == 1
+    assert "Application logging set to 'DEBUG'." in completed_process.stderr
@@ -85,7 +85,7 @@ def test_markdown_with_scan_stdin_with_triggers_and_disabled_rules(
     execute_results.assert_results(expected_results=expected_results)
 
 
-def test_markdown_with_scan_stdin_with_bad_write(
+def test_markdown_with_scan_stdin_with_bad_read(
     scanner_default: MarkdownScanner,
 ) -> None:
     """
@@ -102,7 +102,7 @@ def test_markdown_with_scan_stdin_with_bad_write(
     expected_results = ExpectedResults(
         return_code=1,
         expected_error="""OSError encountered while scanning 'stdin':
-Temporary file to capture stdin was not written (made up).""",
+Contents of stdin were not read (made up).""",
     )
 
     # Act
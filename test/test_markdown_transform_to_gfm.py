@@ -2,7 +2,9 @@
 https://github.github.com/gfm/#lists
 """
 
-from test.utils import act_and_assert, assert_that_exception_is_raised
+import io
+from test.utils import act_and_assert, assert_that_exception_is_raised, create_tokenizer
+from typing import List
 
 import pytest
 
@@ -79,3 +81,58 @@ def test_do_add_end_of_stream_token() -> None:
     act_and_assert(
         source_markdown, expected_gfm, expected_tokens, do_add_end_of_stream_token=True
     )
+
+
+@pytest.mark.gfm
+def test_gfm_transform_to_stream() -> None:
+    """
+    Test to ensure that transforming to a stream produces the same html as
+    transforming to a string, writing each top-level element as it is completed.
+    """
+
+    # Arrange
+    source_markdown = """# Heading
+
+- item one
+  - nested item
+
+> quoted *text*
+
+Some text.
+"""
+    expected_gfm = """<h1>Heading</h1>
+<ul>
+<li>item one
+<ul>
+<li>nested item</li>
+</ul>
+</li>
+</ul>
+<blockquote>
+<p>quoted <em>text</em></p>
+</blockquote>
+<p>Some text.</p>"""
+    tokenizer = create_tokenizer()
+    actual_tokens = tokenizer.transform(source_markdown)
+
+    written_text: List[str] = []
+
+    class RecordingStream(io.StringIO):
+        """
+        Stream that records the text written to it with each call.
+        """
+
+        def write(self, s: str) -> int:
+            written_text.append(s)
+            return super().write(s)
+
+    output_stream = RecordingStream()
+
+    # Act
+    TransformToGfm().transform_to_stream(actual_tokens, output_stream)
+
+    # Assert
+    assert output_stream.getvalue() == expected_gfm
+    assert TransformToGfm().transform(actual_tokens) == expected_gfm
+    assert "".join(written_text[:2]) == "<h1>Heading"
+    assert written_text[-1] == "</p>"
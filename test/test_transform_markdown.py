@@ -2,7 +2,9 @@
 Test the top level transform functions.
 """
 
-from test.utils import act_and_assert
+from test.utils import act_and_assert, create_tokenizer
+
+from pymarkdown.transform_markdown.transform_to_markdown import TransformToMarkdown
 
 
 def test_transform_with_debug_on() -> None:
@@ -53,3 +55,42 @@ def test_transform_with_debug_off() -> None:
 
     # Act & Assert
     act_and_assert(source_markdown, expected_gfm, expected_tokens)
+
+
+def test_transform_with_separate_containers() -> None:
+    """
+    Test to make sure that a document with a number of separate containers is
+    transformed back into the same Markdown, as the text before each outermost
+    container is completed before that container starts.
+    """
+
+    # Arrange
+    source_markdown = """# Heading
+
+- item
+  - nested item
+  - another nested item
+- last item
+
+> quote
+> > nested quote
+
+Some text.
+
+> > - list in block quotes
+
+1. ordered item
+   > quote in list
+
+```text
+code
+```
+"""
+    tokenizer = create_tokenizer()
+    actual_tokens = tokenizer.transform(source_markdown)
+
+    # Act
+    markdown_from_tokens = TransformToMarkdown().transform(actual_tokens)
+
+    # Assert
+    assert markdown_from_tokens == source_markdown
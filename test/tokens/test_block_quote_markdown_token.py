@@ -1,4 +1,6 @@
+import copy
 from test.tokens.mock_plugin_modify_context import MockPluginModifyContext
+from typing import cast
 
 from pymarkdown.general.position_marker import PositionMarker
 from pymarkdown.tokens.block_quote_markdown_token import BlockQuoteMarkdownToken
@@ -21,3 +23,40 @@ def test_block_quote_markdown_token_modify_with_bad_name() -> None:
 
     # Assert
     assert not did_modify
+
+
+def test_block_quote_markdown_token_snapshot_from_journal() -> None:
+    """
+    Test to make sure that a snapshot created from the journal matches a copy of
+    the token made at the same point, regardless of any later changes.
+    """
+
+    # Arrange
+    original_token = BlockQuoteMarkdownToken(
+        position_marker=PositionMarker(1, 1, "", 1),
+        extracted_whitespace="",
+    )
+    original_token.add_bleading_spaces("> ")
+    journal_position = original_token.start_journal()
+    expected_token = copy.deepcopy(original_token)
+
+    # Act
+    original_token.add_bleading_spaces(">\t", tabbed_leading_spaces=">\t")
+    original_token.remove_last_bleading_space()
+    original_token.add_bleading_spaces("> ")
+    original_token.leading_text_index += 2
+    snapshot_token = cast(
+        BlockQuoteMarkdownToken, original_token.create_snapshot(journal_position)
+    )
+    original_token.stop_journal()
+
+    # Assert
+    assert str(snapshot_token) == str(expected_token)
+    assert snapshot_token.bleading_spaces == expected_token.bleading_spaces
+    assert (
+        snapshot_token.tabbed_bleading_spaces == expected_token.tabbed_bleading_spaces
+    )
+    assert snapshot_token.leading_text_index == expected_token.leading_text_index
+    assert original_token.bleading_spaces == "> \n> "
+    assert original_token.tabbed_bleading_spaces == {1: ">\t"}
+    assert original_token.leading_text_index == 1
@@ -20,3 +20,28 @@ def test_paragraph_markdown_token_modify_with_bad_name() -> None:
 
     # Assert
     assert not did_modify
+
+
+def test_paragraph_markdown_token_modify_composes_extra_data() -> None:
+    """
+    Test to make sure that the extra data for the token is composed from its
+    fields, and that the token does not keep a dictionary for those fields.
+    """
+
+    # Arrange
+    modification_context = MockPluginModifyContext()
+    original_token = ParagraphMarkdownToken(
+        extracted_whitespace="  ", position_marker=PositionMarker(1, 1, "")
+    )
+    assert str(original_token) == "[para(1,2):  ]"
+
+    # Act
+    did_modify = original_token.modify_token(
+        modification_context, "extracted_whitespace", " "
+    )
+
+    # Assert
+    assert did_modify
+    assert original_token.extra_data == " "
+    assert str(original_token) == "[para(1,2): ]"
+    assert not hasattr(original_token, "__dict__")
@@ -49,6 +49,27 @@ else:
     SET_CONFIG_X = "--set, -s SET_CONFIGURATION"
 
 
+def create_tokenizer(
+    config_map: Optional[Dict[str, Any]] = None, enabled_extensions: str = ""
+) -> TokenizedMarkdown:
+    """
+    Create a tokenizer that is configured with the specified configuration map,
+    and with the specified extensions enabled.
+    """
+    test_properties = ApplicationProperties()
+    if config_map:
+        test_properties.load_from_dict(config_map)
+        if test_properties.get_boolean_property("mode.strict-config", strict_mode=True):
+            test_properties.enable_strict_mode()
+
+    extension_manager = ExtensionManager(MainPresentation())
+    extension_manager.initialize(test_properties)
+    extension_manager.apply_configuration(enabled_extensions)
+    tokenizer = TokenizedMarkdown()
+    tokenizer.apply_configuration(test_properties, extension_manager)
+    return tokenizer
+
+
 # pylint: disable=too-many-arguments, too-many-locals
 def act_and_assert(
     source_markdown: str,
@@ -75,17 +96,7 @@ def act_and_assert(
     logging.getLogger().setLevel(logging.DEBUG if show_debug else logging.WARNING)
     ParserLogger.sync_on_next_call()
 
-    tokenizer = TokenizedMarkdown()
-    test_properties = ApplicationProperties()
-    if config_map:
-        test_properties.load_from_dict(config_map)
-        if test_properties.get_boolean_property("mode.strict-config", strict_mode=True):
-            test_properties.enable_strict_mode()
-
-    extension_manager = ExtensionManager(MainPresentation())
-    extension_manager.initialize(test_properties)
-    extension_manager.apply_configuration("")
-    tokenizer.apply_configuration(test_properties, extension_manager)
+    tokenizer = create_tokenizer(config_map)
     transformer = TransformToGfm()
 
     # Act
@@ -0,0 +1,145 @@
+"""
+Module to measure how the time taken to transform tokens back into Markdown
+scales with the length of the documents that those tokens were parsed from.
+
+This is the transform used to regenerate each document after its tokens are
+fixed.  For each kind of document, documents of increasing length are parsed,
+and the time taken to transform their tokens back into Markdown is reported per
+line.  If that transform is linear in the length of the document, the time
+taken per line stays roughly the same as the documents get longer.
+"""
+
+import argparse
+import sys
+import time
+from typing import Callable, Dict, List
+
+from application_properties import ApplicationProperties
+
+from pymarkdown.extension_manager.extension_manager import ExtensionManager
+from pymarkdown.general.main_presentation import MainPresentation
+from pymarkdown.general.tokenized_markdown import TokenizedMarkdown
+from pymarkdown.transform_markdown.transform_to_markdown import TransformToMarkdown
+
+
+def __create_paragraphs(line_count: int) -> str:
+    document_lines: List[str] = []
+    while len(document_lines) < line_count:
+        document_lines.extend(
+            [
+                "# Heading",
+                "",
+                "Some *text*",
+                "more `text`.",
+                "",
+                "```text",
+                "code",
+                "```",
+                "",
+            ]
+        )
+    return "\n".join(document_lines[:line_count]) + "\n"
+
+
+def __create_separate_lists(line_count: int) -> str:
+    document_lines: List[str] = []
+    while len(document_lines) < line_count:
+        document_lines.extend(
+            ["- item", "  - nested item", "1. ordered item", "", "Text", ""]
+        )
+    return "\n".join(document_lines[:line_count]) + "\n"
+
+
+def __create_separate_block_quotes(line_count: int) -> str:
+    document_lines: List[str] = []
+    while len(document_lines) < line_count:
+        document_lines.extend(["> quote", "> > nested quote", "", "Text", ""])
+    return "\n".join(document_lines[:line_count]) + "\n"
+
+
+def __create_long_list(line_count: int) -> str:
+    document_lines: List[str] = []
+    while len(document_lines) < line_count:
+        document_lines.extend(["- item", "  - nested item", "    more text"])
+    return "\n".join(document_lines[:line_count]) + "\n"
+
+
+__DOCUMENT_CREATORS: Dict[str, Callable[[int], str]] = {
+    "paragraphs": __create_paragraphs,
+    "separate-lists": __create_separate_lists,
+    "separate-block-quotes": __create_separate_block_quotes,
+    "long-list": __create_long_list,
+}
+
+
+def __handle_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Measure how transforming tokens back into Markdown scales "
+        + "with the length of the document."
+    )
+    parser.add_argument(
+        "--lines",
+        dest="line_counts",
+        type=int,
+        nargs="+",
+        default=[5000, 10000, 25000, 50000],
+        help="number of lines in each of the documents to transform",
+    )
+    parser.add_argument(
+        "--repeat",
+        dest="repeat_count",
+        type=int,
+        default=3,
+        help="number of times to transform each document, keeping the fastest time",
+    )
+    parser.add_argument(
+        "--kind",
+        dest="document_kinds",
+        choices=list(__DOCUMENT_CREATORS),
+        nargs="+",
+        default=list(__DOCUMENT_CREATORS),
+        help="kinds of documents to measure",
+    )
+    return parser.parse_args()
+
+
+def __create_tokenizer() -> TokenizedMarkdown:
+    application_properties = ApplicationProperties()
+    extension_manager = ExtensionManager(MainPresentation())
+    extension_manager.initialize(application_properties)
+    extension_manager.apply_configuration("")
+    tokenizer = TokenizedMarkdown()
+    tokenizer.apply_configuration(application_properties, extension_manager)
+    return tokenizer
+
+
+def main() -> None:
+    """
+    Main entry point.
+    """
+    args = __handle_arguments()
+    tokenizer = __create_tokenizer()
+
+    print(f"{'kind':<24}{'lines':>8}{'seconds':>10}{'ms/line':>10}{'ratio':>8}")
+    for document_kind in args.document_kinds:
+        first_time_per_line = 0.0
+        for line_count in args.line_counts:
+            document_text = __DOCUMENT_CREATORS[document_kind](line_count)
+            actual_tokens = tokenizer.transform(document_text)
+            fastest_time = sys.float_info.max
+            for _ in range(args.repeat_count):
+                start_time = time.perf_counter()
+                markdown_text = TransformToMarkdown().transform(actual_tokens)
+                fastest_time = min(fastest_time, time.perf_counter() - start_time)
+            assert markdown_text == document_text, "Transform must round trip."
+            time_per_line = fastest_time / line_count
+            first_time_per_line = first_time_per_line or time_per_line
+            print(
+                f"{document_kind:<24}{line_count:>8}{fastest_time:>10.3f}"
+                + f"{time_per_line * 1000.0:>10.3f}"
+                + f"{time_per_line / first_time_per_line:>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
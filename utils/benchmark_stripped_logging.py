@@ -0,0 +1,115 @@
+"""
+Module to measure how much time is saved by loading PyMarkdown with its parser
+logging calls removed.
+
+The `bench` command is run in separate processes, alternating between the normal
+modules and the modules loaded with the `PYMARKDOWN_STRIP_PARSER_LOGGING`
+environment variable set, so that any drift in the speed of the machine affects
+both equally.  For each corpus, the fastest time taken by the parser phases to
+tokenize it with each form of the modules is reported, along with the time saved.
+As the time saved is only a few percent for some of the corpora, use a machine
+that is otherwise idle, and enough rounds to smooth out any noise.
+"""
+
+import argparse
+import json
+import os
+import subprocess  # nosec B404
+import sys
+import tempfile
+from typing import Dict, List
+
+from pymarkdown.general.parser_logging_stripper import StrippedLoggingFinder
+from pymarkdown.general.phase_timer import PhaseTimer
+
+__PARSER_PHASES = [
+    PhaseTimer.block_pass_phase,
+    PhaseTimer.coalesce_phase,
+    PhaseTimer.inline_phase,
+]
+
+
+def __handle_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Measure the time saved by removing the parser logging calls."
+    )
+    parser.add_argument(
+        "--rounds",
+        dest="round_count",
+        type=int,
+        default=5,
+        help="number of times to run the bench command with each form of the modules",
+    )
+    parser.add_argument(
+        "--scale",
+        dest="scale",
+        type=int,
+        default=1,
+        help="multiplier for the size of each corpus",
+    )
+    return parser.parse_args()
+
+
+def __run_bench(is_stripped: bool, scale: int) -> Dict[str, float]:
+    bench_environment = dict(os.environ)
+    bench_environment[StrippedLoggingFinder.environment_variable_name] = (
+        "1" if is_stripped else "0"
+    )
+    with tempfile.TemporaryDirectory() as output_directory:
+        output_file = os.path.join(output_directory, "results.json")
+        subprocess.run(  # nosec B603
+            [
+                sys.executable,
+                "-m",
+                "pymarkdown",
+                "bench",
+                "--skip-fix",
+                "--scale",
+                str(scale),
+                "--output-file",
+                output_file,
+            ],
+            check=True,
+            env=bench_environment,
+            stdout=subprocess.DEVNULL,
+        )
+        with open(output_file, "rt", encoding="utf-8") as input_file:
+            bench_results = json.load(input_file)
+    return {
+        corpus_name: sum(
+            corpus_results["scan"]["phases"][next_phase]
+            for next_phase in __PARSER_PHASES
+        )
+        for corpus_name, corpus_results in bench_results["corpora"].items()
+    }
+
+
+def main() -> None:
+    """
+    Main entry point.
+    """
+    args = __handle_arguments()
+
+    normal_times: Dict[str, List[float]] = {}
+    stripped_times: Dict[str, List[float]] = {}
+    for round_index in range(args.round_count):
+        print(f"Round {round_index + 1} of {args.round_count}...")
+        for is_stripped, round_times in ((False, normal_times), (True, stripped_times)):
+            for corpus_name, corpus_time in __run_bench(
+                is_stripped, args.scale
+            ).items():
+                round_times.setdefault(corpus_name, []).append(corpus_time)
+
+    print(f"{'corpus':<22}{'normal':>10}{'stripped':>10}{'saved':>9}")
+    for corpus_name, corpus_times in normal_times.items():
+        normal_time = min(corpus_times)
+        stripped_time = min(stripped_times[corpus_name])
+        saved_percentage = (normal_time - stripped_time) * 100.0 / normal_time
+        print(
+            f"{corpus_name:<22}{normal_time:>10.3f}{stripped_time:>10.3f}"
+            + f"{saved_percentage:>8.1f}%"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Module to measure how much memory is used by the tokens produced for each of the
+benchmark corpora.
+
+Each document in a corpus is tokenized while `tracemalloc` is tracing, and the
+memory still held once the tokens for all of the documents have been produced is
+divided by the number of tokens, giving the number of bytes used by each token.
+That memory includes everything held by the tokens, such as their attributes and
+the strings and lists that those attributes refer to, but not the documents
+themselves.  The peak memory used while tokenizing is also reported.
+"""
+
+import argparse
+import gc
+import tracemalloc
+from typing import List
+
+from application_properties import ApplicationProperties
+
+from pymarkdown.benchmark.benchmark_corpus import BenchmarkCorpora
+from pymarkdown.extension_manager.extension_manager import ExtensionManager
+from pymarkdown.general.bad_tokenization_error import BadTokenizationError
+from pymarkdown.general.main_presentation import MainPresentation
+from pymarkdown.general.tokenized_markdown import TokenizedMarkdown
+from pymarkdown.tokens.markdown_token import MarkdownToken
+
+
+def __handle_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Measure the memory used by the tokens for each benchmark corpus."
+    )
+    parser.add_argument(
+        "--scale",
+        dest="scale",
+        type=int,
+        default=4,
+        help="multiplier for the size of each corpus",
+    )
+    parser.add_argument(
+        "--corpus",
+        dest="corpus_names",
+        action="append",
+        choices=BenchmarkCorpora.corpus_names(),
+        default=None,
+        help="name of a corpus to measure, measuring all corpora if not specified",
+    )
+    return parser.parse_args()
+
+
+def __create_tokenizer(required_extensions: List[str]) -> TokenizedMarkdown:
+    properties = ApplicationProperties()
+    extension_manager = ExtensionManager(MainPresentation())
+    extension_manager.initialize(properties)
+    extension_manager.apply_configuration(",".join(required_extensions))
+    tokenizer = TokenizedMarkdown()
+    tokenizer.apply_configuration(properties, extension_manager)
+    return tokenizer
+
+
+def main() -> None:
+    """
+    Main entry point.
+    """
+    args = __handle_arguments()
+
+    print(f"{'corpus':<22}{'tokens':>10}{'bytes':>12}{'per token':>11}{'peak':>12}")
+    for corpus_name in args.corpus_names or BenchmarkCorpora.corpus_names():
+        benchmark_corpus = BenchmarkCorpora.create_corpus(corpus_name, args.scale)
+        tokenizer = __create_tokenizer(benchmark_corpus.required_extensions)
+
+        # Tokenize the first document once before measuring, so that anything
+        # cached by the parser is not counted against the tokens.
+        tokenizer.transform(benchmark_corpus.documents[0])
+        gc.collect()
+
+        held_tokens: List[List[MarkdownToken]] = []
+        tracemalloc.start()
+        starting_size, _ = tracemalloc.get_traced_memory()
+        for next_document in benchmark_corpus.documents:
+            try:
+                held_tokens.append(tokenizer.transform(next_document))
+            except BadTokenizationError:
+                continue
+        gc.collect()
+        ending_size, peak_size = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        token_count = sum(len(next_tokens) for next_tokens in held_tokens)
+        held_size = ending_size - starting_size
+        print(
+            f"{corpus_name:<22}{token_count:>10}{held_size:>12}"
+            + f"{held_size / max(token_count, 1):>11.1f}{peak_size - starting_size:>12}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Module to generate the corpus of CommonMark specification examples used by the
+`bench` command, taken from the specification tests in the `test/gfm` directory.
+"""
+
+import argparse
+import ast
+import json
+import os
+import re
+import sys
+from typing import List, Optional
+
+__SPECIFICATION_TEST_NAME = re.compile(r"^test_[a-z_]+_\d{3}$")
+
+
+def __handle_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Generate the corpus of CommonMark examples for the bench command."
+    )
+    parser.add_argument(
+        "--check",
+        dest="check_only",
+        action="store_true",
+        default=False,
+        help="only check whether the corpus is up to date",
+    )
+    return parser.parse_args()
+
+
+def __find_source_markdown(test_function: ast.FunctionDef) -> Optional[str]:
+    for next_statement in test_function.body:
+        if (
+            isinstance(next_statement, ast.Assign)
+            and [ast.dump(next_target) for next_target in next_statement.targets]
+            == [ast.dump(ast.Name(id="source_markdown", ctx=ast.Store()))]
+            and isinstance(next_statement.value, ast.Constant)
+            and isinstance(next_statement.value.value, str)
+        ):
+            return next_statement.value.value
+    return None
+
+
+def __collect_examples(test_directory: str) -> List[str]:
+    examples_by_name = {}
+    for next_file_name in sorted(os.listdir(test_directory)):
+        if not next_file_name.endswith(".py"):
+            continue
+        with open(
+            os.path.join(test_directory, next_file_name), "rt", encoding="utf-8"
+        ) as test_file:
+            test_module = ast.parse(test_file.read())
+        for next_node in test_module.body:
+            if isinstance(
+                next_node, ast.FunctionDef
+            ) and __SPECIFICATION_TEST_NAME.match(next_node.name):
+                source_markdown = __find_source_markdown(next_node)
+                if source_markdown is not None:
+                    examples_by_name[next_node.name] = source_markdown
+    return [
+        examples_by_name[next_name]
+        for next_name in sorted(
+            examples_by_name, key=lambda test_name: int(test_name[-3:])
+        )
+    ]
+
+
+def main() -> None:
+    """
+    Main entry point.
+    """
+    args = __handle_arguments()
+
+    corpus_path = os.path.join(
+        "pymarkdown", "resources", "benchmark_commonmark_examples.json"
+    )
+    corpus_text = (
+        json.dumps(
+            __collect_examples(os.path.join("test", "gfm")),
+            indent=1,
+            ensure_ascii=True,
+        )
+        + "\n"
+    )
+
+    if args.check_only:
+        existing_text = ""
+        if os.path.exists(corpus_path):
+            with open(corpus_path, "rt", encoding="utf-8") as corpus_file:
+                existing_text = corpus_file.read()
+        if existing_text != corpus_text:
+            print(f"Benchmark corpus '{corpus_path}' is not up to date.")
+            sys.exit(1)
+        return
+
+    with open(corpus_path, "wt", encoding="utf-8", newline="\n") as corpus_file:
+        corpus_file.write(corpus_text)
+    print(f"Benchmark corpus '{corpus_path}' generated.")
+
+
+if __name__ == "__main__":
+    main()
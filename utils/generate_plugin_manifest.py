@@ -0,0 +1,54 @@
+"""
+Module to generate the manifest for the plugins that are included with PyMarkdown,
+allowing those plugins to be registered without importing each of their modules.
+"""
+
+import argparse
+import os
+import sys
+
+from pymarkdown.plugin_manager.plugin_manager import PluginManager
+from pymarkdown.plugin_manager.plugin_manifest import PluginManifest
+
+
+def __handle_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Generate the manifest for the plugins included with PyMarkdown."
+    )
+    parser.add_argument(
+        "--check",
+        dest="check_only",
+        action="store_true",
+        default=False,
+        help="only check whether the manifest is up to date",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    """
+    Main entry point.
+    """
+    args = __handle_arguments()
+
+    plugins_directory = os.path.join("pymarkdown", "plugins")
+    manifest_path = os.path.join(plugins_directory, PluginManifest.manifest_file_name)
+    manifest_text = PluginManager.create_plugin_manifest(plugins_directory)
+
+    if args.check_only:
+        existing_text = ""
+        if os.path.exists(manifest_path):
+            with open(manifest_path, "rt", encoding="utf-8") as manifest_file:
+                existing_text = manifest_file.read()
+        if existing_text != manifest_text:
+            print(f"Plugin manifest '{manifest_path}' is not up to date.")
+            sys.exit(1)
+        return
+
+    with open(manifest_path, "wt", encoding="utf-8", newline="\n") as manifest_file:
+        manifest_file.write(manifest_text)
+    print(f"Plugin manifest '{manifest_path}' generated.")
+
+
+if __name__ == "__main__":
+    main()